@@ -556,3 +556,84 @@ async def migrate_rent_type(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "MIGRATION_ERROR", "message": str(e)}
         )
+
+
+@router.post(
+    "/rollups/monthly-region-stats/rebuild",
+    status_code=status.HTTP_200_OK,
+    summary="월별 지역 집계 전체 재집계",
+    description="monthly_region_stats 테이블을 원본 sales/rents 에서 다시 집계하고 통계 캐시를 무효화합니다. (매일 새벽 자동 실행)"
+)
+async def rebuild_monthly_region_stats(
+    kind: Optional[str] = Query(None, description="집계 종류: sale(매매), rent(전월세), 없으면 모두"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    월별 지역 집계 재집계 API
+    
+    수집 후 증분 갱신이 실패했거나 거래 데이터를 직접 수정한 경우 집계를 원본과 맞춥니다.
+    """
+    import time
+    from app.services.monthly_region_stats_service import monthly_region_stats_service
+    from app.utils.cache import invalidate_cache_tags, STATS_GLOBAL_TAG
+    
+    try:
+        start_time = time.time()
+        results = await monthly_region_stats_service.rebuild_all(db, kind=kind)
+        await invalidate_cache_tags(STATS_GLOBAL_TAG)
+        total_time = time.time() - start_time
+        logger.info(f" 월별 지역 집계 재집계 완료: {results} ({total_time:.1f}s)")
+        
+        return {
+            "success": True,
+            "message": "월별 지역 집계 재집계가 완료되었습니다.",
+            "rows": results,
+            "time_elapsed": f"{total_time:.1f}s"
+        }
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_KIND", "message": str(e)}
+        )
+    except Exception as e:
+        logger.error(f" 월별 지역 집계 재집계 실패: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"code": "ROLLUP_REBUILD_ERROR", "message": str(e)}
+        )
+
+
+@router.get(
+    "/cache-metrics",
+    status_code=status.HTTP_200_OK,
+    summary="캐시 계층 지표 조회",
+    description="현재 워커의 L1 캐시(적중률 포함), 응답 캐시, 요청 병합, 캐시 무효화 큐, 아파트 검색 색인, 최근 기록 버퍼, 평당가 분포 스냅샷, 주변 단지 목록 지표를 조회합니다."
+)
+async def get_cache_metrics():
+    """
+    캐시 계층 지표 조회 API
+    
+    지표는 워커(프로세스)별로 집계되므로 워커가 여러 개면 요청마다 다른 워커의 값이 반환됩니다.
+    """
+    from app.utils.local_cache import local_cache
+    from app.utils.single_flight import single_flight
+    from app.utils import response_cache
+    from app.services.cache_invalidation import invalidation_queue
+    from app.services.search_index import apartment_search_index
+    from app.services.recent_activity_buffer import recent_activity_buffer
+    from app.services.percentile_snapshot import percentile_snapshot_store
+    from app.services.apartment_neighbor_service import apartment_neighbor_service
+    
+    return {
+        "success": True,
+        "data": {
+            "l1_cache": local_cache.get_metrics(),
+            "response_cache": response_cache.get_metrics(),
+            "single_flight": single_flight.get_metrics(),
+            "invalidation_queue": invalidation_queue.get_metrics(),
+            "search_index": apartment_search_index.get_metrics(),
+            "recent_activity_buffer": recent_activity_buffer.get_metrics(),
+            "percentile_snapshot": percentile_snapshot_store.get_metrics(),
+            "apartment_neighbors": apartment_neighbor_service.get_metrics(),
+        }
+    }
@@ -15,7 +15,7 @@ import re
 import asyncio
 from datetime import date, datetime, timedelta
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, func, and_, desc, case, cast, or_
 from sqlalchemy.types import Float
@@ -23,6 +23,13 @@ from geoalchemy2 import functions as geo_func
 
 from app.api.v1.deps import get_db
 from app.services.apartment import apartment_service
+from app.services.apartment_neighbor_service import apartment_neighbor_service
+from app.services.apartment_price_summary_service import (
+    AREA_BUCKET_ALL,
+    apartment_price_summary_service,
+)
+from app.services.monthly_region_stats_service import STATS_TYPE_JEONSE, STATS_TYPE_SALE
+from app.services.percentile_snapshot import PERIOD_MONTHS, percentile_snapshot_store
 from app.schemas.apartment import (
     ApartDetailBase,
     VolumeTrendResponse,
@@ -50,8 +57,13 @@ from app.utils.cache import (
     delete_from_cache,
     get_nearby_price_cache_key,
     get_nearby_comparison_cache_key,
-    build_cache_key
+    build_cache_key,
+    tag_cache_key,
+    apt_tag,
+    PERCENTILE_TAG
 )
+from app.utils.single_flight import single_flight
+from app.utils.response_cache import get_cached_response, cache_json_response
 from app.utils.kakao_api import address_to_coordinates as kakao_address_to_coordinates
 from app.utils.google_geocoding import address_to_coordinates as google_address_to_coordinates
 
@@ -309,6 +321,7 @@ async def get_trending_apartments(
 )
 async def get_apartment_detail(
     apt_id: int,
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -320,10 +333,15 @@ async def get_apartment_detail(
     3. 병렬 쿼리 - 최신 거래 정보를 병렬로 조회
     4. 최소 컬럼만 SELECT - 네트워크 전송량 최소화
     """
-    cache_key = build_cache_key("apartment", "detail_v2", str(apt_id))
+    cache_key = await tag_cache_key(build_cache_key("apartment", "detail_v2", str(apt_id)), apt_tag(apt_id))
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     # ============================================================
     # 최적화 1: Raw SQL로 쿼리 실행 (ORM 오버헤드 제거)
@@ -498,7 +516,10 @@ async def compare_apartments(
     if not apartment_ids:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="아파트 ID 목록이 비어 있습니다")
     
-    cache_key = build_cache_key("apartment", "compare", ",".join(map(str, apartment_ids)))
+    cache_key = await tag_cache_key(
+        build_cache_key("apartment", "compare", ",".join(map(str, apartment_ids))),
+        *[apt_tag(apt_id) for apt_id in apartment_ids]
+    )
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
         # 캐시된 데이터가 올바른 형식인지 검증
@@ -569,63 +590,12 @@ async def compare_apartments(
     if not detail_map:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="조회 가능한 아파트가 없습니다")
     
-    sale_subq = (
-        select(
-            Sale.apt_id.label("apt_id"),
-            Sale.trans_price.label("price"),
-            Sale.exclusive_area.label("area"),
-            Sale.contract_date.label("date"),
-            func.row_number().over(
-                partition_by=Sale.apt_id,
-                order_by=Sale.contract_date.desc()
-            ).label("rn")
-        )
-        .where(
-            Sale.apt_id.in_(apartment_ids),
-            Sale.is_canceled == False,
-            (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-            Sale.trans_price.isnot(None),
-            Sale.exclusive_area.isnot(None),
-            Sale.exclusive_area > 0,
-            Sale.contract_date.isnot(None)
-        )
-        .subquery()
-    )
-    
-    sale_result = await db.execute(
-        select(sale_subq.c.apt_id, sale_subq.c.price, sale_subq.c.area, sale_subq.c.date)
-        .where(sale_subq.c.rn == 1)
-    )
-    recent_sales = {row.apt_id: row for row in sale_result.all()}
-    
-    rent_subq = (
-        select(
-            Rent.apt_id.label("apt_id"),
-            Rent.deposit_price.label("price"),
-            Rent.exclusive_area.label("area"),
-            Rent.deal_date.label("date"),
-            func.row_number().over(
-                partition_by=Rent.apt_id,
-                order_by=Rent.deal_date.desc()
-            ).label("rn")
-        )
-        .where(
-            Rent.apt_id.in_(apartment_ids),
-            or_(Rent.monthly_rent == 0, Rent.monthly_rent.is_(None)),
-            (Rent.is_deleted == False) | (Rent.is_deleted.is_(None)),
-            Rent.deposit_price.isnot(None),
-            Rent.exclusive_area.isnot(None),
-            Rent.exclusive_area > 0,
-            Rent.deal_date.isnot(None)
-        )
-        .subquery()
-    )
-    
-    rent_result = await db.execute(
-        select(rent_subq.c.apt_id, rent_subq.c.price, rent_subq.c.area, rent_subq.c.date)
-        .where(rent_subq.c.rn == 1)
+    # 최신 매매/전세 (아파트별 가격 요약, 기본키 조회 1회)
+    summaries = await apartment_price_summary_service.get_summaries(
+        db,
+        apartment_ids,
+        transaction_types=(STATS_TYPE_SALE, STATS_TYPE_JEONSE)
     )
-    recent_rents = {row.apt_id: row for row in rent_result.all()}
     
     apartments: List[ApartmentCompareItem] = []
     for apt_id in apartment_ids:
@@ -633,18 +603,15 @@ async def compare_apartments(
         if not detail:
             continue
         
-        sale = recent_sales.get(apt_id)
-        rent = recent_rents.get(apt_id)
+        sale = summaries.get((apt_id, STATS_TYPE_SALE, AREA_BUCKET_ALL))
+        rent = summaries.get((apt_id, STATS_TYPE_JEONSE, AREA_BUCKET_ALL))
         
-        sale_price = round(float(sale.price) / 10000, 2) if sale and sale.price else None
+        sale_price = round(float(sale["latest_price"]) / 10000, 2) if sale and sale["latest_price"] else None
         sale_pp = None
-        if sale and sale.price and sale.area:
-            sale_pp = round(float(sale.price) / float(sale.area) * 3.3 / 10000, 2)
+        if sale and sale["latest_price"] and sale["latest_area"]:
+            sale_pp = round(float(sale["latest_price"]) / float(sale["latest_area"]) * 3.3 / 10000, 2)
         
-        rent_price = round(float(rent.price) / 10000, 2) if rent and rent.price else None
-        rent_pp = None
-        if rent and rent.price and rent.area:
-            rent_pp = round(float(rent.price) / float(rent.area) * 3.3 / 10000, 2)
+        rent_price = round(float(rent["latest_price"]) / 10000, 2) if rent and rent["latest_price"] else None
         
         parking_per_household = None
         if detail.total_household_cnt:
@@ -708,7 +675,7 @@ async def get_pyeong_prices(
     logger = logging.getLogger(__name__)
     
     try:
-        cache_key = build_cache_key("apartment", "pyeong_prices", str(apt_id))
+        cache_key = await tag_cache_key(build_cache_key("apartment", "pyeong_prices", str(apt_id)), apt_tag(apt_id))
         cached_data = await get_from_cache(cache_key)
         if cached_data is not None:
             return cached_data
@@ -718,103 +685,44 @@ async def get_pyeong_prices(
         if not apartment:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="아파트를 찾을 수 없습니다")
         
-        sales_stmt = (
-            select(
-                Sale.trans_price,
-                Sale.exclusive_area,
-                Sale.contract_date
-            )
-            .where(
-                Sale.apt_id == apt_id,
-                Sale.is_canceled == False,
-                (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-                Sale.trans_price.isnot(None),
-                Sale.exclusive_area.isnot(None),
-                Sale.exclusive_area > 0,
-                Sale.contract_date.isnot(None)
-            )
-            .order_by(Sale.contract_date.desc())
-            .limit(200)
-        )
-        
-        rents_stmt = (
-            select(
-                Rent.deposit_price,
-                Rent.exclusive_area,
-                Rent.deal_date
-            )
-            .where(
-                Rent.apt_id == apt_id,
-                or_(Rent.monthly_rent == 0, Rent.monthly_rent.is_(None)),
-                (Rent.is_deleted == False) | (Rent.is_deleted.is_(None)),
-                Rent.deposit_price.isnot(None),
-                Rent.exclusive_area.isnot(None),
-                Rent.exclusive_area > 0,
-                Rent.deal_date.isnot(None)
-            )
-            .order_by(Rent.deal_date.desc())
-            .limit(200)
+        # 평형별 최신 매매/전세 (아파트별 가격 요약, 기본키 조회 1회)
+        summaries = await apartment_price_summary_service.get_summaries(
+            db,
+            [apt_id],
+            transaction_types=(STATS_TYPE_SALE, STATS_TYPE_JEONSE),
+            area_bucket=None
         )
         
-        sales_result = await db.execute(sales_stmt)
-        rents_result = await db.execute(rents_stmt)
-        
-        pyeong_groups: dict[str, dict] = {}
+        pyeong_groups: dict[int, dict] = {}
         
-        for row in sales_result.all():
-            try:
-                area = float(row.exclusive_area) if row.exclusive_area else 0
-                if area <= 0:
-                    continue
-                pyeong = round(area / 3.3058)
-                pyeong_type = f"{pyeong}평형"
-                if pyeong_type not in pyeong_groups:
-                    pyeong_groups[pyeong_type] = {
-                        "area": area,
-                        "sale": None,
-                        "jeonse": None
-                    }
-                if pyeong_groups[pyeong_type]["sale"] is None and row.trans_price and row.contract_date:
-                    price = float(row.trans_price)
-                    date_str = row.contract_date.isoformat() if hasattr(row.contract_date, 'isoformat') else str(row.contract_date)
-                    pyeong_groups[pyeong_type]["sale"] = PyeongRecentPrice(
-                        price=round(price / 10000, 2),
-                        date=date_str,
-                        price_per_pyeong=round(price / area * 3.3 / 10000, 2)
-                    )
-            except Exception as e:
-                logger.warning(f"[pyeong-prices] 매매 데이터 처리 오류 (apt_id={apt_id}): {e}")
+        for (_, transaction_type, area_bucket), summary in summaries.items():
+            if area_bucket == AREA_BUCKET_ALL or not summary["latest_price"] or not summary["latest_area"]:
                 continue
-        
-        for row in rents_result.all():
             try:
-                area = float(row.exclusive_area) if row.exclusive_area else 0
-                if area <= 0:
-                    continue
-                pyeong = round(area / 3.3058)
-                pyeong_type = f"{pyeong}평형"
-                if pyeong_type not in pyeong_groups:
-                    pyeong_groups[pyeong_type] = {
-                        "area": area,
-                        "sale": None,
-                        "jeonse": None
-                    }
-                if pyeong_groups[pyeong_type]["jeonse"] is None and row.deposit_price and row.deal_date:
-                    price = float(row.deposit_price)
-                    date_str = row.deal_date.isoformat() if hasattr(row.deal_date, 'isoformat') else str(row.deal_date)
-                    pyeong_groups[pyeong_type]["jeonse"] = PyeongRecentPrice(
-                        price=round(price / 10000, 2),
-                        date=date_str,
-                        price_per_pyeong=round(price / area * 3.3 / 10000, 2)
-                    )
+                price = float(summary["latest_price"])
+                area = float(summary["latest_area"])
+                group = pyeong_groups.setdefault(area_bucket, {"area": None, "sale": None, "jeonse": None})
+                recent_price = PyeongRecentPrice(
+                    price=round(price / 10000, 2),
+                    date=summary["latest_date"].isoformat(),
+                    price_per_pyeong=round(price / area * 3.3 / 10000, 2)
+                )
+                # 대표 면적은 최신 매매 기준 (매매가 없으면 최신 전세)
+                if transaction_type == STATS_TYPE_SALE:
+                    group["sale"] = recent_price
+                    group["area"] = area
+                else:
+                    group["jeonse"] = recent_price
+                    if group["area"] is None:
+                        group["area"] = area
             except Exception as e:
-                logger.warning(f"[pyeong-prices] 전세 데이터 처리 오류 (apt_id={apt_id}): {e}")
+                logger.warning(f"[pyeong-prices] 가격 요약 처리 오류 (apt_id={apt_id}, {transaction_type}): {e}")
                 continue
         
         pyeong_options_data: List[dict] = []
-        for pyeong_type, data in sorted(pyeong_groups.items(), key=lambda x: int(re.sub(r"[^0-9]", "", x[0]) or 0)):
+        for area_bucket, data in sorted(pyeong_groups.items()):
             option = PyeongOption(
-                pyeong_type=pyeong_type,
+                pyeong_type=f"{area_bucket}평형",
                 area_m2=round(data["area"], 2),
                 recent_sale=data["sale"],
                 recent_jeonse=data["jeonse"]
@@ -849,6 +757,7 @@ async def get_pyeong_prices(
     description="아파트 ID로 상세정보 조회")
 async def get_apart_detail(
     apt_id: int,
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ) -> ApartDetailBase:
     """
@@ -863,17 +772,22 @@ async def get_apart_detail(
       - 404: 아파트 상세 정보를 찾을 수 없음
     """
     # 캐시 키 생성
-    cache_key = build_cache_key("apartment", "detail", str(apt_id))
+    cache_key = await tag_cache_key(build_cache_key("apartment", "detail", str(apt_id)), apt_tag(apt_id))
     
-    # 1. 캐시에서 조회 시도
+    # 1. 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 2. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        return ApartDetailBase.model_validate(cached_data)
+        return await cache_json_response(http_request, cache_key, ApartDetailBase.model_validate(cached_data))
     
-    # 2. 캐시 미스: 서비스 호출
+    # 3. 캐시 미스: 서비스 호출
     detail_data = await apartment_service.get_apart_detail(db, apt_id=apt_id)
     
-    # 3. 캐시에 저장 (TTL: 6시간 = 21600초) - 아파트 상세정보는 자주 변경되지 않음
+    # 4. 캐시에 저장 (TTL: 6시간 = 21600초) - 아파트 상세정보는 자주 변경되지 않음
     detail_dict = detail_data.model_dump()
     await set_to_cache(cache_key, detail_dict, ttl=21600)
     
@@ -1137,7 +1051,7 @@ async def get_nearby_price(
     평당가를 계산하고, 기준 아파트의 면적을 곱하여 예상 가격을 산출합니다.
     """
     # 캐시 키 생성
-    cache_key = get_nearby_price_cache_key(apt_id, months)
+    cache_key = await tag_cache_key(get_nearby_price_cache_key(apt_id, months), apt_tag(apt_id))
     
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
@@ -1260,7 +1174,10 @@ async def get_nearby_comparison(
     limit = 10  # 최대 10개
     
     # 캐시 키 생성 (area, area_tolerance, transaction_type 추가)
-    cache_key = get_nearby_comparison_cache_key(apt_id, months, radius_meters, area, area_tolerance, transaction_type)
+    cache_key = await tag_cache_key(
+        get_nearby_comparison_cache_key(apt_id, months, radius_meters, area, area_tolerance, transaction_type),
+        apt_tag(apt_id)
+    )
     
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
@@ -1376,7 +1293,10 @@ async def get_same_region_comparison(
     각 아파트의 최근 거래 가격 정보를 포함하여 비교 데이터를 제공합니다.
     """
     # 캐시 키 생성
-    cache_key = build_cache_key("apartment", "same_region_comparison", str(apt_id), str(months), str(limit), str(area) if area else "all", str(area_tolerance), transaction_type)
+    cache_key = await tag_cache_key(
+        build_cache_key("apartment", "same_region_comparison", str(apt_id), str(months), str(limit), str(area) if area else "all", str(area_tolerance), transaction_type),
+        apt_tag(apt_id)
+    )
     
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
@@ -1525,6 +1445,7 @@ async def update_geometry(
         
         success_count = 0
         failed_count = 0
+        updated_apt_ids = []
         
         # 배치 처리
         for batch_start in range(0, total_processed, batch_size):
@@ -1591,6 +1512,7 @@ async def update_geometry(
                     
                     logger.debug(f"[{idx}/{total_processed}]  성공: apt_detail_id={record.apt_detail_id}, 좌표=({longitude}, {latitude})")
                     success_count += 1
+                    updated_apt_ids.append(record.apt_id)
                     
                 except Exception as e:
                     tb = traceback.format_exc()
@@ -1609,6 +1531,14 @@ async def update_geometry(
         logger.info(" [아파트 geometry] Geometry 일괄 업데이트 작업 완료!")
         logger.info(f"   [아파트 geometry] 처리: {total_processed}개, 성공: {success_count}개, 실패: {failed_count}개")
         
+        # 위치가 바뀐 아파트와 그 주변 아파트의 주변 단지 목록 갱신 (실패해도 KNN 조회로 대체되므로 경고만)
+        if updated_apt_ids:
+            try:
+                await apartment_neighbor_service.refresh_for_geometry_change(db, updated_apt_ids)
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f" [아파트 geometry] 주변 단지 목록 갱신 실패: {type(e).__name__}: {str(e)}")
+        
         return {
             "success": True,
             "message": "Geometry 일괄 업데이트 작업 완료!",
@@ -1677,7 +1607,10 @@ async def get_apartment_transactions(
     logger.info(f" [Apt Transactions] 조회 시작 - apt_id: {apt_id}, type: {transaction_type}, months: {months}, area: {area}")
     
     # 캐시 키 생성 (area, area_tolerance 추가)
-    cache_key = build_cache_key("apartment", "transactions", str(apt_id), transaction_type, str(limit), str(months), str(area) if area else "all", str(area_tolerance))
+    cache_key = await tag_cache_key(
+        build_cache_key("apartment", "transactions", str(apt_id), transaction_type, str(limit), str(months), str(area) if area else "all", str(area_tolerance)),
+        apt_tag(apt_id)
+    )
     
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
@@ -1685,6 +1618,11 @@ async def get_apartment_transactions(
         logger.info(f" [Apt Transactions] 캐시 히트 - apt_id: {apt_id}")
         return cached_data
     
+    # 캐시 미스: 같은 키를 동시에 계산하지 않도록 요청 병합
+    flight = await single_flight.acquire(cache_key)
+    if flight.value is not None:
+        return flight.value
+    
     try:
         # 2. 캐시 미스: 데이터베이스에서 조회
         # 아파트 존재 확인
@@ -1989,13 +1927,14 @@ async def get_apartment_transactions(
         }
         
         # 3. 캐시에 저장 (TTL: 10분 = 600초)
-        await set_to_cache(cache_key, response_data, ttl=600)
+        await flight.set(response_data, ttl=600)
         
         logger.info(f" [Apt Transactions] 조회 완료 - apt_id: {apt_id}, 거래내역: {len(response_data['data']['recent_transactions'])}건, 추이: {len(response_data['data']['price_trend'])}개월")
         
         return response_data
         
-    except HTTPException:
+    except HTTPException as e:
+        flight.fail(e)
         raise
     except Exception as e:
         error_type = type(e).__name__
@@ -2022,10 +1961,15 @@ async def get_apartment_transactions(
         print(f"  에러 메시지: {error_message}")
         print(f"  스택 트레이스:\n{error_traceback}")
         
-        raise HTTPException(
+        error = HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"거래 내역 조회 중 오류가 발생했습니다 (apt_id: {apt_id}): {error_type}: {error_message}"
         )
+        # 같은 키를 기다리던 요청에도 같은 오류 전달 (동시 재계산 방지)
+        flight.fail(error)
+        raise error
+    finally:
+        await flight.release()
 
 
 @router.post(
@@ -2476,8 +2420,24 @@ async def get_apartment_percentile(
     전국 아파트 기준 percentile과 동 내 percentile을 모두 계산하여 반환합니다.
     - 전국 기준: 모든 아파트의 최근 6개월 평당가 기준
     - 동 내 기준: 같은 동 내 아파트의 최근 6개월 평당가 기준
+    - 요청마다 집계하지 않고 수집 후 만든 분포 스냅샷에서 이진 탐색
+    - 응답은 스냅샷 태그(PERCENTILE_TAG)와 아파트 태그에 묶어 캐시 (스냅샷 재구성 시 무효화)
     """
     try:
+        # 평당가 분포 스냅샷 (수집 후 재구성, 최근 6개월 평균 평당가의 정렬 배열)
+        snapshot = await percentile_snapshot_store.get(db)
+        
+        # 캐시 키: 스냅샷 태그 + 아파트 태그 + 이 워커의 스냅샷 버전
+        # (다른 워커가 재구성한 스냅샷을 아직 읽지 않은 워커가 이전 결과를 새 세대 키에 저장하지 않도록)
+        cache_key = await tag_cache_key(
+            build_cache_key("apartment", "percentile", str(apt_id), snapshot.version if snapshot else "none"),
+            PERCENTILE_TAG,
+            apt_tag(apt_id)
+        )
+        cached_data = await get_from_cache(cache_key)
+        if cached_data is not None:
+            return cached_data
+        
         # 1. 아파트 정보 조회
         apt_stmt = (
             select(Apartment, State)
@@ -2500,105 +2460,48 @@ async def get_apartment_percentile(
         apartment, region = apt_row
         region_id = apartment.region_id
         
-        # 2. 최근 6개월 날짜 범위 계산
-        today = date.today()
-        six_months_ago = today - timedelta(days=180)
+        # 2. 분포 크기
+        national_total_count = len(snapshot.national) if snapshot else 0
         
-        # 3. 전국 모든 아파트의 최근 6개월 평당가 계산
-        # 평당가 = (매매가 / 전용면적) * 3.3 (평 변환)
-        # 평당가 단위: 만원/평
-        national_price_stmt = (
-            select(
-                Sale.apt_id,
-                func.avg(
-                    cast(Sale.trans_price, Float) / 
-                    cast(Sale.exclusive_area, Float) * 3.3
-                ).label('avg_price_per_pyeong')
-            )
-            .join(Apartment, Sale.apt_id == Apartment.apt_id)
-            .where(
-                Sale.contract_date.isnot(None),
-                Sale.contract_date >= six_months_ago,
-                Sale.contract_date <= today,
-                Sale.trans_price.isnot(None),
-                Sale.trans_price > 0,
-                Sale.exclusive_area.isnot(None),
-                Sale.exclusive_area > 0,
-                Sale.is_canceled == False,
-                (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-                (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None))
-            )
-            .group_by(Sale.apt_id)
-            .having(func.count(Sale.trans_id) >= 1)  # 최소 1건 이상 거래
-        )
-        
-        national_price_result = await db.execute(national_price_stmt)
-        national_price_data = {row[0]: float(row[1]) for row in national_price_result.fetchall()}
-        
-        # 4. 전국 데이터 부족 체크 (최소 5개 아파트 필요)
-        if len(national_price_data) < 5:
+        # 3. 전국 데이터 부족 체크 (최소 5개 아파트 필요)
+        if national_total_count < 5:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"전국 거래 데이터가 부족합니다 (필요: 5개 이상, 현재: {len(national_price_data)}개)"
+                detail=f"전국 거래 데이터가 부족합니다 (필요: 5개 이상, 현재: {national_total_count}개)"
             )
         
-        # 5. 해당 아파트의 평당가 확인 (전국 기준)
-        target_price_per_pyeong = national_price_data.get(apt_id)
-        if target_price_per_pyeong is None:
+        # 4. 해당 아파트의 평당가 확인 (전국 기준)
+        target = snapshot.lookup(apt_id)
+        if target is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="해당 아파트의 최근 6개월 거래 데이터가 없습니다"
             )
+        target_price_per_pyeong, _ = target
         
-        # 6. 전국 percentile 계산
-        # 가격이 높을수록 상위 percentile
-        national_sorted_prices = sorted(national_price_data.values(), reverse=True)
-        national_total_count = len(national_sorted_prices)
-        
-        # 해당 아파트보다 높은 가격의 아파트 개수
-        national_higher_count = sum(1 for price in national_sorted_prices if price > target_price_per_pyeong)
-        
-        # 전국 percentile 계산: (더 높은 가격의 아파트 수 / 전체) * 100
-        national_percentile = (national_higher_count / national_total_count) * 100
-        
-        # 전국 순위 계산 (1부터 시작, 같은 가격은 같은 순위)
-        national_rank = national_higher_count + 1
-        
-        # 전국 평균 평당가 계산
-        national_average_price_per_pyeong = sum(national_sorted_prices) / national_total_count
-        
-        # 7. 동 내 percentile 계산 (선택적)
-        same_region_apts_stmt = (
-            select(Apartment.apt_id)
-            .where(
-                Apartment.region_id == region_id,
-                (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None))
-            )
-        )
-        same_region_result = await db.execute(same_region_apts_stmt)
-        same_region_apt_ids = [row[0] for row in same_region_result.fetchall()]
+        # 5. 전국 percentile 계산 (이진 탐색, 가격이 높을수록 상위, 같은 가격은 같은 순위)
+        national = snapshot.national_rank(target_price_per_pyeong)
+        national_percentile = national.percentile
+        national_rank = national.rank
+        national_average_price_per_pyeong = national.average
         
+        # 6. 동 내 percentile 계산 (선택적, 동 내 5개 이상일 때만)
         region_percentile = None
         region_rank = None
         region_total_count = None
         region_average_price_per_pyeong = None
         
-        if same_region_apt_ids:
-            # 동 내 아파트의 평당가만 필터링
-            region_price_data = {apt_id: price for apt_id, price in national_price_data.items() if apt_id in same_region_apt_ids}
-            
-            if len(region_price_data) >= 5 and apt_id in region_price_data:
-                region_sorted_prices = sorted(region_price_data.values(), reverse=True)
-                region_total_count = len(region_sorted_prices)
-                region_higher_count = sum(1 for price in region_sorted_prices if price > target_price_per_pyeong)
-                region_percentile = (region_higher_count / region_total_count) * 100
-                region_rank = region_higher_count + 1
-                region_average_price_per_pyeong = sum(region_sorted_prices) / region_total_count
-        
-        # 8. 표시용 텍스트 생성 (전국 기준)
+        regional = snapshot.region_rank(region_id, target_price_per_pyeong) if region_id is not None else None
+        if regional is not None and regional.total_count >= 5:
+            region_percentile = regional.percentile
+            region_rank = regional.rank
+            region_total_count = regional.total_count
+            region_average_price_per_pyeong = regional.average
+        
+        # 7. 표시용 텍스트 생성 (전국 기준)
         display_text = f"상위 {national_percentile:.1f}% ({national_total_count}개 중 {national_rank}위)"
         
-        # 9. 응답 생성
+        # 8. 응답 생성
         response = PercentileResponse(
             apt_id=apartment.apt_id,
             apt_name=apartment.apt_name,
@@ -2615,10 +2518,12 @@ async def get_apartment_percentile(
             price_per_pyeong=round(target_price_per_pyeong, 1),
             average_price_per_pyeong=round(national_average_price_per_pyeong, 1),
             region_average_price_per_pyeong=round(region_average_price_per_pyeong, 1) if region_average_price_per_pyeong is not None else None,
-            period_months=6,
+            period_months=PERIOD_MONTHS,
             display_text=display_text
         )
         
+        # 캐시에 저장 (TTL: 10분 = 600초, 스냅샷 재구성 시 태그로 무효화)
+        await set_to_cache(cache_key, response.model_dump(), ttl=600)
         return response
         
     except HTTPException:
@@ -10,7 +10,7 @@ import logging
 import asyncio
 from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, case, desc, text
 from sqlalchemy.orm import selectinload
@@ -20,7 +20,26 @@ from app.models.apartment import Apartment
 from app.models.sale import Sale
 from app.models.rent import Rent
 from app.models.state import State
-from app.utils.cache import get_from_cache, set_to_cache, build_cache_key
+from app.models.monthly_region_stats import MonthlyRegionStats
+from app.services.monthly_region_stats_service import (
+    STATS_TYPE_JEONSE,
+    STATS_TYPE_SALE,
+    monthly_region_stats_service,
+    shift_ym,
+    ym_bounds,
+)
+from app.utils.cache import (
+    get_from_cache,
+    set_to_cache,
+    build_cache_key,
+    tag_cache_key,
+    STATS_GLOBAL_TAG,
+    get_swr_from_cache,
+    set_swr_to_cache,
+    swr_endpoint_refresh,
+)
+from app.utils.single_flight import single_flight
+from app.utils.response_cache import get_cached_response, cache_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +68,7 @@ router = APIRouter()
 async def get_regional_heatmap(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(3, ge=1, le=12, description="비교 기간 (개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -56,134 +76,57 @@ async def get_regional_heatmap(
     
     도/특별시/광역시 단위로 가격 상승률을 계산하여 반환합니다.
     """
-    cache_key = build_cache_key("dashboard", "regional-heatmap", transaction_type, str(months))
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "regional-heatmap", transaction_type, str(months)), STATS_GLOBAL_TAG)
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_regional_heatmap, transaction_type=transaction_type, months=months)
+    )
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(f" [Dashboard Heatmap] 지역별 히트맵 데이터 조회 시작 - transaction_type: {transaction_type}, months: {months}")
         
-        trans_table = get_transaction_table(transaction_type)
-        price_field = get_price_field(transaction_type, trans_table)
-        date_field = get_date_field(transaction_type, trans_table)
+        # 월별 지역 집계 테이블 기준 (평당가 계산 가능 거래가 있는 월)
+        stats_type = get_stats_transaction_type(transaction_type)
+        min_ym, max_ym = await monthly_region_stats_service.get_ym_range(db, stats_type, require_pyeong=True)
         
-        # 필터 조건 (더미 데이터 포함)
-        if transaction_type == "sale":
-            base_filter = and_(
-                trans_table.is_canceled == False,
-                (trans_table.is_deleted == False) | (trans_table.is_deleted.is_(None)),
-                trans_table.trans_price.isnot(None),
-                trans_table.exclusive_area.isnot(None),
-                trans_table.exclusive_area > 0
-            )
-        else:  # jeonse
-            base_filter = and_(
-                or_(
-                    trans_table.monthly_rent == 0,
-                    trans_table.monthly_rent.is_(None)
-                ),
-                (trans_table.is_deleted == False) | (trans_table.is_deleted.is_(None)),
-                trans_table.deposit_price.isnot(None),
-                trans_table.exclusive_area.isnot(None),
-                trans_table.exclusive_area > 0
-            )
-        
-        # 실제 데이터의 날짜 범위 확인
-        date_range_stmt = select(
-            func.min(date_field).label('min_date'),
-            func.max(date_field).label('max_date')
-        ).where(
-            and_(
-                base_filter,
-                date_field.isnot(None)
-            )
-        )
-        date_range_result = await db.execute(date_range_stmt)
-        date_range = date_range_result.first()
-        
-        if not date_range or not date_range.min_date or not date_range.max_date:
+        if not min_ym or not max_ym:
             logger.warning(f" [Dashboard Heatmap] 날짜 범위를 찾을 수 없음 - 빈 데이터 반환")
             return {
                 "success": True,
                 "data": []
             }
         
-        max_date = date_range.max_date
-        min_date = date_range.min_date
-        
-        # 최근 기간: 최대 날짜로부터 months 개월 전
-        recent_start = max_date - timedelta(days=months * 30)
-        # 이전 기간: recent_start로부터 months 개월 전
-        previous_start = recent_start - timedelta(days=months * 30)
+        # 최근 기간: 최대 월까지 months 개월
+        recent_start_ym = shift_ym(max_ym, -(months - 1))
+        # 이전 기간: recent_start_ym 직전 months 개월
+        previous_start_ym = shift_ym(recent_start_ym, -months)
         
-        # 날짜 범위가 데이터 범위를 벗어나면 조정
-        if previous_start < min_date:
-            previous_start = min_date
-        if recent_start < min_date:
-            recent_start = min_date + timedelta(days=months * 30)
-            previous_start = min_date
+        # 기간이 데이터 범위를 벗어나면 조정
+        if previous_start_ym < min_ym:
+            previous_start_ym = min_ym
+        if recent_start_ym <= min_ym:
+            recent_start_ym = shift_ym(min_ym, months)
+            previous_start_ym = min_ym
         
-        logger.info(f" [Dashboard Heatmap] 날짜 범위 - min_date: {min_date}, max_date: {max_date}, previous_start: {previous_start}, recent_start: {recent_start}, recent_end: {max_date}")
+        logger.info(f" [Dashboard Heatmap] 기간 - min_ym: {min_ym}, max_ym: {max_ym}, previous_start: {previous_start_ym}, recent_start: {recent_start_ym}, recent_end: {max_ym}")
         
         # 도/특별시/광역시 단위로 그룹화 (city_name 사용)
-        # 최근 기간 평균 가격
-        recent_prices_stmt = (
-            select(
-                State.city_name,
-                func.avg(price_field / trans_table.exclusive_area * 3.3).label('avg_price_per_pyeong'),
-                func.count(trans_table.trans_id).label('transaction_count')
-            )
-            .join(Apartment, trans_table.apt_id == Apartment.apt_id)
-            .join(State, Apartment.region_id == State.region_id)
-            .where(
-                and_(
-                    base_filter,
-                    date_field.isnot(None),
-                    date_field >= recent_start,
-                    date_field <= max_date,
-                    (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None)),
-                    trans_table.exclusive_area.isnot(None),
-                    trans_table.exclusive_area > 0
-                )
-            )
-            .group_by(State.city_name)
-            .having(func.count(trans_table.trans_id) >= 5)  # 최소 5건 이상
-        )
+        # 최근 기간 평균 평당가 (평당가 합계 / 건수)
+        recent_prices_stmt = build_city_price_per_pyeong_stmt(stats_type, recent_start_ym, max_ym)
+        # 이전 기간 평균 평당가
+        previous_prices_stmt = build_city_price_per_pyeong_stmt(stats_type, previous_start_ym, shift_ym(recent_start_ym, -1))
         
-        # 이전 기간 평균 가격
-        previous_prices_stmt = (
-            select(
-                State.city_name,
-                func.avg(price_field / trans_table.exclusive_area * 3.3).label('avg_price_per_pyeong')
-            )
-            .join(Apartment, trans_table.apt_id == Apartment.apt_id)
-            .join(State, Apartment.region_id == State.region_id)
-            .where(
-                and_(
-                    base_filter,
-                    date_field.isnot(None),
-                    date_field >= previous_start,
-                    date_field < recent_start,
-                    (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None)),
-                    trans_table.exclusive_area.isnot(None),
-                    trans_table.exclusive_area > 0
-                )
-            )
-            .group_by(State.city_name)
-            .having(func.count(trans_table.trans_id) >= 5)  # 최소 5건 이상
-        )
-        
-        recent_result, previous_result = await asyncio.gather(
-            db.execute(recent_prices_stmt),
-            db.execute(previous_prices_stmt)
-        )
-        
-        # 결과를 리스트로 변환 (세션 종료 전에 데이터 가져오기)
-        recent_rows = recent_result.fetchall()
-        previous_rows = previous_result.fetchall()
+        recent_rows = (await db.execute(recent_prices_stmt)).fetchall()
+        previous_rows = (await db.execute(previous_prices_stmt)).fetchall()
         
         # 이전 기간 가격 딕셔너리
         previous_prices = {row.city_name: float(row.avg_price_per_pyeong or 0) for row in previous_rows}
@@ -221,7 +164,7 @@ async def get_regional_heatmap(
         
         # 캐시에 저장 (TTL: 30분)
         if len(heatmap_data) > 0:
-            await set_to_cache(cache_key, response_data, ttl=1800)
+            await set_swr_to_cache(cache_key, response_data, soft_ttl=1800)
         
         return response_data
         
@@ -253,6 +196,7 @@ async def get_regional_heatmap(
 async def get_regional_trends(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(12, ge=1, le=24, description="조회 기간 (개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -260,114 +204,74 @@ async def get_regional_trends(
     
     도/특별시/광역시 단위로 월별 평균 가격 추이를 반환합니다.
     """
-    cache_key = build_cache_key("dashboard", "regional-trends", transaction_type, str(months))
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "regional-trends", transaction_type, str(months)), STATS_GLOBAL_TAG)
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_regional_trends, transaction_type=transaction_type, months=months)
+    )
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(f" [Dashboard Trends] 지역별 추이 데이터 조회 시작 - transaction_type: {transaction_type}, months: {months}")
         
-        trans_table = get_transaction_table(transaction_type)
-        price_field = get_price_field(transaction_type, trans_table)
-        date_field = get_date_field(transaction_type, trans_table)
+        # 월별 지역 집계 테이블 기준 (평당가 계산 가능 거래가 있는 월)
+        stats_type = get_stats_transaction_type(transaction_type)
+        min_ym, max_ym = await monthly_region_stats_service.get_ym_range(db, stats_type, require_pyeong=True)
         
-        # 필터 조건
-        if transaction_type == "sale":
-            base_filter = and_(
-                trans_table.is_canceled == False,
-                (trans_table.is_deleted == False) | (trans_table.is_deleted.is_(None)),
-                trans_table.trans_price.isnot(None),
-                trans_table.exclusive_area.isnot(None),
-                trans_table.exclusive_area > 0
-            )
-        else:  # jeonse
-            base_filter = and_(
-                or_(
-                    trans_table.monthly_rent == 0,
-                    trans_table.monthly_rent.is_(None)
-                ),
-                (trans_table.is_deleted == False) | (trans_table.is_deleted.is_(None)),
-                trans_table.deposit_price.isnot(None),
-                trans_table.exclusive_area.isnot(None),
-                trans_table.exclusive_area > 0
-            )
+        logger.info(f" [Dashboard Trends] 집계 연월 범위 조회 결과 - min_ym: {min_ym}, max_ym: {max_ym}")
         
-        # 실제 데이터의 날짜 범위 확인 (JOIN 포함하여 실제 사용 가능한 데이터 범위 확인)
-        date_range_stmt = (
-            select(
-                func.min(date_field).label('min_date'),
-                func.max(date_field).label('max_date')
-            )
-            .select_from(trans_table)
-            .join(Apartment, trans_table.apt_id == Apartment.apt_id)
-            .join(State, Apartment.region_id == State.region_id)
-            .where(
-                and_(
-                    base_filter,
-                    date_field.isnot(None),
-                    (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None)),
-                    trans_table.exclusive_area.isnot(None),
-                    trans_table.exclusive_area > 0
-                )
-            )
-        )
-        date_range_result = await db.execute(date_range_stmt)
-        date_range = date_range_result.first()
-        
-        logger.info(f" [Dashboard Trends] DB 날짜 범위 조회 결과 - min_date: {date_range.min_date if date_range else 'None'}, max_date: {date_range.max_date if date_range else 'None'}")
-        
-        if not date_range or not date_range.min_date or not date_range.max_date:
+        if not min_ym or not max_ym:
             logger.warning(f" [Dashboard Trends] 날짜 범위를 찾을 수 없음 - 빈 데이터 반환")
             return {
                 "success": True,
                 "data": []
             }
         
-        # 데이터가 있는 기간을 기준으로 날짜 범위 설정
-        end_date = date_range.max_date
-        # months 파라미터에 따라 시작 날짜 계산 (1개월 = 약 30일)
-        start_date = max(
-            date_range.min_date,
-            end_date - timedelta(days=months * 30)
-        )
+        # 데이터가 있는 마지막 월을 기준으로 months 개월
+        requested_start_ym = shift_ym(max_ym, -(months - 1))
+        start_ym = max(min_ym, requested_start_ym)
+        start_date = ym_bounds(start_ym)[0]
+        end_date = ym_bounds(max_ym)[1]
         
         # 요청된 기간 vs 실제 사용되는 기간 로깅
-        requested_start = end_date - timedelta(days=months * 30)
-        logger.info(f" [Dashboard Trends] 날짜 범위 - min_date: {date_range.min_date}, max_date: {date_range.max_date}")
-        logger.info(f" [Dashboard Trends] 요청 기간: {months}개월, 요청 시작일: {requested_start}, 실제 시작일: {start_date}, 종료일: {end_date}")
-        if start_date > requested_start:
-            logger.warning(f" [Dashboard Trends] 데이터베이스에 {months}개월 전 데이터가 없음 - 사용 가능한 최소 날짜({date_range.min_date})부터 조회")
+        logger.info(f" [Dashboard Trends] 요청 기간: {months}개월, 요청 시작월: {requested_start_ym}, 실제 시작월: {start_ym}, 종료월: {max_ym}")
+        if start_ym > requested_start_ym:
+            logger.warning(f" [Dashboard Trends] 데이터베이스에 {months}개월 전 데이터가 없음 - 사용 가능한 최소 월({min_ym})부터 조회")
         
-        # 월별 그룹화 표현식
-        month_expr = func.to_char(date_field, 'YYYY-MM')
+        # 월 표현식 (YYYYMM → YYYY-MM)
+        month_expr = func.concat(
+            func.substr(MonthlyRegionStats.ym, 1, 4), '-', func.substr(MonthlyRegionStats.ym, 5, 2)
+        )
         
-        # 지역별 월별 평균 가격 조회 (months 개월 전부터 오늘까지)
+        # 지역별 월별 평균 평당가 조회 (평당가 합계 / 건수)
+        pyeong_count_sum = func.sum(MonthlyRegionStats.pyeong_count)
         regional_trends_stmt = (
             select(
                 State.city_name,
                 month_expr.label('month'),
-                func.avg(price_field / trans_table.exclusive_area * 3.3).label('avg_price_per_pyeong'),
-                func.count(trans_table.trans_id).label('transaction_count')
+                (func.sum(MonthlyRegionStats.total_price_per_pyeong) / pyeong_count_sum).label('avg_price_per_pyeong'),
+                pyeong_count_sum.label('transaction_count')
             )
-            .join(Apartment, trans_table.apt_id == Apartment.apt_id)
-            .join(State, Apartment.region_id == State.region_id)
+            .select_from(MonthlyRegionStats)
+            .join(State, MonthlyRegionStats.region_id == State.region_id)
             .where(
                 and_(
-                    base_filter,
-                    date_field.isnot(None),
-                    date_field >= start_date,  # 1년 전부터
-                    date_field <= end_date,  # 오늘까지
-                    (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None)),
-                    trans_table.exclusive_area.isnot(None),
-                    trans_table.exclusive_area > 0
+                    MonthlyRegionStats.transaction_type == stats_type,
+                    MonthlyRegionStats.ym >= start_ym,
+                    MonthlyRegionStats.ym <= max_ym,
+                    MonthlyRegionStats.pyeong_count > 0
                 )
             )
-            .group_by(State.city_name, month_expr)
-            .having(func.count(trans_table.trans_id) >= 1)  # 최소 1건 이상 (더 많은 데이터 포함)
-            .order_by(State.city_name, month_expr)  # 지역별, 월별 정렬
+            .group_by(State.city_name, MonthlyRegionStats.ym)
+            .order_by(State.city_name, MonthlyRegionStats.ym)  # 지역별, 월별 정렬
         )
         
         result = await db.execute(regional_trends_stmt)
@@ -497,14 +401,14 @@ async def get_regional_trends(
                 "actual_months": actual_months_count,
                 "data_start_date": str(start_date),
                 "data_end_date": str(end_date),
-                "db_min_date": str(date_range.min_date),
-                "db_max_date": str(date_range.max_date)
+                "db_min_date": str(ym_bounds(min_ym)[0]),
+                "db_max_date": str(end_date)
             }
         }
         
         # 캐시에 저장 (TTL: 30분)
         if len(regional_trends) > 0:
-            await set_to_cache(cache_key, response_data, ttl=1800)
+            await set_swr_to_cache(cache_key, response_data, soft_ttl=1800)
         
         return response_data
         
@@ -546,6 +450,41 @@ def get_date_field(transaction_type: str, table):
         return table.contract_date
 
 
+def get_stats_transaction_type(transaction_type: str) -> str:
+    """거래 유형에 따른 월별 지역 집계(monthly_region_stats) 거래 유형 반환"""
+    if transaction_type == "jeonse":
+        return STATS_TYPE_JEONSE
+    return STATS_TYPE_SALE
+
+
+def build_city_price_per_pyeong_stmt(stats_type: str, start_ym: str, end_ym: str):
+    """
+    시도별 평균 평당가 조회 쿼리 (월별 지역 집계 기반, 최소 5건 이상)
+    
+    평균 평당가 = 평당가 합계 / 평당가 계산 가능 거래 건수
+    """
+    pyeong_count_sum = func.sum(MonthlyRegionStats.pyeong_count)
+    return (
+        select(
+            State.city_name,
+            (func.sum(MonthlyRegionStats.total_price_per_pyeong) / pyeong_count_sum).label('avg_price_per_pyeong'),
+            pyeong_count_sum.label('transaction_count')
+        )
+        .select_from(MonthlyRegionStats)
+        .join(State, MonthlyRegionStats.region_id == State.region_id)
+        .where(
+            and_(
+                MonthlyRegionStats.transaction_type == stats_type,
+                MonthlyRegionStats.ym >= start_ym,
+                MonthlyRegionStats.ym <= end_ym,
+                MonthlyRegionStats.pyeong_count > 0
+            )
+        )
+        .group_by(State.city_name)
+        .having(pyeong_count_sum >= 5)  # 최소 5건 이상
+    )
+
+
 @router.get(
     "/advanced-charts/price-distribution",
     response_model=dict,
@@ -561,14 +500,20 @@ def get_date_field(transaction_type: str, table):
 )
 async def get_price_distribution(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """가격대별 아파트 분포 조회 (히스토그램용)"""
-    cache_key = build_cache_key("dashboard", "price-distribution", transaction_type)
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "price-distribution", transaction_type), STATS_GLOBAL_TAG)
+    
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
     
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(f" [Dashboard Advanced] 가격 분포 조회 시작 - transaction_type: {transaction_type}")
@@ -673,14 +618,20 @@ async def get_price_distribution(
 async def get_regional_price_correlation(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(3, ge=1, le=12, description="비교 기간 (개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """지역별 가격 상관관계 조회 (버블 차트용)"""
-    cache_key = build_cache_key("dashboard", "price-correlation", transaction_type, str(months))
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "price-correlation", transaction_type, str(months)), STATS_GLOBAL_TAG)
+    
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
     
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(f" [Dashboard Advanced] 가격 상관관계 조회 시작 - transaction_type: {transaction_type}, months: {months}")
@@ -865,6 +816,7 @@ async def get_regional_price_correlation(
 async def get_dashboard_summary(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(6, ge=1, le=12, description="조회 기간 (개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -873,12 +825,20 @@ async def get_dashboard_summary(
     전국 평당가 및 거래량 추이, 월간 아파트 값 추이를 반환합니다.
     """
     # 캐시 키 생성
-    cache_key = build_cache_key("dashboard", "summary", transaction_type, str(months))
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "summary", transaction_type, str(months)), STATS_GLOBAL_TAG)
     
-    # 1. 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 1. 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_dashboard_summary, transaction_type=transaction_type, months=months)
+    )
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         # 2. 캐시 미스: 데이터베이스에서 조회
@@ -1145,8 +1105,8 @@ async def get_dashboard_summary(
         
         if has_data:
             logger.info(f" [Dashboard] 데이터가 있으므로 캐시에 저장")
-            # 3. 캐시에 저장 (TTL: 6시간 = 21600초)
-            await set_to_cache(cache_key, response_data, ttl=21600)
+            # 3. 캐시에 저장 (soft TTL: 6시간 = 21600초)
+            await set_swr_to_cache(cache_key, response_data, soft_ttl=21600)
         else:
             logger.warning(f" [Dashboard] 데이터가 없으므로 캐시에 저장하지 않음")
         
@@ -1185,6 +1145,7 @@ async def get_dashboard_rankings(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     trending_days: int = Query(7, ge=1, le=30, description="관심 많은 아파트 조회 기간 (일)"),
     trend_months: int = Query(3, ge=1, le=120, description="상승/하락률 계산 기간 (개월, 최대 120개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -1193,12 +1154,30 @@ async def get_dashboard_rankings(
     요즘 관심 많은 아파트, 상승률 TOP 5, 하락률 TOP 5를 반환합니다.
     """
     # 캐시 키 생성
-    cache_key = build_cache_key("dashboard", "rankings", transaction_type, str(trending_days), str(trend_months))
+    cache_key = await tag_cache_key(build_cache_key("dashboard", "rankings", transaction_type, str(trending_days), str(trend_months)), STATS_GLOBAL_TAG)
     
-    # 1. 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 1. 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(
+            get_dashboard_rankings,
+            transaction_type=transaction_type,
+            trending_days=trending_days,
+            trend_months=trend_months
+        )
+    )
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
+    
+    # 캐시 미스: 같은 키를 동시에 계산하지 않도록 요청 병합
+    flight = await single_flight.acquire(cache_key)
+    if flight.value is not None:
+        return await flight.to_response(http_request)
     
     try:
         # 2. 캐시 미스: 데이터베이스에서 조회
@@ -1788,11 +1767,11 @@ async def get_dashboard_rankings(
         
         if has_data:
             logger.info(f" [Dashboard Rankings] 데이터가 있으므로 캐시에 저장")
-            # 3. 캐시에 저장 (TTL: 6시간 = 21600초)
-            await set_to_cache(cache_key, response_data, ttl=21600)
-        else:
-            logger.warning(f" [Dashboard Rankings] 데이터가 없으므로 캐시에 저장하지 않음")
+            # 3. 캐시에 저장 (soft TTL: 6시간 = 21600초)
+            await flight.set(response_data, ttl=21600, swr=True)
+            return await cache_json_response(http_request, cache_key, response_data)
         
+        logger.warning(f" [Dashboard Rankings] 데이터가 없으므로 캐시에 저장하지 않음")
         return response_data
         
     except Exception as e:
@@ -1822,10 +1801,15 @@ async def get_dashboard_rankings(
         print(f"  trend_months: {trend_months}")
         print(f"  스택 트레이스:\n{error_traceback}")
         
-        raise HTTPException(
+        error = HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"데이터 조회 중 오류가 발생했습니다: {error_type}: {error_message}"
         )
+        # 같은 키를 기다리던 요청에도 같은 오류 전달 (동시 재계산 방지)
+        flight.fail(error)
+        raise error
+    finally:
+        await flight.release()
 
 
 @router.get(
@@ -1931,7 +1915,7 @@ async def get_dashboard_rankings_region(
     cache_key_parts = ["dashboard", "rankings_region", transaction_type, str(trending_days), str(trend_months)]
     if region_name:
         cache_key_parts.append(region_name)
-    cache_key = build_cache_key(*cache_key_parts)
+    cache_key = await tag_cache_key(build_cache_key(*cache_key_parts), STATS_GLOBAL_TAG)
     
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
@@ -2352,7 +2336,7 @@ async def preload_home_cache():
                         months = params.get("months", 6)
                         
                         # 캐시 키 생성
-                        cache_key = build_cache_key("dashboard", "summary", transaction_type, str(months))
+                        cache_key = await tag_cache_key(build_cache_key("dashboard", "summary", transaction_type, str(months)), STATS_GLOBAL_TAG)
                         
                         # 이미 캐시가 있는지 확인
                         existing_cache = await get_from_cache(cache_key)
@@ -2368,9 +2352,9 @@ async def preload_home_cache():
                             db=db
                         )
                         
-                        # 캐시에 저장 (TTL: 12시간)
+                        # 캐시에 저장 (soft TTL: 6시간, hard TTL: 12시간)
                         if result and result.get("success"):
-                            await set_to_cache(cache_key, result, ttl=PRELOAD_TTL)
+                            await set_swr_to_cache(cache_key, result, soft_ttl=21600, hard_ttl=PRELOAD_TTL)
                             logger.info(f" [Preload Cache] {api_name} ({transaction_type}, {months}개월) - 캐싱 완료")
                             success_count += 1
                         else:
@@ -2384,7 +2368,7 @@ async def preload_home_cache():
                         trend_months = params.get("trend_months", 3)
                         
                         # 캐시 키 생성
-                        cache_key = build_cache_key("dashboard", "rankings", transaction_type, str(trending_days), str(trend_months))
+                        cache_key = await tag_cache_key(build_cache_key("dashboard", "rankings", transaction_type, str(trending_days), str(trend_months)), STATS_GLOBAL_TAG)
                         
                         # 이미 캐시가 있는지 확인
                         existing_cache = await get_from_cache(cache_key)
@@ -2401,9 +2385,9 @@ async def preload_home_cache():
                             db=db
                         )
                         
-                        # 캐시에 저장 (TTL: 12시간)
+                        # 캐시에 저장 (soft TTL: 6시간, hard TTL: 12시간)
                         if result and result.get("success"):
-                            await set_to_cache(cache_key, result, ttl=PRELOAD_TTL)
+                            await set_swr_to_cache(cache_key, result, soft_ttl=21600, hard_ttl=PRELOAD_TTL)
                             logger.info(f" [Preload Cache] {api_name} ({transaction_type}) - 캐싱 완료")
                             success_count += 1
                         else:
@@ -2418,9 +2402,9 @@ async def preload_home_cache():
                         quadrant_period = params.get("quadrant_period_months", 2)
                         
                         # RVOL 캐시 키
-                        rvol_cache_key = build_cache_key("statistics", "rvol_v2", transaction_type, str(current_period), str(average_period))
+                        rvol_cache_key = await tag_cache_key(build_cache_key("statistics", "rvol_v2", transaction_type, str(current_period), str(average_period)), STATS_GLOBAL_TAG)
                         # Quadrant 캐시 키
-                        quadrant_cache_key = build_cache_key("statistics", "quadrant_v2", str(quadrant_period))
+                        quadrant_cache_key = await tag_cache_key(build_cache_key("statistics", "quadrant_v2", str(quadrant_period)), STATS_GLOBAL_TAG)
                         
                         # 이미 캐시가 있는지 확인 (둘 다 있어야 함)
                         rvol_cache = await get_from_cache(rvol_cache_key)
@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from app.api.v1.deps import get_db, get_db_no_auto_commit
 from app.services.data_collection import data_collection_service
+from app.services.data_collection.utils.work_queue import collection_work_queue
 from app.schemas.state import StateCollectionResponse
 from app.schemas.apartment import ApartmentCollectionResponse
 from app.schemas.apart_detail import ApartDetailCollectionResponse
@@ -347,11 +348,15 @@ async def collect_apartments(
     - allow_duplicate: 중복 데이터 처리 방식 (선택사항, 기본값: False)
       - False: 중복 데이터 건너뛰기 (기본값)
       - True: 중복 데이터 업데이트
+    - resume: 이어서 수집 여부 (선택사항, 기본값: False)
+      - False: 기간 내 모든 (연월, 지역) 작업 단위를 처음부터 수집
+      - True: 작업 큐에서 완료되지 않은 단위(대기/실패/중단)만 수집
     
     **주의사항:**
     - API 호출량이 많을 수 있으므로 기간을 짧게 설정하는 것이 좋습니다.
     - 이미 수집된 데이터는 중복 저장되지 않습니다 (상세 조건 비교).
     - 병렬 처리로 인해 빠른 수집이 가능합니다 (최대 9개 동시 처리).
+    - 진행 상황은 GET /data-collection/transactions/status 로 확인할 수 있습니다.
     """,
     responses={
         200: {
@@ -368,6 +373,7 @@ async def collect_rent_transactions(
     end_ym: str = Query(..., description="종료 연월 (YYYYMM)", min_length=6, max_length=6, examples=["202412"]),
     max_items: Optional[int] = Query(None, description="최대 수집 개수 제한 (None이면 제한 없음)", ge=1),
     allow_duplicate: bool = Query(False, description="중복 데이터 처리 (False=건너뛰기, True=업데이트)"),
+    resume: bool = Query(False, description="이어서 수집 (True=작업 큐에서 완료되지 않은 연월/지역만 수집)"),
     db: AsyncSession = Depends(get_db)
 ) -> RentCollectionResponse:
     """
@@ -378,6 +384,7 @@ async def collect_rent_transactions(
         end_ym: 종료 연월 (YYYYMM)
         max_items: 최대 수집 개수 제한 (선택사항)
         allow_duplicate: 중복 데이터 처리 방식 (False=건너뛰기, True=업데이트)
+        resume: 이어서 수집 여부 (작업 큐 기준)
         db: 데이터베이스 세션
         
     Returns:
@@ -388,6 +395,7 @@ async def collect_rent_transactions(
         logger.info(f" 전월세 실거래가 수집 요청: {start_ym} ~ {end_ym}")
         logger.info(f"    최대 수집 개수: {max_items if max_items else '제한 없음'}")
         logger.info(f"    중복 처리: {'업데이트' if allow_duplicate else '건너뛰기'}")
+        logger.info(f"    실행 방식: {'이어서 수집' if resume else '처음부터 수집'}")
         logger.info("=" * 60)
         
         result = await data_collection_service.collect_rent_data(
@@ -395,7 +403,8 @@ async def collect_rent_transactions(
             start_ym, 
             end_ym,
             max_items=max_items,
-            allow_duplicate=allow_duplicate
+            allow_duplicate=allow_duplicate,
+            resume=resume
         )
         
         return result
@@ -447,11 +456,15 @@ async def collect_rent_transactions(
     - allow_duplicate: 중복 데이터 처리 방식 (선택사항, 기본값: False)
       - False: 중복 데이터 건너뛰기 (기본값)
       - True: 중복 데이터 업데이트
+    - resume: 이어서 수집 여부 (선택사항, 기본값: False)
+      - False: 기간 내 모든 (연월, 지역) 작업 단위를 처음부터 수집
+      - True: 작업 큐에서 완료되지 않은 단위(대기/실패/중단)만 수집
     
     **주의사항:**
     - API 호출량이 많을 수 있으므로 기간을 짧게 설정하는 것이 좋습니다.
     - 이미 수집된 데이터는 중복 저장되지 않습니다 (상세 조건 비교).
     - 병렬 처리로 인해 빠른 수집이 가능합니다 (최대 9개 동시 처리).
+    - 진행 상황은 GET /data-collection/transactions/status 로 확인할 수 있습니다.
     """,
     responses={
         200: {
@@ -468,6 +481,7 @@ async def collect_sales_transactions(
     end_ym: str = Query(..., description="종료 연월 (YYYYMM)", min_length=6, max_length=6, examples=["202412"]),
     max_items: Optional[int] = Query(None, description="최대 수집 개수 제한 (None이면 제한 없음)", ge=1),
     allow_duplicate: bool = Query(False, description="중복 데이터 처리 (False=건너뛰기, True=업데이트)"),
+    resume: bool = Query(False, description="이어서 수집 (True=작업 큐에서 완료되지 않은 연월/지역만 수집)"),
     db: AsyncSession = Depends(get_db)
 ) -> SalesCollectionResponse:
     """
@@ -478,6 +492,7 @@ async def collect_sales_transactions(
         end_ym: 종료 연월 (YYYYMM)
         max_items: 최대 수집 개수 제한 (선택사항)
         allow_duplicate: 중복 데이터 처리 방식 (False=건너뛰기, True=업데이트)
+        resume: 이어서 수집 여부 (작업 큐 기준)
         db: 데이터베이스 세션
         
     Returns:
@@ -488,6 +503,7 @@ async def collect_sales_transactions(
         logger.info(f" 매매 실거래가 수집 요청: {start_ym} ~ {end_ym}")
         logger.info(f"    최대 수집 개수: {max_items if max_items else '제한 없음'}")
         logger.info(f"    중복 처리: {'업데이트' if allow_duplicate else '건너뛰기'}")
+        logger.info(f"    실행 방식: {'이어서 수집' if resume else '처음부터 수집'}")
         logger.info("=" * 60)
         
         result = await data_collection_service.collect_sales_data(
@@ -495,7 +511,8 @@ async def collect_sales_transactions(
             start_ym, 
             end_ym,
             max_items=max_items,
-            allow_duplicate=allow_duplicate
+            allow_duplicate=allow_duplicate,
+            resume=resume
         )
         
         return result
@@ -520,6 +537,55 @@ async def collect_sales_transactions(
         )
 
 
+@router.get(
+    "/transactions/status",
+    status_code=status.HTTP_200_OK,
+    tags=[" Data Collection (데이터 수집)"],
+    summary="실거래가 수집 작업 큐 진행 상황",
+    description="""
+    매매/전월세 수집 작업 큐((연월, 시군구) 단위)의 진행 상황을 조회합니다.
+    
+    **응답 내용:**
+    - status_counts: 상태별 작업 단위 수 (pending, running, done, failed)
+    - progress: 완료 비율 (%)
+    - months: 연월별 상태별 작업 단위 수
+    - avg_duration_ms / max_duration_ms: 작업 단위 처리 시간
+    - failed_units: 실패한 작업 단위 목록 (시도 횟수, 마지막 오류)
+    
+    실패/중단된 단위는 수집 API를 resume=true 로 다시 호출하면 이어서 수집합니다.
+    """
+)
+async def get_transaction_collection_status(
+    kind: str = Query("sales", description="수집 종류 (sales=매매, rents=전월세)", pattern="^(sales|rents)$"),
+    start_ym: Optional[str] = Query(None, description="시작 연월 (YYYYMM)", min_length=6, max_length=6),
+    end_ym: Optional[str] = Query(None, description="종료 연월 (YYYYMM)", min_length=6, max_length=6),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    실거래가 수집 작업 큐 진행 상황 조회
+    
+    Args:
+        kind: 수집 종류 (sales, rents)
+        start_ym: 시작 연월 (선택사항)
+        end_ym: 종료 연월 (선택사항)
+        db: 데이터베이스 세션
+        
+    Returns:
+        작업 큐 진행 상황
+    """
+    try:
+        return await collection_work_queue.get_status(db, kind, start_ym, end_ym)
+    except Exception as e:
+        logger.error(f" 수집 작업 큐 조회 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "QUEUE_STATUS_ERROR",
+                "message": f"수집 작업 큐 조회 중 오류가 발생했습니다: {str(e)}"
+            }
+        )
+
+
 @router.post(
     "/house-scores",
     response_model=HouseScoreCollectionResponse,
@@ -9,7 +9,7 @@ from datetime import date, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Body, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, func, and_, or_
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,7 @@ from app.utils.cache import (
     get_favorite_apartments_count_cache_key,
     get_favorite_apartment_pattern_key
 )
+from app.services.apartment_price_summary_service import apartment_price_summary_service
 from app.services.asset_activity_service import (
     log_apartment_added,
     log_apartment_deleted
@@ -521,78 +522,22 @@ async def get_favorite_apartments(
         if fav.apartment and fav.apartment.region:
             region_ids.add(fav.apartment.region.region_id)
     
-    # 2. 모든 아파트의 최신 거래가 일괄 조회 (N+1 → 1개 쿼리)
+    # 2. 모든 아파트의 최신 거래가 일괄 조회 (아파트별 가격 요약, 기본키 조회 1회)
     latest_sales_map = {}  # apt_id -> {price, area, date}
     if apt_ids:
         try:
-            from sqlalchemy.dialects.postgresql import aggregate_order_by
-            # PostgreSQL의 DISTINCT ON을 사용하여 각 apt_id별 최신 거래 1건씩만 조회
-            latest_sales_stmt = (
-                select(
-                    Sale.apt_id,
-                    Sale.trans_price,
-                    Sale.exclusive_area,
-                    Sale.contract_date
-                )
-                .where(
-                    Sale.apt_id.in_(apt_ids),
-                    Sale.is_canceled == False,
-                    (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-                    Sale.trans_price.isnot(None),
-                    Sale.trans_price > 0,
-                    Sale.exclusive_area.isnot(None),
-                    Sale.exclusive_area > 0
-                )
-                .distinct(Sale.apt_id)
-                .order_by(Sale.apt_id, desc(Sale.contract_date))
-            )
-            sales_result = await db.execute(latest_sales_stmt)
-            for sale in sales_result.fetchall():
-                latest_sales_map[sale.apt_id] = {
-                    "price": int(sale.trans_price),
-                    "area": float(sale.exclusive_area) if sale.exclusive_area else None,
-                    "date": sale.contract_date
-                }
+            summaries = await apartment_price_summary_service.get_summaries(db, apt_ids)
+            for (summary_apt_id, _, _), summary in summaries.items():
+                if summary["latest_price"]:
+                    latest_sales_map[summary_apt_id] = {
+                        "price": int(summary["latest_price"]),
+                        "area": float(summary["latest_area"]) if summary["latest_area"] else None,
+                        "date": summary["latest_date"]
+                    }
             logger.info(f" 최신 거래가 일괄 조회 완료 - {len(latest_sales_map)}건")
         except Exception as e:
             logger.warning(f" 최신 거래가 일괄 조회 실패: {str(e)}")
     
-    # 3. Fallback: 최신 거래가 없는 아파트들의 평균가 일괄 조회
-    missing_apt_ids = [apt_id for apt_id in apt_ids if apt_id not in latest_sales_map]
-    if missing_apt_ids:
-        try:
-            from datetime import datetime as dt
-            one_year_ago = date.today() - timedelta(days=365)
-            avg_sales_stmt = (
-                select(
-                    Sale.apt_id,
-                    func.avg(Sale.trans_price).label('avg_price'),
-                    func.avg(Sale.exclusive_area).label('avg_area')
-                )
-                .where(
-                    Sale.apt_id.in_(missing_apt_ids),
-                    Sale.is_canceled == False,
-                    (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-                    Sale.trans_price.isnot(None),
-                    Sale.trans_price > 0,
-                    Sale.exclusive_area.isnot(None),
-                    Sale.exclusive_area > 0,
-                    Sale.contract_date >= one_year_ago
-                )
-                .group_by(Sale.apt_id)
-            )
-            avg_result = await db.execute(avg_sales_stmt)
-            for avg_sale in avg_result.fetchall():
-                if avg_sale.avg_price:
-                    latest_sales_map[avg_sale.apt_id] = {
-                        "price": int(avg_sale.avg_price),
-                        "area": float(avg_sale.avg_area) if avg_sale.avg_area else None,
-                        "date": None
-                    }
-            logger.info(f" 평균 거래가 일괄 조회 완료 - {len(missing_apt_ids)}건 중 {len([a for a in missing_apt_ids if a in latest_sales_map])}건 매칭")
-        except Exception as e:
-            logger.warning(f" 평균 거래가 일괄 조회 실패: {str(e)}")
-    
     # 4. 지역별 부동산 지수 일괄 조회 (N+1 → 1개 쿼리)
     from datetime import datetime as dt
     from app.models.house_score import HouseScore
@@ -10,7 +10,7 @@ import logging
 import asyncio
 from datetime import date, timedelta
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc, text
 from geoalchemy2 import functions as geo_func
@@ -22,7 +22,27 @@ from app.models.apart_detail import ApartDetail
 from app.models.sale import Sale
 from app.models.rent import Rent
 from app.models.state import State
-from app.utils.cache import get_from_cache, set_to_cache, build_cache_key
+from app.models.monthly_region_stats import MonthlyRegionStats
+from app.utils.cache import (
+    get_from_cache,
+    set_to_cache,
+    get_many_from_cache,
+    set_many_to_cache,
+    build_cache_key,
+    get_swr_from_cache,
+    set_swr_to_cache,
+    swr_endpoint_refresh,
+)
+from app.utils.response_cache import get_cached_response, cache_json_response
+from app.services.monthly_region_stats_service import STATS_TYPE_JEONSE, STATS_TYPE_SALE, ym_of
+from app.services.apartment_price_summary_service import AREA_BUCKET_ALL, SUMMARY_WINDOWS
+from app.utils.map_tiles import (
+    point_in_bounds,
+    squared_distance_to_center,
+    tile_bounds,
+    tile_zoom_for_level,
+    tiles_for_bounds,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,14 +53,11 @@ REGION_CACHE_TTL = 7200  # 2시간 (동/시군구 레벨)
 APARTMENT_CACHE_TTL = 3600  # 1시간 (아파트 레벨)
 MAP_CACHE_TTL = 1200  # 기본값 (하위 호환성)
 
-
-def round_bounds(val: float, precision: int = 3) -> str:
-    """
-    캐시 키용 좌표 반올림
-    precision=3은 약 111m 정밀도
-    precision=2는 약 1.1km 정밀도
-    """
-    return str(round(val, precision))
+# 타일 캐시: 타일당 최대 항목 수 (뷰포트 결과 제한보다 넉넉하게), 뷰포트 결과 제한
+TILE_ITEM_LIMIT = 500
+APARTMENT_RESULT_LIMIT = 50
+REGION_RESULT_LIMIT = 100
+TILE_EDGE_EPSILON = 1e-9
 
 
 class MapBoundsRequest(BaseModel):
@@ -135,12 +152,17 @@ def get_data_type_by_zoom(zoom_level: int) -> str:
     - `data_type`: 반환 데이터 타입 (regions / apartments)
     - `regions`: 지역별 데이터 (시/도, 시군구, 동)
     - `apartments`: 아파트별 데이터
+    
+    ### 캐싱
+    - 시군구/동/아파트 레벨은 영역을 고정 타일(z/x/y)로 나누어 타일별로 캐싱합니다.
+      지도를 조금 이동해도 겹치는 타일은 캐시를 그대로 사용하고 새로 보이는 타일만 계산합니다.
     """
 )
 async def get_map_bounds_data(
     request: MapBoundsRequest,
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(6, ge=1, le=24, description="평균가 계산 기간 (개월)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -151,24 +173,9 @@ async def get_map_bounds_data(
     # 데이터 타입 결정 (캐시 키와 TTL 결정에 사용)
     data_type = get_data_type_by_zoom(request.zoom_level)
     
-    # 캐시 키 생성 (좌표를 3자리로 반올림하여 캐시 효율성 향상 - 약 111m 정밀도)
-    cache_key = build_cache_key(
-        "map", "bounds",
-        f"{round_bounds(request.sw_lat)}_{round_bounds(request.sw_lng)}_{round_bounds(request.ne_lat)}_{round_bounds(request.ne_lng)}",
-        str(request.zoom_level),
-        transaction_type,
-        str(months)
-    )
-    
     # 데이터 타입에 따른 캐시 TTL 결정
     cache_ttl = REGION_CACHE_TTL if data_type in ["sido", "sigungu", "dong"] else APARTMENT_CACHE_TTL
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
-    if cached_data is not None:
-        logger.info(f"[Map Bounds] Cache hit - zoom: {request.zoom_level}")
-        return cached_data
-    
     try:
         logger.info(
             f"[Map Bounds] Request - "
@@ -177,58 +184,74 @@ async def get_map_bounds_data(
             f"transaction_type: {transaction_type}"
         )
         
-        if data_type in ["sido", "sigungu", "dong"]:
-            # 시/도, 시군구 또는 동 레벨 데이터 조회
-            logger.info(f"[Map Bounds] Fetching region prices for type: {data_type}")
-            result = await get_region_prices(
-                db=db,
-                sw_lat=request.sw_lat,
-                sw_lng=request.sw_lng,
-                ne_lat=request.ne_lat,
-                ne_lng=request.ne_lng,
-                region_type=data_type,
-                transaction_type=transaction_type,
-                months=months
-            )
+        if data_type == "sido":
+            # 시/도 레벨은 영역과 무관한 전국 집계이므로 키 하나로 캐싱
+            cache_key = build_cache_key("map", "bounds", "sido", transaction_type, str(months))
             
-            logger.info(f"[Map Bounds] Region prices result count: {len(result)}")
+            # 응답에 zoom_level 이 들어가므로 직렬화된 응답은 확대 레벨별로 저장
+            # (원본 키의 파생 키가 아니므로 RESPONSE_CACHE_TTL 이 지나야 갱신됨)
+            response_cache_key = f"{cache_key}:z{request.zoom_level}"
+            cached_response = await get_cached_response(http_request, response_cache_key)
+            if cached_response is not None:
+                return cached_response
             
-            response_data = MapDataResponse(
-                success=True,
-                data_type="regions",
-                regions=result,
-                apartments=None,
-                zoom_level=request.zoom_level,
-                total_count=len(result)
-            )
+            items = await get_from_cache(cache_key)
+            if items is None:
+                result = await get_region_prices(
+                    db=db,
+                    sw_lat=request.sw_lat,
+                    sw_lng=request.sw_lng,
+                    ne_lat=request.ne_lat,
+                    ne_lng=request.ne_lng,
+                    region_type=data_type,
+                    transaction_type=transaction_type,
+                    months=months
+                )
+                items = [item.model_dump() for item in result]
+                await set_to_cache(cache_key, items, ttl=cache_ttl)
+            else:
+                logger.info(f"[Map Bounds] Cache hit - zoom: {request.zoom_level}")
+                return await cache_json_response(
+                    http_request,
+                    response_cache_key,
+                    MapDataResponse(
+                        success=True,
+                        data_type="regions",
+                        regions=items,
+                        apartments=None,
+                        zoom_level=request.zoom_level,
+                        total_count=len(items)
+                    )
+                )
         else:
-            # 아파트 레벨 데이터 조회
-            logger.info(f"[Map Bounds] Fetching apartment prices")
-            result = await get_apartment_prices(
+            # 시군구/동/아파트 레벨은 타일 단위로 캐싱 후 이어 붙임
+            items = await get_tiled_map_items(
                 db=db,
-                sw_lat=request.sw_lat,
-                sw_lng=request.sw_lng,
-                ne_lat=request.ne_lat,
-                ne_lng=request.ne_lng,
+                request=request,
+                data_type=data_type,
                 transaction_type=transaction_type,
                 months=months,
-                limit=50  # 최대 50개
+                cache_ttl=cache_ttl
             )
-            
-            logger.info(f"[Map Bounds] Apartment prices result count: {len(result)}")
-            
+        
+        if data_type == "apartment":
             response_data = MapDataResponse(
                 success=True,
                 data_type="apartments",
                 regions=None,
-                apartments=result,
+                apartments=items,
                 zoom_level=request.zoom_level,
-                total_count=len(result)
+                total_count=len(items)
+            )
+        else:
+            response_data = MapDataResponse(
+                success=True,
+                data_type="regions",
+                regions=items,
+                apartments=None,
+                zoom_level=request.zoom_level,
+                total_count=len(items)
             )
-        
-        # 캐시에 저장 (데이터 타입에 따른 TTL 적용)
-        if response_data.total_count > 0:
-            await set_to_cache(cache_key, response_data.model_dump(), ttl=cache_ttl)
         
         logger.info(f"[Map Bounds] Response - data_type: {response_data.data_type}, total_count: {response_data.total_count}")
         
@@ -242,6 +265,110 @@ async def get_map_bounds_data(
         )
 
 
+async def get_tiled_map_items(
+    db: AsyncSession,
+    request: MapBoundsRequest,
+    data_type: str,
+    transaction_type: str,
+    months: int,
+    cache_ttl: int
+) -> List[Dict[str, Any]]:
+    """
+    타일 캐시 기반 지도 데이터 조회
+    
+    1. 뷰포트를 확대 레벨에 맞는 고정 타일(z/x/y)로 분할
+    2. 타일별 집계 결과를 MGET으로 한 번에 조회
+    3. 캐시에 없는 타일만 DB에서 계산 후 일괄 저장
+    4. 타일 결과를 합쳐 중복 제거 → 뷰포트 필터 → 거래량 순 정렬/제한
+    
+    타일은 뷰포트보다 넓으므로 좌표(시군구는 중심점)가 뷰포트 밖인 항목은 제외합니다.
+    시군구가 제한 개수를 넘으면 뷰포트 중심에 가까운 시군구를 우선합니다.
+    """
+    tile_zoom = tile_zoom_for_level(request.zoom_level)
+    tiles = tiles_for_bounds(request.sw_lat, request.sw_lng, request.ne_lat, request.ne_lng, tile_zoom)
+    cache_keys = [
+        build_cache_key("map", "tile", data_type, transaction_type, str(months), tile.key)
+        for tile in tiles
+    ]
+    
+    tile_items: List[Optional[List[Dict[str, Any]]]] = await get_many_from_cache(cache_keys)
+    missing = [idx for idx, items in enumerate(tile_items) if items is None]
+    
+    # 캐시에 없는 타일만 계산 (같은 세션이므로 순차 실행)
+    computed: Dict[str, List[Dict[str, Any]]] = {}
+    for idx in missing:
+        sw_lat, sw_lng, ne_lat, ne_lng = tile_bounds(tiles[idx])
+        # ST_Within은 경계를 포함하지 않으므로 인접 타일 경계 위의 좌표가 빠지지 않도록 살짝 확장 (중복은 병합 시 제거)
+        sw_lat, sw_lng = sw_lat - TILE_EDGE_EPSILON, sw_lng - TILE_EDGE_EPSILON
+        ne_lat, ne_lng = ne_lat + TILE_EDGE_EPSILON, ne_lng + TILE_EDGE_EPSILON
+        if data_type == "apartment":
+            result = await get_apartment_prices(
+                db=db,
+                sw_lat=sw_lat,
+                sw_lng=sw_lng,
+                ne_lat=ne_lat,
+                ne_lng=ne_lng,
+                transaction_type=transaction_type,
+                months=months,
+                limit=TILE_ITEM_LIMIT
+            )
+        else:
+            result = await get_region_prices(
+                db=db,
+                sw_lat=sw_lat,
+                sw_lng=sw_lng,
+                ne_lat=ne_lat,
+                ne_lng=ne_lng,
+                region_type=data_type,
+                transaction_type=transaction_type,
+                months=months,
+                limit=TILE_ITEM_LIMIT
+            )
+        tile_items[idx] = [item.model_dump() for item in result]
+        computed[cache_keys[idx]] = tile_items[idx]
+    
+    if computed:
+        await set_many_to_cache(computed, ttl=cache_ttl)
+    
+    logger.info(
+        f"[Map Bounds] Tiles - z: {tiles[0].z if tiles else tile_zoom}, "
+        f"total: {len(tiles)}, hit: {len(tiles) - len(missing)}, computed: {len(missing)}"
+    )
+    
+    # 타일 결과 병합 (타일 경계에 걸친 항목 중복 제거)
+    id_field = "apt_id" if data_type == "apartment" else "region_id"
+    merged: Dict[int, Dict[str, Any]] = {}
+    for items in tile_items:
+        for item in items or []:
+            merged.setdefault(item[id_field], item)
+    
+    bounds = (request.sw_lat, request.sw_lng, request.ne_lat, request.ne_lng)
+    stitched = list(merged.values())
+    # 타일은 뷰포트보다 넓으므로 뷰포트 밖 항목 제외 (좌표가 없는 지역은 기존 쿼리와 같이 항상 포함)
+    visible = [
+        item for item in stitched
+        if item.get("lat") is None or item.get("lng") is None
+        or point_in_bounds(item["lat"], item["lng"], *bounds)
+    ]
+    if data_type == "sigungu" and not visible:
+        # 뷰포트가 시군구 하나 안으로 확대되어 중심점이 모두 밖에 있으면 타일 결과 사용 (아래에서 가까운 순으로 제한)
+        visible = stitched
+    stitched = visible
+    
+    limit = APARTMENT_RESULT_LIMIT if data_type == "apartment" else REGION_RESULT_LIMIT
+    if data_type == "sigungu" and len(stitched) > limit:
+        # 제한에 걸리면 뷰포트 중심에 가까운 시군구를 우선
+        stitched.sort(key=lambda item: (
+            item.get("lat") is None or item.get("lng") is None,
+            squared_distance_to_center(item["lat"], item["lng"], *bounds)
+            if item.get("lat") is not None and item.get("lng") is not None else 0.0,
+            item[id_field]
+        ))
+        stitched = stitched[:limit]
+    stitched.sort(key=lambda item: (-item["transaction_count"], item[id_field]))
+    return stitched[:limit]
+
+
 @router.get(
     "/directions",
     status_code=status.HTTP_200_OK,
@@ -490,38 +617,44 @@ async def get_region_prices(
     ne_lng: float,
     region_type: str,
     transaction_type: str,
-    months: int
+    months: int,
+    limit: int = 100
 ) -> List[RegionPriceItem]:
     """
-    지역별 평균 가격 조회 (Raw SQL 최적화 버전)
+    지역별 평균 가격 조회 (월별 지역 집계 테이블 기반)
     
     최적화 전략:
-    1. CTE로 bounds 내 지역을 먼저 필터링
-    2. 필터링된 지역에 대해서만 거래 데이터 조인
-    3. 시군구/동 레벨별 최적화된 쿼리 사용
+    1. 원본 거래 테이블 대신 monthly_region_stats (지역 × 연월 × 거래 유형) 롤업을 조회
+    2. CTE로 bounds 내 지역을 먼저 필터링한 뒤 롤업과 조인
+    3. 평균가는 합계/건수로 다시 계산 (월 평균끼리 평균내지 않음)
+    
+    기간은 월 단위로 집계되므로 시작일이 속한 월 전체부터 포함합니다.
     
     Args:
         region_type: "sido", "sigungu" 또는 "dong"
+        limit: 최대 지역 수 (시군구/동 레벨)
     """
     logger.info(f"[get_region_prices] region_type: {region_type}, transaction_type: {transaction_type}, months: {months}")
     
-    # 날짜 범위
+    # 날짜 범위 (연월 단위)
     end_date = date.today()
     start_date = end_date - timedelta(days=months * 30)
+    stats_type = STATS_TYPE_SALE if transaction_type == "sale" else STATS_TYPE_JEONSE
+    stats_params = {
+        "stats_type": stats_type,
+        "start_ym": ym_of(start_date),
+        "end_ym": ym_of(end_date),
+    }
     
-    # 거래 타입에 따른 테이블/필드 선택
-    if transaction_type == "sale":
-        trans_table = "sales"
-        price_field = "trans_price"
-        date_field = "contract_date"
-        trans_id_field = "trans_id"
-        extra_filter = "AND s.is_canceled = FALSE"
-    else:  # jeonse
-        trans_table = "rents"
-        price_field = "deposit_price"
-        date_field = "deal_date"
-        trans_id_field = "rent_id"
-        extra_filter = "AND (s.monthly_rent = 0 OR s.monthly_rent IS NULL)"
+    # 거래 건수로 가중한 지역 중심 좌표 (원본 거래 단위 평균과 동일)
+    weighted_lng = "(SUM(ST_X(st.geometry) * m.price_count) / NULLIF(SUM(m.price_count) FILTER (WHERE st.geometry IS NOT NULL), 0))::FLOAT"
+    weighted_lat = "(SUM(ST_Y(st.geometry) * m.price_count) / NULLIF(SUM(m.price_count) FILTER (WHERE st.geometry IS NOT NULL), 0))::FLOAT"
+    stats_filter = """
+              m.transaction_type = :stats_type
+              AND m.ym >= :start_ym
+              AND m.ym <= :end_ym
+              AND m.price_count > 0
+    """
     
     if region_type == "sido":
         # 시/도 레벨: city_name으로 그룹화 (전국 레벨이므로 bounds 필터 없음)
@@ -530,30 +663,21 @@ async def get_region_prices(
                 MIN(st.region_id)::INT as region_id,
                 st.city_name as region_name,
                 st.city_name,
-                AVG(s.{price_field})::FLOAT as avg_price,
-                COUNT(s.{trans_id_field})::INT as transaction_count,
-                AVG(ST_X(st.geometry))::FLOAT as lng,
-                AVG(ST_Y(st.geometry))::FLOAT as lat
-            FROM {trans_table} s
-            JOIN apartments a ON s.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
-            JOIN states st ON a.region_id = st.region_id
-            WHERE (s.is_deleted = FALSE OR s.is_deleted IS NULL)
-              AND s.{price_field} IS NOT NULL
-              AND s.{date_field} >= :start_date
-              AND s.{date_field} <= :end_date
+                (SUM(m.total_price) / SUM(m.price_count))::FLOAT as avg_price,
+                SUM(m.price_count)::INT as transaction_count,
+                {weighted_lng} as lng,
+                {weighted_lat} as lat
+            FROM monthly_region_stats m
+            JOIN states st ON m.region_id = st.region_id
+            WHERE {stats_filter}
               AND st.is_deleted = FALSE
               AND st.city_name IS NOT NULL
-              {extra_filter}
             GROUP BY st.city_name
-            HAVING COUNT(s.{trans_id_field}) >= 1
             ORDER BY transaction_count DESC
             LIMIT 50
         """)
         
-        result = await db.execute(
-            raw_sql,
-            {"start_date": start_date, "end_date": end_date}
-        )
+        result = await db.execute(raw_sql, stats_params)
         rows = result.fetchall()
         
     elif region_type == "sigungu":
@@ -570,37 +694,31 @@ async def get_region_prices(
                 MIN(st.region_id)::INT as region_id,
                 MIN(st.region_name) as region_name,
                 MIN(st.city_name) as city_name,
-                AVG(s.{price_field})::FLOAT as avg_price,
-                COUNT(s.{trans_id_field})::INT as transaction_count,
-                AVG(ST_X(st.geometry))::FLOAT as lng,
-                AVG(ST_Y(st.geometry))::FLOAT as lat,
+                (SUM(m.total_price) / SUM(m.price_count))::FLOAT as avg_price,
+                SUM(m.price_count)::INT as transaction_count,
+                {weighted_lng} as lng,
+                {weighted_lat} as lat,
                 SUBSTRING(st.region_code, 1, 5) as sigungu_code
-            FROM {trans_table} s
-            JOIN apartments a ON s.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
-            JOIN states st ON a.region_id = st.region_id
+            FROM monthly_region_stats m
+            JOIN states st ON m.region_id = st.region_id
             JOIN bounded_sigungu bs ON SUBSTRING(st.region_code, 1, 5) = bs.sigungu_code
-            WHERE (s.is_deleted = FALSE OR s.is_deleted IS NULL)
-              AND s.{price_field} IS NOT NULL
-              AND s.{date_field} >= :start_date
-              AND s.{date_field} <= :end_date
+            WHERE {stats_filter}
               AND st.is_deleted = FALSE
               AND st.region_code IS NOT NULL
-              {extra_filter}
             GROUP BY SUBSTRING(st.region_code, 1, 5)
-            HAVING COUNT(s.{trans_id_field}) >= 1
             ORDER BY transaction_count DESC
-            LIMIT 100
+            LIMIT :limit
         """)
         
         result = await db.execute(
             raw_sql,
             {
+                **stats_params,
                 "sw_lat": sw_lat,
                 "sw_lng": sw_lng,
                 "ne_lat": ne_lat,
                 "ne_lng": ne_lng,
-                "start_date": start_date,
-                "end_date": end_date
+                "limit": limit
             }
         )
         rows = result.fetchall()
@@ -618,35 +736,29 @@ async def get_region_prices(
                 st.region_id::INT as region_id,
                 st.region_name,
                 st.city_name,
-                AVG(s.{price_field})::FLOAT as avg_price,
-                COUNT(s.{trans_id_field})::INT as transaction_count,
+                (SUM(m.total_price) / SUM(m.price_count))::FLOAT as avg_price,
+                SUM(m.price_count)::INT as transaction_count,
                 ST_X(st.geometry)::FLOAT as lng,
                 ST_Y(st.geometry)::FLOAT as lat
-            FROM {trans_table} s
-            JOIN apartments a ON s.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
-            JOIN states st ON a.region_id = st.region_id
+            FROM monthly_region_stats m
+            JOIN states st ON m.region_id = st.region_id
             JOIN bounded_dong bd ON st.region_id = bd.region_id
-            WHERE (s.is_deleted = FALSE OR s.is_deleted IS NULL)
-              AND s.{price_field} IS NOT NULL
-              AND s.{date_field} >= :start_date
-              AND s.{date_field} <= :end_date
+            WHERE {stats_filter}
               AND st.is_deleted = FALSE
-              {extra_filter}
             GROUP BY st.region_id, st.region_name, st.city_name, st.geometry
-            HAVING COUNT(s.{trans_id_field}) >= 1
             ORDER BY transaction_count DESC
-            LIMIT 100
+            LIMIT :limit
         """)
         
         result = await db.execute(
             raw_sql,
             {
+                **stats_params,
                 "sw_lat": sw_lat,
                 "sw_lng": sw_lng,
                 "ne_lat": ne_lat,
                 "ne_lng": ne_lng,
-                "start_date": start_date,
-                "end_date": end_date
+                "limit": limit
             }
         )
         rows = result.fetchall()
@@ -720,6 +832,7 @@ async def get_apartment_prices(
     1. CTE로 bounds 내 아파트를 먼저 필터링
     2. 필터링된 아파트에 대해서만 거래 데이터 조인
     3. 인덱스 활용을 위한 쿼리 구조 최적화
+    4. 6/12개월 평균은 원본 거래 집계 대신 아파트별 가격 요약(apartment_price_summary) 조회
     """
     logger.info(f"[get_apartment_prices] transaction_type: {transaction_type}, months: {months}, limit: {limit}")
     
@@ -727,7 +840,40 @@ async def get_apartment_prices(
     end_date = date.today()
     start_date = end_date - timedelta(days=months * 30)
     
-    if transaction_type == "sale":
+    if months in SUMMARY_WINDOWS:
+        # 요약 테이블에 있는 기간(6/12개월)은 아파트별 가격 요약에서 기본키 조회
+        window = f"{months}m"
+        raw_sql = text(f"""
+            WITH bounded_apts AS (
+                SELECT ad.apt_id, ad.road_address, ad.jibun_address, ad.geometry
+                FROM apart_details ad
+                WHERE (ad.is_deleted = FALSE OR ad.is_deleted IS NULL)
+                  AND ad.geometry IS NOT NULL
+                  AND ST_Within(ad.geometry, ST_MakeEnvelope(:sw_lng, :sw_lat, :ne_lng, :ne_lat, 4326))
+            )
+            SELECT 
+                a.apt_id,
+                a.apt_name,
+                ba.road_address,
+                ba.jibun_address,
+                ps.avg_price_{window}::FLOAT as avg_price,
+                ps.min_price_{window}::FLOAT as min_price,
+                ps.max_price_{window}::FLOAT as max_price,
+                ps.avg_price_per_pyeong_{window}::FLOAT as price_per_pyeong,
+                ps.count_{window}::INT as transaction_count,
+                ST_X(ba.geometry)::FLOAT as lng,
+                ST_Y(ba.geometry)::FLOAT as lat
+            FROM bounded_apts ba
+            JOIN apartments a ON ba.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+            JOIN apartment_price_summary ps
+              ON ps.apt_id = a.apt_id
+             AND ps.transaction_type = :summary_type
+             AND ps.area_bucket = :area_bucket
+            WHERE ps.count_{window} >= 1
+            ORDER BY transaction_count DESC
+            LIMIT :limit
+        """)
+    elif transaction_type == "sale":
         # 매매 데이터 Raw SQL (CTE로 bounds 필터 우선 적용)
         raw_sql = text("""
             WITH bounded_apts AS (
@@ -783,7 +929,7 @@ async def get_apartment_prices(
                 MIN(r.deposit_price)::FLOAT as min_price,
                 MAX(r.deposit_price)::FLOAT as max_price,
                 AVG(r.deposit_price / NULLIF(r.exclusive_area, 0) * 3.3)::FLOAT as price_per_pyeong,
-                COUNT(r.rent_id)::INT as transaction_count,
+                COUNT(r.trans_id)::INT as transaction_count,
                 ST_X(ba.geometry)::FLOAT as lng,
                 ST_Y(ba.geometry)::FLOAT as lat
             FROM bounded_apts ba
@@ -797,7 +943,7 @@ async def get_apartment_prices(
               AND r.deal_date >= :start_date
               AND r.deal_date <= :end_date
             GROUP BY a.apt_id, a.apt_name, ba.road_address, ba.jibun_address, ba.geometry
-            HAVING COUNT(r.rent_id) >= 1
+            HAVING COUNT(r.trans_id) >= 1
             ORDER BY transaction_count DESC
             LIMIT :limit
         """)
@@ -811,6 +957,8 @@ async def get_apartment_prices(
             "ne_lng": ne_lng,
             "start_date": start_date,
             "end_date": end_date,
+            "summary_type": STATS_TYPE_SALE if transaction_type == "sale" else STATS_TYPE_JEONSE,
+            "area_bucket": AREA_BUCKET_ALL,
             "limit": limit
         }
     )
@@ -864,6 +1012,7 @@ async def get_all_region_prices(
     transaction_type: str = Query("sale", description="거래 유형: sale(매매), jeonse(전세)"),
     months: int = Query(6, ge=1, le=24, description="평균가 계산 기간 (개월)"),
     city_name: Optional[str] = Query(None, description="시도명 필터 (예: 서울특별시)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -877,32 +1026,28 @@ async def get_all_region_prices(
         city_name or "all"
     )
     
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(
+            get_all_region_prices,
+            region_type=region_type,
+            transaction_type=transaction_type,
+            months=months,
+            city_name=city_name
+        )
+    )
     if cached_data is not None:
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
-        # 거래 테이블 및 필드 선택
-        if transaction_type == "sale":
-            trans_table = Sale
-            price_field = Sale.trans_price
-            date_field = Sale.contract_date
-            base_filter = and_(
-                Sale.is_canceled == False,
-                (Sale.is_deleted == False) | (Sale.is_deleted.is_(None)),
-                Sale.trans_price.isnot(None),
-                Sale.contract_date.isnot(None)
-            )
-        else:
-            trans_table = Rent
-            price_field = Rent.deposit_price
-            date_field = Rent.deal_date
-            base_filter = and_(
-                or_(Rent.monthly_rent == 0, Rent.monthly_rent.is_(None)),
-                (Rent.is_deleted == False) | (Rent.is_deleted.is_(None)),
-                Rent.deposit_price.isnot(None),
-                Rent.deal_date.isnot(None)
-            )
+        # 월별 지역 집계 테이블 조회 (기간은 연월 단위, 평균가는 합계/건수로 계산)
+        stats_type = STATS_TYPE_SALE if transaction_type == "sale" else STATS_TYPE_JEONSE
         
         # 날짜 범위
         end_date = date.today()
@@ -917,32 +1062,31 @@ async def get_all_region_prices(
         # 시도 필터
         city_filter = State.city_name == city_name if city_name else True
         
+        price_count_sum = func.sum(MonthlyRegionStats.price_count)
         stmt = (
             select(
                 State.region_id,
                 State.region_name,
                 State.city_name,
-                func.avg(price_field).label('avg_price'),
-                func.count(trans_table.trans_id).label('transaction_count'),
+                (func.sum(MonthlyRegionStats.total_price) / price_count_sum).label('avg_price'),
+                price_count_sum.label('transaction_count'),
                 geo_func.ST_X(State.geometry).label('lng'),
                 geo_func.ST_Y(State.geometry).label('lat')
             )
-            .select_from(trans_table)
-            .join(Apartment, trans_table.apt_id == Apartment.apt_id)
-            .join(State, Apartment.region_id == State.region_id)
+            .select_from(MonthlyRegionStats)
+            .join(State, MonthlyRegionStats.region_id == State.region_id)
             .where(
                 and_(
-                    base_filter,
-                    date_field >= start_date,
-                    date_field <= end_date,
+                    MonthlyRegionStats.transaction_type == stats_type,
+                    MonthlyRegionStats.ym >= ym_of(start_date),
+                    MonthlyRegionStats.ym <= ym_of(end_date),
+                    MonthlyRegionStats.price_count > 0,
                     region_filter,
                     city_filter,
-                    (Apartment.is_deleted == False) | (Apartment.is_deleted.is_(None)),
                     State.is_deleted == False
                 )
             )
             .group_by(State.region_id, State.region_name, State.city_name, State.geometry)
-            .having(func.count(trans_table.trans_id) >= 1)
             .order_by(desc('avg_price'))
         )
         
@@ -973,7 +1117,7 @@ async def get_all_region_prices(
         }
         
         if len(data) > 0:
-            await set_to_cache(cache_key, response_data, ttl=MAP_CACHE_TTL)
+            await set_swr_to_cache(cache_key, response_data, soft_ttl=MAP_CACHE_TTL)
         
         return response_data
         
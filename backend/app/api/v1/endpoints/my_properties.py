@@ -40,6 +40,12 @@ from app.utils.cache import (
     get_my_property_detail_cache_key,
     get_my_property_pattern_key
 )
+from app.services.apartment_price_summary_service import (
+    AREA_BUCKET_ALL,
+    apartment_price_summary_service,
+    pick_latest_by_area,
+    window_start,
+)
 from app.services.asset_activity_service import (
     log_apartment_added,
     log_apartment_deleted,
@@ -218,65 +224,63 @@ async def get_my_properties(
                 print(f"[WARNING] 부동산 지수 일괄 조회 실패: {type(e).__name__}: {str(e)}")
         
         # 3.3. 내 자산별 전용면적에 맞는 최신 매매가 조회 (최적화: 일괄 조회)
-        # N+1 문제 해결: 모든 아파트의 최근 거래를 한 번에 가져와서 메모리에서 매칭
+        # 아파트별 가격 요약의 평형별 최신 거래를 한 번에 가져와서 메모리에서 매칭
         latest_prices = {}
         if properties and apt_ids:
             try:
-                # 12개월치 거래 데이터를 일괄 조회 (이미 최신순 정렬됨)
-                recent_sales = await sale_crud.get_recent_sales_for_apartments(
+                # 최근 12개월 거래만 사용
+                since = window_start(date.today(), 12)
+                summaries = await apartment_price_summary_service.get_summaries(
                     db,
-                    apt_ids=list(set(apt_ids)),
-                    months=12
+                    list(set(apt_ids)),
+                    area_bucket=None
                 )
                 
-                # 아파트 ID별로 거래 데이터 그룹화
-                sales_by_apt = {}
-                for sale_item in recent_sales:
-                    # sale_item은 (apt_id, trans_price, contract_date, exclusive_area) 튜플 형태의 Row
-                    s_apt_id = sale_item.apt_id
-                    if s_apt_id not in sales_by_apt:
-                        sales_by_apt[s_apt_id] = []
-                    sales_by_apt[s_apt_id].append(sale_item)
+                # 아파트 ID별로 평형별 요약 그룹화
+                summaries_by_apt = {}
+                for (s_apt_id, _, _), summary in summaries.items():
+                    summaries_by_apt.setdefault(s_apt_id, []).append(summary)
                 
                 # 각 내 자산별로 최적의 거래 매칭
                 for prop in properties:
-                    if not prop.apt_id or prop.apt_id not in sales_by_apt:
-                        continue
-                        
-                    prop_sales = sales_by_apt[prop.apt_id]
-                    if not prop_sales:
+                    if not prop.apt_id or prop.apt_id not in summaries_by_apt:
                         continue
+                    
+                    prop_summaries = summaries_by_apt[prop.apt_id]
                         
                     # 전용면적 허용 오차 (±5㎡)
                     target_area = float(prop.exclusive_area) if prop.exclusive_area else 0
                     area_tolerance = 5.0
-                    min_area = target_area - area_tolerance
-                    max_area = target_area + area_tolerance
                     
-                    # 1. 면적 범위 내 최신 거래 찾기
-                    matched_sale = None
-                    for s in prop_sales:
-                        s_area = float(s.exclusive_area) if s.exclusive_area else 0
-                        if min_area <= s_area <= max_area:
-                            matched_sale = s
-                            break # 이미 최신순 정렬되어 있으므로 첫 번째가 최신
+                    # 1. 면적 범위 내 최신 거래 찾기 (평형별 최신 거래 기준)
+                    matched = pick_latest_by_area(prop_summaries, target_area, area_tolerance, since=since)
                     
-                    if matched_sale:
-                        latest_prices[prop.apt_id] = int(matched_sale.trans_price)
+                    if matched:
+                        latest_prices[prop.apt_id] = int(matched["latest_price"])
                         logger.info(
                             f" 내 자산 최신가 조회 성공 (Batch) - "
                             f"property_id: {prop.property_id}, apt_id: {prop.apt_id}, "
                             f"등록면적: {prop.exclusive_area}㎡, "
-                            f"거래면적: {matched_sale.exclusive_area}㎡, "
-                            f"가격: {matched_sale.trans_price}만원"
+                            f"거래면적: {matched['latest_area']}㎡, "
+                            f"가격: {matched['latest_price']}만원"
                         )
-                    else:
-                        # 2. 면적 불일치 시, 해당 아파트의 가장 최신 거래 사용 (fallback)
-                        fallback_sale = prop_sales[0] # 첫 번째가 최신
-                        latest_prices[prop.apt_id] = int(fallback_sale.trans_price)
+                        continue
+                    
+                    # 2. 면적 불일치 시, 해당 아파트의 가장 최신 거래 사용 (fallback)
+                    fallback = next(
+                        (
+                            summary for summary in prop_summaries
+                            if summary["area_bucket"] == AREA_BUCKET_ALL
+                            and summary["latest_date"] is not None
+                            and summary["latest_date"] >= since
+                        ),
+                        None
+                    )
+                    if fallback:
+                        latest_prices[prop.apt_id] = int(fallback["latest_price"])
                         logger.warning(
                             f" 전용면적({prop.exclusive_area}㎡)에 맞는 거래 없음, "
-                            f"전체 최신 거래 사용 - apt_id: {prop.apt_id}, 가격: {fallback_sale.trans_price}만원"
+                            f"전체 최신 거래 사용 - apt_id: {prop.apt_id}, 가격: {fallback['latest_price']}만원"
                         )
 
             except Exception as e:
@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.deps import get_db, get_current_user, get_current_user_optional
 from app.models.account import Account
 from app.services.search import search_service
+from app.services.recent_activity_buffer import recent_activity_buffer
 from app.crud.recent_search import recent_search as recent_search_crud
 from app.crud.my_property import my_property as my_property_crud
 from app.schemas.recent_search import RecentSearchCreate, RecentSearchResponse
@@ -103,19 +104,9 @@ async def search_apartments(
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        # 캐시에서 가져온 경우에도 최근 검색어 저장 (비동기로 처리)
+        # 캐시에서 가져온 경우에도 최근 검색어 저장 (버퍼에 모아 일괄 저장)
         if current_user:
-            try:
-                await recent_search_crud.create_or_update(
-                    db,
-                    account_id=current_user.account_id,
-                    query=q,
-                    search_type="apartment"
-                )
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"최근 검색어 자동 저장 실패 (무시됨): {e}")
+            recent_activity_buffer.record_search(current_user.account_id, q, "apartment")
         return cached_data
     
     # 2. 캐시 미스: Service 레이어를 통해 비즈니스 로직 처리
@@ -126,20 +117,9 @@ async def search_apartments(
         threshold=threshold
     )
     
-    # 로그인한 사용자인 경우 자동으로 최근 검색어 저장
+    # 로그인한 사용자인 경우 자동으로 최근 검색어 저장 (버퍼에 모아 일괄 저장)
     if current_user:
-        try:
-            await recent_search_crud.create_or_update(
-                db,
-                account_id=current_user.account_id,
-                query=q,
-                search_type="apartment"
-            )
-        except Exception as e:
-            # 최근 검색어 저장 실패해도 검색 결과는 반환
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"최근 검색어 자동 저장 실패 (무시됨): {e}")
+        recent_activity_buffer.record_search(current_user.account_id, q, "apartment")
     
     # Pydantic 스키마로 변환
     apartment_results = [
@@ -238,17 +218,7 @@ async def search_apartments_excluding_my_property(
     filtered_results = filtered_results[:limit]
     
     # 5. 최근 검색어 저장
-    try:
-        await recent_search_crud.create_or_update(
-            db,
-            account_id=current_user.account_id,
-            query=q,
-            search_type="apartment"
-        )
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"최근 검색어 자동 저장 실패 (무시됨): {e}")
+    recent_activity_buffer.record_search(current_user.account_id, q, "apartment")
     
     # 6. Pydantic 스키마로 변환
     apartment_results = [
@@ -325,19 +295,9 @@ async def search_locations(
     # 1. 캐시에서 조회 시도
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
-        # 캐시에서 가져온 경우에도 최근 검색어 저장 (비동기로 처리)
+        # 캐시에서 가져온 경우에도 최근 검색어 저장 (버퍼에 모아 일괄 저장)
         if current_user:
-            try:
-                await recent_search_crud.create_or_update(
-                    db,
-                    account_id=current_user.account_id,
-                    query=q,
-                    search_type="location"
-                )
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"최근 검색어 자동 저장 실패 (무시됨): {e}")
+            recent_activity_buffer.record_search(current_user.account_id, q, "location")
         return cached_data
     
     # 2. 캐시 미스: Service 레이어를 통해 비즈니스 로직 처리
@@ -348,20 +308,9 @@ async def search_locations(
         limit=limit
     )
     
-    # 로그인한 사용자인 경우 자동으로 최근 검색어 저장
+    # 로그인한 사용자인 경우 자동으로 최근 검색어 저장 (버퍼에 모아 일괄 저장)
     if current_user:
-        try:
-            await recent_search_crud.create_or_update(
-                db,
-                account_id=current_user.account_id,
-                query=q,
-                search_type="location"
-            )
-        except Exception as e:
-            # 최근 검색어 저장 실패해도 검색 결과는 반환
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"최근 검색어 자동 저장 실패 (무시됨): {e}")
+        recent_activity_buffer.record_search(current_user.account_id, q, "location")
     
     # Pydantic 스키마로 변환
     location_results = [
@@ -429,16 +378,16 @@ async def save_recent_search(
     Raises:
         HTTPException: 로그인이 필요한 경우 401 에러
     """
-    # 최근 검색어 저장 또는 업데이트
-    recent_search = await recent_search_crud.create_or_update(
+    # 최근 검색어 저장 또는 업데이트 (기록 버퍼와 같은 ON CONFLICT upsert, 동시 저장에도 중복 키 오류 없음)
+    recent_search = await recent_activity_buffer.save_search(
         db,
-        account_id=current_user.account_id,
-        query=search_data.query,
-        search_type=search_data.search_type
+        current_user.account_id,
+        search_data.query,
+        search_data.search_type
     )
     
     # searched_at은 created_at을 사용 (최신 검색 시간)
-    searched_at = recent_search.created_at if recent_search.created_at else recent_search.updated_at
+    searched_at = recent_search.created_at
     
     response_data = {
         "success": True,
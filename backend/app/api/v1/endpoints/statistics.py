@@ -16,7 +16,7 @@ import asyncio
 from collections import defaultdict
 from datetime import date, datetime, timedelta
 from typing import Optional, List, Dict, Any, Union
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, case, desc, text, extract
 from sqlalchemy.orm import selectinload, aliased
@@ -26,6 +26,7 @@ from app.models.sale import Sale
 from app.models.rent import Rent
 from app.models.apartment import Apartment
 from app.models.state import State
+from app.models.monthly_region_stats import MonthlyRegionStats
 from app.models.house_score import HouseScore
 from app.models.population_movement import PopulationMovement
 from app.schemas.statistics import (
@@ -54,9 +55,22 @@ from app.schemas.statistics import (
     MarketPhaseCalculationMethod,
     MarketPhaseThresholds
 )
-from app.utils.cache import get_from_cache, set_to_cache, build_cache_key, delete_cache_pattern
+from app.utils.cache import (
+    get_from_cache,
+    set_to_cache,
+    build_cache_key,
+    delete_cache_pattern,
+    tag_cache_key,
+    STATS_GLOBAL_TAG,
+    get_swr_from_cache,
+    set_swr_to_cache,
+    swr_endpoint_refresh,
+)
+from app.utils.single_flight import single_flight
+from app.utils.response_cache import get_cached_response, cache_json_response
 from app.services import statistics_service
 from app.services.statistics_cache_service import statistics_cache_service
+from app.services.monthly_region_stats_service import STATS_TYPE_SALE, shift_ym, ym_of
 
 # 로거 설정 (Docker 로그에 출력되도록)
 logger = logging.getLogger(__name__)
@@ -609,6 +623,35 @@ def calculate_market_phase(
     }
 
 
+def build_monthly_sale_volume_stmt(start_ym: str, end_ym: str, region_filters: list):
+    """
+    월별 매매 거래량 조회 쿼리 (월별 지역 집계 기반)
+    
+    Args:
+        start_ym: 시작 연월 (YYYYMM, 포함)
+        end_ym: 종료 연월 (YYYYMM, 포함)
+        region_filters: get_region_filters() 결과 (State 기준 필터)
+    """
+    return select(
+        MonthlyRegionStats.ym,
+        func.sum(MonthlyRegionStats.transaction_count).label('volume')
+    ).select_from(
+        MonthlyRegionStats.__table__.join(
+            State.__table__,
+            MonthlyRegionStats.region_id == State.region_id
+        )
+    ).where(
+        and_(
+            MonthlyRegionStats.transaction_type == STATS_TYPE_SALE,
+            MonthlyRegionStats.ym >= start_ym,
+            MonthlyRegionStats.ym <= end_ym,
+            *region_filters
+        )
+    ).group_by(
+        MonthlyRegionStats.ym
+    )
+
+
 async def calculate_volume_change_rate_average(
     db: AsyncSession,
     region_type: str,
@@ -618,6 +661,8 @@ async def calculate_volume_change_rate_average(
     """
     과거 평균 대비 거래량 변동률 계산
     
+    월별 지역 집계(monthly_region_stats)에서 월별 거래량을 조회합니다.
+    
     Args:
         db: 데이터베이스 세션
         region_type: 지역 유형
@@ -629,175 +674,35 @@ async def calculate_volume_change_rate_average(
     """
     # 현재 날짜 기준으로 기간 계산
     # 가이드 문서에 따르면 "이전 달" 데이터를 조회 (완전히 집계된 데이터)
-    now = datetime.now()
-    current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    # 이전 달 계산 (더 안전한 방법)
-    if current_month_start.month == 1:
-        previous_month_start = current_month_start.replace(year=current_month_start.year - 1, month=12)
-    else:
-        previous_month_start = current_month_start.replace(month=current_month_start.month - 1)
+    previous_ym = shift_ym(ym_of(date.today()), -1)
     
     # 지역 필터
     region_filters = get_region_filters(region_type, city_name)
     
     # 현재 월 거래량 (이전 달 완전히 집계된 데이터)
-    # 가이드 문서: contract_date >= DATE_TRUNC('month', CURRENT_DATE) - INTERVAL '1 month'
-    #            AND contract_date < DATE_TRUNC('month', CURRENT_DATE)
-    current_volume_query = select(func.count(Sale.trans_id)).select_from(
-        Sale.__table__.join(
-            Apartment.__table__,
-            Sale.apt_id == Apartment.apt_id
-        ).join(
-            State.__table__,
-            Apartment.region_id == State.region_id
-        )
-    ).where(
-        and_(
-            Sale.is_canceled == False,
-            or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-            Sale.contract_date.isnot(None),
-            # TODO: 실제 데이터 사용 시 아래 주석 해제
-            # or_(Sale.remarks != '더미', Sale.remarks.is_(None)),
-            Sale.contract_date >= previous_month_start,
-            Sale.contract_date < current_month_start,
-            *region_filters
-        )
+    current_volume_result = await db.execute(
+        build_monthly_sale_volume_stmt(previous_ym, previous_ym, region_filters)
     )
+    current_row = current_volume_result.first()
+    current_month_volume = int(current_row.volume) if current_row and current_row.volume else 0
     
-    current_volume_result = await db.execute(current_volume_query)
-    current_month_volume = current_volume_result.scalar() or 0
-    
-    # 디버깅: 쿼리 결과 상세 로깅
     if current_month_volume == 0:
         logger.warning(
             f"거래량 변동률 계산: 현재 월 거래량 0 - "
             f"region_type: {region_type}, city_name: {city_name}, "
-            f"조회 기간: {previous_month_start.date()} ~ {current_month_start.date()}, "
+            f"조회 월: {previous_ym}, "
             f"필터 조건: {region_filters}"
         )
-        
-        # 디버깅: 필터 없이 전체 거래량 확인
-        debug_query = select(func.count(Sale.trans_id)).select_from(
-            Sale.__table__.join(
-                Apartment.__table__,
-                Sale.apt_id == Apartment.apt_id
-            ).join(
-                State.__table__,
-                Apartment.region_id == State.region_id
-            )
-        ).where(
-            and_(
-                Sale.is_canceled == False,
-                or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-                Sale.contract_date.isnot(None),
-                Sale.contract_date >= previous_month_start,
-                Sale.contract_date < current_month_start,
-                *region_filters
-            )
-        )
-        debug_result = await db.execute(debug_query)
-        debug_count = debug_result.scalar() or 0
-        logger.info(f"디버깅: 필터 적용 거래량 = {debug_count}")
-        
-        # 디버깅: 해당 지역의 전체 거래량 확인 (필터 없이)
-        if city_name:
-            city_only_query = select(func.count(Sale.trans_id)).select_from(
-                Sale.__table__.join(
-                    Apartment.__table__,
-                    Sale.apt_id == Apartment.apt_id
-                ).join(
-                    State.__table__,
-                    Apartment.region_id == State.region_id
-                )
-            ).where(
-                and_(
-                    Sale.is_canceled == False,
-                    or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-                    Sale.contract_date.isnot(None),
-                    Sale.contract_date >= previous_month_start,
-                    Sale.contract_date < current_month_start,
-                    State.city_name == city_name
-                )
-            )
-            city_result = await db.execute(city_only_query)
-            city_count = city_result.scalar() or 0
-            logger.info(
-                f" 디버깅: {city_name} 지역 전체 거래량 (필터 없이) = {city_count}, "
-                f"조회 기간: {previous_month_start.date()} ~ {current_month_start.date()}"
-            )
-            
-            # 디버깅: 해당 지역의 아파트 수 확인
-            apt_count_query = select(func.count(Apartment.apt_id)).select_from(
-                Apartment.__table__.join(
-                    State.__table__,
-                    Apartment.region_id == State.region_id
-                )
-            ).where(
-                State.city_name == city_name
-            )
-            apt_result = await db.execute(apt_count_query)
-            apt_count = apt_result.scalar() or 0
-            logger.info(f" 디버깅: {city_name} 지역 아파트 수 = {apt_count}")
-            
-            # 디버깅: 해당 지역의 전체 거래 수 확인 (기간 제한 없이)
-            all_time_query = select(func.count(Sale.trans_id)).select_from(
-                Sale.__table__.join(
-                    Apartment.__table__,
-                    Sale.apt_id == Apartment.apt_id
-                ).join(
-                    State.__table__,
-                    Apartment.region_id == State.region_id
-                )
-            ).where(
-                and_(
-                    Sale.is_canceled == False,
-                    or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-                    Sale.contract_date.isnot(None),
-                    State.city_name == city_name
-                )
-            )
-            all_time_result = await db.execute(all_time_query)
-            all_time_count = all_time_result.scalar() or 0
-            logger.info(f" 디버깅: {city_name} 지역 전체 기간 거래량 = {all_time_count}")
-        
         return None, 0
     
     # 과거 평균 거래량 계산 (N개월 평균)
     # 월별 거래량을 구한 후 평균 계산
-    avg_start_date = previous_month_start - timedelta(days=30 * average_period_months)
+    avg_start_ym = shift_ym(previous_ym, -average_period_months)
     
-    # 월별 거래량 조회
-    monthly_volumes_query = select(
-        extract('year', Sale.contract_date).label('year'),
-        extract('month', Sale.contract_date).label('month'),
-        func.count(Sale.trans_id).label('volume')
-    ).select_from(
-        Sale.__table__.join(
-            Apartment.__table__,
-            Sale.apt_id == Apartment.apt_id
-        ).join(
-            State.__table__,
-            Apartment.region_id == State.region_id
-        )
-    ).where(
-        and_(
-            Sale.is_canceled == False,
-            or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-            Sale.contract_date.isnot(None),
-            # TODO: 실제 데이터 사용 시 아래 주석 해제
-            # or_(Sale.remarks != '더미', Sale.remarks.is_(None)),
-            Sale.contract_date >= avg_start_date,
-            Sale.contract_date < previous_month_start,
-            *region_filters
-        )
-    ).group_by(
-        extract('year', Sale.contract_date),
-        extract('month', Sale.contract_date)
+    monthly_volumes_result = await db.execute(
+        build_monthly_sale_volume_stmt(avg_start_ym, shift_ym(previous_ym, -1), region_filters)
     )
-    
-    monthly_volumes_result = await db.execute(monthly_volumes_query)
-    monthly_volumes = [row.volume for row in monthly_volumes_result.fetchall()]
+    monthly_volumes = [int(row.volume) for row in monthly_volumes_result.fetchall()]
     
     if not monthly_volumes:
         logger.warning(
@@ -828,6 +733,8 @@ async def calculate_volume_change_rate_mom(
     """
     전월 대비 거래량 변동률 계산
     
+    월별 지역 집계(monthly_region_stats)에서 최근 2개월 거래량을 조회합니다.
+    
     Args:
         db: 데이터베이스 세션
         region_type: 지역 유형
@@ -836,11 +743,9 @@ async def calculate_volume_change_rate_mom(
     Returns:
         (volume_change_rate, current_month_volume) 튜플
     """
-    # 현재 날짜 기준으로 기간 계산
-    now = datetime.now()
-    current_month_start = now.replace(day=1)
-    previous_month_start = (current_month_start - timedelta(days=1)).replace(day=1)
-    two_months_ago_start = (previous_month_start - timedelta(days=1)).replace(day=1)
+    # 현재 날짜 기준으로 기간 계산 (이번 달 제외, 직전 2개월)
+    previous_ym = shift_ym(ym_of(date.today()), -1)
+    two_months_ago_ym = shift_ym(previous_ym, -1)
     
     # 지역 필터
     region_filters = get_region_filters(region_type, city_name)
@@ -851,35 +756,10 @@ async def calculate_volume_change_rate_mom(
     )
     
     # 최근 2개월 거래량 조회
-    monthly_volumes_query = select(
-        extract('year', Sale.contract_date).label('year'),
-        extract('month', Sale.contract_date).label('month'),
-        func.count(Sale.trans_id).label('volume')
-    ).select_from(
-        Sale.__table__.join(
-            Apartment.__table__,
-            Sale.apt_id == Apartment.apt_id
-        ).join(
-            State.__table__,
-            Apartment.region_id == State.region_id
-        )
-    ).where(
-        and_(
-            Sale.is_canceled == False,
-            or_(Sale.is_deleted == False, Sale.is_deleted.is_(None)),
-            Sale.contract_date.isnot(None),
-            # TODO: 실제 데이터 사용 시 아래 주석 해제
-            # or_(Sale.remarks != '더미', Sale.remarks.is_(None)),
-            Sale.contract_date >= two_months_ago_start,
-            Sale.contract_date < current_month_start,
-            *region_filters
-        )
-    ).group_by(
-        extract('year', Sale.contract_date),
-        extract('month', Sale.contract_date)
+    monthly_volumes_query = build_monthly_sale_volume_stmt(
+        two_months_ago_ym, previous_ym, region_filters
     ).order_by(
-        desc(extract('year', Sale.contract_date)),
-        desc(extract('month', Sale.contract_date))
+        desc(MonthlyRegionStats.ym)
     ).limit(2)
     
     monthly_volumes_result = await db.execute(monthly_volumes_query)
@@ -893,8 +773,8 @@ async def calculate_volume_change_rate_mom(
         )
         return None, 0
     
-    current_volume = monthly_data[0].volume
-    previous_volume = monthly_data[1].volume
+    current_volume = int(monthly_data[0].volume)
+    previous_volume = int(monthly_data[1].volume)
     
     if previous_volume == 0:
         logger.warning(
@@ -1150,6 +1030,7 @@ async def get_rvol(
 )
 async def get_quadrant(
     period_months: int = Query(2, ge=1, le=12, description="비교 기간 (개월, 최대 12)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -1157,13 +1038,21 @@ async def get_quadrant(
     
     월별 집계로 간소화하여 빠른 응답 제공
     """
-    cache_key = build_cache_key("statistics", "quadrant_v2", str(period_months))
+    cache_key = await tag_cache_key(build_cache_key("statistics", "quadrant_v2", str(period_months)), STATS_GLOBAL_TAG)
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_quadrant, period_months=period_months)
+    )
     if cached_data is not None:
         logger.info(f" [Statistics Quadrant] 캐시에서 반환")
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(
@@ -1341,7 +1230,7 @@ async def get_quadrant(
         
         # 캐시에 저장 (TTL: 6시간)
         if len(quadrant_data) > 0:
-            await set_to_cache(cache_key, response_data.dict(), ttl=STATISTICS_CACHE_TTL)
+            await set_swr_to_cache(cache_key, response_data.dict(), soft_ttl=STATISTICS_CACHE_TTL)
         
         logger.info(f" [Statistics Quadrant] 4분면 분류 데이터 생성 완료 - 데이터 포인트 수: {len(quadrant_data)}")
         
@@ -1382,6 +1271,7 @@ async def get_hpi(
     region_id: Optional[int] = Query(None, description="지역 ID (선택)"),
     index_type: str = Query("APT", description="지수 유형: APT(아파트), HOUSE(단독주택), ALL(전체)"),
     months: int = Query(24, ge=1, le=60, description="조회 기간 (개월, 최대 60)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -1397,18 +1287,34 @@ async def get_hpi(
             detail=f"유효하지 않은 index_type입니다. 가능한 값: {', '.join(valid_index_types)}"
         )
     
-    cache_key = build_cache_key(
-        "statistics", "hpi", 
-        str(region_id) if region_id else "all",
-        index_type,
-        str(months)
+    cache_key = await tag_cache_key(
+        build_cache_key(
+            "statistics", "hpi", 
+            str(region_id) if region_id else "all",
+            index_type,
+            str(months)
+        ),
+        STATS_GLOBAL_TAG
     )
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_hpi, region_id=region_id, index_type=index_type, months=months)
+    )
     if cached_data is not None:
         logger.info(f" [Statistics HPI] 캐시에서 반환")
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
+    
+    # 캐시 미스: 같은 키를 동시에 계산하지 않도록 요청 병합
+    flight = await single_flight.acquire(cache_key)
+    if flight.value is not None:
+        return await flight.to_response(http_request)
     
     try:
         logger.info(
@@ -1574,19 +1480,25 @@ async def get_hpi(
         )
         
         # 캐시에 저장 (TTL: 6시간)
-        if len(hpi_data) > 0:
-            await set_to_cache(cache_key, response_data.dict(), ttl=STATISTICS_CACHE_TTL)
-        
         logger.info(f" [Statistics HPI] HPI 데이터 생성 완료 - 데이터 포인트 수: {len(hpi_data)}")
         
+        if len(hpi_data) > 0:
+            await flight.set(response_data.dict(), ttl=STATISTICS_CACHE_TTL, swr=True)
+            return await cache_json_response(http_request, cache_key, response_data)
+        
         return response_data
         
     except Exception as e:
         logger.error(f" [Statistics HPI] HPI 데이터 조회 실패: {e}", exc_info=True)
-        raise HTTPException(
+        error = HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"HPI 데이터 조회 중 오류가 발생했습니다: {str(e)}"
         )
+        # 같은 키를 기다리던 요청에도 같은 오류 전달 (동시 재계산 방지)
+        flight.fail(error)
+        raise error
+    finally:
+        await flight.release()
 
 
 @router.get(
@@ -1606,6 +1518,7 @@ async def get_hpi(
 )
 async def get_hpi_heatmap(
     index_type: str = Query("APT", description="지수 유형: APT(아파트), HOUSE(단독주택), ALL(전체)"),
+    http_request: Request = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -1621,13 +1534,21 @@ async def get_hpi_heatmap(
             detail=f"유효하지 않은 index_type입니다. 가능한 값: {', '.join(valid_index_types)}"
         )
     
-    cache_key = build_cache_key("statistics", "hpi_heatmap", index_type)
+    cache_key = await tag_cache_key(build_cache_key("statistics", "hpi_heatmap", index_type), STATS_GLOBAL_TAG)
     
-    # 캐시에서 조회 시도
-    cached_data = await get_from_cache(cache_key)
+    # 직렬화/압축된 응답이 있으면 그대로 반환
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+    
+    # 캐시에서 조회 시도 (soft TTL 이 지났으면 이전 값 반환 + 백그라운드 갱신)
+    cached_data = await get_swr_from_cache(
+        cache_key,
+        refresh=swr_endpoint_refresh(get_hpi_heatmap, index_type=index_type)
+    )
     if cached_data is not None:
         logger.info(f" [Statistics HPI Heatmap] 캐시에서 반환")
-        return cached_data
+        return await cache_json_response(http_request, cache_key, cached_data)
     
     try:
         logger.info(
@@ -1731,7 +1652,7 @@ async def get_hpi_heatmap(
         
         # 캐시에 저장 (TTL: 6시간)
         if len(heatmap_data) > 0:
-            await set_to_cache(cache_key, response_data.dict(), ttl=STATISTICS_CACHE_TTL)
+            await set_swr_to_cache(cache_key, response_data.dict(), soft_ttl=STATISTICS_CACHE_TTL)
         
         logger.info(f" [Statistics HPI Heatmap] HPI 히트맵 데이터 생성 완료 - 데이터 포인트 수: {len(heatmap_data)}")
         
@@ -1770,9 +1691,12 @@ async def get_statistics_summary(
     RVOL과 4분면 분류 데이터를 한 번에 조회합니다.
     """
     # 캐시 키 생성
-    cache_key = build_cache_key(
-        "statistics", "summary", transaction_type,
-        str(current_period_months), str(average_period_months), str(quadrant_period_months)
+    cache_key = await tag_cache_key(
+        build_cache_key(
+            "statistics", "summary", transaction_type,
+            str(current_period_months), str(average_period_months), str(quadrant_period_months)
+        ),
+        STATS_GLOBAL_TAG
     )
     
     # 캐시에서 조회 시도
@@ -1783,7 +1707,7 @@ async def get_statistics_summary(
     
     # RVOL과 4분면 분류를 순차적으로 조회 (SQLAlchemy 세션 공유 문제 방지)
     rvol_response = await get_rvol(transaction_type, current_period_months, average_period_months, db)
-    quadrant_response = await get_quadrant(quadrant_period_months, db)
+    quadrant_response = await get_quadrant(quadrant_period_months, db=db)
     
     response_data = StatisticsSummaryResponse(
         success=True,
@@ -1907,9 +1831,12 @@ async def get_hpi_by_region_type(
             detail=f"유효하지 않은 index_type입니다. 가능한 값: {', '.join(valid_index_types)}"
         )
     
-    cache_key = build_cache_key(
-        "statistics", "hpi-by-region-type", region_type, index_type,
-        base_ym if base_ym else "latest"
+    cache_key = await tag_cache_key(
+        build_cache_key(
+            "statistics", "hpi-by-region-type", region_type, index_type,
+            base_ym if base_ym else "latest"
+        ),
+        STATS_GLOBAL_TAG
     )
     
     # 캐시에서 조회 시도
@@ -2871,15 +2798,18 @@ async def get_market_phase(
             )
         
         # 캐시 키 생성
-        cache_key = build_cache_key(
-            "statistics",
-            "market-phase",
-            region_type,
-            volume_calculation_method,
-            str(average_period_months),
-            str(volume_threshold) if volume_threshold is not None else "default",
-            str(price_threshold) if price_threshold is not None else "default",
-            str(min_transaction_count)
+        cache_key = await tag_cache_key(
+            build_cache_key(
+                "statistics",
+                "market-phase",
+                region_type,
+                volume_calculation_method,
+                str(average_period_months),
+                str(volume_threshold) if volume_threshold is not None else "default",
+                str(price_threshold) if price_threshold is not None else "default",
+                str(min_transaction_count)
+            ),
+            STATS_GLOBAL_TAG
         )
         
         # 캐시 확인
@@ -3100,7 +3030,7 @@ async def get_population_flow_sankey(
     
     raw=True인 경우 원시 데이터(city_name 레벨)를 반환하여 프론트엔드에서 그룹화할 수 있습니다.
     """
-    cache_key = build_cache_key("statistics", "population_flow", str(period_months), "raw" if raw else "grouped")
+    cache_key = await tag_cache_key(build_cache_key("statistics", "population_flow", str(period_months), "raw" if raw else "grouped"), STATS_GLOBAL_TAG)
     
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
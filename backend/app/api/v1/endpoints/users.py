@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1.deps import get_db, get_current_user
 from app.models.account import Account
 from app.crud.recent_view import recent_view as recent_view_crud
+from app.services.recent_activity_buffer import recent_activity_buffer
 from app.schemas.recent_view import RecentViewCreate, RecentViewResponse
 from app.schemas.ui_preferences import UiPreferencesResponse, UiPreferencesUpdateRequest, UiPreferences
 
@@ -132,6 +133,7 @@ async def create_recent_view(
     
     아파트 상세 페이지를 방문했을 때 호출하여 조회 기록을 저장합니다.
     같은 아파트를 이미 본 기록이 있으면 기존 레코드의 viewed_at만 업데이트합니다.
+    기록은 버퍼에 모았다가 몇 초 안에 일괄 저장되므로 view_id/viewed_at 은 반환하지 않습니다.
     
     Args:
         request: 아파트 ID를 포함한 요청 데이터
@@ -142,9 +144,7 @@ async def create_recent_view(
         {
             "success": true,
             "data": {
-                "view_id": int,
-                "apt_id": int,
-                "viewed_at": str  # ISO 8601 형식
+                "apt_id": int
             }
         }
     
@@ -163,19 +163,13 @@ async def create_recent_view(
             detail="아파트를 찾을 수 없습니다"
         )
     
-    # 최근 본 아파트 기록 생성 또는 업데이트
-    recent_view = await recent_view_crud.create_or_update(
-        db,
-        account_id=current_user.account_id,
-        apt_id=request.apt_id
-    )
+    # 최근 본 아파트 기록 (버퍼에 모아 일괄 저장, 같은 아파트는 조회 시간만 갱신)
+    recent_activity_buffer.record_view(current_user.account_id, request.apt_id)
     
     return {
         "success": True,
         "data": {
-            "view_id": recent_view.view_id,
-            "apt_id": recent_view.apt_id,
-            "viewed_at": recent_view.viewed_at.isoformat() if recent_view.viewed_at else None
+            "apt_id": request.apt_id
         }
     }
 
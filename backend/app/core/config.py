@@ -58,6 +58,21 @@ class Settings(BaseSettings):
     NAVER_CLIENT_ID: Optional[str] = None
     NAVER_CLIENT_SECRET: Optional[str] = None
     
+    # 데이터 수집 HTTP 전송 계층 (API 키 + 호스트 단위 토큰 버킷)
+    COLLECTOR_RATE_PER_SECOND: float = 20.0  # 초당 요청 수 (0 이하면 제한 없음)
+    COLLECTOR_RATE_BURST: int = 20  # 순간 최대 요청 수
+    COLLECTOR_MAX_CONNECTIONS: int = 50  # 공용 클라이언트 최대 연결 수
+    COLLECTOR_HTTP2: bool = True  # h2 패키지가 설치된 경우에만 HTTP/2 사용
+    COLLECTION_PROCESS_WORKERS: int = 0  # 실거래가 XML 파싱/매칭 프로세스 수 (0이면 이벤트 루프에서 직접 처리)
+    
+    # 프로세스 내 L1 캐시 (Redis 앞단, 대시보드/통계/지도 집계 키)
+    L1_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 워커당 최대 용량 (0이면 비활성화)
+    L1_CACHE_TTL: int = 60  # 항목 최대 유지 시간 (초)
+    
+    # 아파트 검색 자동완성 색인 (워커 메모리)
+    SEARCH_INDEX_ENABLED: bool = True
+    SEARCH_INDEX_REFRESH_INTERVAL: int = 60  # 신규/수정 아파트 반영 주기 (초)
+    
     # CORS 설정 (문자열로 받아서 split)
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:5173,http://localhost:8081"
     
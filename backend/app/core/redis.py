@@ -32,6 +32,7 @@ REDIS_RETRY_INTERVAL = 60.0   # Redis 재연결 시도 간격 (초)
 
 # 전역 Redis 클라이언트 인스턴스
 _redis_client: Optional[Redis] = None
+_redis_binary_client: Optional[Redis] = None  # 바이트 값(압축 응답 등)용 클라이언트
 _last_ping_time: float = 0.0
 _ping_interval: float = PING_INTERVAL
 _redis_available: bool = True  # Redis 가용성 플래그
@@ -133,6 +134,36 @@ async def get_redis_client(check_health: bool = False) -> Optional[Redis]:
     return _redis_client
 
 
+async def get_redis_binary_client() -> Optional[Redis]:
+    """
+    바이트 값을 그대로 주고받는 Redis 클라이언트 (decode_responses=False)
+    
+    gzip 으로 압축된 응답 본문처럼 UTF-8 로 디코딩할 수 없는 값을 저장할 때 사용합니다.
+    가용성 판단과 재연결 주기는 기본 클라이언트(get_redis_client)를 따릅니다.
+    
+    Returns:
+        Redis 클라이언트 또는 None (Redis 비가용 시)
+    """
+    global _redis_binary_client
+    
+    if await get_redis_client() is None:
+        return None
+    
+    if _redis_binary_client is None:
+        _redis_binary_client = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            max_connections=MAX_CONNECTIONS,
+            retry_on_timeout=False,
+            retry=Retry(ExponentialBackoff(cap=0.5, base=0.1), retries=0),
+            socket_timeout=SOCKET_TIMEOUT,
+            socket_connect_timeout=CONNECT_TIMEOUT,
+            socket_keepalive=True,
+            health_check_interval=HEALTH_CHECK_INTERVAL,
+        )
+    return _redis_binary_client
+
+
 def is_redis_available() -> bool:
     """Redis 가용성 확인 (캐시 사용 여부 판단용)"""
     return _redis_available
@@ -144,7 +175,15 @@ async def close_redis_client():
     
     애플리케이션 종료 시 호출됩니다.
     """
-    global _redis_client
+    global _redis_client, _redis_binary_client
+    
+    if _redis_binary_client is not None:
+        try:
+            await _redis_binary_client.close()
+        except Exception as e:
+            logger.error(f" Redis 바이트 클라이언트 종료 실패: {e}")
+        finally:
+            _redis_binary_client = None
     
     if _redis_client is not None:
         try:
@@ -7,7 +7,6 @@ import logging
 from typing import Optional, List, Tuple
 from sqlalchemy import select, case, and_, func as sql_func, literal_column, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from geoalchemy2 import functions as geo_func
 
 logger = logging.getLogger(__name__)
 
@@ -327,6 +326,7 @@ class CRUDApartment(CRUDBase[Apartment, ApartmentCreate, ApartmentUpdate]):
         
         기준 아파트로부터 가장 가까운 아파트들을 조회하고 거리순으로 정렬합니다.
         radius_meters가 지정되어 있으면 그 범위 내에서, 없으면 가장 가까운 limit개를 반환합니다.
+        geography(geometry) GiST 인덱스의 KNN 정렬(<->)로 가까운 순서대로 limit개만 읽습니다.
         
         Args:
             db: 데이터베이스 세션
@@ -348,50 +348,39 @@ class CRUDApartment(CRUDBase[Apartment, ApartmentCreate, ApartmentUpdate]):
             logger.warning(f" 기준 아파트에 geometry 데이터가 없음: apt_id={apt_id}")
             return []
         
-        # 2. 기준 geometry 서브쿼리
-        target_geometry_subq = (
-            select(ApartDetail.geometry)
+        # 2. 기준 위치 서브쿼리 (geography, 미터 단위)
+        target_geography_subq = (
+            select(func.geography(ApartDetail.geometry))
             .where(ApartDetail.apt_id == apt_id)
             .where(ApartDetail.is_deleted == False)
             .limit(1)
         ).scalar_subquery()
         
-        # 3. 거리 계산식 (미터 단위, 정확한 구면 거리)
-        # ST_Distance를 사용하고 좌표계를 3857로 변환하여 미터 단위 거리 계산
-        distance_expr = geo_func.ST_Distance(
-            geo_func.ST_Transform(target_geometry_subq, 3857),
-            geo_func.ST_Transform(ApartDetail.geometry, 3857)
-        ).label('distance_meters')
-        
-        # 4. 쿼리 구성 - 반경 제한 없이 가장 가까운 아파트 찾기
-        # 성능을 위해 큰 반경(111km)으로 대략 필터링 후 정확한 거리로 정렬
-        # 111km ≈ 1.0도 (위도 기준)
-        # 일부 지역에서는 더 멀리 떨어진 아파트도 있을 수 있으므로 충분히 큰 값 사용
-        large_radius_degrees = 2.0  # 약 222km (충분히 큰 범위)
+        # 3. 거리 계산식 (geography 기준 실제 거리, 미터)
+        # idx_apart_details_geography 인덱스와 같은 식(geography(geometry))을 사용해야 인덱스를 탐
+        geography_expr = func.geography(ApartDetail.geometry)
+        distance_expr = func.ST_Distance(geography_expr, target_geography_subq).label('distance_meters')
         
         where_conditions = [
             ApartDetail.apt_id != apt_id,  # 자기 자신 제외
             ApartDetail.is_deleted == False,
             ApartDetail.geometry.isnot(None),
-            # 대략적인 필터링 (인덱스 활용을 위해 ST_DWithin 사용)
-            # 2.0도는 충분히 큰 범위이므로 거의 모든 아파트 포함
-            geo_func.ST_DWithin(
-                ApartDetail.geometry,
-                target_geometry_subq,
-                large_radius_degrees
-            )
         ]
+        if radius_meters is not None:
+            # 반경 검색 (geography 인덱스 사용)
+            where_conditions.append(
+                func.ST_DWithin(geography_expr, target_geography_subq, radius_meters)
+            )
         
-        # 5. 거리순으로 정렬하여 가장 가까운 아파트 조회
-        # limit만큼만 가져오면 됨 (반경 제한 없음)
+        # 4. KNN 정렬: <-> 연산자로 인덱스에서 가까운 순서대로 limit개만 읽음 (O(k log n))
         stmt = (
             select(
                 ApartDetail,
                 distance_expr
             )
             .where(and_(*where_conditions))
-            .order_by(distance_expr)  # 거리순 정렬
-            .limit(limit)  # 가장 가까운 limit개만
+            .order_by(geography_expr.op('<->')(target_geography_subq))
+            .limit(limit)
         )
         
         result = await db.execute(stmt)
@@ -399,14 +388,11 @@ class CRUDApartment(CRUDBase[Apartment, ApartmentCreate, ApartmentUpdate]):
         
         logger.debug(f" 주변 아파트 조회 결과: apt_id={apt_id}, 조회된 개수={len(rows)}, limit={limit}")
         
-        # 6. 결과 반환
-        # radius_meters가 None이면 거리 제한 없이 반환
-        # radius_meters가 지정되어 있으면 해당 반경 내만 필터링
-        results = []
-        for row in rows:
-            distance = float(row.distance_meters)
-            if radius_meters is None or distance <= radius_meters:
-                results.append((row.ApartDetail, distance))
+        # 5. 결과 반환 (KNN 거리와 실제 거리의 미세한 차이를 감안해 실제 거리로 다시 정렬)
+        results = sorted(
+            ((row.ApartDetail, float(row.distance_meters)) for row in rows),
+            key=lambda item: item[1]
+        )
         
         if len(results) == 0:
             logger.warning(f" 주변 아파트를 찾지 못함: apt_id={apt_id}, radius_meters={radius_meters}")
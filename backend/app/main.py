@@ -13,6 +13,7 @@ FastAPI 애플리케이션 메인 파일
 - 느린 요청 로깅 (성능 모니터링)
 """
 import asyncio
+import re
 import time
 import logging
 
@@ -25,6 +26,12 @@ from prometheus_fastapi_instrumentator import Instrumentator
 
 from app.core.config import settings
 from app.core.redis import get_redis_client, close_redis_client
+from app.utils.response_cache import (
+    compute_etag,
+    etag_matches,
+    not_modified_response,
+    VARY_ACCEPT_ENCODING,
+)
 
 perf_logger = logging.getLogger("performance")
 
@@ -58,6 +65,51 @@ app = FastAPI(
     default_response_class=ORJSONResponse,  # orjson 사용 (JSON 직렬화 속도 개선)
 )
 
+# ============================================================
+# ETag / 조건부 요청 미들웨어 (재방문 시 304)
+# ============================================================
+# GZip 보다 안쪽에서 실행되도록 먼저 등록
+# - 응답 캐시(app.utils.response_cache)가 만든 응답은 태그 세대 캐시 키로 만든 ETag 가 있고
+#   304 비교도 이미 끝났으므로 그대로 통과
+# - 그 외 대상 경로의 200 응답은 압축 전 본문 해시로 약한 ETag(W/) 생성
+#   (이후 GZipMiddleware 가 압축하면 바이트가 달라지므로 강한 ETag 는 쓰지 않음)
+ETAG_PATH_PREFIXES = tuple(f"{settings.API_V1_STR}/{name}/" for name in ("statistics", "dashboard", "map"))
+ETAG_APARTMENT_DETAIL_PATH = re.compile(rf"^{re.escape(settings.API_V1_STR)}/apartments/\d+(/detail)?$")
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """통계/대시보드/지도/아파트 상세 GET 응답에 ETag 를 붙이고 If-None-Match 가 일치하면 304 반환"""
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        if request.method != "GET" or not (
+            path.startswith(ETAG_PATH_PREFIXES) or ETAG_APARTMENT_DETAIL_PATH.match(path)
+        ):
+            return await call_next(request)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        # 응답 캐시가 만든 응답 (ETag/Content-Encoding/304 처리 완료)
+        if "etag" in response.headers or "content-encoding" in response.headers:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = compute_etag(body, weak=True)
+        headers = dict(response.headers)
+        headers["etag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(etag, headers.get("vary") or VARY_ACCEPT_ENCODING)
+        return Response(
+            content=body,
+            status_code=response.status_code,
+            headers=headers,
+            background=response.background,
+        )
+
+
+app.add_middleware(ETagMiddleware)
+
 # ============================================================
 # GZip 압축 미들웨어 (응답 크기 감소)
 # ============================================================
@@ -373,6 +425,20 @@ async def startup_event():
     except Exception as e:
         logger.warning(f" 통계 캐시 스케줄러 시작 실패 (무시하고 계속 진행): {e}")
     
+    # L1 캐시 무효화 채널 구독 (워커 간 L1 일관성)
+    try:
+        from app.utils.local_cache import local_cache
+        local_cache.start_listener()
+    except Exception as e:
+        logger.warning(f" L1 캐시 무효화 구독 시작 실패 (무시하고 계속 진행): {e}")
+    
+    # 아파트 검색 자동완성 색인 구성 (백그라운드, 구성 전에는 DB 검색)
+    try:
+        from app.services.search_index import apartment_search_index
+        apartment_search_index.start()
+    except Exception as e:
+        logger.warning(f" 아파트 검색 색인 시작 실패 (무시하고 계속 진행): {e}")
+    
     # 캐시 무효화 이벤트 리스너 등록
     try:
         from app.services.cache_invalidation import register_cache_invalidation
@@ -388,12 +454,58 @@ async def shutdown_event():
     import logging
     logger = logging.getLogger(__name__)
     
+    # 대기 중인 캐시 무효화 플러시 (Redis 종료 전)
+    try:
+        from app.services.cache_invalidation import flush_cache_invalidation_queue, invalidation_queue
+        await flush_cache_invalidation_queue()
+        logger.info(f" 캐시 무효화 큐 지표: {invalidation_queue.get_metrics()}")
+    except Exception as e:
+        logger.warning(f" 캐시 무효화 큐 플러시 중 오류: {e}")
+
+    # 대기 중인 최근 검색어/최근 본 아파트 기록 저장
+    try:
+        from app.services.recent_activity_buffer import recent_activity_buffer
+        await recent_activity_buffer.flush()
+        logger.info(f" 최근 기록 버퍼 지표: {recent_activity_buffer.get_metrics()}")
+    except Exception as e:
+        logger.warning(f" 최근 기록 버퍼 플러시 중 오류: {e}")
+
+    # L1 캐시 무효화 구독 종료
+    try:
+        from app.utils.local_cache import local_cache
+        await local_cache.stop_listener()
+        logger.info(f" L1 캐시 지표: {local_cache.get_metrics()}")
+    except Exception as e:
+        logger.warning(f" L1 캐시 구독 종료 중 오류: {e}")
+    
+    # 아파트 검색 색인 갱신 종료
+    try:
+        from app.services.search_index import apartment_search_index
+        await apartment_search_index.stop()
+        logger.info(f" 아파트 검색 색인 지표: {apartment_search_index.get_metrics()}")
+    except Exception as e:
+        logger.warning(f" 아파트 검색 색인 종료 중 오류: {e}")
+    
     # Redis 연결 종료
     try:
         await close_redis_client()
         logger.info(" Redis 연결 종료 완료")
     except Exception as e:
         logger.warning(f" Redis 연결 종료 중 오류: {e}")
+    
+    # 데이터 수집 공용 HTTP 클라이언트 종료
+    try:
+        from app.services.data_collection.utils.http_transport import close_collector_transport
+        await close_collector_transport()
+    except Exception as e:
+        logger.warning(f" 수집 HTTP 클라이언트 종료 중 오류: {e}")
+    
+    # 파싱/매칭 프로세스 풀 종료
+    try:
+        from app.services.data_collection.utils.trade_matching import shutdown_match_process_pool
+        shutdown_match_process_pool()
+    except Exception as e:
+        logger.warning(f" 파싱/매칭 프로세스 풀 종료 중 오류: {e}")
 
 
 # ============================================================
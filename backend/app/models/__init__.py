@@ -21,6 +21,11 @@ from app.models.recent_view import RecentView
 from app.models.interest_rate import InterestRate
 from app.models.asset_activity_log import AssetActivityLog
 from app.models.daily_statistics import DailyStatistics
+from app.models.apt_match_decision import AptMatchDecision
+from app.models.collection_work_unit import CollectionWorkUnit
+from app.models.monthly_region_stats import MonthlyRegionStats
+from app.models.apartment_price_summary import ApartmentPriceSummary
+from app.models.apartment_neighbor import ApartmentNeighbor
 
 __all__ = [
     "Account",
@@ -40,4 +45,9 @@ __all__ = [
     "InterestRate",
     "AssetActivityLog",
     "DailyStatistics",
+    "AptMatchDecision",
+    "CollectionWorkUnit",
+    "MonthlyRegionStats",
+    "ApartmentPriceSummary",
+    "ApartmentNeighbor",
 ]
@@ -6,7 +6,7 @@
 """
 from datetime import date, datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, Boolean, Integer, Date, ForeignKey, CHAR, Index
+from sqlalchemy import String, DateTime, Boolean, Integer, Date, ForeignKey, CHAR, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from geoalchemy2 import Geometry
 
@@ -50,6 +50,8 @@ class ApartDetail(Base):
     __table_args__ = (
         # GiST 인덱스: 공간 쿼리 최적화 (ST_Distance, ST_DWithin 등)
         Index("idx_apart_details_geometry", "geometry", postgresql_using="gist"),
+        # geography 식 GiST 인덱스: 미터 단위 KNN 정렬(<->)과 반경 검색(ST_DWithin)
+        Index("idx_apart_details_geography", text("geography(geometry)"), postgresql_using="gist"),
     )
     
     # 기본키 (Primary Key)
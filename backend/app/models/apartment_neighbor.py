@@ -0,0 +1,72 @@
+"""
+아파트 주변 단지 모델
+
+테이블명: apartment_neighbors
+아파트별로 가장 가까운 단지 K개를 거리순으로 저장하는 사전 계산 테이블입니다.
+아파트 geometry가 바뀌면 영향받는 아파트만 다시 계산하며,
+주변 아파트 비교 API는 KNN 쿼리 대신 이 테이블을 먼저 조회합니다.
+"""
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, SmallInteger, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class ApartmentNeighbor(Base):
+    """
+    아파트 주변 단지 테이블
+
+    거리는 geography 기준 실제 거리(미터)입니다.
+
+    컬럼:
+        - apt_id: 기준 아파트 ID (PK, FK)
+        - rank: 거리 순위 (PK, 1부터)
+        - neighbor_apt_id: 주변 아파트 ID (FK)
+        - distance_meters: 기준 아파트와의 거리 (미터)
+        - updated_at: 마지막 계산 시각
+    """
+    __tablename__ = "apartment_neighbors"
+
+    # 복합 기본키
+    apt_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("apartments.apt_id"),
+        primary_key=True,
+        comment="기준 아파트 ID"
+    )
+
+    rank: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        comment="거리 순위 (1부터)"
+    )
+
+    neighbor_apt_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("apartments.apt_id"),
+        nullable=False,
+        index=True,  # geometry 변경 시 이 아파트를 주변 단지로 가진 아파트 조회
+        comment="주변 아파트 ID"
+    )
+
+    distance_meters: Mapped[float] = mapped_column(
+        Numeric(10, 2),
+        nullable=False,
+        comment="거리 (미터)"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="마지막 계산 시각"
+    )
+
+    # ===== 관계 (Relationships) =====
+    apartment = relationship("Apartment", foreign_keys=[apt_id])
+    neighbor = relationship("Apartment", foreign_keys=[neighbor_apt_id])
+
+    def __repr__(self):
+        return f"<ApartmentNeighbor(apt_id={self.apt_id}, rank={self.rank}, neighbor_apt_id={self.neighbor_apt_id}, distance_meters={self.distance_meters})>"
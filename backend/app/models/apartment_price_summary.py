@@ -0,0 +1,122 @@
+"""
+아파트별 가격 요약 모델
+
+테이블명: apartment_price_summary
+(아파트, 거래 유형, 평형) 단위로 최신 거래와 최근 6/12개월 가격 집계를 저장하는 요약 테이블입니다.
+실거래가 수집 시 거래가 저장된 아파트만 다시 계산하며,
+관심 아파트/내 집/지도/비교/평형별 가격 API는 원본 거래 테이블 대신 이 테이블을 조회합니다.
+"""
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import String, Date, DateTime, Integer, SmallInteger, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class ApartmentPriceSummary(Base):
+    """
+    아파트별 가격 요약 테이블
+
+    기간 집계(6m, 12m)는 as_of 기준 최근 180일/360일 거래입니다.
+    (수집 후 해당 아파트만 다시 계산하고, 매일 전체를 다시 계산해 기준일을 맞춤)
+
+    컬럼:
+        - apt_id: 아파트 ID (PK, FK)
+        - transaction_type: 거래 유형 (PK, sale, jeonse)
+        - area_bucket: 평형 (PK, ROUND(전용면적 / 3.3058), 0이면 전체 면적)
+        - latest_price: 최신 거래 가격 (만원, 전세는 보증금)
+        - latest_area: 최신 거래 전용면적 (㎡)
+        - latest_date: 최신 거래일
+        - transaction_count: 전체 기간 거래 건수
+        - count_6m / count_12m: 최근 6/12개월 거래 건수
+        - avg_price_6m / avg_price_12m: 최근 6/12개월 평균 가격 (만원)
+        - min_price_6m / min_price_12m, max_price_6m / max_price_12m: 최근 6/12개월 최저/최고 가격 (만원)
+        - avg_price_per_pyeong_6m / avg_price_per_pyeong_12m: 최근 6/12개월 평균 평당가 (만원/평)
+        - avg_area_6m / avg_area_12m: 최근 6/12개월 평균 전용면적 (㎡)
+        - as_of: 기간 집계 기준일
+        - updated_at: 마지막 계산 시각
+    """
+    __tablename__ = "apartment_price_summary"
+
+    # 복합 기본키
+    apt_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("apartments.apt_id"),
+        primary_key=True,
+        comment="아파트 ID"
+    )
+
+    transaction_type: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True,
+        comment="거래 유형 (sale, jeonse)"
+    )
+
+    area_bucket: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        comment="평형 (ROUND(전용면적 / 3.3058), 0이면 전체)"
+    )
+
+    # 최신 거래
+    latest_price: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="최신 거래 가격 (만원)"
+    )
+
+    latest_area: Mapped[Optional[float]] = mapped_column(
+        Numeric(7, 2),
+        nullable=True,
+        comment="최신 거래 전용면적 (㎡)"
+    )
+
+    latest_date: Mapped[Optional[date]] = mapped_column(
+        Date,
+        nullable=True,
+        comment="최신 거래일"
+    )
+
+    transaction_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="전체 기간 거래 건수"
+    )
+
+    # 최근 6개월
+    count_6m: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="최근 6개월 거래 건수")
+    avg_price_6m: Mapped[Optional[float]] = mapped_column(Numeric(12, 2), nullable=True, comment="최근 6개월 평균 가격 (만원)")
+    min_price_6m: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="최근 6개월 최저 가격 (만원)")
+    max_price_6m: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="최근 6개월 최고 가격 (만원)")
+    avg_price_per_pyeong_6m: Mapped[Optional[float]] = mapped_column(Numeric(12, 2), nullable=True, comment="최근 6개월 평균 평당가 (만원/평)")
+    avg_area_6m: Mapped[Optional[float]] = mapped_column(Numeric(7, 2), nullable=True, comment="최근 6개월 평균 전용면적 (㎡)")
+
+    # 최근 12개월
+    count_12m: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="최근 12개월 거래 건수")
+    avg_price_12m: Mapped[Optional[float]] = mapped_column(Numeric(12, 2), nullable=True, comment="최근 12개월 평균 가격 (만원)")
+    min_price_12m: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="최근 12개월 최저 가격 (만원)")
+    max_price_12m: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="최근 12개월 최고 가격 (만원)")
+    avg_price_per_pyeong_12m: Mapped[Optional[float]] = mapped_column(Numeric(12, 2), nullable=True, comment="최근 12개월 평균 평당가 (만원/평)")
+    avg_area_12m: Mapped[Optional[float]] = mapped_column(Numeric(7, 2), nullable=True, comment="최근 12개월 평균 전용면적 (㎡)")
+
+    as_of: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="기간 집계 기준일"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="마지막 계산 시각"
+    )
+
+    # ===== 관계 (Relationships) =====
+    apartment = relationship("Apartment", foreign_keys=[apt_id])
+
+    def __repr__(self):
+        return f"<ApartmentPriceSummary(apt_id={self.apt_id}, transaction_type='{self.transaction_type}', area_bucket={self.area_bucket}, latest_price={self.latest_price})>"
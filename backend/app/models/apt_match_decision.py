@@ -0,0 +1,98 @@
+"""
+아파트 매칭 결정 모델
+
+테이블명: apt_match_decisions
+거래 API의 (시군구, 동, 지번, 아파트명) 조합이 어떤 아파트로 매칭되었는지 저장합니다.
+다음 수집 실행에서 같은 조합은 매칭 로직을 거치지 않고 바로 apt_id를 사용합니다.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AptMatchDecision(Base):
+    """
+    아파트 매칭 결정 테이블
+
+    매칭 로직(ApartmentMatcher) 버전이 바뀌면 이전 버전의 결정은 사용하지 않습니다.
+
+    컬럼:
+        - sgg_cd: 시군구 코드 5자리 (PK)
+        - umd_nm: API 법정동 이름 (PK, 없으면 빈 문자열)
+        - jibun: API 지번 (PK, 없으면 빈 문자열)
+        - api_apt_name: API 아파트명 (PK)
+        - apt_id: 매칭된 아파트 ID (FK)
+        - method: 매칭 단계 (address_jibun, name_matching, name_matching_full 등)
+        - matcher_version: 매칭 로직 버전
+        - created_at: 생성일
+        - updated_at: 수정일
+    """
+    __tablename__ = "apt_match_decisions"
+
+    # 복합 기본키 (매칭 키)
+    sgg_cd: Mapped[str] = mapped_column(
+        String(5),
+        primary_key=True,
+        comment="시군구 코드"
+    )
+
+    umd_nm: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        default="",
+        comment="API 법정동 이름"
+    )
+
+    jibun: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        default="",
+        comment="API 지번"
+    )
+
+    api_apt_name: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+        comment="API 아파트명"
+    )
+
+    # 매칭 결과
+    apt_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("apartments.apt_id", ondelete="CASCADE"),
+        nullable=False,
+        comment="매칭된 아파트 ID"
+    )
+
+    method: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+        comment="매칭 단계"
+    )
+
+    matcher_version: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="매칭 로직 버전"
+    )
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        comment="생성일"
+    )
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="수정일"
+    )
+
+    def __repr__(self):
+        return f"<AptMatchDecision(sgg_cd='{self.sgg_cd}', api_apt_name='{self.api_apt_name}', apt_id={self.apt_id}, method='{self.method}')>"
@@ -0,0 +1,127 @@
+"""
+수집 작업 단위 모델
+
+테이블명: collection_work_units
+실거래가 수집을 (종류, 연월, 시군구) 단위로 나눈 작업 큐입니다.
+수집이 중단되어도 완료된 단위는 다시 호출하지 않고 남은 단위부터 이어서 수집합니다.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CollectionWorkUnit(Base):
+    """
+    수집 작업 단위 테이블
+
+    상태 흐름: pending → running → done / failed (failed는 재시도 횟수 내에서 다시 pending처럼 가져감)
+
+    컬럼:
+        - kind: 수집 종류 (sales, rents) (PK)
+        - ym: 계약 연월 YYYYMM (PK)
+        - sgg_cd: 시군구 코드 5자리 (PK)
+        - status: 상태 (pending, running, done, failed)
+        - attempts: 시도 횟수
+        - fetched_count: API에서 가져온 거래 수 (마지막 시도 기준)
+        - saved_count: 저장한 거래 수 (마지막 시도 기준)
+        - duration_ms: 마지막 시도 소요 시간 (밀리초)
+        - last_error: 마지막 오류 메시지
+        - started_at: 마지막 시도 시작 시각
+        - finished_at: 마지막 시도 종료 시각
+        - created_at: 생성일
+        - updated_at: 수정일
+    """
+    __tablename__ = "collection_work_units"
+
+    # 복합 기본키 (작업 단위)
+    kind: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True,
+        comment="수집 종류 (sales, rents)"
+    )
+
+    ym: Mapped[str] = mapped_column(
+        String(6),
+        primary_key=True,
+        comment="계약 연월 (YYYYMM)"
+    )
+
+    sgg_cd: Mapped[str] = mapped_column(
+        String(5),
+        primary_key=True,
+        comment="시군구 코드"
+    )
+
+    # 진행 상태
+    status: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+        default="pending",
+        comment="상태 (pending, running, done, failed)"
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="시도 횟수"
+    )
+
+    fetched_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="API에서 가져온 거래 수"
+    )
+
+    saved_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="저장한 거래 수"
+    )
+
+    duration_ms: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="소요 시간 (밀리초)"
+    )
+
+    last_error: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        comment="마지막 오류 메시지"
+    )
+
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="시작 시각"
+    )
+
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        comment="종료 시각"
+    )
+
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        comment="생성일"
+    )
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        nullable=True,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="수정일"
+    )
+
+    def __repr__(self):
+        return f"<CollectionWorkUnit(kind='{self.kind}', ym='{self.ym}', sgg_cd='{self.sgg_cd}', status='{self.status}', attempts={self.attempts})>"
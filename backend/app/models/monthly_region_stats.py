@@ -0,0 +1,134 @@
+"""
+월별 지역 거래 집계 모델
+
+테이블명: monthly_region_stats
+(지역, 연월, 거래 유형) 단위로 거래 건수/가격/평당가/면적 합계와 평균을 저장하는 롤업 테이블입니다.
+실거래가 수집 시 저장된 거래가 있는 월만 다시 집계하며,
+지도/대시보드/통계 API는 원본 거래 테이블 대신 이 테이블을 조회합니다.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class MonthlyRegionStats(Base):
+    """
+    월별 지역 거래 집계 테이블
+
+    여러 달을 합칠 때는 평균끼리 평균내지 말고 합계/건수로 다시 계산합니다.
+    (예: 평균가 = SUM(total_price) / SUM(price_count))
+
+    컬럼:
+        - region_id: 지역 ID (PK, FK, 읍면동 단위 - apartments.region_id)
+        - ym: 계약 연월 YYYYMM (PK)
+        - transaction_type: 거래 유형 (PK, sale, jeonse, wolse)
+        - transaction_count: 거래 건수 (취소/삭제 제외)
+        - price_count: 가격이 있는 거래 건수
+        - total_price: 가격 합계 (만원, 전월세는 보증금)
+        - avg_price: 평균 가격 (만원)
+        - pyeong_count: 평당가 계산 가능 거래 건수 (가격 있음, 전용면적 > 0)
+        - total_price_per_pyeong: 평당가 합계 (만원/평)
+        - avg_price_per_pyeong: 평균 평당가 (만원/평)
+        - total_area: 전용면적 합계 (㎡)
+        - avg_area: 평균 전용면적 (㎡)
+        - updated_at: 마지막 집계 시각
+    """
+    __tablename__ = "monthly_region_stats"
+
+    # 복합 기본키
+    region_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("states.region_id"),
+        primary_key=True,
+        comment="지역 ID"
+    )
+
+    ym: Mapped[str] = mapped_column(
+        String(6),
+        primary_key=True,
+        comment="계약 연월 (YYYYMM)"
+    )
+
+    transaction_type: Mapped[str] = mapped_column(
+        String(10),
+        primary_key=True,
+        comment="거래 유형 (sale, jeonse, wolse)"
+    )
+
+    # 거래 건수
+    transaction_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="거래 건수"
+    )
+
+    # 가격
+    price_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="가격이 있는 거래 건수"
+    )
+
+    total_price: Mapped[Optional[float]] = mapped_column(
+        Numeric(18, 2),
+        nullable=True,
+        comment="가격 합계 (만원)"
+    )
+
+    avg_price: Mapped[Optional[float]] = mapped_column(
+        Numeric(12, 2),
+        nullable=True,
+        comment="평균 가격 (만원)"
+    )
+
+    # 평당가
+    pyeong_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="평당가 계산 가능 거래 건수"
+    )
+
+    total_price_per_pyeong: Mapped[Optional[float]] = mapped_column(
+        Numeric(18, 2),
+        nullable=True,
+        comment="평당가 합계 (만원/평)"
+    )
+
+    avg_price_per_pyeong: Mapped[Optional[float]] = mapped_column(
+        Numeric(12, 2),
+        nullable=True,
+        comment="평균 평당가 (만원/평)"
+    )
+
+    # 면적
+    total_area: Mapped[Optional[float]] = mapped_column(
+        Numeric(14, 2),
+        nullable=True,
+        comment="전용면적 합계 (㎡)"
+    )
+
+    avg_area: Mapped[Optional[float]] = mapped_column(
+        Numeric(7, 2),
+        nullable=True,
+        comment="평균 전용면적 (㎡)"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        comment="마지막 집계 시각"
+    )
+
+    # ===== 관계 (Relationships) =====
+    region = relationship("State", foreign_keys=[region_id])
+
+    def __repr__(self):
+        return f"<MonthlyRegionStats(region_id={self.region_id}, ym='{self.ym}', transaction_type='{self.transaction_type}', transaction_count={self.transaction_count})>"
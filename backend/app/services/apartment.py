@@ -21,6 +21,7 @@ from geoalchemy2.shape import to_shape
 
 from app.core.redis import get_redis_client
 from app.crud.apartment import apartment as apart_crud
+from app.services.apartment_neighbor_service import apartment_neighbor_service
 from app.models.apartment import Apartment
 from app.models.apart_detail import ApartDetail
 from app.models.sale import Sale
@@ -354,8 +355,8 @@ class ApartmentService:
             "jibun_address": target_detail.jibun_address
         }
         
-        # 2. 반경 내 주변 아파트 조회 (거리순 정렬)
-        nearby_list = await apart_crud.get_nearby_within_radius(
+        # 2. 반경 내 주변 아파트 조회 (거리순 정렬, 사전 계산 목록 우선)
+        nearby_list = await apartment_neighbor_service.get_nearby(
             db,
             apt_id=apt_id,
             radius_meters=radius_meters,  # 실제 반경 제한 적용
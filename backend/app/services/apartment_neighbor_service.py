@@ -0,0 +1,267 @@
+"""
+아파트 주변 단지 서비스
+
+아파트별 가장 가까운 단지 K개를 저장하는 사전 계산 테이블(apartment_neighbors)을 관리합니다.
+- 계산: 아파트마다 geography(geometry) 인덱스 KNN(<->) 1회 (O(k log n))
+- 갱신: geometry가 바뀐 아파트와, 그 변경으로 주변 단지 목록이 달라질 수 있는 아파트만 다시 계산
+- 조회: 사전 계산 목록을 먼저 쓰고, 없거나 오래된 경우 KNN 쿼리로 조회
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.apartment import apartment as apart_crud
+from app.models.apart_detail import ApartDetail
+from app.models.apartment_neighbor import ApartmentNeighbor
+
+logger = logging.getLogger(__name__)
+
+# 아파트별 저장하는 주변 단지 수 (주변 아파트 비교 API limit 이상)
+NEIGHBOR_K = 20
+
+# 한 번에 다시 계산할 아파트 수
+REFRESH_CHUNK_SIZE = 1000
+
+_DELETE_SQL = text("DELETE FROM apartment_neighbors WHERE apt_id = ANY(:apt_ids)")
+
+# 기준 아파트마다 인덱스 KNN으로 가까운 K개를 읽고 실제 거리순으로 순위를 매김
+_REFRESH_SQL = text("""
+    INSERT INTO apartment_neighbors (apt_id, rank, neighbor_apt_id, distance_meters, updated_at)
+    SELECT ranked.apt_id, ranked.rank, ranked.neighbor_apt_id, ranked.distance_meters, NOW()
+    FROM (
+        SELECT t.apt_id, knn.apt_id AS neighbor_apt_id, knn.distance_meters,
+               ROW_NUMBER() OVER (PARTITION BY t.apt_id ORDER BY knn.distance_meters, knn.apt_id) AS rank
+        FROM apart_details t
+        CROSS JOIN LATERAL (
+            SELECT n.apt_id, ST_Distance(geography(n.geometry), geography(t.geometry)) AS distance_meters
+            FROM apart_details n
+            WHERE n.is_deleted = FALSE
+              AND n.geometry IS NOT NULL
+              AND n.apt_id <> t.apt_id
+            ORDER BY geography(n.geometry) <-> geography(t.geometry)
+            LIMIT :k
+        ) knn
+        WHERE t.apt_id = ANY(:apt_ids)
+          AND t.is_deleted = FALSE
+          AND t.geometry IS NOT NULL
+    ) ranked
+""")
+
+# 바뀐 아파트를 주변 단지로 가지고 있던 아파트 (위치가 멀어졌을 수 있음)
+_LISTED_BY_SQL = text("""
+    SELECT DISTINCT apt_id FROM apartment_neighbors WHERE neighbor_apt_id = ANY(:apt_ids)
+""")
+
+# 모든 아파트의 K번째 주변 단지 거리 중 최댓값 (새 위치가 어떤 목록에 들어갈 수 있는 최대 거리)
+_MAX_REACH_SQL = text("""
+    SELECT MAX(distance_meters) AS reach FROM apartment_neighbors WHERE rank = :k
+""")
+
+# 새 위치가 K번째 주변 단지보다 가까운 아파트 (또는 목록이 K개 미만인 아파트)
+_REACHED_SQL = text("""
+    SELECT DISTINCT a.apt_id
+    FROM apart_details c
+    JOIN apart_details a
+      ON a.is_deleted = FALSE
+     AND a.geometry IS NOT NULL
+     AND a.apt_id <> c.apt_id
+     AND ST_DWithin(geography(a.geometry), geography(c.geometry), :reach)
+    LEFT JOIN apartment_neighbors kth
+      ON kth.apt_id = a.apt_id AND kth.rank = :k
+    WHERE c.apt_id = ANY(:apt_ids)
+      AND c.is_deleted = FALSE
+      AND c.geometry IS NOT NULL
+      AND (
+          kth.apt_id IS NULL
+          OR ST_Distance(geography(a.geometry), geography(c.geometry)) <= kth.distance_meters
+      )
+""")
+
+_ALL_APT_IDS_SQL = text("""
+    SELECT apt_id FROM apart_details WHERE is_deleted = FALSE AND geometry IS NOT NULL
+""")
+
+_DELETE_STALE_SQL = text("DELETE FROM apartment_neighbors WHERE apt_id <> ALL(:apt_ids)")
+
+
+@dataclass
+class NeighborMetrics:
+    """주변 단지 조회/갱신 지표"""
+    precomputed_hits: int = 0
+    live_lookups: int = 0
+    stale_fallbacks: int = 0
+    refreshes: int = 0
+    refreshed_apartments: int = 0
+    last_refresh_ms: float = 0.0
+    max_refresh_ms: float = 0.0
+
+    def observe_refresh(self, apartments: int, elapsed: float) -> None:
+        self.refreshes += 1
+        self.refreshed_apartments += apartments
+        self.last_refresh_ms = elapsed * 1000
+        self.max_refresh_ms = max(self.max_refresh_ms, self.last_refresh_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.precomputed_hits + self.live_lookups
+        return {
+            "precomputed_hits": self.precomputed_hits,
+            "live_lookups": self.live_lookups,
+            "stale_fallbacks": self.stale_fallbacks,
+            "hit_rate": round(self.precomputed_hits / lookups, 4) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refreshed_apartments": self.refreshed_apartments,
+            "last_refresh_ms": round(self.last_refresh_ms, 1),
+            "max_refresh_ms": round(self.max_refresh_ms, 1),
+        }
+
+
+class ApartmentNeighborService:
+    """아파트 주변 단지 서비스"""
+
+    def __init__(self, k: int = NEIGHBOR_K):
+        self.k = k
+        self._metrics = NeighborMetrics()
+
+    async def refresh_apartments(self, db: AsyncSession, apt_ids: Iterable[int]) -> int:
+        """
+        지정한 아파트의 주변 단지 목록을 다시 계산 (아파트 묶음 단위 DELETE + INSERT ... SELECT)
+
+        geometry가 없거나 삭제된 아파트는 목록만 삭제됩니다.
+
+        Returns:
+            저장된 행 수
+        """
+        targets = sorted({apt_id for apt_id in apt_ids if apt_id})
+        if not targets:
+            return 0
+
+        started = time.perf_counter()
+        total_rows = 0
+        for offset in range(0, len(targets), REFRESH_CHUNK_SIZE):
+            chunk = targets[offset:offset + REFRESH_CHUNK_SIZE]
+            await db.execute(_DELETE_SQL, {"apt_ids": chunk})
+            result = await db.execute(_REFRESH_SQL, {"apt_ids": chunk, "k": self.k})
+            total_rows += result.rowcount or 0
+            await db.commit()
+
+        elapsed = time.perf_counter() - started
+        self._metrics.observe_refresh(len(targets), elapsed)
+        logger.info(
+            f" 주변 단지 목록 갱신: {len(targets)}개 아파트, {total_rows}행, {elapsed * 1000:.1f}ms"
+        )
+        return total_rows
+
+    async def refresh_for_geometry_change(self, db: AsyncSession, apt_ids: Iterable[int]) -> int:
+        """
+        geometry가 바뀐 아파트 기준으로 영향받는 아파트만 다시 계산
+
+        영향받는 아파트:
+            - geometry가 바뀐 아파트
+            - 바뀐 아파트를 주변 단지로 가지고 있던 아파트
+            - 바뀐 아파트의 새 위치가 K번째 주변 단지보다 가까운 아파트
+
+        geometry 변경이 커밋된 뒤 호출해야 합니다.
+        """
+        changed = sorted({apt_id for apt_id in apt_ids if apt_id})
+        if not changed:
+            return 0
+
+        result = await db.execute(_MAX_REACH_SQL, {"k": self.k})
+        reach = result.scalar()
+        if reach is None:
+            # 주변 단지가 K개인 아파트가 없음 (단지 수가 적음) → 전체 재계산
+            return await self.rebuild_all(db)
+
+        affected = set(changed)
+        result = await db.execute(_LISTED_BY_SQL, {"apt_ids": changed})
+        affected.update(row.apt_id for row in result.fetchall())
+        result = await db.execute(
+            _REACHED_SQL,
+            {"apt_ids": changed, "k": self.k, "reach": float(reach)}
+        )
+        affected.update(row.apt_id for row in result.fetchall())
+
+        logger.info(f" geometry 변경 {len(changed)}건 → 주변 단지 재계산 대상 {len(affected)}개 아파트")
+        return await self.refresh_apartments(db, affected)
+
+    async def rebuild_all(self, db: AsyncSession) -> int:
+        """geometry가 있는 모든 아파트의 주변 단지 목록을 다시 계산"""
+        result = await db.execute(_ALL_APT_IDS_SQL)
+        apt_ids = [row.apt_id for row in result.fetchall()]
+        # geometry가 없어지거나 삭제된 아파트의 목록 정리
+        await db.execute(_DELETE_STALE_SQL, {"apt_ids": apt_ids})
+        await db.commit()
+        return await self.refresh_apartments(db, apt_ids)
+
+    async def get_nearby(
+        self,
+        db: AsyncSession,
+        *,
+        apt_id: int,
+        radius_meters: Optional[float] = 500,
+        limit: int = 10
+    ) -> List[Tuple[ApartDetail, float]]:
+        """
+        반경 내 주변 아파트 조회 (거리순)
+
+        limit이 K 이하이면 사전 계산 목록(기본키 조회)을 사용합니다.
+        목록은 전체 거리순 상위 K개이므로 반경 필터 후 앞에서 limit개를 자르면 KNN 결과와 같습니다.
+        목록이 없거나 삭제된 단지가 있으면 KNN 쿼리(apart_crud.get_nearby_within_radius)로 조회합니다.
+
+        Returns:
+            (ApartDetail, distance_meters) 튜플 리스트
+        """
+        if limit <= self.k:
+            result = await db.execute(
+                select(ApartmentNeighbor.neighbor_apt_id, ApartmentNeighbor.distance_meters)
+                .where(ApartmentNeighbor.apt_id == apt_id)
+                .order_by(ApartmentNeighbor.rank)
+            )
+            neighbors = result.all()
+            if neighbors:
+                picked = [
+                    (row.neighbor_apt_id, float(row.distance_meters))
+                    for row in neighbors
+                    if radius_meters is None or float(row.distance_meters) <= radius_meters
+                ][:limit]
+                details = await self._load_details(db, [neighbor_apt_id for neighbor_apt_id, _ in picked])
+                if len(details) == len(picked):
+                    self._metrics.precomputed_hits += 1
+                    return [(details[neighbor_apt_id], distance) for neighbor_apt_id, distance in picked]
+                self._metrics.stale_fallbacks += 1
+                logger.debug(f" 주변 단지 목록에 삭제된 단지 포함: apt_id={apt_id} → KNN 조회")
+
+        self._metrics.live_lookups += 1
+        return await apart_crud.get_nearby_within_radius(
+            db,
+            apt_id=apt_id,
+            radius_meters=radius_meters,
+            limit=limit
+        )
+
+    async def _load_details(self, db: AsyncSession, apt_ids: List[int]) -> Dict[int, ApartDetail]:
+        if not apt_ids:
+            return {}
+        result = await db.execute(
+            select(ApartDetail).where(
+                ApartDetail.apt_id.in_(apt_ids),
+                ApartDetail.is_deleted == False,
+                ApartDetail.geometry.isnot(None)
+            )
+        )
+        return {detail.apt_id: detail for detail in result.scalars().all()}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """주변 단지 지표"""
+        return {"k": self.k, **self._metrics.to_dict()}
+
+    def reset_metrics(self) -> None:
+        self._metrics = NeighborMetrics()
+
+
+# 서비스 인스턴스
+apartment_neighbor_service = ApartmentNeighborService()
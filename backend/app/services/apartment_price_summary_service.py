@@ -0,0 +1,337 @@
+"""
+아파트별 가격 요약 서비스
+
+(아파트, 거래 유형, 평형) 단위 요약 테이블(apartment_price_summary)을 관리합니다.
+실거래가 수집이 끝나면 거래가 저장된 아파트만 다시 계산하고,
+관심 아파트/내 집/지도/비교/평형별 가격 API가 조회할 때 쓰는 헬퍼를 제공합니다.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.monthly_region_stats_service import (
+    STATS_KIND_RENT,
+    STATS_KIND_SALE,
+    STATS_TYPE_JEONSE,
+    STATS_TYPE_SALE,
+    ym_bounds,
+)
+
+logger = logging.getLogger(__name__)
+
+# 전체 면적 평형 값
+AREA_BUCKET_ALL = 0
+
+# 평형 계산 기준 (㎡ → 평)
+PYEONG_AREA = 3.3058
+
+# 기간 집계 (개월 → 일수, 기존 API와 같이 1개월 = 30일)
+SUMMARY_WINDOWS = (6, 12)
+
+# 한 번에 다시 계산할 아파트 수
+REFRESH_CHUNK_SIZE = 2000
+
+_KIND_TRANSACTION_TYPE = {
+    STATS_KIND_SALE: STATS_TYPE_SALE,
+    STATS_KIND_RENT: STATS_TYPE_JEONSE,
+}
+
+# 요약 대상 원본 거래 (가격 > 0, 전용면적 > 0, 거래일 있음)
+_SOURCE_SQL = {
+    STATS_KIND_SALE: """
+        SELECT s.apt_id, s.trans_id AS deal_id, s.trans_price AS price,
+               s.exclusive_area AS area, s.contract_date AS deal_date
+        FROM sales s
+        WHERE s.apt_id = ANY(:apt_ids)
+          AND s.is_canceled = FALSE
+          AND (s.is_deleted = FALSE OR s.is_deleted IS NULL)
+          AND s.trans_price > 0
+          AND s.exclusive_area > 0
+          AND s.contract_date IS NOT NULL
+    """,
+    # 전세만 (월세 0 또는 NULL, 가격은 보증금)
+    STATS_KIND_RENT: """
+        SELECT r.apt_id, r.trans_id AS deal_id, r.deposit_price AS price,
+               r.exclusive_area AS area, r.deal_date AS deal_date
+        FROM rents r
+        WHERE r.apt_id = ANY(:apt_ids)
+          AND (r.monthly_rent = 0 OR r.monthly_rent IS NULL)
+          AND (r.is_deleted = FALSE OR r.is_deleted IS NULL)
+          AND r.deposit_price > 0
+          AND r.exclusive_area > 0
+          AND r.deal_date IS NOT NULL
+    """,
+}
+
+# 평형별 + 전체(0) 요약 계산
+_SUMMARY_SQL = """
+    WITH src AS ({source}),
+    keyed AS (
+        SELECT apt_id, GREATEST(ROUND(area / {pyeong_area}), 1)::SMALLINT AS area_bucket,
+               deal_id, price, area, deal_date
+        FROM src
+        UNION ALL
+        SELECT apt_id, {bucket_all}::SMALLINT, deal_id, price, area, deal_date
+        FROM src
+    ),
+    latest AS (
+        SELECT DISTINCT ON (apt_id, area_bucket) apt_id, area_bucket, price, area, deal_date
+        FROM keyed
+        ORDER BY apt_id, area_bucket, deal_date DESC, deal_id DESC
+    ),
+    agg AS (
+        SELECT
+            apt_id, area_bucket,
+            COUNT(*) AS transaction_count,
+            COUNT(*) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS count_6m,
+            AVG(price) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS avg_price_6m,
+            MIN(price) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS min_price_6m,
+            MAX(price) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS max_price_6m,
+            AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS avg_price_per_pyeong_6m,
+            AVG(area) FILTER (WHERE deal_date BETWEEN :start_6m AND :as_of) AS avg_area_6m,
+            COUNT(*) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS count_12m,
+            AVG(price) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS avg_price_12m,
+            MIN(price) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS min_price_12m,
+            MAX(price) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS max_price_12m,
+            AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS avg_price_per_pyeong_12m,
+            AVG(area) FILTER (WHERE deal_date BETWEEN :start_12m AND :as_of) AS avg_area_12m
+        FROM keyed
+        GROUP BY apt_id, area_bucket
+    )
+    INSERT INTO apartment_price_summary (
+        apt_id, transaction_type, area_bucket,
+        latest_price, latest_area, latest_date, transaction_count,
+        count_6m, avg_price_6m, min_price_6m, max_price_6m, avg_price_per_pyeong_6m, avg_area_6m,
+        count_12m, avg_price_12m, min_price_12m, max_price_12m, avg_price_per_pyeong_12m, avg_area_12m,
+        as_of, updated_at
+    )
+    SELECT
+        agg.apt_id, :transaction_type, agg.area_bucket,
+        latest.price, latest.area, latest.deal_date, agg.transaction_count,
+        agg.count_6m, agg.avg_price_6m, agg.min_price_6m, agg.max_price_6m, agg.avg_price_per_pyeong_6m, agg.avg_area_6m,
+        agg.count_12m, agg.avg_price_12m, agg.min_price_12m, agg.max_price_12m, agg.avg_price_per_pyeong_12m, agg.avg_area_12m,
+        :as_of, NOW()
+    FROM agg
+    JOIN latest ON latest.apt_id = agg.apt_id AND latest.area_bucket = agg.area_bucket
+"""
+
+_DELETE_SQL = text(
+    "DELETE FROM apartment_price_summary "
+    "WHERE apt_id = ANY(:apt_ids) AND transaction_type = :transaction_type"
+)
+
+# 거래가 없어진 아파트의 요약 정리 (전체 재계산 시)
+_DELETE_STALE_SQL = text(
+    "DELETE FROM apartment_price_summary "
+    "WHERE transaction_type = :transaction_type AND apt_id <> ALL(:apt_ids)"
+)
+
+# 기간 내 거래가 있는 아파트 (이어서 수집 시 갱신 대상)
+_APT_IDS_IN_RANGE_SQL = {
+    STATS_KIND_SALE: "SELECT DISTINCT apt_id FROM sales WHERE contract_date BETWEEN :start_date AND :end_date",
+    STATS_KIND_RENT: "SELECT DISTINCT apt_id FROM rents WHERE deal_date BETWEEN :start_date AND :end_date",
+}
+
+_ALL_APT_IDS_SQL = {
+    STATS_KIND_SALE: "SELECT DISTINCT apt_id FROM sales",
+    STATS_KIND_RENT: "SELECT DISTINCT apt_id FROM rents",
+}
+
+
+def area_bucket_of(area: Optional[float]) -> int:
+    """전용면적(㎡) → 평형 (요약 테이블과 같은 계산)"""
+    if not area or area <= 0:
+        return AREA_BUCKET_ALL
+    return max(round(area / PYEONG_AREA), 1)
+
+
+def window_start(as_of: date, months: int) -> date:
+    """기간 집계 시작일 (as_of 포함 최근 months * 30일)"""
+    return as_of - timedelta(days=months * 30)
+
+
+class ApartmentPriceSummaryService:
+    """아파트별 가격 요약 서비스"""
+
+    async def refresh_apartments(
+        self,
+        db: AsyncSession,
+        kind: str,
+        apt_ids: Iterable[int],
+        as_of: Optional[date] = None
+    ) -> int:
+        """
+        지정한 아파트의 요약을 원본 거래 테이블에서 다시 계산 (아파트 묶음 단위 DELETE + INSERT ... SELECT)
+
+        Args:
+            db: 데이터베이스 세션
+            kind: 요약 종류 (sale, rent)
+            apt_ids: 다시 계산할 아파트 ID 목록
+            as_of: 기간 집계 기준일 (기본값: 오늘)
+
+        Returns:
+            저장된 요약 행 수
+        """
+        if kind not in _SOURCE_SQL:
+            raise ValueError(f"유효하지 않은 요약 종류: {kind}")
+
+        targets = sorted({apt_id for apt_id in apt_ids if apt_id})
+        if not targets:
+            return 0
+
+        as_of = as_of or date.today()
+        transaction_type = _KIND_TRANSACTION_TYPE[kind]
+        summary_stmt = text(_SUMMARY_SQL.format(
+            source=_SOURCE_SQL[kind],
+            pyeong_area=PYEONG_AREA,
+            bucket_all=AREA_BUCKET_ALL,
+        ))
+        params = {
+            "transaction_type": transaction_type,
+            "as_of": as_of,
+            "start_6m": window_start(as_of, 6),
+            "start_12m": window_start(as_of, 12),
+        }
+
+        total_rows = 0
+        for offset in range(0, len(targets), REFRESH_CHUNK_SIZE):
+            chunk = targets[offset:offset + REFRESH_CHUNK_SIZE]
+            await db.execute(_DELETE_SQL, {"apt_ids": chunk, "transaction_type": transaction_type})
+            result = await db.execute(summary_stmt, {**params, "apt_ids": chunk})
+            total_rows += result.rowcount or 0
+            await db.commit()
+
+        logger.info(
+            f" 아파트 가격 요약 갱신: {transaction_type} "
+            f"({len(targets)}개 아파트, {total_rows}행, 기준일 {as_of.isoformat()})"
+        )
+        return total_rows
+
+    async def apt_ids_in_months(self, db: AsyncSession, kind: str, yms: Iterable[str]) -> List[int]:
+        """
+        지정한 월에 거래가 있는 아파트 ID 목록
+
+        이어서 수집하는 경우처럼 어떤 아파트가 바뀌었는지 모를 때 갱신/무효화 대상으로 사용합니다.
+        """
+        if kind not in _APT_IDS_IN_RANGE_SQL:
+            raise ValueError(f"유효하지 않은 요약 종류: {kind}")
+
+        months = sorted({ym for ym in yms if ym and len(ym) == 6})
+        if not months:
+            return []
+
+        start_date, _ = ym_bounds(months[0])
+        _, end_date = ym_bounds(months[-1])
+        result = await db.execute(
+            text(_APT_IDS_IN_RANGE_SQL[kind]),
+            {"start_date": start_date, "end_date": end_date}
+        )
+        return [row.apt_id for row in result.fetchall()]
+
+    async def refresh_months(self, db: AsyncSession, kind: str, yms: Iterable[str]) -> int:
+        """지정한 월에 거래가 있는 아파트의 요약을 다시 계산"""
+        apt_ids = await self.apt_ids_in_months(db, kind, yms)
+        return await self.refresh_apartments(db, kind, apt_ids)
+
+    async def rebuild_all(self, db: AsyncSession, kind: Optional[str] = None) -> dict:
+        """
+        거래가 있는 모든 아파트의 요약을 다시 계산 (기간 집계 기준일을 오늘로 맞춤)
+
+        거래가 없어진 아파트의 요약 행은 삭제합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            kind: 요약 종류 (None이면 매매/전세 모두)
+
+        Returns:
+            종류별 요약 행 수
+        """
+        if kind is not None and kind not in _SOURCE_SQL:
+            raise ValueError(f"유효하지 않은 요약 종류: {kind}")
+
+        kinds = [kind] if kind else list(_SOURCE_SQL)
+        summary = {}
+        for target_kind in kinds:
+            result = await db.execute(text(_ALL_APT_IDS_SQL[target_kind]))
+            apt_ids = [row.apt_id for row in result.fetchall()]
+            await db.execute(
+                _DELETE_STALE_SQL,
+                {"apt_ids": apt_ids, "transaction_type": _KIND_TRANSACTION_TYPE[target_kind]}
+            )
+            await db.commit()
+            summary[target_kind] = await self.refresh_apartments(db, target_kind, apt_ids)
+        return summary
+
+    async def get_summaries(
+        self,
+        db: AsyncSession,
+        apt_ids: Sequence[int],
+        transaction_types: Sequence[str] = (STATS_TYPE_SALE,),
+        area_bucket: Optional[int] = AREA_BUCKET_ALL
+    ) -> Dict[Tuple[int, str, int], dict]:
+        """
+        요약 조회 (기본키 인덱스 조회 1회)
+
+        Args:
+            apt_ids: 아파트 ID 목록
+            transaction_types: 거래 유형 목록 (sale, jeonse)
+            area_bucket: 평형 (None이면 모든 평형, 기본값: 전체 면적)
+
+        Returns:
+            {(apt_id, transaction_type, area_bucket): 요약 dict}
+        """
+        if not apt_ids:
+            return {}
+
+        params = {"apt_ids": list(apt_ids), "transaction_types": list(transaction_types)}
+        bucket_filter = ""
+        if area_bucket is not None:
+            bucket_filter = "AND area_bucket = :area_bucket"
+            params["area_bucket"] = area_bucket
+        result = await db.execute(
+            text(f"""
+                SELECT *
+                FROM apartment_price_summary
+                WHERE apt_id = ANY(:apt_ids)
+                  AND transaction_type = ANY(:transaction_types)
+                  {bucket_filter}
+            """),
+            params
+        )
+        return {
+            (row["apt_id"], row["transaction_type"], row["area_bucket"]): dict(row)
+            for row in result.mappings().all()
+        }
+
+
+def pick_latest_by_area(
+    summaries: Iterable[dict],
+    target_area: Optional[float],
+    tolerance: float,
+    since: Optional[date] = None
+) -> Optional[dict]:
+    """
+    평형별 요약 중 최신 거래 전용면적이 target_area ± tolerance 인 가장 최근 요약
+
+    Args:
+        summaries: 한 아파트/거래 유형의 평형별 요약
+        since: 이 날짜 이후 거래만 (None이면 전체)
+    """
+    matched: List[dict] = []
+    for summary in summaries:
+        if summary["area_bucket"] == AREA_BUCKET_ALL or summary.get("latest_date") is None:
+            continue
+        if since is not None and summary["latest_date"] < since:
+            continue
+        if target_area and abs(float(summary["latest_area"] or 0) - target_area) <= tolerance:
+            matched.append(summary)
+    if not matched:
+        return None
+    return max(matched, key=lambda summary: summary["latest_date"])
+
+
+# 서비스 인스턴스
+apartment_price_summary_service = ApartmentPriceSummaryService()
@@ -5,10 +5,10 @@
 """
 import logging
 import sys
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import datetime, date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import select, and_, or_, desc, func, insert
 
 from app.models.asset_activity_log import AssetActivityLog
 from app.schemas.asset_activity_log import AssetActivityLogCreate
@@ -321,6 +321,165 @@ async def trigger_price_change_log_if_needed(
         )
 
 
+async def trigger_price_change_logs_bulk(
+    db: AsyncSession,
+    new_sales: Sequence[Dict[str, Any]]
+) -> int:
+    """
+    수집 배치 단위 가격 변동 로그 생성 (set-based)
+    
+    trigger_price_change_log_if_needed를 거래마다 호출하는 대신,
+    배치에서 새로 저장된 거래를 모아 한 번에 처리합니다.
+    판정 기준(최근 1년 내 두 번째 최신 거래 대비 1% 이상 변동, 같은 날짜 중복 방지)은 동일합니다.
+    
+    1. 배치의 apt_id 중 my_properties / favorite_apartments에 등록된 아파트만 선별 (쿼리 2회)
+    2. 등록된 아파트의 최근 1년 최신 거래 2건을 윈도우 함수로 한 번에 조회
+    3. 기존 가격 변동 로그를 한 번에 조회해 메모리에서 중복 제거
+    4. AssetActivityLog 일괄 INSERT (커밋은 호출자 책임)
+    
+    Args:
+        db: 데이터베이스 세션 (새 거래가 이미 INSERT된 트랜잭션)
+        new_sales: 새로 저장된 거래 목록 (apt_id, trans_price, contract_date 키 필요)
+    
+    Returns:
+        생성된 로그 개수
+    """
+    from app.models.my_property import MyProperty
+    from app.models.favorite import FavoriteApartment
+    from app.models.sale import Sale
+    
+    sales = [
+        sale for sale in new_sales
+        if sale.get("apt_id") and sale.get("trans_price")
+    ]
+    if not sales:
+        return 0
+    
+    apt_ids = {sale["apt_id"] for sale in sales}
+    
+    # 1. 등록된 아파트 구독자 조회 (apt_id -> [(category, account_id)])
+    subscribers: Dict[int, List[Tuple[str, int]]] = {}
+    
+    my_properties_result = await db.execute(
+        select(MyProperty.apt_id, MyProperty.account_id).where(
+            MyProperty.apt_id.in_(apt_ids),
+            MyProperty.is_deleted == False
+        )
+    )
+    for row in my_properties_result.all():
+        subscribers.setdefault(row.apt_id, []).append(("MY_ASSET", row.account_id))
+    
+    favorites_result = await db.execute(
+        select(FavoriteApartment.apt_id, FavoriteApartment.account_id).where(
+            FavoriteApartment.apt_id.in_(apt_ids),
+            FavoriteApartment.is_deleted == False,
+            FavoriteApartment.account_id.isnot(None)
+        )
+    )
+    for row in favorites_result.all():
+        subscribers.setdefault(row.apt_id, []).append(("INTEREST", row.account_id))
+    
+    if not subscribers:
+        # 등록된 아파트가 없으면 로그 생성하지 않음 (대부분의 배치)
+        return 0
+    
+    # 2. 최근 1년 내 최신 거래 2건 조회 (두 번째 거래가를 이전 가격으로 사용)
+    one_year_ago = datetime.now().date() - timedelta(days=365)
+    ranked = (
+        select(
+            Sale.apt_id,
+            Sale.trans_price,
+            func.row_number().over(
+                partition_by=Sale.apt_id,
+                order_by=Sale.contract_date.desc()
+            ).label("rn")
+        )
+        .where(
+            Sale.apt_id.in_(subscribers.keys()),
+            Sale.is_canceled == False,
+            Sale.trans_price.isnot(None),
+            Sale.contract_date >= one_year_ago
+        )
+        .subquery()
+    )
+    previous_result = await db.execute(
+        select(ranked.c.apt_id, ranked.c.trans_price).where(ranked.c.rn == 2)
+    )
+    previous_prices: Dict[int, int] = {
+        row.apt_id: row.trans_price for row in previous_result.all()
+    }
+    
+    # 3. 1% 이상 변동 후보 계산 (같은 계정/아파트/카테고리/날짜는 한 번만)
+    candidates: Dict[Tuple[int, int, str, date], Dict[str, Any]] = {}
+    today = datetime.now().date()
+    for sale in sales:
+        apt_id = sale["apt_id"]
+        previous_price = previous_prices.get(apt_id)
+        if apt_id not in subscribers or not previous_price:
+            continue
+        
+        new_price = sale["trans_price"]
+        if abs(new_price - previous_price) / previous_price < 0.01:
+            continue
+        
+        check_date = sale.get("contract_date") or today
+        price_change = new_price - previous_price
+        for category, account_id in subscribers[apt_id]:
+            key = (account_id, apt_id, category, check_date)
+            if key in candidates:
+                continue
+            candidates[key] = {
+                "account_id": account_id,
+                "apt_id": apt_id,
+                "category": category,
+                "event_type": "PRICE_UP" if price_change > 0 else "PRICE_DOWN",
+                "price_change": abs(price_change),
+                "previous_price": previous_price,
+                "current_price": new_price,
+            }
+    
+    if not candidates:
+        return 0
+    
+    # 4. 기존 가격 변동 로그와 중복 제거 (한 번의 조회)
+    check_dates = {key[3] for key in candidates}
+    log_date = func.date(AssetActivityLog.created_at)
+    existing_result = await db.execute(
+        select(
+            AssetActivityLog.account_id,
+            AssetActivityLog.apt_id,
+            AssetActivityLog.category,
+            log_date.label("log_date")
+        ).where(
+            AssetActivityLog.apt_id.in_({key[1] for key in candidates}),
+            AssetActivityLog.event_type.in_(["PRICE_UP", "PRICE_DOWN"]),
+            log_date.in_(check_dates)
+        )
+    )
+    existing_keys: Set[Tuple[int, int, str, date]] = {
+        (row.account_id, row.apt_id, row.category, row.log_date)
+        for row in existing_result.all()
+    }
+    
+    now = datetime.utcnow()
+    rows = [
+        {**values, "created_at": now}
+        for key, values in candidates.items()
+        if key not in existing_keys
+    ]
+    if not rows:
+        return 0
+    
+    # 5. 일괄 INSERT
+    await db.execute(insert(AssetActivityLog), rows)
+    
+    logger.info(
+        f" 가격 변동 로그 일괄 생성 - "
+        f"대상 아파트: {len(subscribers)}개, 생성: {len(rows)}개"
+    )
+    return len(rows)
+
+
 async def generate_historical_price_change_logs(
     db: AsyncSession,
     account_id: int,
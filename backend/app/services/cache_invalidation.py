@@ -2,116 +2,251 @@
 캐시 무효화 이벤트 리스너
 
 데이터 업데이트 시 관련 캐시를 자동으로 무효화합니다.
+
+- 행 단위 after_update 리스너는 세션(session.info)에 무효화할 캐시 태그만 모음
+- 트랜잭션 커밋(after_commit) 시 모은 태그를 무효화 큐로 넘기고, 롤백 시 버림
+- 큐는 태그 집합이라 같은 apt_id 는 한 번만 무효화 (중복 제거)
+- 짧게 모은 뒤(debounce) 한 번의 Redis 파이프라인으로 세대 번호를 올림
+- 대기 태그 수에 상한을 두고, 넘치면 전체 통계 태그 하나로 축약
 """
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set
+
 from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
 from app.models.sale import Sale
 from app.models.rent import Rent
 from app.models.apartment import Apartment
 from app.models.apart_detail import ApartDetail
-from app.services.statistics_cache_service import statistics_cache_service
+from app.utils.cache import (
+    STATS_GLOBAL_TAG,
+    apt_tag,
+    invalidate_cache_tags,
+)
 
 logger = logging.getLogger(__name__)
 
+# session.info 에 트랜잭션별 무효화 태그를 모으는 키
+_SESSION_TAGS_KEY = "pending_cache_tags"
+
+# 커밋 후 플러시까지 모으는 시간 (초)
+FLUSH_DELAY_SECONDS = 0.5
+
+# 큐에 대기할 수 있는 최대 태그 수
+MAX_PENDING_TAGS = 10000
+
+
+@dataclass
+class InvalidationQueueMetrics:
+    """무효화 큐 지표"""
+    enqueued: int = 0
+    deduplicated: int = 0
+    dropped: int = 0
+    overflows: int = 0
+    flushes: int = 0
+    flushed_tags: int = 0
+    failures: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+
+    def observe_flush(self, tag_count: int, elapsed: float) -> None:
+        self.flushes += 1
+        self.flushed_tags += tag_count
+        self.last_flush_ms = elapsed * 1000
+        self.max_flush_ms = max(self.max_flush_ms, self.last_flush_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "overflows": self.overflows,
+            "flushes": self.flushes,
+            "flushed_tags": self.flushed_tags,
+            "failures": self.failures,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "max_flush_ms": round(self.max_flush_ms, 1),
+        }
+
+
+class CacheInvalidationQueue:
+    """
+    커밋된 트랜잭션의 캐시 태그를 모아 한 번에 무효화하는 큐
+
+    Args:
+        flush_delay: 첫 태그가 들어온 뒤 플러시까지 기다리는 시간 (초)
+        max_pending: 대기 태그 상한 (넘치면 apt 태그를 버리고 전체 통계 태그만 남김)
+    """
+
+    def __init__(self, flush_delay: float = FLUSH_DELAY_SECONDS, max_pending: int = MAX_PENDING_TAGS):
+        self.flush_delay = flush_delay
+        self.max_pending = max(1, max_pending)
+        self._pending: Set[str] = set()
+        # 상한을 넘어 전체 통계 태그로 축약된 상태 (다음 플러시까지 개별 태그는 버림)
+        self._collapsed = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._metrics = InvalidationQueueMetrics()
+
+    def enqueue(self, tags: Iterable[str]) -> None:
+        """태그 추가 후 플러시 예약 (이벤트 루프가 없으면 다음 플러시 때 처리)"""
+        for tag in tags:
+            self._metrics.enqueued += 1
+            if tag in self._pending:
+                self._metrics.deduplicated += 1
+                continue
+            if not self._collapsed and len(self._pending) >= self.max_pending:
+                self._collapse()
+            if self._collapsed:
+                # 축약된 동안에는 전체 통계 태그만 유지 (이미 대기 중이므로 개별 태그는 버림)
+                self._metrics.dropped += 1
+                continue
+            self._pending.add(tag)
+        self._schedule_flush()
+
+    def _collapse(self) -> None:
+        """
+        대기 태그가 상한을 넘으면 개별 태그를 버리고 전체 통계 태그로 축약
+
+        다음 플러시까지 축약 상태를 유지하며, 버린 apt 태그의 캐시는 TTL 만료로 갱신됩니다.
+        """
+        self._metrics.overflows += 1
+        self._metrics.dropped += len(self._pending - {STATS_GLOBAL_TAG})
+        logger.warning(f" 캐시 무효화 대기 태그 상한 초과 ({self.max_pending}개) - 전체 통계 태그로 축약")
+        self._pending = {STATS_GLOBAL_TAG}
+        self._collapsed = True
+
+    def _schedule_flush(self) -> None:
+        if not self._pending:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 동기 스크립트 등 실행 중인 루프가 없으면 대기 (상한 내에서 보관)
+            return
+        self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        # 플러시 중 새로 들어온 태그도 같은 태스크에서 이어서 처리
+        while self._pending:
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        대기 중인 태그를 한 번의 파이프라인으로 무효화
+
+        Returns:
+            무효화한 태그 수 (실패 시 0)
+        """
+        if not self._pending:
+            return 0
+
+        tags, self._pending = self._pending, set()
+        self._collapsed = False
+        started = time.perf_counter()
+        ok = await invalidate_cache_tags(*tags)
+        elapsed = time.perf_counter() - started
 
-async def invalidate_apartment_cache(apt_id: int):
-    """아파트 관련 캐시 무효화"""
-    from app.utils.cache import delete_cache_pattern
-    
-    patterns = [
-        f"realestate:apartment:detail:*:apt:{apt_id}",
-        f"realestate:apartment:detail_v2:*:apt:{apt_id}",
-        f"realestate:apartment:nearby_price:*:apt:{apt_id}:*",
-        f"realestate:apartment:nearby_comparison:*:apt:{apt_id}:*",
-    ]
-    
-    for pattern in patterns:
-        await delete_cache_pattern(pattern)
-    
-    logger.debug(f"아파트 캐시 무효화 완료: apt_id={apt_id}")
+        if not ok:
+            # Redis 장애 시 재시도하지 않음 (태그 없는 키는 TTL로 만료)
+            self._metrics.failures += 1
+            logger.warning(f" 캐시 무효화 플러시 실패: {len(tags)}개 태그")
+            return 0
 
+        self._metrics.observe_flush(len(tags), elapsed)
+        logger.debug(f" 캐시 무효화 플러시: {len(tags)}개 태그, {elapsed * 1000:.1f}ms")
+        return len(tags)
 
-async def invalidate_region_statistics_cache(region_id: int):
-    """지역 통계 캐시 무효화"""
-    # 통계 캐싱 서비스를 사용하여 무효화
-    await statistics_cache_service.invalidate_statistics_cache(region_id=region_id)
-    logger.debug(f"지역 통계 캐시 무효화 완료: region_id={region_id}")
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """큐 지표"""
+        return {
+            "pending": len(self._pending),
+            "max_pending": self.max_pending,
+            "flush_delay": self.flush_delay,
+            **self._metrics.to_dict(),
+        }
+
+    def reset_metrics(self) -> None:
+        self._metrics = InvalidationQueueMetrics()
+
+
+# 프로세스 공용 무효화 큐
+invalidation_queue = CacheInvalidationQueue()
+
+
+def _collect_tags(target: Any, *tags: str) -> None:
+    """대상 객체가 속한 세션의 트랜잭션 태그 집합에 추가"""
+    session = object_session(target)
+    if session is None:
+        invalidation_queue.enqueue(tags)
+        return
+    session.info.setdefault(_SESSION_TAGS_KEY, set()).update(tags)
 
 
 # SQLAlchemy 이벤트 리스너 (동기 함수)
 def setup_cache_invalidation_listeners():
     """캐시 무효화 이벤트 리스너 설정"""
-    
+
     @event.listens_for(Sale, 'after_update')
     def sale_after_update(mapper, connection, target):
-        """매매 데이터 업데이트 시 관련 캐시 무효화"""
-        # 비동기 함수는 직접 호출할 수 없으므로 백그라운드 태스크로 실행
-        import asyncio
-        try:
-            # 현재 이벤트 루프 가져오기
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 이미 실행 중인 루프가 있으면 태스크로 추가
-                asyncio.create_task(invalidate_region_statistics_cache(None))
-                asyncio.create_task(invalidate_apartment_cache(target.apt_id))
-            else:
-                # 루프가 없으면 새로 실행
-                loop.run_until_complete(invalidate_region_statistics_cache(None))
-                loop.run_until_complete(invalidate_apartment_cache(target.apt_id))
-        except Exception as e:
-            logger.warning(f"캐시 무효화 실패 (무시): {e}")
-    
+        """매매 데이터 업데이트 시 아파트/전체 통계 캐시 무효화 예약"""
+        _collect_tags(target, apt_tag(target.apt_id), STATS_GLOBAL_TAG)
+
     @event.listens_for(Rent, 'after_update')
     def rent_after_update(mapper, connection, target):
-        """전월세 데이터 업데이트 시 관련 캐시 무효화"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(invalidate_region_statistics_cache(None))
-                asyncio.create_task(invalidate_apartment_cache(target.apt_id))
-            else:
-                loop.run_until_complete(invalidate_region_statistics_cache(None))
-                loop.run_until_complete(invalidate_apartment_cache(target.apt_id))
-        except Exception as e:
-            logger.warning(f"캐시 무효화 실패 (무시): {e}")
-    
+        """전월세 데이터 업데이트 시 아파트/전체 통계 캐시 무효화 예약"""
+        _collect_tags(target, apt_tag(target.apt_id), STATS_GLOBAL_TAG)
+
     @event.listens_for(Apartment, 'after_update')
     def apartment_after_update(mapper, connection, target):
-        """아파트 데이터 업데이트 시 관련 캐시 무효화"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(invalidate_apartment_cache(target.apt_id))
-                if target.region_id:
-                    asyncio.create_task(invalidate_region_statistics_cache(target.region_id))
-            else:
-                loop.run_until_complete(invalidate_apartment_cache(target.apt_id))
-                if target.region_id:
-                    loop.run_until_complete(invalidate_region_statistics_cache(target.region_id))
-        except Exception as e:
-            logger.warning(f"캐시 무효화 실패 (무시): {e}")
-    
+        """아파트 데이터 업데이트 시 아파트/전체 통계 캐시 무효화 예약"""
+        tags = [apt_tag(target.apt_id)]
+        if target.region_id:
+            tags.append(STATS_GLOBAL_TAG)
+        _collect_tags(target, *tags)
+
     @event.listens_for(ApartDetail, 'after_update')
     def apart_detail_after_update(mapper, connection, target):
-        """아파트 상세정보 업데이트 시 관련 캐시 무효화"""
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(invalidate_apartment_cache(target.apt_id))
-            else:
-                loop.run_until_complete(invalidate_apartment_cache(target.apt_id))
-        except Exception as e:
-            logger.warning(f"캐시 무효화 실패 (무시): {e}")
-    
+        """아파트 상세정보 업데이트 시 아파트 캐시 무효화 예약"""
+        _collect_tags(target, apt_tag(target.apt_id))
+
+    @event.listens_for(Session, 'after_commit')
+    def session_after_commit(session):
+        """커밋된 트랜잭션의 태그를 무효화 큐로 전달"""
+        tags = session.info.pop(_SESSION_TAGS_KEY, None)
+        if tags:
+            invalidation_queue.enqueue(tags)
+
+    @event.listens_for(Session, 'after_rollback')
+    def session_after_rollback(session):
+        """롤백된 트랜잭션의 태그는 버림"""
+        session.info.pop(_SESSION_TAGS_KEY, None)
+
     logger.info("캐시 무효화 이벤트 리스너 설정 완료")
 
 
+_listeners_registered = False
+
+
 # 앱 시작 시 이벤트 리스너 등록
 def register_cache_invalidation():
-    """캐시 무효화 이벤트 리스너 등록"""
+    """캐시 무효화 이벤트 리스너 등록 (중복 등록 방지)"""
+    global _listeners_registered
+    if _listeners_registered:
+        return
     setup_cache_invalidation_listeners()
+    _listeners_registered = True
+
+
+async def flush_cache_invalidation_queue() -> int:
+    """대기 중인 무효화 태그 즉시 플러시 (종료 시 사용)"""
+    return await invalidation_queue.flush()
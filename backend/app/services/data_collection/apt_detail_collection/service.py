@@ -14,7 +14,6 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
-import httpx
 from datetime import datetime, date
 import os
 
@@ -118,33 +117,11 @@ class AptDetailCollectionService(DataCollectionServiceBase):
             "kaptCode": kapt_code
         }
         
-        client = self._get_http_client()
-        
-        for attempt in range(retries):
-            try:
-                response = await client.get(MOLIT_APARTMENT_BASIC_API_URL, params=params)
-                
-                # 429 에러 처리 (Rate Limit)
-                if response.status_code == 429:
-                    wait_time = (attempt + 1) * 2  # 지수 백오프: 2초, 4초, 6초
-                    logger.warning(f" Rate Limit (429) 발생, {wait_time}초 대기 후 재시도...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                logger.info(f" 외부 API 호출 성공: 기본정보 API (kapt_code: {kapt_code})")
-                data = response.json()
-                return data
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429 and attempt < retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f" Rate Limit (429) 발생, {wait_time}초 대기 후 재시도...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                raise
-        
-        raise httpx.HTTPStatusError("Rate Limit 초과", request=None, response=None)
+        # 공용 전송 계층이 레이트 리밋과 429/5xx 재시도(Retry-After 준수)를 처리
+        response = await self._get_transport().get(MOLIT_APARTMENT_BASIC_API_URL, params=params, retries=retries)
+        response.raise_for_status()
+        logger.info(f" 외부 API 호출 성공: 기본정보 API (kapt_code: {kapt_code})")
+        return response.json()
     
 
     async def fetch_apartment_detail_info(self, kapt_code: str, retries: int = 3) -> Dict[str, Any]:
@@ -168,33 +145,11 @@ class AptDetailCollectionService(DataCollectionServiceBase):
             "kaptCode": kapt_code
         }
         
-        client = self._get_http_client()
-        
-        for attempt in range(retries):
-            try:
-                response = await client.get(MOLIT_APARTMENT_DETAIL_API_URL, params=params)
-                
-                # 429 에러 처리 (Rate Limit)
-                if response.status_code == 429:
-                    wait_time = (attempt + 1) * 2  # 지수 백오프: 2초, 4초, 6초
-                    logger.warning(f" Rate Limit (429) 발생, {wait_time}초 대기 후 재시도...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                
-                response.raise_for_status()
-                logger.info(f" 외부 API 호출 성공: 상세정보 API (kapt_code: {kapt_code})")
-                data = response.json()
-                return data
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429 and attempt < retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f" Rate Limit (429) 발생, {wait_time}초 대기 후 재시도...")
-                    await asyncio.sleep(wait_time)
-                    continue
-                raise
-        
-        raise httpx.HTTPStatusError("Rate Limit 초과", request=None, response=None)
+        # 공용 전송 계층이 레이트 리밋과 429/5xx 재시도(Retry-After 준수)를 처리
+        response = await self._get_transport().get(MOLIT_APARTMENT_DETAIL_API_URL, params=params, retries=retries)
+        response.raise_for_status()
+        logger.info(f" 외부 API 호출 성공: 상세정보 API (kapt_code: {kapt_code})")
+        return response.json()
     
 
     def parse_date(self, date_str: Optional[str]) -> Optional[str]:
@@ -6,12 +6,19 @@
 import logging
 import sys
 import os
+import io
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
 import httpx
-import asyncio
 
 from app.core.config import settings
+from app.services.data_collection.utils.http_transport import (
+    CollectorTransport,
+    get_collector_transport,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -29,6 +36,79 @@ if not logger.handlers:
     logger.propagate = False
 
 
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """쉼표 포함 정수 문자열 변환 (실패 시 None)"""
+    if not value:
+        return None
+    try:
+        return int(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _to_float(value: Optional[str]) -> Optional[float]:
+    """실수 문자열 변환 (실패 시 None)"""
+    if not value:
+        return None
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class MolitTradeRecord:
+    """
+    국토부 실거래가 API item 1건
+
+    fields: 원본 필드 (태그 → 공백 제거 문자열, 텍스트가 없는 태그는 제외)
+    나머지: 파싱 시점에 변환한 값 (필드가 없거나 변환 실패 시 None)
+    """
+    fields: Dict[str, str]
+    deal_amount: Optional[int] = None  # 매매 거래금액 (만원)
+    deposit: Optional[int] = None  # 전월세 보증금 (만원)
+    monthly_rent: Optional[int] = None  # 월세 (만원)
+    exclusive_area: Optional[float] = None  # 전용면적 (㎡)
+    floor: Optional[int] = None
+    deal_date: Optional[date] = None  # dealYear/dealMonth/dealDay 조합
+
+    def get(self, name: str, default: str = "") -> str:
+        """원본 필드 조회 (없으면 default)"""
+        return self.fields.get(name, default)
+
+
+@dataclass(slots=True)
+class MolitXmlResult:
+    """국토부 실거래가 API XML 응답 파싱 결과"""
+    result_code: str = ""
+    result_msg: str = ""
+    total_count: int = 0
+    items: List[MolitTradeRecord] = field(default_factory=list)
+
+
+def _build_trade_record(fields: Dict[str, str]) -> MolitTradeRecord:
+    """item 필드에서 타입 변환된 레코드 생성"""
+    deal_date = None
+    year = _to_int(fields.get("dealYear"))
+    month = _to_int(fields.get("dealMonth"))
+    day = _to_int(fields.get("dealDay"))
+    if year and month and day:
+        try:
+            deal_date = date(year, month, day)
+        except ValueError:
+            pass
+
+    return MolitTradeRecord(
+        fields=fields,
+        deal_amount=_to_int(fields.get("dealAmount")),
+        deposit=_to_int(fields.get("deposit")),
+        monthly_rent=_to_int(fields.get("monthlyRent")),
+        exclusive_area=_to_float(fields.get("excluUseAr")),
+        floor=_to_int(fields.get("floor")),
+        deal_date=deal_date,
+    )
+
+
 class DataCollectionServiceBase:
     """
     데이터 수집 서비스 기본 클래스
@@ -36,9 +116,6 @@ class DataCollectionServiceBase:
     공통 메서드와 로깅 기능을 제공합니다.
     """
     
-    # HTTP 클라이언트 풀 (재사용으로 속도 향상)
-    _http_client: Optional[httpx.AsyncClient] = None
-    
     # 아파트 매칭 로그 (월별로 관리: YYYYMM -> {apt_id -> set of API에서 받은 아파트명})
     _apt_matching_log_by_month: Dict[str, Dict[int, set]] = {}
     _apt_name_map_by_month: Dict[str, Dict[int, str]] = {}  # 월별 apt_id -> DB 아파트명
@@ -49,9 +126,8 @@ class DataCollectionServiceBase:
     # 아파트 매칭 성공 로그 (월별로 관리: YYYYMM -> List[Dict]) - 주소+지번 매칭 성공 케이스
     _apt_success_log_by_month: Dict[str, list] = {}
     
-    # CSV 파일 경로 캐싱 (house_score_collection용)
-    _csv_path_checked: bool = False
-    _csv_path_cache: Optional[Path] = None
+    # 반영 대기 중인 매칭 로그 이벤트 (월별 관리: YYYYMM -> {sgg_cd -> events})
+    _pending_match_events_by_month: Dict[str, Dict[str, list]] = {}
     
     def __init__(self):
         """서비스 초기화"""
@@ -65,9 +141,8 @@ class DataCollectionServiceBase:
         self._apt_fail_log_by_month = {}
         # 매칭 성공 로그 초기화 (월별 관리) - 주소+지번 매칭 성공 케이스
         self._apt_success_log_by_month = {}
-        # CSV 경로 캐시 초기화
-        self._csv_path_checked = False
-        self._csv_path_cache = None
+        # 매칭 로그 이벤트 버퍼 초기화
+        self._pending_match_events_by_month = {}
     
     @staticmethod
     def _get_project_root() -> Path:
@@ -236,9 +311,34 @@ class DataCollectionServiceBase:
             api_response_data: API 응답 원본 데이터 (dict 형태)
                 예: {'aptNm': '금호', 'jibun': '553', 'buildYear': '1998', ...}
         """
+        self._append_apt_fail_entry(ym, self._build_apt_fail_entry(
+            trans_type=trans_type, apt_name=apt_name, jibun=jibun, build_year=build_year,
+            umd_nm=umd_nm, sgg_cd=sgg_cd, ym=ym, reason=reason,
+            normalized_name=normalized_name, candidates=candidates, local_apts=local_apts,
+            sgg_code_matched=sgg_code_matched, dong_matched=dong_matched, region_name=region_name,
+            full_region_code=full_region_code, matching_steps=matching_steps,
+            api_response_data=api_response_data
+        ))
+    
+    def _append_apt_fail_entry(self, ym: str, entry: dict):
+        """구성된 매칭 실패 기록 추가 (월별 관리)"""
         if ym not in self._apt_fail_log_by_month:
             self._apt_fail_log_by_month[ym] = []
+        self._apt_fail_log_by_month[ym].append(entry)
+    
+    @staticmethod
+    def _build_apt_fail_entry(trans_type: str, apt_name: str, jibun: str, build_year: str, 
+                              umd_nm: str, sgg_cd: str, ym: str, reason: str,
+                              normalized_name: str = None, candidates: list = None, 
+                              local_apts: list = None, sgg_code_matched: bool = False,
+                              dong_matched: bool = False, region_name: str = None,
+                              full_region_code: str = None, matching_steps: list = None,
+                              api_response_data: dict = None) -> dict:
+        """
+        아파트 매칭 실패 기록 항목 구성 (후보 목록은 상위 10개 이름/ID만 남김)
         
+        워커 프로세스에서도 호출할 수 있도록 인스턴스 상태를 사용하지 않습니다.
+        """
         candidate_names = []
         candidate_details = []
         if candidates:
@@ -268,7 +368,7 @@ class DataCollectionServiceBase:
         # 매칭 단계별 정보 정리
         matching_steps_info = matching_steps or []
         
-        self._apt_fail_log_by_month[ym].append({
+        return {
             'type': trans_type,
             'apt_name': apt_name,
             'normalized_name': normalized_name or '',
@@ -290,7 +390,7 @@ class DataCollectionServiceBase:
             'api_response_data': api_response_data or {},
             'ym': ym,
             'reason': reason
-        })
+        }
     
     def _save_apt_fail_log(self, current_ym: str):
         """
@@ -391,13 +491,13 @@ class DataCollectionServiceBase:
                         'dealYear', 'dealMonth', 'dealDay',
                         'roadnm', 'roadnmbcd', 'roadnmbonbun', 'roadnmbubun'
                     ]
-                    for field in important_fields:
-                        if field in api_data and api_data[field]:
-                            value = api_data[field]
+                    for field_name in important_fields:
+                        if field_name in api_data and api_data[field_name]:
+                            value = api_data[field_name]
                             # 값이 너무 길면 잘라서 표시
                             if isinstance(value, str) and len(value) > 100:
                                 value = value[:100] + "..."
-                            lines.append(f"  {field}: {value}")
+                            lines.append(f"  {field_name}: {value}")
                     
                     # 나머지 필드가 있으면 요약
                     other_fields = [k for k in api_data.keys() if k not in important_fields and api_data[k]]
@@ -462,37 +562,157 @@ class DataCollectionServiceBase:
         except Exception as e:
             logger.error(f" 아파트 매칭 성공 로그 저장 실패: {e}", exc_info=True)
     
+    def _replay_match_events(self, events: list):
+        """
+        매칭 로그 이벤트 반영 (trade_matching.TradeMatchResult.events)
+        
+        Args:
+            events: [(메서드명, kwargs)] - _record_apt_matching, _record_apt_success, _append_apt_fail_entry
+        """
+        for method_name, kwargs in events:
+            getattr(self, method_name)(**kwargs)
+    
+    def _buffer_match_events(self, ym: str, sgg_cd: str, events: list):
+        """
+        매칭 로그 이벤트 보관 (월 완료 시 _flush_match_events로 반영)
+        
+        시군구 처리 완료 순서는 실행마다 달라지므로 바로 반영하지 않고 모아 두었다가
+        시군구 코드 순서로 반영하여 같은 입력이면 항상 같은 로그 파일이 생성되도록 합니다.
+        재시도로 같은 시군구를 다시 처리하면 마지막 결과로 덮어씁니다.
+        """
+        self._pending_match_events_by_month.setdefault(ym, {})[sgg_cd] = events
+    
+    def _flush_match_events(self, ym: str):
+        """보관 중인 해당 월 매칭 로그 이벤트를 시군구 코드 순서로 반영"""
+        pending = self._pending_match_events_by_month.pop(ym, {})
+        for sgg_cd in sorted(pending):
+            self._replay_match_events(pending[sgg_cd])
+    
+    def _save_month_logs(self, ym: str, trans_label: str):
+        """해당 월의 매칭/실패/성공 로그 저장 (apart_YYYYMM.log, apartfail_YYYYMM.log, apartsuccess_YYYYMM.log)"""
+        self._flush_match_events(ym)
+        ym_formatted = f"{int(ym[:4])}년 {int(ym[4:])}월" if len(ym) == 6 and ym.isdigit() else ym
+        print(f"[LOG_SAVE] 월 완료 - {ym_formatted} 로그 저장 시작 (ym={ym})")
+        logger.info(f"=" * 60)
+        logger.info(f" [{trans_label}] {ym_formatted} 로그 저장 시작")
+        logger.info(f"   매칭 로그: {len(self._apt_matching_log_by_month.get(ym, {}))}개 아파트")
+        logger.info(f"   실패 로그: {len(self._apt_fail_log_by_month.get(ym, []))}건")
+        logger.info(f"=" * 60)
+        
+        try:
+            print(f"[LOG_SAVE] {ym} - _save_apt_matching_log 호출")
+            self._save_apt_matching_log(ym)
+            print(f"[LOG_SAVE] {ym} - _save_apt_matching_log 완료")
+        except Exception as e:
+            print(f"[LOG_SAVE] ERROR: {ym} 매칭 로그 저장 실패 - {e}")
+            logger.error(f" [{trans_label}] {ym_formatted} 매칭 로그 저장 실패: {e}", exc_info=True)
+        
+        try:
+            print(f"[LOG_SAVE] {ym} - _save_apt_fail_log 호출")
+            self._save_apt_fail_log(ym)
+            print(f"[LOG_SAVE] {ym} - _save_apt_fail_log 완료")
+        except Exception as e:
+            print(f"[LOG_SAVE] ERROR: {ym} 실패 로그 저장 실패 - {e}")
+            logger.error(f" [{trans_label}] {ym_formatted} 실패 로그 저장 실패: {e}", exc_info=True)
+        
+        try:
+            print(f"[LOG_SAVE] {ym} - _save_apt_success_log 호출")
+            self._save_apt_success_log(ym)
+            print(f"[LOG_SAVE] {ym} - _save_apt_success_log 완료")
+        except Exception as e:
+            print(f"[LOG_SAVE] ERROR: {ym} 성공 로그 저장 실패 - {e}")
+            logger.error(f" [{trans_label}] {ym_formatted} 성공 로그 저장 실패: {e}", exc_info=True)
+        
+        logger.info(f"=" * 60)
+        logger.info(f" [{trans_label}] {ym_formatted} 로그 저장 완료")
+        logger.info(f"=" * 60)
+        print(f"[LOG_SAVE] {ym_formatted} 로그 저장 프로세스 완료")
+    
+    @staticmethod
+    def iter_molit_items(content: bytes, header: Optional[Dict[str, str]] = None) -> Iterator[MolitTradeRecord]:
+        """
+        국토부 실거래가 API XML 스트리밍 파싱 (iterparse)
+
+        응답 전체를 문자열로 디코딩하거나 전체 트리를 만들지 않고,
+        item 단위로 필드를 읽은 뒤 즉시 Element를 해제합니다.
+
+        Args:
+            content: 응답 원본 bytes (response.content)
+            header: 전달 시 resultCode/resultMsg/totalCount 값을 채워 넣음
+
+        Yields:
+            MolitTradeRecord
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+        """
+        items_elem = None
+        fields: Dict[str, str] = {}
+        depth_in_item = False
+
+        for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == "items":
+                    items_elem = elem
+                elif tag == "item":
+                    depth_in_item = True
+                    fields = {}
+                continue
+
+            if tag == "item":
+                depth_in_item = False
+                yield _build_trade_record(fields)
+                # 처리한 item 해제 (부모에서도 제거하여 트리가 커지지 않도록)
+                elem.clear()
+                if items_elem is not None:
+                    items_elem.remove(elem)
+            elif depth_in_item:
+                if elem.text is not None:
+                    fields[tag] = elem.text.strip()
+            elif header is not None and tag in ("resultCode", "resultMsg", "totalCount"):
+                header[tag] = elem.text.strip() if elem.text else ""
+
+    @classmethod
+    def parse_molit_xml(cls, content: bytes) -> MolitXmlResult:
+        """
+        국토부 실거래가 API XML 응답 파싱
+
+        Args:
+            content: 응답 원본 bytes (response.content)
+
+        Returns:
+            MolitXmlResult (결과 코드/메시지, item 레코드 목록)
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+        """
+        header: Dict[str, str] = {}
+        items = list(cls.iter_molit_items(content, header))
+        return MolitXmlResult(
+            result_code=header.get("resultCode", ""),
+            result_msg=header.get("resultMsg", ""),
+            total_count=_to_int(header.get("totalCount")) or 0,
+            items=items,
+        )
+    
+    def _get_transport(self) -> CollectorTransport:
+        """수집기 공용 전송 계층 (연결 풀 + 레이트 리밋 + 재시도)"""
+        return get_collector_transport()
+    
     def _get_http_client(self) -> httpx.AsyncClient:
-        """HTTP 클라이언트 풀 반환"""
-        if self._http_client is None:
-            limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
-            self._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(15.0, connect=5.0),
-                limits=limits,
-                http2=False
-            )
-        return self._http_client
+        """HTTP 클라이언트 풀 반환 (공용 전송 계층의 클라이언트)"""
+        return self._get_transport().client
     
     async def _close_http_client(self):
-        """HTTP 클라이언트 종료"""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """
+        HTTP 클라이언트 종료
+        
+        공용 클라이언트는 다른 수집 작업과 공유하므로 여기서 닫지 않습니다.
+        (애플리케이션 종료 시 close_collector_transport에서 종료)
+        """
+        return None
     
     async def fetch_with_retry(self, url: str, params: Dict, retries: int = 3) -> Dict:
-        """API 호출 재시도 로직"""
-        for attempt in range(retries):
-            try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-                    return response.json()
-            except httpx.TimeoutException:
-                if attempt == retries - 1:
-                    raise
-                await asyncio.sleep(0.5 * (2 ** attempt))
-            except Exception as e:
-                if attempt == retries - 1:
-                    raise
-                await asyncio.sleep(0.5 * (2 ** attempt))
-        return {}
+        """API 호출 재시도 로직 (공용 전송 계층 사용)"""
+        return await self._get_transport().get_json(url, params=params, retries=retries)
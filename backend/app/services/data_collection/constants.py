@@ -24,6 +24,11 @@ MOLIT_SALE_API_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcAptTradeDev/get
 # 국토부 아파트 전월세 실거래가 API 엔드포인트 (JSON)
 MOLIT_RENT_API_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcAptRent/getRTMSDataSvcAptRent"
 
+# 실거래가 수집 지역 동시 처리 수 (DB 연결 풀 크기에 맞춤 - QueuePool 에러 방지)
+# DB pool_size=5, max_overflow=10 → 최대 15개 연결 가능
+# API 호출 속도는 공용 전송 계층의 토큰 버킷(COLLECTOR_RATE_PER_SECOND)이 별도로 제한
+COLLECTION_REGION_CONCURRENCY = 10
+
 # 시도 목록 (17개)
 CITY_NAMES = [
     "강원특별자치도",
@@ -6,12 +6,10 @@ House Score Collection Service
 import logging
 import asyncio
 import sys
-import csv
 import re
 import calendar
 import xml.etree.ElementTree as ET
 from difflib import SequenceMatcher
-from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from collections import namedtuple
 from urllib.parse import quote
@@ -90,6 +88,7 @@ from app.services.data_collection.constants import (
 
 
 from app.services.data_collection.base import DataCollectionServiceBase
+from app.services.data_collection.utils.region_code_registry import LEGION_CODE_CSV, get_region_code_registry
 from app.services.data_collection.utils.matching import ApartmentMatcher
 
 
@@ -102,6 +101,8 @@ class HouseScoreCollectionService(DataCollectionServiceBase):
         """
         CSV 파일에서 region_code 앞 5자리로 area_code(CLS_ID)를 찾아 반환
         
+        legion_code.csv는 프로세스당 한 번만 읽어 접두사 사전으로 조회합니다 (region_code_registry).
+        
         Args:
             region_code_prefix: region_code 앞 5자리
         
@@ -109,71 +110,23 @@ class HouseScoreCollectionService(DataCollectionServiceBase):
             area_code (int) 또는 None
         """
         try:
-            # CSV 파일 경로 캐싱 (한 번만 확인)
-            if not self._csv_path_checked:
-                current_file = Path(__file__).resolve()
-                current_file_str = str(current_file)
-                
-                if current_file_str.startswith('/app'):
-                    # Docker 컨테이너 내부
-                    csv_path = Path('/app/legion_code.csv')
-                else:
-                    # 로컬 실행: backend/app/services/data_collection.py -> 프로젝트 루트
-                    csv_path = current_file.parent.parent.parent.parent / 'legion_code.csv'
-                
-                if not csv_path.exists():
-                    logger.error(f" CSV 파일을 찾을 수 없습니다: {csv_path}")
-                    logger.error(f"   현재 파일 경로: {current_file_str}")
-                    self._csv_path_checked = True
-                    self._csv_path_cache = None
-                    return None
-                
-                self._csv_path_cache = csv_path
-                self._csv_path_checked = True
-            
-            # 캐시된 경로가 없으면 (파일이 없는 경우)
-            if self._csv_path_cache is None:
-                return None
-            
-            csv_path = self._csv_path_cache
+            registry = get_region_code_registry(LEGION_CODE_CSV)
             
             region_code_prefix = str(region_code_prefix)
             if len(region_code_prefix) < 5:
                 region_code_prefix = region_code_prefix[:5].ljust(5, '0')
             
-            # CSV 파일 읽기
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            
             # 1. 정확히 5자리 일치 검색 (최우선)
             if len(region_code_prefix) == 5:
-                for row in rows:
-                    region_code = str(row.get('region_code', '')).strip()
-                    if region_code == region_code_prefix or region_code.startswith(region_code_prefix):
-                        area_code = int(row.get('area_code', 0))
-                        if area_code > 0:
-                            return area_code
+                area_code = registry.sgg_area_code(region_code_prefix, positive_only=True)
+                if area_code:
+                    return area_code
             
             # 2. 앞 2자리 일치 검색 (시도 레벨)
-            # 시도 코드 매핑 (시도별 대표 area_code 찾기)
-            prefix_2 = region_code_prefix[:2] if len(region_code_prefix) >= 2 else region_code_prefix
+            # 2자리로 시작하는 region_code 중 가장 짧은 것 (예: "51" -> "51000000")
+            prefix_2 = region_code_prefix[:2]
             if len(prefix_2) == 2:
-                # 시도 코드별 매핑 (앞 2자리로 시작하는 region_code 중에서 선택)
-                matched_rows = []
-                for row in rows:
-                    region_code = str(row.get('region_code', '')).strip()
-                    if region_code.startswith(prefix_2):
-                        area_code = int(row.get('area_code', 0))
-                        if area_code > 0:
-                            matched_rows.append((region_code, area_code))
-                
-                if matched_rows:
-                    # 같은 길이의 region_code 중에서 가장 짧은 것을 우선 (시도 레벨)
-                    # 예: "51" -> "51000" 같은 것을 찾음
-                    matched_rows.sort(key=lambda x: (len(x[0]), x[0]))
-                    # 2자리로 시작하는 것 중 가장 짧은 것을 반환 (시도 레벨 데이터)
-                    return matched_rows[0][1]
+                return registry.sido_area_code(prefix_2, prefer_shortest=True)
             
             return None
         except Exception as e:
@@ -6,12 +6,10 @@ House Volume Collection Service
 import logging
 import asyncio
 import sys
-import csv
 import re
 import calendar
 import xml.etree.ElementTree as ET
 from difflib import SequenceMatcher
-from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
 import httpx
@@ -50,6 +48,7 @@ from app.services.data_collection.constants import (
 )
 
 from app.services.data_collection.base import DataCollectionServiceBase
+from app.services.data_collection.utils.region_code_registry import LEGION_CODE2_CSV, get_region_code_registry
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -77,6 +76,8 @@ class HouseVolumeCollectionService(DataCollectionServiceBase):
         """
         CSV 파일에서 region_code 앞 5자리로 area_code(CLS_ID)를 찾아 반환
         
+        legion_code2.csv는 프로세스당 한 번만 읽어 접두사 사전으로 조회합니다 (region_code_registry).
+        
         Args:
             region_code_prefix: region_code 앞 5자리
         
@@ -84,57 +85,19 @@ class HouseVolumeCollectionService(DataCollectionServiceBase):
             area_code (int) 또는 None
         """
         try:
-            # CSV 파일 경로 캐싱 (한 번만 확인)
-            if not self._csv_path_checked:
-                current_file = Path(__file__).resolve()
-                current_file_str = str(current_file)
-                
-                if current_file_str.startswith('/app'):
-                    # Docker 컨테이너 내부
-                    csv_path = Path('/app/legion_code2.csv')
-                else:
-                    # 로컬 실행: backend/app/services/data_collection/house_volume_collection/service.py -> 프로젝트 루트
-                    csv_path = current_file.parent.parent.parent.parent.parent / 'legion_code2.csv'
-                
-                if not csv_path.exists():
-                    logger.error(f" CSV 파일을 찾을 수 없습니다: {csv_path}")
-                    logger.error(f"   현재 파일 경로: {current_file_str}")
-                    self._csv_path_checked = True
-                    self._csv_path_cache = None
-                    return None
-                
-                self._csv_path_cache = csv_path
-                self._csv_path_checked = True
-            
-            # 캐시된 경로가 없으면 (파일이 없는 경우)
-            if self._csv_path_cache is None:
-                return None
-            
-            csv_path = self._csv_path_cache
+            registry = get_region_code_registry(LEGION_CODE2_CSV)
             
             region_code_prefix = str(region_code_prefix)
             if len(region_code_prefix) < 5:
                 region_code_prefix = region_code_prefix[:5].ljust(5, '0')
             
-            # CSV 파일 읽기
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-            
             # 1. 5자리 일치 검색
-            for row in rows:
-                region_code = str(row.get('region_code', '')).strip()
-                if region_code.startswith(region_code_prefix):
-                    return int(row.get('area_code', 0))
+            area_code = registry.sgg_area_code(region_code_prefix[:5])
+            if area_code is not None:
+                return area_code
             
             # 2. 앞 2자리 일치 검색 (fallback)
-            prefix_2 = region_code_prefix[:2]
-            for row in rows:
-                region_code = str(row.get('region_code', '')).strip()
-                if region_code.startswith(prefix_2):
-                    return int(row.get('area_code', 0))
-            
-            return None
+            return registry.sido_area_code(region_code_prefix[:2])
         except Exception as e:
             logger.error(f" CSV 파일 읽기 오류: {e}")
             return None
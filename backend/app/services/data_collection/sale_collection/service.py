@@ -14,12 +14,12 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
-import httpx
+from dataclasses import replace
 from datetime import datetime, date
 import os
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, text
+from sqlalchemy import select, func, and_, text, update
 from sqlalchemy.orm import joinedload
 from app.db.session import AsyncSessionLocal
 
@@ -89,9 +89,35 @@ from app.services.data_collection.constants import (
 
 
 from app.services.data_collection.base import DataCollectionServiceBase
-from app.services.data_collection.utils.matching import ApartmentMatcher
+from app.services.data_collection.constants import COLLECTION_REGION_CONCURRENCY
+from app.services.data_collection.utils.work_queue import (
+    WORK_KIND_SALES,
+    WorkUnitOutcome,
+    collection_work_queue,
+    run_work_queue,
+)
+from app.services.data_collection.utils.bulk_writer import sale_bulk_writer
+from app.services.data_collection.utils.trade_matching import (
+    TRANS_TYPE_SALE,
+    RegionSnapshot,
+    parse_and_match_trades,
+    run_parse_and_match,
+)
+from app.services.data_collection.utils.match_decision_store import match_decision_store
+from app.services.data_collection.utils.cache import (
+    BoundedCache,
+    RegionApartmentCache,
+    region_apartment_cache,
+)
+from app.utils.cache import invalidate_apartment_tags, invalidate_cache_tags, STATS_GLOBAL_TAG
+from app.services.monthly_region_stats_service import (
+    STATS_KIND_SALE,
+    monthly_region_stats_service,
+)
+from app.services.apartment_price_summary_service import apartment_price_summary_service
+from app.services.percentile_snapshot import percentile_snapshot_store
 from app.services.data_collection.constants import MOLIT_SALE_API_URL
-from app.services.asset_activity_service import trigger_price_change_log_if_needed
+from app.services.asset_activity_service import trigger_price_change_logs_bulk
 
 
 class SaleCollectionService(DataCollectionServiceBase):
@@ -108,6 +134,8 @@ class SaleCollectionService(DataCollectionServiceBase):
         allow_duplicate: bool = False,
         sgg_codes: Optional[List[str]] = None,
         apt_id_filter: Optional[int] = None,
+        resume: bool = False,
+        process_workers: Optional[int] = None,
     ) -> Any:
         """
         아파트 매매 실거래가 데이터 수집 (새로운 JSON API 사용)
@@ -117,13 +145,20 @@ class SaleCollectionService(DataCollectionServiceBase):
             end_ym: 종료 연월 (YYYYMM)
             max_items: 최대 수집 개수 제한 (기본값: None, 제한 없음)
             allow_duplicate: 중복 저장 허용 여부 (기본값: False, False=건너뛰기, True=업데이트)
+            resume: 작업 큐에서 완료되지 않은 (연월, 시군구) 단위만 이어서 수집 (기본값: False, 처음부터)
+            process_workers: XML 파싱/아파트 매칭을 실행할 프로세스 수 (기본값: COLLECTION_PROCESS_WORKERS, 0이면 이벤트 루프에서 직접 처리)
         """
-        from app.schemas.sale import SalesCollectionResponse, SaleCreate
+        if process_workers is None:
+            process_workers = settings.COLLECTION_PROCESS_WORKERS
+        
+        from app.schemas.sale import SalesCollectionResponse
         
         total_fetched = 0
         total_saved = 0
         skipped = 0
         errors = []
+        touched_months: set = set()  # 저장된 거래가 있는 월 (월별 지역 집계 갱신 대상)
+        touched_apt_ids: set = set()  # 거래가 저장된 아파트 (가격 요약 갱신, 아파트 캐시 무효화 대상)
         
         logger.info(f" 매매 수집 시작: {start_ym} ~ {end_ym}")
         if apt_id_filter is not None:
@@ -168,14 +203,15 @@ class SaleCollectionService(DataCollectionServiceBase):
             return SalesCollectionResponse(success=False, message=f"DB 오류: {e}")
         
         # 2.5. 지역별 아파트/지역 정보 사전 로드 (성능 최적화)
-        apt_cache: Dict[str, List[Apartment]] = {}
-        region_cache: Dict[str, Dict[int, State]] = {}
-        detail_cache: Dict[str, Dict[int, ApartDetail]] = {}
+        # 공용 region_apartment_cache(LRU + TTL + 메모리 상한) 사용, 이번 실행 대상 지역은 새로 로드
+        for sgg_cd in target_sgg_codes:
+            region_apartment_cache.invalidate(sgg_cd)
         
         async def load_apts_and_regions(sgg_cd: str) -> tuple[List[Apartment], Dict[int, State], Dict[int, ApartDetail]]:
             """지역별 아파트, 지역 정보, 아파트 상세 정보 로드 (캐싱)"""
-            if sgg_cd in apt_cache:
-                return apt_cache[sgg_cd], region_cache[sgg_cd], detail_cache.get(sgg_cd, {})
+            cached = region_apartment_cache.get(sgg_cd)
+            if cached is not None:
+                return cached["apartments"], cached["regions"], cached["details"]
             
             async with AsyncSessionLocal() as cache_db:
                 # 아파트 로드
@@ -199,19 +235,41 @@ class SaleCollectionService(DataCollectionServiceBase):
                 else:
                     apt_details = {}
                 
-                apt_cache[sgg_cd] = local_apts
-                region_cache[sgg_cd] = all_regions
-                detail_cache[sgg_cd] = apt_details
+                region_apartment_cache.set(sgg_cd, local_apts, all_regions, apt_details)
+                
+                # 저장된 매칭 결정 로드 (이전 실행에서 매칭된 조합은 매칭 생략)
+                await match_decision_store.load_region(cache_db, sgg_cd)
                 
                 return local_apts, all_regions, apt_details
         
-        # 3. 병렬 처리 (DB 연결 풀 크기에 맞춰 10개로 제한 - QueuePool 에러 방지)
-        # DB pool_size=5, max_overflow=10 → 최대 15개 연결 가능
-        semaphore = asyncio.Semaphore(10)
+        snapshot_cache = BoundedCache(
+            "region_snapshot",
+            max_entries=RegionApartmentCache._max_regions,
+            max_bytes=RegionApartmentCache._max_bytes,
+        )
+        
+        async def load_region_snapshot(sgg_cd: str) -> RegionSnapshot:
+            """지역별 매칭 입력 스냅샷 (워커 프로세스로 보낼 수 있는 경량 레코드, 캐싱)"""
+            snapshot = snapshot_cache.get(sgg_cd)
+            if snapshot is None:
+                local_apts, all_regions, apt_details = await load_apts_and_regions(sgg_cd)
+                snapshot = RegionSnapshot.from_orm(sgg_cd, local_apts, all_regions, apt_details)
+                snapshot_cache.set(sgg_cd, snapshot)
+            # 매칭 결정은 수집 중에도 추가되므로 호출 시점의 복사본을 사용
+            return replace(
+                snapshot,
+                decisions=dict(match_decision_store.region_decisions(sgg_cd))
+            )
+        
+        # 3. 병렬 처리 (DB 연결 풀 크기에 맞춰 제한 - QueuePool 에러 방지)
+        semaphore = asyncio.Semaphore(COLLECTION_REGION_CONCURRENCY)
         
         # 진행 상황 추적용 변수
         total_regions = len(target_sgg_codes)
         
+        # 전체 지역 수집은 작업 큐로 처리 (Fix 모드는 대상 시군구만 직접 처리)
+        use_queue = sgg_codes is None and apt_id_filter is None and bool(target_months)
+        
         def format_ym(ym: str) -> str:
             """연월 형식 변환: YYYYMM -> YYYY년 MM월"""
             try:
@@ -221,14 +279,12 @@ class SaleCollectionService(DataCollectionServiceBase):
             except:
                 return ym
         
-        # 공유 HTTP 클라이언트 (연결 재사용으로 성능 향상)
-        http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(60.0, connect=10.0),
-            limits=httpx.Limits(max_connections=15, max_keepalive_connections=10)
-        )
+        # 수집기 공용 전송 계층 (연결 재사용 + 레이트 리밋 + 재시도)
+        transport = self._get_transport()
         
         async def process_sale_region(ym: str, sgg_cd: str):
             """매매 데이터 수집 작업"""
+            outcome = WorkUnitOutcome()
             ym_formatted = format_ym(ym)
             async with semaphore:
                 async with AsyncSessionLocal() as local_db:
@@ -255,11 +311,13 @@ class SaleCollectionService(DataCollectionServiceBase):
                         if existing_count > 0 and not allow_duplicate and apt_id_filter is None:
                             skipped += existing_count
                             logger.info(f"⏭ {sgg_cd}/{ym} ({ym_formatted}): 건너뜀 ({existing_count}건 존재)")
-                            return
+                            return outcome
                         
                         # max_items 제한 확인
                         if max_items and total_saved >= max_items:
-                            return
+                            # 처리하지 않은 단위는 큐에 되돌림
+                            outcome.deferred = True
+                            return outcome
                         
                         # API 호출 (XML) - 공유 클라이언트 사용
                         params = {
@@ -269,516 +327,111 @@ class SaleCollectionService(DataCollectionServiceBase):
                             "numOfRows": 4000
                         }
                         
-                        response = await http_client.get(MOLIT_SALE_API_URL, params=params)
+                        response = await transport.get(MOLIT_SALE_API_URL, params=params)
                         response.raise_for_status()
-                        xml_content = response.text
                         
-                        # XML 파싱
+                        # XML 파싱 + 아파트 매칭 (프로세스 모드: 워커 프로세스, 기본: 이벤트 루프에서 직접)
+                        snapshot = await load_region_snapshot(sgg_cd)
+                        max_rows = max(max_items - total_saved, 0) if max_items else None
                         try:
-                            root = ET.fromstring(xml_content)
+                            if process_workers:
+                                match_result = await run_parse_and_match(
+                                    process_workers, response.content, snapshot, TRANS_TYPE_SALE, ym,
+                                    apt_id_filter=apt_id_filter, max_rows=max_rows
+                                )
+                            else:
+                                match_result = parse_and_match_trades(
+                                    response.content, snapshot, TRANS_TYPE_SALE, ym,
+                                    apt_id_filter=apt_id_filter, max_rows=max_rows
+                                )
                         except ET.ParseError as e:
-                            errors.append(f"{sgg_cd}/{ym} ({ym_formatted}): XML 파싱 실패 - {str(e)}")
+                            outcome.error = f"{sgg_cd}/{ym} ({ym_formatted}): XML 파싱 실패 - {str(e)}"
+                            errors.append(outcome.error)
                             logger.error(f" {sgg_cd}/{ym} ({ym_formatted}): XML 파싱 실패 - {str(e)}")
-                            return
+                            return outcome
                         
                         # 결과 코드 확인
-                        result_code_elem = root.find(".//resultCode")
-                        result_msg_elem = root.find(".//resultMsg")
-                        result_code = result_code_elem.text if result_code_elem is not None else ""
-                        result_msg = result_msg_elem.text if result_msg_elem is not None else ""
-                        
-                        if result_code != "000":
-                            errors.append(f"{sgg_cd}/{ym} ({ym_formatted}): {result_msg}")
-                            logger.error(f" {sgg_cd}/{ym} ({ym_formatted}): {result_msg}")
-                            return
-                        
-                        # items 추출
-                        items = root.findall(".//item")
+                        if match_result.result_code != "000":
+                            outcome.error = f"{sgg_cd}/{ym} ({ym_formatted}): {match_result.result_msg}"
+                            errors.append(outcome.error)
+                            logger.error(f" {sgg_cd}/{ym} ({ym_formatted}): {match_result.result_msg}")
+                            return outcome
                         
-                        if not items:
-                            return
+                        if not match_result.fetched:
+                            return outcome
                         
-                        total_fetched += len(items)
+                        total_fetched += match_result.fetched
+                        outcome.fetched = match_result.fetched
                         
-                        # 아파트 및 지역 정보 로드 (캐싱 활용)
-                        local_apts, all_regions, apt_details = await load_apts_and_regions(sgg_cd)
+                        # 매칭 로그는 월 단위로 모았다가 시군구 순서대로 반영 (실행 순서와 무관하게 동일한 로그)
+                        self._buffer_match_events(ym, sgg_cd, match_result.events)
+                        match_decision_store.record_lookups(match_result.decision_hits, match_result.decision_misses)
                         
-                        if not local_apts:
-                            return
-                        
-                        sales_to_save = []
+                        staged_rows = match_result.rows  # 일괄 저장용 스테이징 버퍼
+                        new_decisions = match_result.new_decisions  # 새로 매칭된 결정 (페이지 처리 후 저장)
                         success_count = 0
                         skip_count = 0
-                        error_count = 0
-                        apt_name_log = ""
-                        normalized_cache: Dict[str, Any] = {}  # 정규화 결과 캐싱
-                        batch_size = 100  # 배치 커밋 크기
+                        error_count = match_result.error_count
+                        inserted_count = 0
+                        updated_count = 0
+                        apt_name_log = match_result.apt_name_log
                         
-                        for item in items:
-                            # max_items 제한 확인
-                            if max_items and total_saved >= max_items:
-                                break
+                        # 페이지 단위 일괄 저장 (INSERT ... ON CONFLICT, 자연키 UNIQUE 인덱스)
+                        if staged_rows:
+                            write_result = await sale_bulk_writer.write(
+                                local_db, staged_rows, allow_duplicate=allow_duplicate
+                            )
                             
-                            try:
-                                #  API 응답 원본 데이터 추출 (실패 로그용)
-                                api_response_data = {}
-                                for child in item:
-                                    if child.text is not None:
-                                        api_response_data[child.tag] = child.text.strip()
-                                
-                                # XML Element에서 필드 추출 (Dev API: camelCase 필드명)
-                                apt_nm_elem = item.find("aptNm")
-                                apt_nm = apt_nm_elem.text.strip() if apt_nm_elem is not None and apt_nm_elem.text else ""
-                                
-                                umd_nm_elem = item.find("umdNm")
-                                umd_nm = umd_nm_elem.text.strip() if umd_nm_elem is not None and umd_nm_elem.text else ""
-                                
-                                #  새 API 추가 필드: umdCd (읍면동코드) - 더 정확한 동 매칭에 활용
-                                umd_cd_elem = item.find("umdCd")
-                                umd_cd = umd_cd_elem.text.strip() if umd_cd_elem is not None and umd_cd_elem.text else ""
-                                
-                                sgg_cd_elem = item.find("sggCd")
-                                sgg_cd_item = sgg_cd_elem.text.strip() if sgg_cd_elem is not None and sgg_cd_elem.text else sgg_cd
-                                
-                                # 지번 추출 (기존 필드 유지)
-                                jibun_elem = item.find("jibun")
-                                jibun = jibun_elem.text.strip() if jibun_elem is not None and jibun_elem.text else ""
-                                
-                                #  새 API 추가 필드: bonbun/bubun (본번/부번) - 더 정확한 지번 매칭
-                                bonbun_elem = item.find("bonbun")
-                                bonbun = bonbun_elem.text.strip().lstrip('0') if bonbun_elem is not None and bonbun_elem.text else ""
-                                bubun_elem = item.find("bubun")
-                                bubun = bubun_elem.text.strip().lstrip('0') if bubun_elem is not None and bubun_elem.text else ""
-                                
-                                # 본번/부번으로 정확한 지번 생성 (bonbun이 있으면 우선 사용)
-                                if bonbun:
-                                    jibun_precise = bonbun
-                                    if bubun and bubun != "0" and bubun != "":
-                                        jibun_precise += f"-{bubun}"
-                                    # 기존 jibun과 비교하여 더 정확한 것 사용
-                                    if not jibun or len(jibun_precise) >= len(jibun):
-                                        jibun = jibun_precise
-                                
-                                #  새 API 추가 필드: aptSeq (단지 일련번호) - 중복 체크 및 추적에 활용
-                                apt_seq_elem = item.find("aptSeq")
-                                apt_seq = apt_seq_elem.text.strip() if apt_seq_elem is not None and apt_seq_elem.text else ""
-                                
-                                # 건축년도 추출 (매칭에 활용)
-                                build_year_elem = item.find("buildYear")
-                                build_year_for_match = build_year_elem.text.strip() if build_year_elem is not None and build_year_elem.text else ""
-                                
-                                if not apt_nm:
-                                    continue
-                                
-                                if not apt_name_log:
-                                    apt_name_log = apt_nm
-                                
-                                #  최우선 매칭: 법정동 코드 10자리 + 지번(부번까지) 정확 매칭
-                                # 이름과 관계없이 법정동 코드와 지번이 모두 일치하면 같은 아파트로 인식
-                                # (95% 신뢰구간에서 같은 부동산을 가리키는 것으로 간주)
-                                matched_apt = None
-                                candidates = local_apts
-                                sgg_code_matched = True
-                                dong_matched = False
-                                
-                                # 매칭 단계 추적용 리스트
-                                matching_steps = []
-                                
-                                # 0단계: 법정동 코드 10자리 + 지번(부번까지) 정확 매칭 (최우선, 이름 무관)
-                                if sgg_cd_item and umd_cd and jibun:
-                                    full_region_code = f"{sgg_cd_item}{umd_cd}"
-                                    
-                                    #  새로운 매칭 함수 사용: 법정동 코드 + 지번(부번까지) 정확 매칭
-                                    matched_apt = ApartmentMatcher.match_by_address_and_jibun(
-                                        full_region_code=full_region_code,
-                                        jibun=jibun,
-                                        bonbun=bonbun if bonbun else None,
-                                        bubun=bubun if bubun else None,
-                                        candidates=local_apts,
-                                        apt_details=apt_details,
-                                        all_regions=all_regions
-                                    )
-                                    
-                                    if matched_apt:
-                                        candidates = [matched_apt]
-                                        sgg_code_matched = True
-                                        dong_matched = True
-                                        matching_steps.append({
-                                            'step': 'address_jibun',
-                                            'attempted': True,
-                                            'success': True,
-                                            'full_region_code': full_region_code,
-                                            'jibun': jibun
-                                        })
-                                        #  매칭 성공 로그를 파일로 저장 (docker log에는 출력 안 함)
-                                        self._record_apt_success(
-                                            trans_type='매매',
-                                            full_region_code=full_region_code,
-                                            jibun=jibun,
-                                            apt_name=matched_apt.apt_name,
-                                            ym=ym  # 거래 발생 월
-                                        )
-                                        # 성공 로그 기록
-                                        self._record_apt_matching(
-                                            matched_apt.apt_id,
-                                            matched_apt.apt_name,
-                                            apt_nm,
-                                            ym,
-                                            matching_method='address_jibun'
-                                        )
-                                    else:
-                                        matching_steps.append({
-                                            'step': 'address_jibun',
-                                            'attempted': True,
-                                            'success': False,
-                                            'full_region_code': full_region_code,
-                                            'jibun': jibun,
-                                            'reason': '법정동코드+지번 매칭 실패'
-                                        })
-                                
-                                #  개선: 법정동 코드 10자리로 후보 강제 필터링 (미스매칭 방지)
-                                # 지번 매칭 실패 시, 법정동 코드만으로라도 후보를 제한
-                                if not matched_apt and sgg_cd_item and umd_cd:
-                                    full_region_code = f"{sgg_cd_item}{umd_cd}"
-                                    filtered = [
-                                        apt for apt in local_apts
-                                        if apt.region_id in all_regions
-                                        and all_regions[apt.region_id].region_code == full_region_code
-                                    ]
-                                    if filtered:
-                                        # 동 단위로 후보 제한 성공
-                                        candidates = filtered
-                                        sgg_code_matched = True
-                                        dong_matched = True
-                                        matching_steps.append({
-                                            'step': 'full_region_code',
-                                            'attempted': True,
-                                            'success': True,
-                                            'full_region_code': full_region_code,
-                                            'candidates': len(filtered)
-                                        })
-                                    else:
-                                        #  개선: 법정동 코드로 후보가 없으면 매칭 실패로 간주 (미스매칭 방지)
-                                        matching_steps.append({
-                                            'step': 'full_region_code',
-                                            'attempted': True,
-                                            'success': False,
-                                            'full_region_code': full_region_code,
-                                            'reason': '법정동 코드로 후보 없음 (DB에 해당 동 아파트 없음)'
-                                        })
-                                        # 매칭 실패로 처리
-                                        candidates = []
-                                
-                                # 3단계: 시군구 코드만 매칭 (fallback)
-                                if not matched_apt and not dong_matched and sgg_cd_item and str(sgg_cd_item).strip():
-                                    sgg_cd_item_str = str(sgg_cd_item).strip()
-                                    sgg_cd_db = ApartmentMatcher.convert_sgg_code_to_db_format(sgg_cd_item_str)
-                                    
-                                    if sgg_cd_db:
-                                        filtered = [
-                                            apt for apt in local_apts
-                                            if apt.region_id in all_regions
-                                            and all_regions[apt.region_id].region_code == sgg_cd_db
-                                        ]
-                                        if not filtered:
-                                            filtered = [
-                                                apt for apt in local_apts
-                                                if apt.region_id in all_regions
-                                                and all_regions[apt.region_id].region_code.startswith(sgg_cd_item_str)
-                                            ]
-                                        if filtered:
-                                            candidates = filtered
-                                            sgg_code_matched = True
-                                            matching_steps.append({
-                                                'step': 'sgg_code_only',
-                                                'attempted': True,
-                                                'success': True,
-                                                'candidates': len(filtered)
-                                            })
-                                
-                                # 4단계: 동 이름 매칭 (fallback)
-                                if not matched_apt and not dong_matched and umd_nm and candidates:
-                                    matching_region_ids = ApartmentMatcher.find_matching_regions(umd_nm, all_regions)
-                                    
-                                    if matching_region_ids:
-                                        filtered = [
-                                            apt for apt in candidates
-                                            if apt.region_id in matching_region_ids
-                                        ]
-                                        if filtered:
-                                            candidates = filtered
-                                            dong_matched = True
-                                            matching_steps.append({
-                                                'step': 'dong_name',
-                                                'attempted': True,
-                                                'success': True,
-                                                'candidates': len(filtered)
-                                            })
-                                
-                                #  개선: 법정동 코드로 필터링한 경우, 후보가 없으면 매칭 불가 (미스매칭 방지)
-                                # 동 검증 실패 시 전체 후보로 복원하지 않음
-                                if not candidates and sgg_cd_item and umd_cd:
-                                    # 법정동 코드로 필터링했는데 후보가 없음 → 매칭 불가
-                                    error_count += 1
-                                    matching_steps.append({
-                                        'step': 'final_check',
-                                        'attempted': True,
-                                        'success': False,
-                                        'reason': '동 검증 실패 (법정동 코드로 후보 없음)'
-                                    })
-                                    # 로깅 (파일로만 저장, docker log 출력 안 함)
-                                    self._record_apt_failure(
-                                        trans_type='매매',
-                                        full_region_code=f"{sgg_cd_item}{umd_cd}",
-                                        jibun=jibun if jibun else "",
-                                        apt_name_api=apt_nm,
-                                        ym=ym,
-                                        reason='dong_no_candidates',
-                                        candidates_count=0
-                                    )
-                                    continue  # 다음 거래로 넘어감
-                                elif not candidates:
-                                    # 읍면동 코드가 없는 경우만 전체 후보로 복원 (하위 호환성)
-                                    candidates = local_apts
-                                    sgg_code_matched = True
-                                    dong_matched = False
-                                
-                                # 5단계: 이름 매칭 (시군구+동코드+지번 매칭 실패 시에만 사용)
-                                #  동 검증 기본 활성화 (require_dong_match 기본값 True)
-                                if not matched_apt:
-                                    matched_apt = ApartmentMatcher.match_apartment(
-                                        apt_nm, candidates, sgg_cd, umd_nm, 
-                                        jibun, build_year_for_match, apt_details, normalized_cache,
-                                        all_regions=all_regions  # require_dong_match 기본값 True 사용
-                                    )
-                                    
-                                    if matched_apt:
-                                        matching_steps.append({
-                                            'step': 'name_matching',
-                                            'attempted': True,
-                                            'success': True,
-                                            'candidates': len(candidates)
-                                        })
-                                    else:
-                                        matching_steps.append({
-                                            'step': 'name_matching',
-                                            'attempted': True,
-                                            'success': False,
-                                            'candidates': len(candidates),
-                                            'reason': '유사도 부족 또는 Veto 조건'
-                                        })
-                                
-                                # 필터링된 후보에서 실패 시 전체 후보로 재시도 (단, 동 검증 필수!)
-                                if not matched_apt and len(candidates) < len(local_apts) and dong_matched:
-                                    matched_apt = ApartmentMatcher.match_apartment(
-                                        apt_nm, local_apts, sgg_cd, umd_nm, 
-                                        jibun, build_year_for_match, apt_details, normalized_cache,
-                                        all_regions=all_regions, require_dong_match=True
-                                    )
-                                    
-                                    if matched_apt:
-                                        matching_steps.append({
-                                            'step': 'name_matching_full',
-                                            'attempted': True,
-                                            'success': True,
-                                            'candidates': len(local_apts)
-                                        })
-                                    else:
-                                        matching_steps.append({
-                                            'step': 'name_matching_full',
-                                            'attempted': True,
-                                            'success': False,
-                                            'candidates': len(local_apts),
-                                            'reason': '전체 후보에서도 매칭 실패'
-                                        })
-                                
-                                if not matched_apt:
-                                    error_count += 1
-                                    # 정규화된 이름 가져오기
-                                    normalized_name = normalized_cache.get(apt_nm)
-                                    if not normalized_name:
-                                        normalized_name = ApartmentMatcher.normalize_apt_name(apt_nm)
-                                        normalized_cache[apt_nm] = normalized_name
-                                    
-                                    # 지역 이름 가져오기 (시군구/동)
-                                    region_name = None
-                                    if umd_nm:
-                                        # 동 이름으로 지역 찾기
-                                        matching_region_ids = ApartmentMatcher.find_matching_regions(umd_nm, all_regions)
-                                        if matching_region_ids:
-                                            first_region_id = list(matching_region_ids)[0]
-                                            if first_region_id in all_regions:
-                                                region_name = all_regions[first_region_id].region_name
-                                    elif sgg_cd_item:
-                                        # 시군구 코드로 지역 찾기
-                                        sgg_cd_db = ApartmentMatcher.convert_sgg_code_to_db_format(str(sgg_cd_item).strip())
-                                        if sgg_cd_db:
-                                            for region in all_regions.values():
-                                                if region.region_code == sgg_cd_db:
-                                                    region_name = region.region_name
-                                                    break
-                                    
-                                    # 실패 케이스 로깅 (apartfail_YYYYMM.log 파일로 저장)
-                                    self._record_apt_fail(
-                                        trans_type='매매',
-                                        apt_name=apt_nm,
-                                        jibun=jibun,
-                                        build_year=build_year_for_match,
-                                        umd_nm=umd_nm,
-                                        sgg_cd=sgg_cd,
-                                        ym=ym,  # 거래 발생 월
-                                        reason='이름매칭 실패',
-                                        normalized_name=normalized_name,
-                                        candidates=candidates,
-                                        local_apts=local_apts,
-                                        sgg_code_matched=sgg_code_matched,
-                                        dong_matched=dong_matched,
-                                        region_name=region_name,
-                                        full_region_code=full_region_code if sgg_cd_item and umd_cd else None,
-                                        matching_steps=matching_steps,
-                                        api_response_data=api_response_data
-                                    )
-                                    continue
-                                
-                                # 매칭 로그 기록 (apart_YYYYMM.log용) - 거래 발생 월(ym) 사용
-                                matching_method = 'name_matching'
-                                if matching_steps:
-                                    # 가장 먼저 성공한 단계 찾기
-                                    for step in matching_steps:
-                                        if step.get('success'):
-                                            matching_method = step.get('step', 'name_matching')
-                                            break
-                                
-                                self._record_apt_matching(
-                                    matched_apt.apt_id,
-                                    matched_apt.apt_name,
-                                    apt_nm,
-                                    ym,  # 거래 발생 월
-                                    matching_method=matching_method
-                                )
-                                
-                                # 거래 데이터 파싱 (XML Element에서 추출)
-                                deal_amount_elem = item.find("dealAmount")
-                                deal_amount = deal_amount_elem.text.replace(",", "").strip() if deal_amount_elem is not None and deal_amount_elem.text else "0"
-                                
-                                build_year_elem = item.find("buildYear")
-                                build_year = build_year_elem.text.strip() if build_year_elem is not None and build_year_elem.text else None
-                                
-                                deal_year_elem = item.find("dealYear")
-                                deal_year = deal_year_elem.text.strip() if deal_year_elem is not None and deal_year_elem.text else None
-                                
-                                deal_month_elem = item.find("dealMonth")
-                                deal_month = deal_month_elem.text.strip() if deal_month_elem is not None and deal_month_elem.text else None
-                                
-                                deal_day_elem = item.find("dealDay")
-                                deal_day = deal_day_elem.text.strip() if deal_day_elem is not None and deal_day_elem.text else None
-                                
-                                exclu_use_ar_elem = item.find("excluUseAr")
-                                exclu_use_ar = exclu_use_ar_elem.text.strip() if exclu_use_ar_elem is not None and exclu_use_ar_elem.text else None
-                                
-                                floor_elem = item.find("floor")
-                                floor = floor_elem.text.strip() if floor_elem is not None and floor_elem.text else None
-                                
-                                contract_date = None
-                                if deal_year and deal_month and deal_day:
-                                    try:
-                                        contract_date = date(int(deal_year), int(deal_month), int(deal_day))
-                                    except:
-                                        pass
-                                
-                                if apt_id_filter is not None and matched_apt.apt_id != apt_id_filter:
-                                    continue
-                                
-                                sale_create = SaleCreate(
-                                    apt_id=matched_apt.apt_id,
-                                    build_year=build_year,
-                                    trans_type="매매",
-                                    trans_price=int(deal_amount) if deal_amount else 0,
-                                    exclusive_area=float(exclu_use_ar) if exclu_use_ar else 0.0,
-                                    floor=int(floor) if floor else 0,
-                                    contract_date=contract_date,
-                                    is_canceled=False,
-                                    remarks=matched_apt.apt_name
-                                )
-                                
-                                # 중복 체크 및 저장
-                                exists_stmt = select(Sale).where(
-                                    and_(
-                                        Sale.apt_id == sale_create.apt_id,
-                                        Sale.contract_date == sale_create.contract_date,
-                                        Sale.trans_price == sale_create.trans_price,
-                                        Sale.floor == sale_create.floor,
-                                        Sale.exclusive_area == sale_create.exclusive_area
+                            # 신규 거래가 생긴 아파트 상태 일괄 업데이트
+                            new_apt_ids = {row["apt_id"] for row in write_result.inserted_rows}
+                            if new_apt_ids:
+                                await local_db.execute(
+                                    update(Apartment)
+                                    .where(
+                                        Apartment.apt_id.in_(new_apt_ids),
+                                        Apartment.is_available.is_distinct_from("1")
                                     )
+                                    .values(is_available="1")
                                 )
-                                exists = await local_db.execute(exists_stmt)
-                                existing_sale = exists.scalars().first()
-                                
-                                if existing_sale:
-                                    if allow_duplicate:
-                                        # 업데이트
-                                        existing_sale.build_year = build_year
-                                        existing_sale.trans_price = sale_create.trans_price
-                                        existing_sale.exclusive_area = sale_create.exclusive_area
-                                        existing_sale.floor = sale_create.floor
-                                        existing_sale.remarks = matched_apt.apt_name
-                                        local_db.add(existing_sale)
-                                        success_count += 1
-                                        total_saved += 1
-                                    else:
-                                        skip_count += 1
-                                    continue
-                                
-                                db_obj = Sale(**sale_create.model_dump())
-                                local_db.add(db_obj)
-                                sales_to_save.append(sale_create)
-                                
-                                # 아파트 상태 업데이트
-                                if matched_apt.is_available != "1":
-                                    matched_apt.is_available = "1"
-                                    local_db.add(matched_apt)
-                                
-                                # 가격 변동 로그 트리거 (실시간 업데이트)
-                                # 실거래가 저장 후 가격 변동이 1% 이상이면 로그 생성
-                                if sale_create.trans_price and sale_create.contract_date:
-                                    try:
-                                        await trigger_price_change_log_if_needed(
-                                            db=local_db,
-                                            apt_id=matched_apt.apt_id,
-                                            new_price=sale_create.trans_price,
-                                            sale_date=sale_create.contract_date
-                                        )
-                                    except Exception as e:
-                                        # 트리거 실패해도 실거래가 저장은 성공으로 처리
-                                        logger.warning(
-                                            f" 가격 변동 로그 트리거 실패 - "
-                                            f"apt_id: {matched_apt.apt_id}, "
-                                            f"에러: {type(e).__name__}: {str(e)}"
+                            
+                            # 가격 변동 로그 트리거 (신규 거래만, 배치 단위 set-based 처리)
+                            # 가격 변동이 1% 이상이면 로그 생성
+                            if write_result.inserted_rows:
+                                try:
+                                    async with local_db.begin_nested():
+                                        await trigger_price_change_logs_bulk(
+                                            local_db, write_result.inserted_rows
                                         )
-                                
-                                # 배치 커밋 (성능 최적화)
-                                if len(sales_to_save) >= batch_size:
-                                    await local_db.commit()
-                                    total_saved += len(sales_to_save)
-                                    success_count += len(sales_to_save)
-                                    sales_to_save = []
+                                except Exception as e:
+                                    # 트리거 실패해도 실거래가 저장은 성공으로 처리
+                                    logger.warning(
+                                        f" 가격 변동 로그 트리거 실패 - "
+                                        f"{sgg_cd}/{ym}, "
+                                        f"에러: {type(e).__name__}: {str(e)}"
+                                    )
                             
-                            except Exception as e:
-                                error_count += 1
-                                continue
+                            await local_db.commit()
+                            
+                            success_count += write_result.saved
+                            skip_count += write_result.skipped
+                            total_saved += write_result.saved
+                            outcome.saved += write_result.saved
+                            if write_result.saved:
+                                touched_months.add(ym)
+                                touched_apt_ids.update(write_result.touched_apt_ids)
+                            inserted_count = write_result.inserted
+                            updated_count = write_result.updated
                         
-                        # 남은 데이터 커밋
-                        if sales_to_save or (allow_duplicate and success_count > 0):
+                        # 새 매칭 결정 저장 (다음 수집 실행에서 매칭 생략)
+                        if new_decisions:
+                            await match_decision_store.save(local_db, sgg_cd, new_decisions)
                             await local_db.commit()
-                            if sales_to_save:
-                                total_saved += len(sales_to_save)
-                                success_count += len(sales_to_save)
                         
                         # 간결한 로그 (한 줄)
                         if success_count > 0 or skip_count > 0 or error_count > 0:
                             logger.info(
                                 f"{sgg_cd}/{ym} ({ym_formatted}): "
-                                f"{success_count} ⏭{skip_count} {error_count} "
+                                f"{success_count}(신규 {inserted_count}/갱신 {updated_count}) ⏭{skip_count} {error_count} "
                                 f"({apt_name_log})"
                             )
                         if apt_id_filter is not None:
@@ -792,75 +445,106 @@ class SaleCollectionService(DataCollectionServiceBase):
                         
                         # max_items 제한 확인
                         if max_items and total_saved >= max_items:
-                            return
+                            return outcome
                         
                     except Exception as e:
-                        errors.append(f"{sgg_cd}/{ym}: {str(e)}")
+                        outcome.error = f"{sgg_cd}/{ym}: {str(e)}"
+                        errors.append(outcome.error)
                         logger.error(f" {sgg_cd}/{ym}: {str(e)}")
                         await local_db.rollback()
+            
+            return outcome
         
         # 병렬 실행
-        try:
+        if use_queue:
+            # 작업 큐 모드: (연월, 시군구) 단위를 워커들이 연월 구분 없이 가져가 처리
+            await collection_work_queue.enqueue(
+                db, WORK_KIND_SALES, target_months, target_sgg_codes, reset=not resume
+            )
+            if resume:
+                requeued = await collection_work_queue.requeue_stale(
+                    db, WORK_KIND_SALES, target_months[0], target_months[-1]
+                )
+                if requeued:
+                    logger.info(f" 중단된 작업 단위 {requeued}개를 다시 대기열에 추가")
+            logger.info(
+                f" 작업 큐 실행: {len(target_months)}개 월 × {total_regions}개 지역 "
+                f"({'이어서 수집' if resume else '처음부터 수집'}, 워커 {COLLECTION_REGION_CONCURRENCY}개)"
+            )
+            
+            processed = await run_work_queue(
+                WORK_KIND_SALES,
+                target_months[0],
+                target_months[-1],
+                process_sale_region,
+                workers=COLLECTION_REGION_CONCURRENCY,
+                on_month_done=lambda ym: self._save_month_logs(ym, "매매"),
+                should_stop=lambda: bool(max_items and total_saved >= max_items),
+            )
+            logger.info(f" 작업 큐 처리: 완료 {processed['done']}개, 실패 {processed['failed']}개 | 누적 저장: {total_saved}건")
+        else:
             total_months = len(target_months)
             for month_idx, ym in enumerate(target_months, 1):
                 if max_items and total_saved >= max_items:
                     break
-                
+            
                 ym_formatted = format_ym(ym)
                 # 월 시작 로그 (Fix 모드: 대상 아파트 소재 시군구만 사용, 지역 자체를 수집하는 아님)
                 if apt_id_filter is not None:
                     logger.info(f" {ym_formatted} | {month_idx}/{total_months}개 월 | Fix: 대상 아파트(apt_id={apt_id_filter}) 소재 시군구 1개 기준 매매 수집 중...")
                 else:
                     logger.info(f" {ym_formatted} | {month_idx}/{total_months}개 월 | {total_regions}개 지역 데이터 수집 중...")
-                
+            
                 tasks = [process_sale_region(ym, sgg_cd) for sgg_cd in target_sgg_codes]
                 await asyncio.gather(*tasks, return_exceptions=True)
-                
+            
                 # 월 완료 로그
                 logger.info(f" {ym_formatted} 완료 | 누적 저장: {total_saved}건")
-                
+            
                 # 해당 월의 로그 저장 (apart_YYYYMM.log, apartfail_YYYYMM.log)
-                print(f"[LOG_SAVE] 월 완료 - {ym_formatted} 로그 저장 시작 (ym={ym})")
-                logger.info(f"=" * 60)
-                logger.info(f" [매매] {ym_formatted} 로그 저장 시작")
-                logger.info(f"   매칭 로그: {len(self._apt_matching_log_by_month.get(ym, {}))}개 아파트")
-                logger.info(f"   실패 로그: {len(self._apt_fail_log_by_month.get(ym, []))}건")
-                logger.info(f"=" * 60)
-                
-                try:
-                    print(f"[LOG_SAVE] {ym} - _save_apt_matching_log 호출")
-                    self._save_apt_matching_log(ym)
-                    print(f"[LOG_SAVE] {ym} - _save_apt_matching_log 완료")
-                except Exception as e:
-                    print(f"[LOG_SAVE] ERROR: {ym} 매칭 로그 저장 실패 - {e}")
-                    logger.error(f" [매매] {ym_formatted} 매칭 로그 저장 실패: {e}", exc_info=True)
-                
-                try:
-                    print(f"[LOG_SAVE] {ym} - _save_apt_fail_log 호출")
-                    self._save_apt_fail_log(ym)
-                    print(f"[LOG_SAVE] {ym} - _save_apt_fail_log 완료")
-                except Exception as e:
-                    print(f"[LOG_SAVE] ERROR: {ym} 실패 로그 저장 실패 - {e}")
-                    logger.error(f" [매매] {ym_formatted} 실패 로그 저장 실패: {e}", exc_info=True)
-                
-                try:
-                    print(f"[LOG_SAVE] {ym} - _save_apt_success_log 호출")
-                    self._save_apt_success_log(ym)
-                    print(f"[LOG_SAVE] {ym} - _save_apt_success_log 완료")
-                except Exception as e:
-                    print(f"[LOG_SAVE] ERROR: {ym} 성공 로그 저장 실패 - {e}")
-                    logger.error(f" [매매] {ym_formatted} 성공 로그 저장 실패: {e}", exc_info=True)
-                
-                logger.info(f"=" * 60)
-                logger.info(f" [매매] {ym_formatted} 로그 저장 완료")
-                logger.info(f"=" * 60)
-                print(f"[LOG_SAVE] {ym_formatted} 로그 저장 프로세스 완료")
-                
+                self._save_month_logs(ym, "매매")
+            
                 if max_items and total_saved >= max_items:
                     break
-        finally:
-            # HTTP 클라이언트 정리
-            await http_client.aclose()
+        
+        # 월별 지역 집계 갱신 (저장된 거래가 있는 월만)
+        # 이어서 수집하는 경우 이전 실행에서 저장 후 집계하지 못한 월이 있을 수 있으므로 대상 월 전체
+        if resume and use_queue:
+            touched_months.update(target_months)
+        if touched_months:
+            try:
+                await monthly_region_stats_service.refresh_months(db, STATS_KIND_SALE, touched_months)
+                # 통계 캐시는 stats:global 태그로 한 번에 무효화 (SCAN 없음)
+                await invalidate_cache_tags(STATS_GLOBAL_TAG)
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f" 월별 지역 집계 갱신 실패: {type(e).__name__}: {str(e)}")
+        
+        # 이어서 수집하는 경우 이전 실행에서 저장된 아파트를 알 수 없으므로 대상 월에 거래가 있는 아파트 전체
+        if resume and use_queue and touched_months:
+            try:
+                touched_apt_ids.update(
+                    await apartment_price_summary_service.apt_ids_in_months(db, STATS_KIND_SALE, touched_months)
+                )
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f" 갱신 대상 아파트 조회 실패: {type(e).__name__}: {str(e)}")
+        
+        # 아파트별 가격 요약 갱신 (거래가 저장된 아파트만)
+        if touched_apt_ids:
+            try:
+                await apartment_price_summary_service.refresh_apartments(db, STATS_KIND_SALE, touched_apt_ids)
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f" 아파트 가격 요약 갱신 실패: {type(e).__name__}: {str(e)}")
+            
+            # 아파트 단위 캐시(상세, 평형별 가격, 거래 내역, 주변 시세 등) 무효화
+            # 일괄 저장은 ORM after_update 이벤트를 거치지 않으므로 apt 태그를 직접 올림
+            await invalidate_apartment_tags(touched_apt_ids)
+        
+        # 평당가 분포 스냅샷 재구성 (percentile 조회용, 매매 가격 요약 기준)
+        if touched_apt_ids:
+            await percentile_snapshot_store.rebuild(db)
         
         logger.info(f" 매매 수집 완료: 저장 {total_saved}건, 건너뜀 {skipped}건, 오류 {len(errors)}건")
         # 참고: 각 월의 로그는 월별로 이미 저장되었습니다.
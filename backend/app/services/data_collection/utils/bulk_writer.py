@@ -0,0 +1,203 @@
+"""
+거래 데이터 일괄 저장 유틸리티
+
+수집한 거래 데이터를 (연월, 시군구) 단위로 모아 한 번에 저장합니다.
+행마다 중복 확인 SELECT 후 ORM add 하던 방식을
+자연키 UNIQUE 인덱스 기반 INSERT ... ON CONFLICT 로 대체합니다.
+
+자연키 UNIQUE 인덱스는 scripts/migrations 의 마이그레이션에서 생성합니다.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Sequence, Set, Tuple, Type
+
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rent import Rent
+from app.models.sale import Sale
+
+logger = logging.getLogger(__name__)
+
+# 매매 자연키 (uq_sales_natural_key 인덱스와 동일한 컬럼 순서)
+SALE_NATURAL_KEY: Tuple[str, ...] = (
+    "apt_id",
+    "contract_date",
+    "trans_price",
+    "floor",
+    "exclusive_area",
+)
+
+# 전월세 자연키 (uq_rents_natural_key 인덱스와 동일한 컬럼 순서)
+# 전세는 monthly_rent가 NULL이므로 인덱스는 NULLS NOT DISTINCT로 생성
+RENT_NATURAL_KEY: Tuple[str, ...] = (
+    "apt_id",
+    "deal_date",
+    "floor",
+    "exclusive_area",
+    "deposit_price",
+    "monthly_rent",
+    "apt_seq",
+)
+
+# 한 INSERT 문에 담을 최대 행 수 (asyncpg 바인드 파라미터 32767개 제한 고려)
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class BulkWriteResult:
+    """일괄 저장 결과 (배치 단위 집계)"""
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    # 새로 INSERT된 행 (returning_columns 기준) - 후처리(가격 변동 로그 등)에 사용
+    inserted_rows: List[Dict[str, Any]] = field(default_factory=list)
+    # 실제로 INSERT/UPDATE된 행의 아파트 (아파트 단위 캐시 무효화, 가격 요약 갱신 대상)
+    touched_apt_ids: Set[int] = field(default_factory=set)
+
+    @property
+    def saved(self) -> int:
+        """저장(신규 + 업데이트)된 행 수"""
+        return self.inserted + self.updated
+
+    def merge(self, other: "BulkWriteResult") -> None:
+        """다른 배치 결과를 누적"""
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.skipped += other.skipped
+        self.inserted_rows.extend(other.inserted_rows)
+        self.touched_apt_ids.update(other.touched_apt_ids)
+
+
+class TransactionBulkWriter:
+    """
+    거래 테이블 일괄 저장기
+
+    1. 메모리에서 자연키 기준 중복 제거 (같은 페이지 내 중복)
+    2. chunk_size 단위 INSERT ... ON CONFLICT 로 DB 중복 처리
+       - allow_duplicate=False: ON CONFLICT DO NOTHING (기존 행 건너뜀)
+       - allow_duplicate=True: ON CONFLICT DO UPDATE (update_columns 갱신)
+
+    커밋은 호출자가 담당합니다.
+    """
+
+    def __init__(
+        self,
+        model: Type[Any],
+        key_columns: Sequence[str],
+        update_columns: Sequence[str],
+        returning_columns: Sequence[str] = ("trans_id", "apt_id"),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.model = model
+        self.key_columns = tuple(key_columns)
+        self.update_columns = tuple(update_columns)
+        self.returning_columns = tuple(returning_columns)
+        self.chunk_size = chunk_size
+
+    def _row_key(self, row: Dict[str, Any]) -> tuple:
+        """자연키 튜플 생성 (면적은 DB Numeric(7, 2) 정밀도에 맞춰 반올림)"""
+        return tuple(
+            round(value, 2) if isinstance(value, float) else value
+            for value in (row.get(column) for column in self.key_columns)
+        )
+
+    def dedup(self, rows: Sequence[Dict[str, Any]], keep_last: bool = False) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        자연키 기준 메모리 중복 제거
+
+        Args:
+            rows: 저장할 행 목록
+            keep_last: True면 같은 키의 마지막 행을 유지 (업데이트 모드), False면 첫 행 유지
+
+        Returns:
+            (중복 제거된 행 목록, 제거된 행 수)
+        """
+        unique: Dict[tuple, Dict[str, Any]] = {}
+        for row in rows:
+            key = self._row_key(row)
+            if keep_last or key not in unique:
+                unique[key] = row
+        return list(unique.values()), len(rows) - len(unique)
+
+    async def write(
+        self,
+        db: AsyncSession,
+        rows: Sequence[Dict[str, Any]],
+        allow_duplicate: bool = False,
+    ) -> BulkWriteResult:
+        """
+        행 목록을 일괄 저장
+
+        Args:
+            db: 데이터베이스 세션 (커밋은 호출자 책임)
+            rows: 모델 컬럼명을 키로 갖는 dict 목록 (모든 행의 키 구성이 같아야 함)
+            allow_duplicate: True면 기존 행 업데이트, False면 건너뜀
+
+        Returns:
+            BulkWriteResult (inserted / updated / skipped)
+        """
+        unique_rows, duplicate_count = self.dedup(rows, keep_last=allow_duplicate)
+        result = BulkWriteResult(skipped=duplicate_count)
+        if not unique_rows:
+            return result
+
+        now = datetime.now()
+        returning = [getattr(self.model, column) for column in self.returning_columns]
+
+        for start in range(0, len(unique_rows), self.chunk_size):
+            chunk = [
+                {**row, "created_at": now, "updated_at": now}
+                for row in unique_rows[start:start + self.chunk_size]
+            ]
+            stmt = insert(self.model).values(chunk)
+
+            if allow_duplicate:
+                set_ = {column: stmt.excluded[column] for column in self.update_columns}
+                set_["updated_at"] = now
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(self.key_columns),
+                    set_=set_,
+                ).returning(*returning, literal_column("(xmax = 0)").label("inserted"))
+            else:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=list(self.key_columns),
+                ).returning(*returning)
+
+            returned = (await db.execute(stmt)).mappings().all()
+            result.touched_apt_ids.update(row["apt_id"] for row in returned)
+
+            if allow_duplicate:
+                for row in returned:
+                    if row["inserted"]:
+                        result.inserted += 1
+                        result.inserted_rows.append(
+                            {column: row[column] for column in self.returning_columns}
+                        )
+                    else:
+                        result.updated += 1
+            else:
+                result.inserted += len(returned)
+                result.skipped += len(chunk) - len(returned)
+                result.inserted_rows.extend(dict(row) for row in returned)
+
+        return result
+
+
+# 매매 일괄 저장기 (업데이트 모드에서는 기존 로직과 동일하게 건축년도/비고만 갱신)
+sale_bulk_writer = TransactionBulkWriter(
+    Sale,
+    key_columns=SALE_NATURAL_KEY,
+    update_columns=("build_year", "remarks"),
+    returning_columns=("trans_id", "apt_id", "trans_price", "contract_date"),
+)
+
+# 전월세 일괄 저장기 (보증금/월세는 자연키이므로 전세/월세 구분 정보만 갱신)
+rent_bulk_writer = TransactionBulkWriter(
+    Rent,
+    key_columns=RENT_NATURAL_KEY,
+    update_columns=("build_year", "rent_type", "contract_type", "remarks"),
+    returning_columns=("trans_id", "apt_id", "deposit_price", "monthly_rent", "deal_date"),
+)
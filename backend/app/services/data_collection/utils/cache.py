@@ -2,52 +2,216 @@
 데이터 수집 캐시 유틸리티
 
 아파트 정규화 및 매칭에 사용되는 캐시를 관리합니다.
+모든 캐시는 BoundedCache(LRU + 선택적 TTL + 메모리 상한) 위에 구현되어
+장시간 실행되는 수집기에서도 메모리가 무한히 늘어나지 않습니다.
 """
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-import asyncio
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def estimate_size(value: Any, _depth: int = 0, _seen: Optional[set] = None) -> int:
+    """
+    객체의 대략적인 메모리 크기 (bytes)
+
+    dict/list/tuple/set 은 재귀적으로, 그 외 객체는 __dict__ 1단계까지만 계산합니다.
+    ORM 객체처럼 관계로 연결된 큰 그래프를 끝까지 따라가지 않도록 깊이를 제한합니다.
+    """
+    if _seen is None:
+        _seen = set()
+    obj_id = id(value)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    size = sys.getsizeof(value)
+    if _depth >= 4:
+        return size
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1, _seen) + estimate_size(v, _depth + 1, _seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1, _seen)
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += estimate_size(vars(value), _depth + 1, _seen)
+    return size
+
+
+class BoundedCache:
+    """
+    크기 제한 LRU 캐시
+
+    - OrderedDict 기반 O(1) 조회/갱신/축출 (조회 시 가장 최근으로 이동)
+    - ttl_seconds: 항목 만료 시간 (None이면 만료 없음)
+    - max_entries: 최대 항목 수
+    - max_bytes: 최대 추정 메모리 (None이면 제한 없음)
+    - hit/miss/eviction/expiration 카운터
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+        # key → (value, 추정 크기, 만료 시각)
+        self._data: "OrderedDict[Any, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not self._is_expired(entry)
+
+    def _is_expired(self, entry: Tuple[Any, int, Optional[float]]) -> bool:
+        return entry[2] is not None and time.monotonic() > entry[2]
+
+    def _remove(self, key: Any) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """조회 (만료 항목은 삭제 후 miss 처리)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        if self._is_expired(entry):
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return default
+        self._data.move_to_end(key)
+        self._hits += 1
+        return entry[0]
+
+    def set(self, key: Any, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """저장 후 상한을 넘으면 가장 오래 사용하지 않은 항목부터 축출"""
+        if key in self._data:
+            self._remove(key)
+
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 한 항목이 전체 상한보다 크면 저장하지 않음 (다른 항목을 모두 밀어내지 않도록)
+            logger.debug(f" {self.name} 캐시 항목 크기 초과로 저장 생략: {size} bytes")
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, size, expires_at)
+        self._bytes += size
+
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self._data))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        self._remove(key)
+        return entry[0]
+
+    def purge_expired(self) -> int:
+        """만료된 항목 일괄 삭제"""
+        now = time.monotonic()
+        expired = [k for k, (_, _, exp) in self._data.items() if exp is not None and now > exp]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """전체 삭제 및 카운터 초기화"""
+        self._data.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        total = self._hits + self._misses
+        hit_rate = self._hits / total * 100 if total > 0 else 0
+        return {
+            "size": len(self._data),
+            "max_size": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
+
+
 class NormalizationCache:
     """
     아파트 이름 정규화 결과 캐시
-    
+
     정규화 계산은 비용이 높으므로 결과를 캐싱하여 재사용합니다.
     """
-    
+
     _instance = None
-    _cache: Dict[str, Dict[str, Any]] = {}
     _max_size: int = 100000  # 최대 캐시 크기
-    _hits: int = 0
-    _misses: int = 0
-    
+    _max_bytes: int = 64 * 1024 * 1024  # 최대 64MB
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._cache = BoundedCache(
+                "normalization", max_entries=cls._max_size, max_bytes=cls._max_bytes
+            )
         return cls._instance
-    
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+
+    def get(self, key: str) -> Optional[Any]:
         """캐시에서 값 조회"""
-        if key in self._cache:
-            self._hits += 1
-            return self._cache[key]
-        self._misses += 1
-        return None
-    
-    def set(self, key: str, value: Dict[str, Any]) -> None:
-        """캐시에 값 저장"""
-        # 캐시 크기 제한
-        if len(self._cache) >= self._max_size:
-            # 가장 오래된 항목 10% 삭제 (간단한 LRU 대체)
-            keys_to_remove = list(self._cache.keys())[:int(self._max_size * 0.1)]
-            for k in keys_to_remove:
-                del self._cache[k]
-        
-        self._cache[key] = value
-    
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시에 값 저장 (상한 초과 시 LRU 축출)"""
+        self._cache.set(key, value)
+
+    # dict 인터페이스 (ApartmentMatcher.match_apartment의 normalized_cache 인자로 전달)
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._cache.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
     def get_or_compute(
         self,
         key: str,
@@ -57,59 +221,47 @@ class NormalizationCache:
         result = self.get(key)
         if result is not None:
             return result
-        
+
         result = compute_func()
         self.set(key, result)
         return result
-    
+
     def clear(self) -> None:
         """캐시 초기화"""
         self._cache.clear()
-        self._hits = 0
-        self._misses = 0
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
-        total = self._hits + self._misses
-        hit_rate = self._hits / total * 100 if total > 0 else 0
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": f"{hit_rate:.2f}%"
-        }
+        return self._cache.get_stats()
 
 
 class RegionApartmentCache:
     """
     지역별 아파트 목록 캐시
-    
+
     시군구 코드별 아파트 목록을 캐싱하여 DB 조회 횟수를 줄입니다.
     """
-    
+
     _instance = None
-    _cache: Dict[str, Dict[str, Any]] = {}
     _ttl_seconds: int = 3600  # 1시간
-    
+    _max_regions: int = 300  # 최대 시군구 수 (전국 약 250개)
+    _max_bytes: int = 512 * 1024 * 1024  # 최대 512MB
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._cache = BoundedCache(
+                "region_apartment",
+                max_entries=cls._max_regions,
+                max_bytes=cls._max_bytes,
+                ttl_seconds=cls._ttl_seconds,
+            )
         return cls._instance
-    
+
     def get(self, sgg_cd: str) -> Optional[Dict[str, Any]]:
-        """캐시에서 지역별 아파트 목록 조회"""
-        if sgg_cd not in self._cache:
-            return None
-        
-        entry = self._cache[sgg_cd]
-        # TTL 확인
-        if datetime.now() > entry["expires_at"]:
-            del self._cache[sgg_cd]
-            return None
-        
-        return entry["data"]
-    
+        """캐시에서 지역별 아파트 목록 조회 (TTL 만료 시 None)"""
+        return self._cache.get(sgg_cd)
+
     def set(
         self,
         sgg_cd: str,
@@ -118,91 +270,81 @@ class RegionApartmentCache:
         details: Dict[int, Any]
     ) -> None:
         """캐시에 지역별 아파트 목록 저장"""
-        self._cache[sgg_cd] = {
-            "data": {
-                "apartments": apartments,
-                "regions": regions,
-                "details": details
-            },
-            "expires_at": datetime.now() + timedelta(seconds=self._ttl_seconds),
-            "created_at": datetime.now()
-        }
-    
+        self._cache.set(sgg_cd, {
+            "apartments": apartments,
+            "regions": regions,
+            "details": details
+        })
+
     def invalidate(self, sgg_cd: str) -> None:
         """특정 지역 캐시 무효화"""
-        if sgg_cd in self._cache:
-            del self._cache[sgg_cd]
-    
+        self._cache.pop(sgg_cd)
+
     def clear(self) -> None:
         """전체 캐시 초기화"""
         self._cache.clear()
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
-        active_entries = sum(
-            1 for entry in self._cache.values()
-            if datetime.now() <= entry["expires_at"]
-        )
-        return {
-            "total_entries": len(self._cache),
-            "active_entries": active_entries,
-            "ttl_seconds": self._ttl_seconds
-        }
+        self._cache.purge_expired()
+        return self._cache.get_stats()
 
 
 class AptSeqCache:
     """
     apt_seq → apt_id 매핑 캐시
-    
+
     API의 aptSeq를 DB의 apt_id로 빠르게 변환합니다.
     """
-    
+
     _instance = None
-    _cache: Dict[str, int] = {}  # apt_seq → apt_id
-    _reverse_cache: Dict[int, str] = {}  # apt_id → apt_seq
-    
+    _max_size: int = 500000  # 최대 매핑 수 (전국 아파트 단지 수 이상)
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # apt_seq → apt_id / apt_id → apt_seq (값이 작으므로 크기는 항목 수로만 제한)
+            cls._instance._cache = BoundedCache("apt_seq", max_entries=cls._max_size)
+            cls._instance._reverse_cache = BoundedCache("apt_seq_reverse", max_entries=cls._max_size)
         return cls._instance
-    
+
     def get_apt_id(self, apt_seq: str) -> Optional[int]:
         """apt_seq로 apt_id 조회"""
         return self._cache.get(apt_seq.strip())
-    
+
     def get_apt_seq(self, apt_id: int) -> Optional[str]:
         """apt_id로 apt_seq 조회"""
         return self._reverse_cache.get(apt_id)
-    
+
     def set(self, apt_seq: str, apt_id: int) -> None:
         """매핑 저장"""
         apt_seq_clean = apt_seq.strip()
-        self._cache[apt_seq_clean] = apt_id
-        self._reverse_cache[apt_id] = apt_seq_clean
-    
+        self._cache.set(apt_seq_clean, apt_id)
+        self._reverse_cache.set(apt_id, apt_seq_clean)
+
     def load_from_db(self, mappings: List[tuple]) -> None:
         """
         DB에서 apt_seq 매핑 로드
-        
+
         Args:
             mappings: List of (apt_id, apt_seq) tuples
         """
         for apt_id, apt_seq in mappings:
             if apt_seq:
                 self.set(apt_seq, apt_id)
-        
+
         logger.info(f" apt_seq 캐시 로드 완료: {len(self._cache)}개 매핑")
-    
+
     def clear(self) -> None:
         """캐시 초기화"""
         self._cache.clear()
         self._reverse_cache.clear()
-    
+
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
-        return {
-            "total_mappings": len(self._cache)
-        }
+        stats = self._cache.get_stats()
+        stats["total_mappings"] = len(self._cache)
+        return stats
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,293 @@
+"""
+수집기 공용 HTTP 전송 계층
+
+모든 데이터 수집기가 하나의 httpx.AsyncClient(연결 풀, keep-alive, 가능하면 HTTP/2)를 공유하고,
+(API 키, 호스트) 단위 토큰 버킷으로 요청 속도를 맞춥니다.
+
+- 연결 재사용: 요청마다 클라이언트를 만들지 않아 TLS 핸드셰이크를 반복하지 않음
+- 토큰 버킷: 여러 수집 작업이 동시에 같은 API를 호출해도 초당 요청 수가 상한을 넘지 않음
+- 재시도: 타임아웃/연결 오류/429/5xx 는 지수 백오프 + 지터로 재시도 (Retry-After 준수)
+- 지표: 엔드포인트(호스트+경로)별 요청 수, 오류 수, 재시도 수, 지연 시간
+
+테스트 시에는 CollectorTransport(transport=httpx.MockTransport(...)) 또는
+로컬 스텁 서버 URL로 호출하면 됩니다.
+"""
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# API 키를 담는 쿼리 파라미터 이름 (레이트 리미터 키 구분용)
+_API_KEY_PARAMS = ("serviceKey", "KEY", "key", "apiKey")
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷
+
+    rate: 초당 충전 토큰 수, burst: 최대 토큰 수
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        토큰 1개 획득 (부족하면 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                await asyncio.sleep(wait)
+                waited = wait
+                self._refill()
+            self._tokens -= 1
+        return waited
+
+
+@dataclass
+class EndpointMetrics:
+    """엔드포인트별 호출 지표"""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+    def observe(self, latency: float, status_code: Optional[int]) -> None:
+        self.requests += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if status_code is not None:
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        avg = self.total_latency / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "avg_latency_ms": round(avg * 1000, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "status_counts": dict(self.status_counts),
+        }
+
+
+class CollectorTransport:
+    """
+    수집기 공용 HTTP 전송 계층
+
+    Args:
+        rate_per_second: (API 키, 호스트)별 초당 요청 수 (0 이하면 제한 없음)
+        burst: 토큰 버킷 최대 크기
+        max_connections: 최대 동시 연결 수
+        max_keepalive_connections: keep-alive 연결 수
+        timeout: 요청 타임아웃 (초)
+        http2: HTTP/2 사용 여부 (h2 패키지가 없으면 자동으로 HTTP/1.1)
+        transport: httpx 전송 계층 주입 (테스트용)
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 20.0,
+        burst: int = 20,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        timeout: float = 60.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._timeout = httpx.Timeout(timeout, connect=10.0)
+        self._http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._metrics: Dict[str, EndpointMetrics] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 (처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=self._limits,
+                http2=self._http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    def _bucket_for(self, url: str, params: Optional[Dict[str, Any]]) -> TokenBucket:
+        """(API 키 해시, 호스트) 단위 토큰 버킷"""
+        api_key = ""
+        if params:
+            for name in _API_KEY_PARAMS:
+                if params.get(name):
+                    api_key = str(params[name])
+                    break
+        key = (hashlib.sha1(api_key.encode()).hexdigest()[:12], urlsplit(url).netloc)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _metrics_for(self, url: str) -> EndpointMetrics:
+        parts = urlsplit(url)
+        endpoint = f"{parts.netloc}{parts.path}"
+        metrics = self._metrics.get(endpoint)
+        if metrics is None:
+            metrics = EndpointMetrics()
+            self._metrics[endpoint] = metrics
+        return metrics
+
+    @staticmethod
+    def _backoff(attempt: int, base: float, retry_after: Optional[str] = None) -> float:
+        """지수 백오프 + 전체 지터 (Retry-After 헤더가 있으면 우선)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+        return random.uniform(0, base * (2 ** attempt))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        retries: int = 3,
+        backoff_base: float = 0.5,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        레이트 리밋/재시도가 적용된 요청
+
+        Returns:
+            성공 응답 (2xx~4xx 중 재시도 대상이 아닌 응답 포함, raise_for_status는 호출자 책임)
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        bucket = self._bucket_for(url, params)
+        metrics = self._metrics_for(url)
+
+        for attempt in range(retries):
+            metrics.throttled_seconds += await bucket.acquire()
+            started = time.monotonic()
+            try:
+                response = await self.client.request(method, url, params=params, **kwargs)
+            except (httpx.TimeoutException, httpx.TransportError):
+                metrics.observe(time.monotonic() - started, None)
+                metrics.errors += 1
+                if attempt == retries - 1:
+                    raise
+                metrics.retries += 1
+                await asyncio.sleep(self._backoff(attempt, backoff_base))
+                continue
+
+            metrics.observe(time.monotonic() - started, response.status_code)
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries - 1:
+                metrics.errors += 1
+                metrics.retries += 1
+                wait = self._backoff(attempt, backoff_base, response.headers.get("Retry-After"))
+                logger.debug(f" 재시도 ({response.status_code}): {url}, {wait:.2f}초 대기")
+                await asyncio.sleep(wait)
+                continue
+            if response.status_code >= 400:
+                metrics.errors += 1
+            return response
+
+        # retries <= 0 인 경우
+        raise httpx.TransportError(f"요청 시도 횟수 없음: {url}")
+
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> httpx.Response:
+        """GET 요청"""
+        return await self.request("GET", url, params=params, **kwargs)
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """GET 후 상태 확인 및 JSON 디코딩"""
+        response = await self.get(url, params=params, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """엔드포인트별 지표"""
+        return {
+            "http2": self._http2,
+            "rate_per_second": self.rate_per_second,
+            "burst": self.burst,
+            "endpoints": {endpoint: m.to_dict() for endpoint, m in self._metrics.items()},
+        }
+
+    def reset_metrics(self) -> None:
+        self._metrics.clear()
+
+    async def aclose(self) -> None:
+        """공유 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_collector_transport: Optional[CollectorTransport] = None
+
+
+def get_collector_transport() -> CollectorTransport:
+    """공용 전송 계층 싱글톤"""
+    global _collector_transport
+    if _collector_transport is None:
+        _collector_transport = CollectorTransport(
+            rate_per_second=settings.COLLECTOR_RATE_PER_SECOND,
+            burst=settings.COLLECTOR_RATE_BURST,
+            max_connections=settings.COLLECTOR_MAX_CONNECTIONS,
+            http2=settings.COLLECTOR_HTTP2,
+        )
+    return _collector_transport
+
+
+async def close_collector_transport() -> None:
+    """공용 전송 계층 종료 (애플리케이션 종료 시)"""
+    global _collector_transport
+    if _collector_transport is not None:
+        await _collector_transport.aclose()
+        _collector_transport = None
@@ -0,0 +1,186 @@
+"""
+아파트 매칭 결정 저장소
+
+거래 API의 (시군구, 동, 지번, 아파트명) 조합은 매달 반복해서 들어오지만
+수집 실행마다 ApartmentMatcher로 처음부터 다시 매칭합니다.
+이 모듈은 매칭 결과(apt_id, 매칭 단계, 매칭 로직 버전)를 apt_match_decisions 테이블에 저장하고,
+시군구 단위로 메모리에 올려 같은 조합은 dict 조회 한 번으로 apt_id를 찾습니다.
+
+- 성공한 매칭만 저장합니다 (실패 조합은 아파트가 추가되면 매칭될 수 있으므로 저장하지 않음).
+- MATCHER_VERSION이 다른 결정은 로드하지 않으므로 매칭 로직 변경 시 자동으로 재매칭됩니다.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.apt_match_decision import AptMatchDecision
+from app.services.data_collection.utils.matching import MATCHER_VERSION
+
+logger = logging.getLogger(__name__)
+
+# apt_match_decisions 키 컬럼 길이 (초과하는 키는 저장하지 않음)
+_MAX_UMD_NM_LENGTH = 50
+_MAX_JIBUN_LENGTH = 50
+_MAX_APT_NAME_LENGTH = 100
+
+DecisionKey = Tuple[str, str, str]
+
+
+class MatchDecisionStore:
+    """
+    매칭 결정 저장소 (싱글톤)
+
+    시군구별로 {(동, 지번, 아파트명): (apt_id, 매칭 단계)} 를 메모리에 보관합니다.
+    """
+
+    _instance = None
+    _decisions: Dict[str, Dict[DecisionKey, Tuple[int, str]]] = {}
+    _loaded: Set[str] = set()
+    _hits: int = 0
+    _misses: int = 0
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    @staticmethod
+    def make_key(umd_nm: Optional[str], jibun: Optional[str], api_apt_name: str) -> DecisionKey:
+        """매칭 키 생성 (sgg_cd 제외)"""
+        return ((umd_nm or "").strip(), (jibun or "").strip(), api_apt_name.strip())
+
+    async def load_region(self, db: AsyncSession, sgg_cd: str) -> None:
+        """
+        시군구의 현재 버전 매칭 결정 로드 (이미 로드했으면 생략)
+
+        Args:
+            db: 데이터베이스 세션
+            sgg_cd: 5자리 시군구 코드
+        """
+        if sgg_cd in self._loaded:
+            return
+
+        result = await db.execute(
+            select(
+                AptMatchDecision.umd_nm,
+                AptMatchDecision.jibun,
+                AptMatchDecision.api_apt_name,
+                AptMatchDecision.apt_id,
+                AptMatchDecision.method,
+            ).where(
+                AptMatchDecision.sgg_cd == sgg_cd,
+                AptMatchDecision.matcher_version == MATCHER_VERSION,
+            )
+        )
+        region_decisions = self._decisions.setdefault(sgg_cd, {})
+        for umd_nm, jibun, api_apt_name, apt_id, method in result.all():
+            region_decisions[(umd_nm, jibun, api_apt_name)] = (apt_id, method)
+        self._loaded.add(sgg_cd)
+
+        if region_decisions:
+            logger.debug(f" 매칭 결정 로드: sgg_cd={sgg_cd}, {len(region_decisions)}건")
+
+    def region_decisions(self, sgg_cd: str) -> Dict[DecisionKey, Tuple[int, str]]:
+        """시군구의 매칭 결정 전체 (load_region 이후 호출, 조회 통계는 record_lookups로 반영)"""
+        return self._decisions.get(sgg_cd, {})
+
+    def record_lookups(self, hits: int, misses: int) -> None:
+        """외부(워커 프로세스 등)에서 조회한 결과를 통계에 반영"""
+        self._hits += hits
+        self._misses += misses
+
+    async def save(
+        self,
+        db: AsyncSession,
+        sgg_cd: str,
+        decisions: List[Dict[str, Any]],
+    ) -> int:
+        """
+        새 매칭 결정 일괄 저장 (커밋은 호출자 책임)
+
+        저장 실패는 거래 저장에 영향을 주지 않도록 savepoint 안에서 처리하고 경고만 남깁니다.
+
+        Args:
+            db: 데이터베이스 세션
+            sgg_cd: 5자리 시군구 코드
+            decisions: {"umd_nm", "jibun", "api_apt_name", "apt_id", "method"} 목록
+
+        Returns:
+            저장한 결정 수
+        """
+        rows: Dict[DecisionKey, Dict[str, Any]] = {}
+        now = datetime.now()
+        for decision in decisions:
+            key = self.make_key(decision.get("umd_nm"), decision.get("jibun"), decision["api_apt_name"])
+            umd_nm, jibun, api_apt_name = key
+            if (
+                not api_apt_name
+                or len(umd_nm) > _MAX_UMD_NM_LENGTH
+                or len(jibun) > _MAX_JIBUN_LENGTH
+                or len(api_apt_name) > _MAX_APT_NAME_LENGTH
+            ):
+                continue
+            rows[key] = {
+                "sgg_cd": sgg_cd,
+                "umd_nm": umd_nm,
+                "jibun": jibun,
+                "api_apt_name": api_apt_name,
+                "apt_id": decision["apt_id"],
+                "method": decision["method"],
+                "matcher_version": MATCHER_VERSION,
+                "created_at": now,
+                "updated_at": now,
+            }
+
+        if not rows:
+            return 0
+
+        stmt = insert(AptMatchDecision).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["sgg_cd", "umd_nm", "jibun", "api_apt_name"],
+            set_={
+                "apt_id": stmt.excluded.apt_id,
+                "method": stmt.excluded.method,
+                "matcher_version": stmt.excluded.matcher_version,
+                "updated_at": now,
+            },
+        )
+        try:
+            async with db.begin_nested():
+                await db.execute(stmt)
+        except Exception as e:
+            logger.warning(f" 매칭 결정 저장 실패 - sgg_cd={sgg_cd}, 에러: {type(e).__name__}: {str(e)}")
+            return 0
+
+        region_decisions = self._decisions.setdefault(sgg_cd, {})
+        for key, row in rows.items():
+            region_decisions[key] = (row["apt_id"], row["method"])
+        return len(rows)
+
+    def clear(self) -> None:
+        """메모리 캐시 초기화 (다음 조회 시 DB에서 다시 로드)"""
+        self._decisions.clear()
+        self._loaded.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        total = self._hits + self._misses
+        hit_rate = self._hits / total * 100 if total > 0 else 0
+        return {
+            "regions": len(self._loaded),
+            "size": sum(len(d) for d in self._decisions.values()),
+            "matcher_version": MATCHER_VERSION,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": f"{hit_rate:.2f}%"
+        }
+
+
+# 전역 저장소 인스턴스
+match_decision_store = MatchDecisionStore()
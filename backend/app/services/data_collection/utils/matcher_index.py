@@ -0,0 +1,195 @@
+"""
+지역별 아파트 매칭 인덱스
+
+ApartmentMatcher.match_apartment는 거래 한 건마다 시군구 내 모든 후보에 대해
+이름 정규화/브랜드·단지 추출과 SequenceMatcher 비교를 반복합니다.
+이 모듈은 시군구(sgg_cd) 단위로 후보 쪽 분석 결과를 한 번만 계산해 두고,
+문자 역색인으로 점수 계산 전에 가망 없는 후보를 걸러냅니다.
+
+후보 축소 기준 (매칭 결과 보존):
+- match_apartment는 이름 유사도(SequenceMatcher.ratio) < 0.20 이면서
+  지번 완전 일치가 아닌 후보를 최종 단계에서 제외합니다.
+- ratio는 항상 quick_ratio(문자 다중집합 교집합 기반) 이하이므로,
+  역색인으로 구한 quick_ratio 상한이 0.20 미만인 후보는 결과에 영향을 주지 않습니다.
+- 정규화명/엄격 정규화명 정확 일치, 지번 완전 일치 가능 후보는 항상 유지합니다.
+"""
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.models import Apartment, ApartDetail
+from app.services.data_collection.utils.matching import ApartmentMatcher
+
+logger = logging.getLogger(__name__)
+
+# match_apartment의 MIN_NAME_SIMILARITY와 동일해야 함
+MIN_NAME_SIMILARITY = 0.20
+
+
+class RegionMatcherIndex:
+    """
+    시군구 단위 사전 계산 매칭 인덱스
+
+    - features: apt_id → 이름 분석 결과 (match_apartment의 db 캐시와 동일한 형태)
+    - jibun_info: apt_id → 지번 주소 파싱 결과 (본번/부번, 동 이름, 주소 내 아파트명)
+    - 문자 역색인: 문자 → [(apt_id, 등장 횟수)], quick_ratio 상한 계산용
+    - apartments: apt_id → Apartment (저장된 매칭 결정의 apt_id 조회용)
+    """
+
+    def __init__(
+        self,
+        apartments: Sequence[Apartment],
+        apt_details: Optional[Dict[int, ApartDetail]] = None,
+    ):
+        apt_details = apt_details or {}
+        self.apartments: Dict[int, Apartment] = {}
+        self.features: Dict[int, Dict[str, Any]] = {}
+        self.jibun_info: Dict[int, Dict[str, Any]] = {}
+        self.is_rental: Dict[int, bool] = {}
+        self._name_lengths: Dict[int, int] = {}
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._strict_to_ids: Dict[str, Set[int]] = {}
+        self._jibun_main_to_ids: Dict[str, Set[int]] = {}
+
+        for apt in apartments:
+            self._add(apt, apt_details.get(apt.apt_id))
+
+    def _add(self, apt: Apartment, detail: Optional[ApartDetail]) -> None:
+        """아파트 1건 인덱싱"""
+        apt_id = apt.apt_id
+        self.apartments[apt_id] = apt
+        features = ApartmentMatcher.build_name_features(apt.apt_name)
+        self.features[apt_id] = features
+        self.is_rental[apt_id] = ApartmentMatcher.is_rental_apartment(apt.apt_name)
+
+        normalized = features['normalized'] or ''
+        self._name_lengths[apt_id] = len(normalized)
+        for char, count in Counter(normalized).items():
+            self._postings.setdefault(char, []).append((apt_id, count))
+        self._strict_to_ids.setdefault(features['strict'], set()).add(apt_id)
+
+        if detail is not None and detail.jibun_address:
+            info = ApartmentMatcher.parse_db_jibun_address(detail.jibun_address)
+            # 지번 매칭 단계에서 반복 계산하던 값 미리 계산
+            info['normalized_dong'] = (
+                ApartmentMatcher.normalize_dong_name(info['dong_name']) if info['dong_name'] else None
+            )
+            info['normalized_apt_name_in_jibun'] = (
+                ApartmentMatcher.normalize_apt_name(ApartmentMatcher.clean_apt_name(info['apt_name_in_jibun']))
+                if info['apt_name_in_jibun'] else None
+            )
+            self.jibun_info[apt_id] = info
+            if info['main']:
+                self._jibun_main_to_ids.setdefault(info['main'], set()).add(apt_id)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def get_apartment(self, apt_id: int) -> Optional[Apartment]:
+        """apt_id로 후보 아파트 조회"""
+        return self.apartments.get(apt_id)
+
+    def get_features(self, apt_id: int) -> Optional[Dict[str, Any]]:
+        """사전 계산된 이름 분석 결과"""
+        return self.features.get(apt_id)
+
+    def get_jibun_info(self, apt_id: int) -> Optional[Dict[str, Any]]:
+        """사전 계산된 지번 주소 파싱 결과 (지번 주소가 없으면 None)"""
+        return self.jibun_info.get(apt_id)
+
+    def upper_bounds(self, normalized_api: str) -> Dict[int, float]:
+        """
+        API 정규화명 대비 후보별 SequenceMatcher 유사도 상한 (quick_ratio)
+
+        역색인에 공통 문자가 하나도 없는 후보는 결과에 포함되지 않습니다 (상한 0).
+        """
+        api_length = len(normalized_api)
+        overlap: Dict[int, int] = {}
+        for char, api_count in Counter(normalized_api).items():
+            for apt_id, db_count in self._postings.get(char, ()):
+                overlap[apt_id] = overlap.get(apt_id, 0) + min(api_count, db_count)
+
+        return {
+            apt_id: 2.0 * matches / (api_length + self._name_lengths[apt_id])
+            for apt_id, matches in overlap.items()
+        }
+
+    def viable_candidate_ids(
+        self,
+        api_features: Dict[str, Any],
+        api_jibun: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    ) -> Set[int]:
+        """
+        점수 계산 대상 후보 apt_id 집합
+
+        Args:
+            api_features: API 이름 분석 결과 (ApartmentMatcher.build_name_features)
+            api_jibun: API 지번 (본번, 부번) - 지번 완전 일치 후보 보존용
+
+        Returns:
+            이름 유사도 상한이 기준 이상이거나, 엄격 정규화명이 같거나,
+            지번 완전 일치가 가능한 후보의 apt_id 집합
+        """
+        viable = {
+            apt_id
+            for apt_id, bound in self.upper_bounds(api_features['normalized']).items()
+            if bound >= MIN_NAME_SIMILARITY
+        }
+        viable |= self._strict_to_ids.get(api_features['strict'], set())
+
+        if api_jibun is not None:
+            api_main, api_sub = api_jibun
+            if api_main:
+                for apt_id in self._jibun_main_to_ids.get(api_main, ()):
+                    db_sub = self.jibun_info[apt_id]['sub']
+                    if (api_sub and db_sub and api_sub == db_sub) or (not api_sub and not db_sub):
+                        viable.add(apt_id)
+        return viable
+
+
+# 시군구별 인덱스 레지스트리 (수집 실행/연월 간 재사용)
+_region_indexes: Dict[str, Tuple[Tuple[int, int, int], RegionMatcherIndex]] = {}
+
+
+def _signature(
+    apartments: Sequence[Apartment],
+    apt_details: Optional[Dict[int, ApartDetail]],
+) -> Tuple[int, int, int]:
+    """아파트 목록/상세 정보 변경 감지용 시그니처"""
+    return (
+        len(apartments),
+        hash(tuple((apt.apt_id, apt.apt_name) for apt in apartments)),
+        hash(tuple(sorted(
+            (apt_id, detail.jibun_address or '')
+            for apt_id, detail in (apt_details or {}).items()
+        ))),
+    )
+
+
+def get_region_matcher_index(
+    sgg_cd: str,
+    apartments: Sequence[Apartment],
+    apt_details: Optional[Dict[int, ApartDetail]] = None,
+) -> RegionMatcherIndex:
+    """
+    시군구 매칭 인덱스 조회 (없거나 아파트 목록이 바뀌었으면 재생성)
+
+    Args:
+        sgg_cd: 5자리 시군구 코드
+        apartments: 시군구 내 아파트 목록
+        apt_details: 아파트 상세 정보 딕셔너리
+
+    Returns:
+        RegionMatcherIndex
+    """
+    signature = _signature(apartments, apt_details)
+    cached = _region_indexes.get(sgg_cd)
+    if cached is not None and cached[0] == signature:
+        # 분석 결과는 재사용하고 Apartment 객체만 현재 세션에서 로드한 것으로 교체
+        cached[1].apartments = {apt.apt_id: apt for apt in apartments}
+        return cached[1]
+
+    index = RegionMatcherIndex(apartments, apt_details)
+    _region_indexes[sgg_cd] = (signature, index)
+    logger.debug(f" 매칭 인덱스 생성: sgg_cd={sgg_cd}, 아파트 {len(index)}개")
+    return index
@@ -17,6 +17,10 @@ from app.services.apt_matching import (
 
 logger = logging.getLogger(__name__)
 
+# 매칭 로직 버전 (매칭 규칙/임계값 변경 시 올려야 함)
+# apt_match_decisions에 저장된 이전 버전의 매칭 결정은 재사용하지 않습니다.
+MATCHER_VERSION = "2026.10.1"
+
 # 한국 대표 아파트 브랜드명 사전 (정규화된 형태로 저장, 긴 것 우선)
 APARTMENT_BRANDS = [
     # 복합 브랜드명 (먼저 매칭, 긴 것부터)
@@ -179,7 +183,8 @@ class ApartmentMatcher:
         bubun: Optional[str] = None,
         candidates: List[Apartment] = None,
         apt_details: Optional[Dict[int, ApartDetail]] = None,
-        all_regions: Optional[Dict[int, Any]] = None
+        all_regions: Optional[Dict[int, Any]] = None,
+        index: Optional[Any] = None
     ) -> Optional[Apartment]:
         """
          최우선 매칭: 법정동 코드 10자리 + 지번(부번까지) 정확 매칭
@@ -195,6 +200,7 @@ class ApartmentMatcher:
             candidates: 후보 아파트 리스트
             apt_details: 아파트 상세 정보 딕셔너리
             all_regions: 지역 정보 딕셔너리
+            index: 지역별 사전 계산 인덱스 (RegionMatcherIndex, 선택) - 지번 파싱 결과 재사용
             
         Returns:
             매칭된 Apartment 객체 또는 None
@@ -208,33 +214,7 @@ class ApartmentMatcher:
             api_sub = bubun.lstrip('0') if bubun and bubun != "0" and bubun != "" else None
         else:
             #  개선: jibun에서 본번-부번 추출 (산지번, 지구번호, 본번-부번-부부번 처리)
-            jibun_clean = jibun.strip()
-            
-            # 산지번 처리: "산37-6" → 본번="37", 부번="6"
-            if jibun_clean.startswith('산'):
-                jibun_clean = jibun_clean[1:]  # "산" 제거
-            
-            # 지구 번호 처리: "지구BL 34-7" → 본번="34", 부번="7"
-            if '지구' in jibun_clean or 'BL' in jibun_clean.upper() or '블록' in jibun_clean:
-                # 숫자 패턴만 추출
-                jibun_parts = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
-                if jibun_parts:
-                    api_main = jibun_parts.group(1).lstrip('0')
-                    # 부부번이 있으면 부번으로 통합 (또는 무시)
-                    api_sub = jibun_parts.group(2).lstrip('0') if jibun_parts.group(2) else None
-                else:
-                    api_main = None
-                    api_sub = None
-            else:
-                # 일반 지번 처리 (본번-부번-부부번 포함)
-                jibun_parts = re.match(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
-                if jibun_parts:
-                    api_main = jibun_parts.group(1).lstrip('0')
-                    # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                    api_sub = jibun_parts.group(2).lstrip('0') if jibun_parts.group(2) else None
-                else:
-                    api_main = None
-                    api_sub = None
+            api_main, api_sub = ApartmentMatcher.parse_api_jibun(jibun)
         
         if not api_main:
             return None
@@ -263,39 +243,14 @@ class ApartmentMatcher:
             if not detail.jibun_address:
                 continue
             
-            #  개선: DB 지번 주소에서 동 이름과 지번을 더 정확히 추출
-            # 패턴: "동이름 지번" 또는 "동이름 지번-부번" 또는 "동이름 지번-부번-부부번"
-            # 산지번, 지구번호도 처리
-            dong_jibun_pattern = r'([가-힣]+(?:동|가|리|읍|면))\s+(?:산)?(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)'
-            db_dong_jibun_match = re.search(dong_jibun_pattern, detail.jibun_address)
-            
-            if db_dong_jibun_match:
-                db_main = db_dong_jibun_match.group(2).lstrip('0')  # 본번
-                # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                db_sub = db_dong_jibun_match.group(3).lstrip('0') if db_dong_jibun_match.group(3) else None  # 부번
-            else:
-                #  개선: 산지번, 지구번호, 본번-부번-부부번 처리
-                # 산지번 패턴: "산37-6"
-                san_match = re.search(r'산\s*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address)
-                if san_match:
-                    db_main = san_match.group(1).lstrip('0')
-                    db_sub = san_match.group(2).lstrip('0') if san_match.group(2) else None
-                else:
-                    # 지구 번호 패턴: "지구BL 34-7" 또는 "가정2지구34-7"
-                    jigu_match = re.search(r'지구[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address)
-                    if not jigu_match:
-                        jigu_match = re.search(r'BL[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address, re.IGNORECASE)
-                    if jigu_match:
-                        db_main = jigu_match.group(1).lstrip('0')
-                        db_sub = jigu_match.group(2).lstrip('0') if jigu_match.group(2) else None
-                    else:
-                        # 일반 지번 패턴 (본번-부번-부부번 포함)
-                        db_jibun_match = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)', detail.jibun_address)
-                        if not db_jibun_match:
-                            continue
-                        db_main = db_jibun_match.group(1).lstrip('0')
-                        # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                        db_sub = db_jibun_match.group(2).lstrip('0') if db_jibun_match.group(2) else None
+            # DB 지번 주소에서 본번-부번 추출 (인덱스가 있으면 사전 계산 결과 사용)
+            jibun_info = index.get_jibun_info(apt.apt_id) if index is not None else None
+            if jibun_info is None:
+                jibun_info = ApartmentMatcher.parse_db_jibun_address(detail.jibun_address)
+            db_main = jibun_info['main']
+            db_sub = jibun_info['sub']
+            if not db_main:
+                continue
             
             # 본번 일치 확인
             if api_main == db_main:
@@ -328,6 +283,119 @@ class ApartmentMatcher:
         
         return None
     
+    @staticmethod
+    def parse_api_jibun(jibun: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        API 지번 문자열에서 본번/부번 추출
+        
+        산지번("산37-6"), 지구번호("지구BL 34-7"), 본번-부번-부부번("12-3-1")을 처리합니다.
+        부부번은 무시합니다.
+        
+        Returns:
+            (본번, 부번) - 추출 실패 시 (None, None)
+        """
+        jibun_clean = jibun.strip()
+        
+        # 산지번 처리: "산37-6" → 본번="37", 부번="6"
+        if jibun_clean.startswith('산'):
+            jibun_clean = jibun_clean[1:]  # "산" 제거
+        
+        # 지구 번호 처리: "지구BL 34-7" → 본번="34", 부번="7"
+        if '지구' in jibun_clean or 'BL' in jibun_clean.upper() or '블록' in jibun_clean:
+            jibun_parts = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
+        else:
+            # 일반 지번 처리 (본번-부번-부부번 포함)
+            jibun_parts = re.match(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
+        
+        if not jibun_parts:
+            return None, None
+        
+        api_main = jibun_parts.group(1).lstrip('0')
+        # 부부번이 있으면 부번만 사용 (부부번은 무시)
+        api_sub = jibun_parts.group(2).lstrip('0') if jibun_parts.group(2) else None
+        return api_main, api_sub
+    
+    @staticmethod
+    def parse_db_jibun_address(jibun_address: str) -> Dict[str, Any]:
+        """
+        DB 지번 주소에서 동 이름, 본번/부번, 주소 뒤 아파트명 추출
+        
+        패턴 우선순위: "동이름 지번" → 산지번 → 지구번호 → 일반 지번
+        
+        Returns:
+            {
+                'dong_name': 동 이름 (동이름+지번 패턴일 때만),
+                'main': 본번, 'sub': 부번,
+                'apt_name_in_jibun': 지번 뒤의 아파트명 (동이름+지번 패턴일 때만),
+                'compact': 공백/하이픈 제거 주소 (포함 관계 fallback 비교용)
+            }
+        """
+        info: Dict[str, Any] = {
+            'dong_name': None,
+            'main': None,
+            'sub': None,
+            'apt_name_in_jibun': None,
+            'compact': re.sub(r'[\s\-]+', '', jibun_address),
+        }
+        
+        # 패턴: "동이름 지번" 또는 "동이름 지번-부번" 또는 "동이름 지번-부번-부부번"
+        dong_jibun_pattern = r'([가-힣]+(?:동|가|리|읍|면))\s+(?:산)?(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)'
+        db_dong_jibun_match = re.search(dong_jibun_pattern, jibun_address)
+        
+        if db_dong_jibun_match:
+            info['dong_name'] = db_dong_jibun_match.group(1)
+            info['main'] = db_dong_jibun_match.group(2).lstrip('0')
+            # 부부번이 있으면 부번만 사용 (부부번은 무시)
+            info['sub'] = db_dong_jibun_match.group(3).lstrip('0') if db_dong_jibun_match.group(3) else None
+            # 지번 주소 형식: "시도 시군구 동 지번 아파트명" → 지번 뒤의 부분
+            info['apt_name_in_jibun'] = jibun_address[db_dong_jibun_match.end():].strip() or None
+            return info
+        
+        # 산지번 패턴: "산37-6"
+        san_match = re.search(r'산\s*(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_address)
+        if san_match:
+            info['main'] = san_match.group(1).lstrip('0')
+            info['sub'] = san_match.group(2).lstrip('0') if san_match.group(2) else None
+            return info
+        
+        # 지구 번호 패턴: "지구BL 34-7" 또는 "가정2지구34-7"
+        jigu_match = re.search(r'지구[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_address)
+        if not jigu_match:
+            jigu_match = re.search(r'BL[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_address, re.IGNORECASE)
+        if jigu_match:
+            info['main'] = jigu_match.group(1).lstrip('0')
+            info['sub'] = jigu_match.group(2).lstrip('0') if jigu_match.group(2) else None
+            return info
+        
+        # 일반 지번 패턴 (본번-부번-부부번 포함)
+        db_jibun_match = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)', jibun_address)
+        if db_jibun_match:
+            info['main'] = db_jibun_match.group(1).lstrip('0')
+            info['sub'] = db_jibun_match.group(2).lstrip('0') if db_jibun_match.group(2) else None
+        return info
+    
+    @staticmethod
+    def build_name_features(name: str) -> Dict[str, Any]:
+        """
+        아파트 이름 분석 결과 (정규화명, 브랜드, 단지/차수 등)
+        
+        match_apartment의 API/DB 양쪽 이름 분석에 공통으로 사용합니다.
+        """
+        cleaned = ApartmentMatcher.clean_apt_name(name)
+        return {
+            'cleaned': cleaned,
+            'normalized': ApartmentMatcher.normalize_apt_name(cleaned),
+            'strict': ApartmentMatcher.normalize_apt_name_strict(cleaned),
+            'brands': ApartmentMatcher.extract_all_brands(name),
+            'danji': ApartmentMatcher.extract_danji_number(name),
+            'cha': ApartmentMatcher.extract_cha_number(name),
+            'village': ApartmentMatcher.extract_village_name(name),
+            'core': ApartmentMatcher.extract_core_name(cleaned),
+            # 괄호 안의 브랜드명과 단지 번호 추출
+            'brand_in_parens': ApartmentMatcher.extract_brand_from_parentheses(name),
+            'danji_in_parens': ApartmentMatcher.extract_danji_from_parentheses(name),
+        }
+    
     @staticmethod
     def is_rental_apartment(name: str) -> bool:
         """
@@ -963,7 +1031,8 @@ class ApartmentMatcher:
         apt_details: Optional[Dict[int, ApartDetail]] = None,
         normalized_cache: Optional[Dict[str, Any]] = None,
         all_regions: Optional[Dict[int, Any]] = None,
-        require_dong_match: bool = True  #  기본값을 True로 변경 (동 검증 기본 활성화)
+        require_dong_match: bool = True,  #  기본값을 True로 변경 (동 검증 기본 활성화)
+        index: Optional[Any] = None
     ) -> Optional[Apartment]:
         """
         아파트 매칭 (한국 아파트 특성에 최적화된 강화 버전)
@@ -994,6 +1063,9 @@ class ApartmentMatcher:
             normalized_cache: 정규화 결과 캐시 (성능 최적화)
             all_regions: 지역 정보 딕셔너리 - 동 검증용 (선택)
             require_dong_match: True면 동 일치 검증 필수 (기본값: True, 동 검증 기본 활성화)
+            index: 지역별 사전 계산 인덱스 (RegionMatcherIndex, 선택)
+                   - 후보 이름 분석/지번 파싱 결과 재사용
+                   - 이름 유사도 상한이 최소 기준 미만인 후보는 점수 계산 생략 (결과 동일)
 
         Returns:
             매칭된 Apartment 객체 또는 None
@@ -1008,29 +1080,7 @@ class ApartmentMatcher:
         # API 이름 분석 (캐싱)
         cache_key_api = f"api:{apt_name_api}"
         if cache_key_api not in normalized_cache:
-            cleaned_api = ApartmentMatcher.clean_apt_name(apt_name_api)
-            normalized_api = ApartmentMatcher.normalize_apt_name(cleaned_api)
-            normalized_strict_api = ApartmentMatcher.normalize_apt_name_strict(cleaned_api)
-            brands_api = ApartmentMatcher.extract_all_brands(apt_name_api)
-            danji_api = ApartmentMatcher.extract_danji_number(apt_name_api)
-            cha_api = ApartmentMatcher.extract_cha_number(apt_name_api)
-            village_api = ApartmentMatcher.extract_village_name(apt_name_api)
-            core_api = ApartmentMatcher.extract_core_name(cleaned_api)
-            # 괄호 안의 브랜드명과 단지 번호 추출
-            brand_in_parens_api = ApartmentMatcher.extract_brand_from_parentheses(apt_name_api)
-            danji_in_parens_api = ApartmentMatcher.extract_danji_from_parentheses(apt_name_api)
-            normalized_cache[cache_key_api] = {
-                'cleaned': cleaned_api,
-                'normalized': normalized_api,
-                'strict': normalized_strict_api,
-                'brands': brands_api,
-                'danji': danji_api,
-                'cha': cha_api,
-                'village': village_api,
-                'core': core_api,
-                'brand_in_parens': brand_in_parens_api,
-                'danji_in_parens': danji_in_parens_api
-            }
+            normalized_cache[cache_key_api] = ApartmentMatcher.build_name_features(apt_name_api)
         api_cache = normalized_cache[cache_key_api]
         
         if not api_cache['cleaned'] or not api_cache['normalized']:
@@ -1040,37 +1090,34 @@ class ApartmentMatcher:
         # 한글 없이 숫자와 특수문자만 있으면 지번으로 간주
         api_is_jibun_only = not re.search(r'[가-힣a-zA-Z]', api_cache['cleaned'])
         
+        # 후보와 무관한 API 쪽 값은 루프 밖에서 한 번만 계산
+        api_is_rental = ApartmentMatcher.is_rental_apartment(apt_name_api)
+        normalized_umd = ApartmentMatcher.normalize_dong_name(umd_nm) if umd_nm else None
+        api_jibun_parts = ApartmentMatcher.parse_api_jibun(jibun) if jibun else (None, None)
+        norm_jibun_api = re.sub(r'[\s\-]+', '', jibun) if jibun else None
+        
+        # 인덱스가 있으면 이름 유사도 상한 기준으로 점수 계산 대상 후보 축소
+        viable_ids = None
+        if index is not None:
+            viable_ids = index.viable_candidate_ids(
+                api_cache,
+                api_jibun_parts if (jibun and apt_details) else None
+            )
+        
         # 후보 아파트 정규화 및 점수 계산
         best_match = None
         best_score = 0.0
         
         for apt in candidates:
+            db_cache = index.get_features(apt.apt_id) if index is not None else None
+            if db_cache is not None and apt.apt_id not in viable_ids:
+                continue  # 이름 유사도 상한 미달 + 지번 완전 일치 불가 → 최종 단계에서 제외될 후보
+            
             cache_key_db = f"db:{apt.apt_name}"
-            if cache_key_db not in normalized_cache:
-                cleaned_db = ApartmentMatcher.clean_apt_name(apt.apt_name)
-                normalized_db = ApartmentMatcher.normalize_apt_name(cleaned_db)
-                normalized_strict_db = ApartmentMatcher.normalize_apt_name_strict(cleaned_db)
-                brands_db = ApartmentMatcher.extract_all_brands(apt.apt_name)
-                danji_db = ApartmentMatcher.extract_danji_number(apt.apt_name)
-                cha_db = ApartmentMatcher.extract_cha_number(apt.apt_name)
-                village_db = ApartmentMatcher.extract_village_name(apt.apt_name)
-                core_db = ApartmentMatcher.extract_core_name(cleaned_db)
-                # 괄호 안의 브랜드명과 단지 번호 추출
-                brand_in_parens_db = ApartmentMatcher.extract_brand_from_parentheses(apt.apt_name)
-                danji_in_parens_db = ApartmentMatcher.extract_danji_from_parentheses(apt.apt_name)
-                normalized_cache[cache_key_db] = {
-                    'cleaned': cleaned_db,
-                    'normalized': normalized_db,
-                    'strict': normalized_strict_db,
-                    'brands': brands_db,
-                    'danji': danji_db,
-                    'cha': cha_db,
-                    'village': village_db,
-                    'core': core_db,
-                    'brand_in_parens': brand_in_parens_db,
-                    'danji_in_parens': danji_in_parens_db
-                }
-            db_cache = normalized_cache[cache_key_db]
+            if db_cache is None and cache_key_db not in normalized_cache:
+                normalized_cache[cache_key_db] = ApartmentMatcher.build_name_features(apt.apt_name)
+            if db_cache is None:
+                db_cache = normalized_cache[cache_key_db]
             
             score = 0.0
             
@@ -1123,8 +1170,10 @@ class ApartmentMatcher:
             #  임대 아파트 Veto 검사 (NEW!)
             # 대한민국 특수 상황: 같은 지번에 임대+분양 공존
             # 예: 에코시티자이2차(분양 5~6억) vs 산내들임대(4000만원) → 같은 지번이지만 다른 아파트!
-            api_is_rental = ApartmentMatcher.is_rental_apartment(apt_name_api)
-            db_is_rental = ApartmentMatcher.is_rental_apartment(apt.apt_name)
+            if index is not None and apt.apt_id in index.is_rental:
+                db_is_rental = index.is_rental[apt.apt_id]
+            else:
+                db_is_rental = ApartmentMatcher.is_rental_apartment(apt.apt_name)
             
             if api_is_rental != db_is_rental:
                 #  VETO: 임대 vs 분양 타입 불일치 → 즉시 제외
@@ -1413,94 +1462,42 @@ class ApartmentMatcher:
                 detail = apt_details[apt.apt_id]
                 if detail.jibun_address:
                     #  개선: API 지번에서 본번-부번 추출 (산지번, 지구번호, 본번-부번-부부번 처리)
-                    jibun_clean = jibun.strip()
+                    api_main, api_sub = api_jibun_parts
                     
-                    # 산지번 처리: "산37-6" → 본번="37", 부번="6"
-                    if jibun_clean.startswith('산'):
-                        jibun_clean = jibun_clean[1:]  # "산" 제거
+                    #  개선: DB 지번 주소에서 동 이름과 지번을 더 정확히 추출 (인덱스가 있으면 사전 계산 결과 사용)
+                    jibun_info = index.get_jibun_info(apt.apt_id) if index is not None else None
+                    if jibun_info is None:
+                        jibun_info = ApartmentMatcher.parse_db_jibun_address(detail.jibun_address)
+                    db_main = jibun_info['main']
+                    db_sub = jibun_info['sub']
                     
-                    # 지구 번호 처리: "지구BL 34-7" → 본번="34", 부번="7"
-                    if '지구' in jibun_clean or 'BL' in jibun_clean.upper() or '블록' in jibun_clean:
-                        jibun_parts = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
-                        if jibun_parts:
-                            api_main = jibun_parts.group(1).lstrip('0')
-                            api_sub = jibun_parts.group(2).lstrip('0') if jibun_parts.group(2) else None
-                        else:
-                            api_main = None
-                            api_sub = None
-                    else:
-                        # 일반 지번 처리 (본번-부번-부부번 포함)
-                        jibun_parts = re.match(r'(\d+)(?:-(\d+))?(?:-(\d+))?', jibun_clean)
-                        if jibun_parts:
-                            api_main = jibun_parts.group(1).lstrip('0')
-                            # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                            api_sub = jibun_parts.group(2).lstrip('0') if jibun_parts.group(2) else None
-                        else:
-                            api_main = None
-                            api_sub = None
-                    
-                    #  개선: DB 지번 주소에서 동 이름과 지번을 더 정확히 추출
-                    # 패턴: "동이름 지번" 또는 "동이름 지번-부번" 또는 "동이름 지번-부번-부부번"
-                    # 산지번, 지구번호도 처리
-                    dong_jibun_pattern = r'([가-힣]+(?:동|가|리|읍|면))\s+(?:산)?(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)'
-                    db_dong_jibun_match = re.search(dong_jibun_pattern, detail.jibun_address)
-                    
-                    if db_dong_jibun_match:
-                        db_dong_name = db_dong_jibun_match.group(1)  # 동 이름
-                        db_main = db_dong_jibun_match.group(2).lstrip('0')  # 본번
-                        # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                        db_sub = db_dong_jibun_match.group(3).lstrip('0') if db_dong_jibun_match.group(3) else None  # 부번
-                        
-                        #  동 이름 검증 강화
-                        if umd_nm:
-                            # API 동 이름과 DB 지번 주소의 동 이름 비교
-                            normalized_umd = ApartmentMatcher.normalize_dong_name(umd_nm)
-                            normalized_db_dong = ApartmentMatcher.normalize_dong_name(db_dong_name)
-                            if normalized_umd == normalized_db_dong or normalized_umd in normalized_db_dong or normalized_db_dong in normalized_umd:
-                                jibun_dong_match = True
-                    else:
-                        #  개선: 산지번, 지구번호, 본번-부번-부부번 처리
-                        # 산지번 패턴: "산37-6"
-                        san_match = re.search(r'산\s*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address)
-                        if san_match:
-                            db_dong_name = None
-                            db_main = san_match.group(1).lstrip('0')
-                            db_sub = san_match.group(2).lstrip('0') if san_match.group(2) else None
-                        else:
-                            # 지구 번호 패턴: "지구BL 34-7" 또는 "가정2지구34-7"
-                            jigu_match = re.search(r'지구[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address)
-                            if not jigu_match:
-                                jigu_match = re.search(r'BL[^\d]*(\d+)(?:-(\d+))?(?:-(\d+))?', detail.jibun_address, re.IGNORECASE)
-                            if jigu_match:
-                                db_dong_name = None
-                                db_main = jigu_match.group(1).lstrip('0')
-                                db_sub = jigu_match.group(2).lstrip('0') if jigu_match.group(2) else None
-                            else:
-                                # 일반 지번 패턴 (본번-부번-부부번 포함)
-                                db_jibun_match = re.search(r'(\d+)(?:-(\d+))?(?:-(\d+))?(?:\s|$)', detail.jibun_address)
-                                db_dong_name = None
-                                db_main = db_jibun_match.group(1).lstrip('0') if db_jibun_match else None
-                                # 부부번이 있으면 부번만 사용 (부부번은 무시)
-                                db_sub = db_jibun_match.group(2).lstrip('0') if db_jibun_match and db_jibun_match.group(2) else None
+                    #  동 이름 검증 강화 ("동이름 지번" 패턴으로 동 이름이 추출된 경우)
+                    if jibun_info['dong_name'] and normalized_umd is not None:
+                        # API 동 이름과 DB 지번 주소의 동 이름 비교
+                        normalized_db_dong = jibun_info.get('normalized_dong')
+                        if normalized_db_dong is None:
+                            normalized_db_dong = ApartmentMatcher.normalize_dong_name(jibun_info['dong_name'])
+                        if normalized_umd == normalized_db_dong or normalized_umd in normalized_db_dong or normalized_db_dong in normalized_umd:
+                            jibun_dong_match = True
                     
                     #  지번 주소에 포함된 아파트명 추출 및 활용
                     # 지번 주소 형식: "시도 시군구 동 지번 아파트명"
                     # 아파트명 부분 추출 (지번 뒤의 부분)
-                    if db_dong_jibun_match:
-                        jibun_end_pos = db_dong_jibun_match.end()
-                        apt_name_in_jibun = detail.jibun_address[jibun_end_pos:].strip()
-                        if apt_name_in_jibun:
-                            # 지번 주소의 아파트명 정규화
+                    apt_name_in_jibun = jibun_info['apt_name_in_jibun']
+                    if apt_name_in_jibun:
+                        # 지번 주소의 아파트명 정규화
+                        normalized_apt_in_jibun = jibun_info.get('normalized_apt_name_in_jibun')
+                        if normalized_apt_in_jibun is None:
                             normalized_apt_in_jibun = ApartmentMatcher.normalize_apt_name(
                                 ApartmentMatcher.clean_apt_name(apt_name_in_jibun)
                             )
-                            # API 아파트명과 비교
-                            if normalized_apt_in_jibun and api_cache['normalized']:
-                                apt_name_similarity = SequenceMatcher(
-                                    None, normalized_apt_in_jibun, api_cache['normalized']
-                                ).ratio()
-                                if apt_name_similarity >= 0.70:
-                                    jibun_apt_name_match = True
+                        # API 아파트명과 비교
+                        if normalized_apt_in_jibun and api_cache['normalized']:
+                            apt_name_similarity = SequenceMatcher(
+                                None, normalized_apt_in_jibun, api_cache['normalized']
+                            ).ratio()
+                            if apt_name_similarity >= 0.70:
+                                jibun_apt_name_match = True
                     
                     # 본번-부번 비교
                     if api_main and db_main:
@@ -1515,8 +1512,7 @@ class ApartmentMatcher:
                     
                     # 기존 포함 확인도 유지 (fallback)
                     if not jibun_match:
-                        norm_jibun_api = re.sub(r'[\s\-]+', '', jibun)
-                        norm_jibun_db = re.sub(r'[\s\-]+', '', detail.jibun_address)
+                        norm_jibun_db = jibun_info['compact']
                         if norm_jibun_api in norm_jibun_db or jibun in detail.jibun_address:
                             jibun_match = True
                     
@@ -0,0 +1,153 @@
+"""
+한국부동산원 지역 코드(area_code, CLS_ID) 레지스트리
+
+legion_code.csv / legion_code2.csv (분류명, area_code, region_code)를 프로세스당 한 번만 읽어
+시군구 5자리/시도 2자리 접두사 → area_code 사전으로 만들어 둡니다.
+부동산 지수/거래량 수집이 지역×연월마다 CSV를 다시 읽고 전체 행을 훑던 부분을 dict 조회로 대체합니다.
+
+- 지연 로드: 처음 조회할 때 읽음
+- 파일 수정 시각(mtime)이 바뀌면 다음 조회 때 다시 읽음
+- 같은 접두사에 여러 행이 있으면 파일 순서상 첫 행 기준 (기존 선형 검색과 동일한 결과)
+"""
+import csv
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 부동산 지수 수집용 / 부동산 거래량 수집용 CSV
+LEGION_CODE_CSV = "legion_code.csv"
+LEGION_CODE2_CSV = "legion_code2.csv"
+
+
+def resolve_csv_path(filename: str) -> Path:
+    """
+    CSV 파일 경로 결정
+
+    Docker 컨테이너에서는 /app 에 마운트되고 (docker-compose.yml),
+    로컬 실행 시에는 프로젝트 루트에 있습니다.
+    """
+    current_file = Path(__file__).resolve()
+    if str(current_file).startswith('/app'):
+        return Path('/app') / filename
+    # backend/app/services/data_collection/utils/region_code_registry.py -> 프로젝트 루트
+    return current_file.parents[5] / filename
+
+
+class RegionCodeRegistry:
+    """
+    지역 코드 CSV 인덱스
+
+    Args:
+        csv_path: CSV 파일 경로
+    """
+
+    def __init__(self, csv_path: Path):
+        self.csv_path = csv_path
+        self._mtime: Optional[float] = None
+        self._missing_logged = False
+        self._lock = threading.Lock()
+        # 접두사 → 파일 순서상 첫 area_code (0 포함)
+        self._sgg_first: Dict[str, int] = {}
+        self._sido_first: Dict[str, int] = {}
+        # 접두사 → 파일 순서상 첫 양수 area_code
+        self._sgg_first_positive: Dict[str, int] = {}
+        # 시도 접두사 → 가장 짧은 region_code(시도 레벨 행)의 양수 area_code
+        self._sido_shortest_positive: Dict[str, int] = {}
+
+    def _load(self, mtime: float) -> None:
+        rows: List[Tuple[str, int]] = []
+        with open(self.csv_path, 'r', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                region_code = str(row.get('region_code', '')).strip()
+                try:
+                    area_code = int(row.get('area_code', 0))
+                except (TypeError, ValueError):
+                    continue
+                if region_code:
+                    rows.append((region_code, area_code))
+
+        sgg_first: Dict[str, int] = {}
+        sido_first: Dict[str, int] = {}
+        sgg_first_positive: Dict[str, int] = {}
+        sido_shortest: Dict[str, Tuple[int, str, int]] = {}
+        for region_code, area_code in rows:
+            sgg = region_code[:5]
+            sido = region_code[:2]
+            if len(sgg) == 5:
+                sgg_first.setdefault(sgg, area_code)
+                if area_code > 0:
+                    sgg_first_positive.setdefault(sgg, area_code)
+            if len(sido) == 2:
+                sido_first.setdefault(sido, area_code)
+                if area_code > 0:
+                    candidate = (len(region_code), region_code, area_code)
+                    if sido not in sido_shortest or candidate[:2] < sido_shortest[sido][:2]:
+                        sido_shortest[sido] = candidate
+
+        self._sgg_first = sgg_first
+        self._sido_first = sido_first
+        self._sgg_first_positive = sgg_first_positive
+        self._sido_shortest_positive = {sido: value[2] for sido, value in sido_shortest.items()}
+        self._mtime = mtime
+        logger.info(f" 지역 코드 CSV 로드: {self.csv_path.name}, {len(rows)}행")
+
+    def _ensure_loaded(self) -> bool:
+        """필요 시 (최초/파일 변경) CSV 로드, 파일이 없으면 False"""
+        try:
+            mtime = os.stat(self.csv_path).st_mtime
+        except OSError:
+            if not self._missing_logged:
+                logger.error(f" CSV 파일을 찾을 수 없습니다: {self.csv_path}")
+                self._missing_logged = True
+            return self._mtime is not None
+
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    self._load(mtime)
+                    self._missing_logged = False
+        return True
+
+    def sgg_area_code(self, sgg_cd: str, positive_only: bool = False) -> Optional[int]:
+        """
+        시군구 5자리 접두사로 area_code 조회
+
+        Args:
+            sgg_cd: region_code 앞 5자리
+            positive_only: True면 area_code가 0 이하인 행은 건너뜀
+        """
+        if not self._ensure_loaded():
+            return None
+        index = self._sgg_first_positive if positive_only else self._sgg_first
+        return index.get(sgg_cd)
+
+    def sido_area_code(self, sido_cd: str, prefer_shortest: bool = False) -> Optional[int]:
+        """
+        시도 2자리 접두사로 area_code 조회
+
+        Args:
+            sido_cd: region_code 앞 2자리
+            prefer_shortest: True면 파일 순서 대신 area_code가 양수인 행 중
+                             가장 짧은 region_code(시도 레벨 행) 기준
+        """
+        if not self._ensure_loaded():
+            return None
+        index = self._sido_shortest_positive if prefer_shortest else self._sido_first
+        return index.get(sido_cd)
+
+
+_registries: Dict[Path, RegionCodeRegistry] = {}
+
+
+def get_region_code_registry(filename: str = LEGION_CODE_CSV) -> RegionCodeRegistry:
+    """CSV 파일별 레지스트리 (프로세스당 하나)"""
+    csv_path = resolve_csv_path(filename)
+    registry = _registries.get(csv_path)
+    if registry is None:
+        registry = RegionCodeRegistry(csv_path)
+        _registries[csv_path] = registry
+    return registry
@@ -0,0 +1,747 @@
+"""
+실거래가 파싱/매칭 공용 로직
+
+매매/전월세 수집기가 공유하는 "XML 거래 레코드 → 아파트 매칭 → 저장용 행" 변환 로직입니다.
+DB 세션이나 서비스 인스턴스 상태에 의존하지 않는 순수 함수로 구성되어
+같은 코드를 이벤트 루프 안에서 직접 호출하거나 ProcessPoolExecutor 워커 프로세스에서 실행할 수 있습니다.
+
+- 매칭/실패/성공 로그는 바로 기록하지 않고 TradeMatchResult.events 로 돌려주며,
+  부모 프로세스가 DataCollectionServiceBase._replay_match_events 로 반영합니다.
+- 프로세스 모드에서는 ORM 객체 대신 RegionSnapshot(가벼운 레코드)을 워커로 보냅니다.
+"""
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.schemas.rent import RentCreate
+from app.schemas.sale import SaleCreate
+from app.services.data_collection.base import DataCollectionServiceBase, MolitTradeRecord
+from app.services.data_collection.utils.cache import normalization_cache
+from app.services.data_collection.utils.match_decision_store import DecisionKey, MatchDecisionStore
+from app.services.data_collection.utils.matcher_index import RegionMatcherIndex, get_region_matcher_index
+from app.services.data_collection.utils.matching import ApartmentMatcher
+
+logger = logging.getLogger(__name__)
+
+TRANS_TYPE_SALE = "매매"
+TRANS_TYPE_RENT = "전월세"
+
+
+# ============================================================
+# 지역 스냅샷 (프로세스 간 전달용 경량 레코드)
+# ============================================================
+
+@dataclass(slots=True, frozen=True)
+class AptRecord:
+    """매칭에 필요한 Apartment 필드"""
+    apt_id: int
+    apt_name: str
+    region_id: Optional[int]
+    apt_seq: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AptDetailRecord:
+    """매칭에 필요한 ApartDetail 필드"""
+    apt_id: int
+    jibun_address: Optional[str]
+    jibun_bonbun: Optional[str] = None
+    jibun_bubun: Optional[str] = None
+    use_approval_date: Optional[date] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StateRecord:
+    """매칭에 필요한 State 필드"""
+    region_id: int
+    region_code: str
+    region_name: str
+
+
+@dataclass
+class RegionSnapshot:
+    """
+    시군구 매칭 입력 스냅샷 (pickle 가능)
+
+    Attributes:
+        sgg_cd: 시군구 코드
+        apartments: 시군구 내 아파트
+        apt_details: apt_id → 상세 정보
+        regions: region_id → 지역 정보
+        decisions: 저장된 매칭 결정 {(동, 지번, 아파트명): (apt_id, 매칭 단계)}
+    """
+    sgg_cd: str
+    apartments: List[AptRecord]
+    apt_details: Dict[int, AptDetailRecord]
+    regions: Dict[int, StateRecord]
+    decisions: Dict[DecisionKey, Tuple[int, str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_orm(
+        cls,
+        sgg_cd: str,
+        apartments: Iterable[Any],
+        regions: Dict[int, Any],
+        apt_details: Dict[int, Any],
+        decisions: Optional[Dict[DecisionKey, Tuple[int, str]]] = None,
+    ) -> "RegionSnapshot":
+        """ORM 객체(Apartment, State, ApartDetail)에서 스냅샷 생성"""
+        return cls(
+            sgg_cd=sgg_cd,
+            apartments=[
+                AptRecord(apt.apt_id, apt.apt_name, apt.region_id, getattr(apt, "apt_seq", None))
+                for apt in apartments
+            ],
+            apt_details={
+                apt_id: AptDetailRecord(
+                    apt_id,
+                    detail.jibun_address,
+                    getattr(detail, "jibun_bonbun", None),
+                    getattr(detail, "jibun_bubun", None),
+                    getattr(detail, "use_approval_date", None),
+                )
+                for apt_id, detail in apt_details.items()
+            },
+            regions={
+                region_id: StateRecord(region_id, region.region_code, region.region_name)
+                for region_id, region in regions.items()
+            },
+            decisions=dict(decisions or {}),
+        )
+
+
+# ============================================================
+# 저장용 행 생성
+# ============================================================
+
+def build_sale_row(
+    item: MolitTradeRecord, matched_apt: Any, apt_nm: str, api_response_data: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    """매매 거래 → sales 저장용 행 (스트리밍 파서에서 타입 변환된 값 사용)"""
+    sale_create = SaleCreate(
+        apt_id=matched_apt.apt_id,
+        build_year=item.get("buildYear", None),
+        trans_type="매매",
+        trans_price=item.deal_amount or 0,
+        exclusive_area=item.exclusive_area or 0.0,
+        floor=item.floor or 0,
+        contract_date=item.deal_date,
+        is_canceled=False,
+        remarks=matched_apt.apt_name
+    )
+    return sale_create.model_dump()
+
+
+def build_rent_row(
+    item: MolitTradeRecord, matched_apt: Any, apt_nm: str, api_response_data: Dict[str, str]
+) -> Optional[Dict[str, Any]]:
+    """전월세 거래 → rents 저장용 행 (거래일/전용면적/층 누락 시 None)"""
+    # 거래일/전용면적/층은 필수 (누락 또는 변환 실패 시 오류 처리)
+    deal_date_obj = item.deal_date
+    exclusive_area = item.exclusive_area
+    floor = item.floor
+    if deal_date_obj is None or exclusive_area is None or floor is None:
+        return None
+    
+    # 보증금/월세 (월세 0은 전세)
+    deposit_price = item.deposit
+    monthly_rent = item.monthly_rent or None
+    
+    # 전세/월세 구분
+    rent_type = "JEONSE" if monthly_rent is None else "MONTHLY_RENT"
+    
+    # apt_seq(아파트 일련번호) - 자연키에 포함 (같은 날 같은 아파트의 여러 거래 구분)
+    apt_seq = api_response_data.get("aptSeq") or None
+    if apt_seq and len(apt_seq) > 10:
+        apt_seq = apt_seq[:10]
+    
+    build_year = api_response_data.get("buildYear") or None
+    contract_type_str = api_response_data.get("contractType")
+    contract_type = contract_type_str == "갱신" if contract_type_str else None
+    
+    rent_create = RentCreate(
+        apt_id=matched_apt.apt_id,
+        build_year=build_year,
+        contract_type=contract_type,
+        deposit_price=deposit_price,
+        monthly_rent=monthly_rent,
+        rent_type=rent_type,
+        exclusive_area=exclusive_area,
+        floor=floor,
+        apt_seq=apt_seq,
+        deal_date=deal_date_obj,
+        contract_date=None,
+        remarks=apt_nm
+    )
+    return rent_create.model_dump()
+
+
+_ROW_BUILDERS: Dict[str, Callable[..., Optional[Dict[str, Any]]]] = {
+    TRANS_TYPE_SALE: build_sale_row,
+    TRANS_TYPE_RENT: build_rent_row,
+}
+
+
+# ============================================================
+# 파싱 + 매칭
+# ============================================================
+
+@dataclass
+class TradeMatchResult:
+    """
+    (연월, 시군구) 단위 매칭 결과
+
+    Attributes:
+        rows: 저장용 행 (거래 순서 유지)
+        new_decisions: 새로 매칭된 결정 (match_decision_store.save 입력)
+        events: 로그 기록 이벤트 [(DataCollectionServiceBase 메서드명, kwargs)]
+        error_count: 매칭/변환 실패 건수
+        apt_name_log: 로그 표시용 첫 아파트명
+        decision_hits / decision_misses: 저장된 매칭 결정 조회 결과
+        result_code / result_msg / fetched: API 응답 헤더와 거래 수 (parse_and_match_trades에서만 채움)
+    """
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    new_decisions: List[Dict[str, Any]] = field(default_factory=list)
+    events: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    error_count: int = 0
+    apt_name_log: str = ""
+    decision_hits: int = 0
+    decision_misses: int = 0
+    result_code: str = "000"
+    result_msg: str = ""
+    fetched: int = 0
+
+
+def match_trade_items(
+    items: Iterable[MolitTradeRecord],
+    *,
+    trans_type: str,
+    sgg_cd: str,
+    ym: str,
+    local_apts: List[Any],
+    apt_details: Dict[int, Any],
+    all_regions: Dict[int, Any],
+    decisions: Dict[DecisionKey, Tuple[int, str]],
+    matcher_index: RegionMatcherIndex,
+    apt_id_filter: Optional[int] = None,
+    max_rows: Optional[int] = None,
+) -> TradeMatchResult:
+    """
+    거래 레코드를 아파트와 매칭하여 저장용 행 생성
+
+    매칭 순서: 저장된 결정 → 법정동코드+지번 → 법정동코드 후보 제한 → 시군구/동 이름 후보 제한
+    → 이름 매칭 → (동 검증 포함) 전체 후보 이름 매칭
+
+    Args:
+        items: 거래 레코드 (parse_molit_xml 결과)
+        trans_type: 거래 종류 ('매매' 또는 '전월세')
+        sgg_cd: 시군구 코드
+        ym: 계약 연월 (YYYYMM)
+        local_apts: 시군구 내 아파트 (ORM 객체 또는 AptRecord)
+        apt_details: apt_id → 상세 정보
+        all_regions: region_id → 지역 정보
+        decisions: 저장된 매칭 결정 (시군구 단위)
+        matcher_index: 시군구 매칭 인덱스
+        apt_id_filter: 지정 시 해당 아파트 거래만 행으로 생성 (Fix 모드)
+        max_rows: 생성할 최대 행 수 (None이면 제한 없음)
+
+    Returns:
+        TradeMatchResult
+    """
+    build_row = _ROW_BUILDERS[trans_type]
+    result = TradeMatchResult()
+    normalized_cache = normalization_cache  # 정규화 결과 캐싱 (프로세스 공용, LRU + 메모리 상한)
+    
+    for item in items:
+        # 저장 한도 확인 (스테이징 중인 건 포함)
+        if max_rows is not None and len(result.rows) >= max_rows:
+            break
+        
+        try:
+            #  API 응답 원본 데이터 (실패 로그용)
+            api_response_data = item.fields
+            
+            # XML Element에서 필드 추출 (Dev API: camelCase 필드명)
+            apt_nm = item.get("aptNm")
+            
+            umd_nm = item.get("umdNm")
+            
+            #  새 API 추가 필드: umdCd (읍면동코드) - 더 정확한 동 매칭에 활용
+            umd_cd = item.get("umdCd")
+            
+            sgg_cd_item = item.get("sggCd", sgg_cd)
+            
+            # 지번 추출 (기존 필드 유지)
+            jibun = item.get("jibun")
+            
+            #  새 API 추가 필드: bonbun/bubun (본번/부번) - 더 정확한 지번 매칭
+            bonbun = item.get("bonbun").lstrip('0')
+            bubun = item.get("bubun").lstrip('0')
+            
+            # 본번/부번으로 정확한 지번 생성 (bonbun이 있으면 우선 사용)
+            if bonbun:
+                jibun_precise = bonbun
+                if bubun and bubun != "0" and bubun != "":
+                    jibun_precise += f"-{bubun}"
+                # 기존 jibun과 비교하여 더 정확한 것 사용
+                if not jibun or len(jibun_precise) >= len(jibun):
+                    jibun = jibun_precise
+            
+            # 건축년도 추출 (매칭에 활용)
+            build_year_for_match = item.get("buildYear")
+            
+            if not apt_nm:
+                continue
+            
+            if not result.apt_name_log:
+                result.apt_name_log = apt_nm
+            
+            #  최우선 매칭: 법정동 코드 10자리 + 지번(부번까지) 정확 매칭
+            # 이름과 관계없이 법정동 코드와 지번이 모두 일치하면 같은 아파트로 인식
+            # (95% 신뢰구간에서 같은 부동산을 가리키는 것으로 간주)
+            matched_apt = None
+            candidates = local_apts
+            sgg_code_matched = True
+            dong_matched = False
+            
+            # 매칭 단계 추적용 리스트
+            matching_steps = []
+            
+            # 저장된 매칭 결정 조회 (같은 시군구/동/지번/아파트명 조합은 매칭 로직 생략)
+            decision = decisions.get(MatchDecisionStore.make_key(umd_nm, jibun, apt_nm))
+            if decision is None:
+                result.decision_misses += 1
+            else:
+                result.decision_hits += 1
+                matched_apt = matcher_index.get_apartment(decision[0])
+                if matched_apt:
+                    candidates = [matched_apt]
+                    dong_matched = True
+                    matching_steps.append({
+                        'step': decision[1],
+                        'attempted': True,
+                        'success': True,
+                        'cached': True
+                    })
+                else:
+                    # 결정된 아파트가 더 이상 후보에 없음 → 재매칭 (새 결정이 기존 결정을 덮어씀)
+                    decision = None
+            
+            # 0단계: 법정동 코드 10자리 + 지번(부번까지) 정확 매칭 (최우선, 이름 무관)
+            if not matched_apt and sgg_cd_item and umd_cd and jibun:
+                full_region_code = f"{sgg_cd_item}{umd_cd}"
+                
+                #  새로운 매칭 함수 사용: 법정동 코드 + 지번(부번까지) 정확 매칭
+                matched_apt = ApartmentMatcher.match_by_address_and_jibun(
+                    full_region_code=full_region_code,
+                    jibun=jibun,
+                    bonbun=bonbun if bonbun else None,
+                    bubun=bubun if bubun else None,
+                    candidates=local_apts,
+                    apt_details=apt_details,
+                    all_regions=all_regions,
+                    index=matcher_index
+                )
+                
+                if matched_apt:
+                    candidates = [matched_apt]
+                    sgg_code_matched = True
+                    dong_matched = True
+                    matching_steps.append({
+                        'step': 'address_jibun',
+                        'attempted': True,
+                        'success': True,
+                        'full_region_code': full_region_code,
+                        'jibun': jibun
+                    })
+                    #  매칭 성공 로그를 파일로 저장 (docker log에는 출력 안 함)
+                    result.events.append(("_record_apt_success", {
+                        'trans_type': trans_type,
+                        'full_region_code': full_region_code,
+                        'jibun': jibun,
+                        'apt_name': matched_apt.apt_name,
+                        'ym': ym  # 거래 발생 월
+                    }))
+                    # 성공 로그 기록
+                    result.events.append(("_record_apt_matching", {
+                        'apt_id': matched_apt.apt_id,
+                        'apt_name_db': matched_apt.apt_name,
+                        'apt_name_api': apt_nm,
+                        'ym': ym,
+                        'matching_method': 'address_jibun'
+                    }))
+                else:
+                    matching_steps.append({
+                        'step': 'address_jibun',
+                        'attempted': True,
+                        'success': False,
+                        'full_region_code': full_region_code,
+                        'jibun': jibun,
+                        'reason': '법정동코드+지번 매칭 실패'
+                    })
+            
+            #  개선: 법정동 코드 10자리로 후보 강제 필터링 (미스매칭 방지)
+            # 지번 매칭 실패 시, 법정동 코드만으로라도 후보를 제한
+            if not matched_apt and sgg_cd_item and umd_cd:
+                full_region_code = f"{sgg_cd_item}{umd_cd}"
+                filtered = [
+                    apt for apt in local_apts
+                    if apt.region_id in all_regions
+                    and all_regions[apt.region_id].region_code == full_region_code
+                ]
+                if filtered:
+                    # 동 단위로 후보 제한 성공
+                    candidates = filtered
+                    sgg_code_matched = True
+                    dong_matched = True
+                    matching_steps.append({
+                        'step': 'full_region_code',
+                        'attempted': True,
+                        'success': True,
+                        'full_region_code': full_region_code,
+                        'candidates': len(filtered)
+                    })
+                else:
+                    #  개선: 법정동 코드로 후보가 없으면 매칭 실패로 간주 (미스매칭 방지)
+                    matching_steps.append({
+                        'step': 'full_region_code',
+                        'attempted': True,
+                        'success': False,
+                        'full_region_code': full_region_code,
+                        'reason': '법정동 코드로 후보 없음 (DB에 해당 동 아파트 없음)'
+                    })
+                    # 매칭 실패로 처리
+                    candidates = []
+            
+            # 3단계: 시군구 코드만 매칭 (fallback)
+            if not matched_apt and not dong_matched and sgg_cd_item and str(sgg_cd_item).strip():
+                sgg_cd_item_str = str(sgg_cd_item).strip()
+                sgg_cd_db = ApartmentMatcher.convert_sgg_code_to_db_format(sgg_cd_item_str)
+                
+                if sgg_cd_db:
+                    filtered = [
+                        apt for apt in local_apts
+                        if apt.region_id in all_regions
+                        and all_regions[apt.region_id].region_code == sgg_cd_db
+                    ]
+                    if not filtered:
+                        filtered = [
+                            apt for apt in local_apts
+                            if apt.region_id in all_regions
+                            and all_regions[apt.region_id].region_code.startswith(sgg_cd_item_str)
+                        ]
+                    if filtered:
+                        candidates = filtered
+                        sgg_code_matched = True
+                        matching_steps.append({
+                            'step': 'sgg_code_only',
+                            'attempted': True,
+                            'success': True,
+                            'candidates': len(filtered)
+                        })
+            
+            # 4단계: 동 이름 매칭 (fallback)
+            if not matched_apt and not dong_matched and umd_nm and candidates:
+                matching_region_ids = ApartmentMatcher.find_matching_regions(umd_nm, all_regions)
+                
+                if matching_region_ids:
+                    filtered = [
+                        apt for apt in candidates
+                        if apt.region_id in matching_region_ids
+                    ]
+                    if filtered:
+                        candidates = filtered
+                        dong_matched = True
+                        matching_steps.append({
+                            'step': 'dong_name',
+                            'attempted': True,
+                            'success': True,
+                            'candidates': len(filtered)
+                        })
+            
+            #  개선: 법정동 코드로 필터링한 경우, 후보가 없으면 매칭 불가 (미스매칭 방지)
+            # 동 검증 실패 시 전체 후보로 복원하지 않음
+            if not candidates and sgg_cd_item and umd_cd:
+                # 법정동 코드로 필터링했는데 후보가 없음 → 매칭 불가
+                result.error_count += 1
+                matching_steps.append({
+                    'step': 'final_check',
+                    'attempted': True,
+                    'success': False,
+                    'reason': '동 검증 실패 (법정동 코드로 후보 없음)'
+                })
+                # 로깅 (파일로만 저장, docker log 출력 안 함)
+                result.events.append(("_append_apt_fail_entry", {
+                    'ym': ym,
+                    'entry': DataCollectionServiceBase._build_apt_fail_entry(
+                        trans_type=trans_type,
+                        apt_name=apt_nm,
+                        jibun=jibun,
+                        build_year=build_year_for_match,
+                        umd_nm=umd_nm,
+                        sgg_cd=sgg_cd,
+                        ym=ym,
+                        reason='dong_no_candidates',
+                        full_region_code=f"{sgg_cd_item}{umd_cd}",
+                        matching_steps=matching_steps,
+                        api_response_data=api_response_data
+                    )
+                }))
+                continue  # 다음 거래로 넘어감
+            elif not candidates:
+                # 읍면동 코드가 없는 경우만 전체 후보로 복원 (하위 호환성)
+                candidates = local_apts
+                sgg_code_matched = True
+                dong_matched = False
+            
+            # 5단계: 이름 매칭 (시군구+동코드+지번 매칭 실패 시에만 사용)
+            #  동 검증 기본 활성화 (require_dong_match 기본값 True)
+            if not matched_apt:
+                matched_apt = ApartmentMatcher.match_apartment(
+                    apt_nm, candidates, sgg_cd, umd_nm, 
+                    jibun, build_year_for_match, apt_details, normalized_cache,
+                    all_regions=all_regions, index=matcher_index  # require_dong_match 기본값 True 사용
+                )
+                
+                if matched_apt:
+                    matching_steps.append({
+                        'step': 'name_matching',
+                        'attempted': True,
+                        'success': True,
+                        'candidates': len(candidates)
+                    })
+                else:
+                    matching_steps.append({
+                        'step': 'name_matching',
+                        'attempted': True,
+                        'success': False,
+                        'candidates': len(candidates),
+                        'reason': '유사도 부족 또는 Veto 조건'
+                    })
+            
+            # 필터링된 후보에서 실패 시 전체 후보로 재시도 (단, 동 검증 필수!)
+            if not matched_apt and len(candidates) < len(local_apts) and dong_matched:
+                matched_apt = ApartmentMatcher.match_apartment(
+                    apt_nm, local_apts, sgg_cd, umd_nm, 
+                    jibun, build_year_for_match, apt_details, normalized_cache,
+                    all_regions=all_regions, require_dong_match=True,
+                    index=matcher_index
+                )
+                
+                if matched_apt:
+                    matching_steps.append({
+                        'step': 'name_matching_full',
+                        'attempted': True,
+                        'success': True,
+                        'candidates': len(local_apts)
+                    })
+                else:
+                    matching_steps.append({
+                        'step': 'name_matching_full',
+                        'attempted': True,
+                        'success': False,
+                        'candidates': len(local_apts),
+                        'reason': '전체 후보에서도 매칭 실패'
+                    })
+            
+            if not matched_apt:
+                result.error_count += 1
+                # 정규화된 이름 가져오기
+                normalized_name = normalized_cache.get(f"norm:{apt_nm}")
+                if not normalized_name:
+                    normalized_name = ApartmentMatcher.normalize_apt_name(apt_nm)
+                    normalized_cache[f"norm:{apt_nm}"] = normalized_name
+                
+                # 지역 이름 가져오기 (시군구/동)
+                region_name = None
+                if umd_nm:
+                    # 동 이름으로 지역 찾기
+                    matching_region_ids = ApartmentMatcher.find_matching_regions(umd_nm, all_regions)
+                    if matching_region_ids:
+                        first_region_id = list(matching_region_ids)[0]
+                        if first_region_id in all_regions:
+                            region_name = all_regions[first_region_id].region_name
+                elif sgg_cd_item:
+                    # 시군구 코드로 지역 찾기
+                    sgg_cd_db = ApartmentMatcher.convert_sgg_code_to_db_format(str(sgg_cd_item).strip())
+                    if sgg_cd_db:
+                        for region in all_regions.values():
+                            if region.region_code == sgg_cd_db:
+                                region_name = region.region_name
+                                break
+                
+                # 실패 케이스 로깅 (apartfail_YYYYMM.log 파일로 저장)
+                # (후보 목록 대신 로그 항목만 부모 프로세스로 전달하도록 여기서 구성)
+                result.events.append(("_append_apt_fail_entry", {
+                    'ym': ym,
+                    'entry': DataCollectionServiceBase._build_apt_fail_entry(
+                        trans_type=trans_type,
+                        apt_name=apt_nm,
+                        jibun=jibun,
+                        build_year=build_year_for_match,
+                        umd_nm=umd_nm,
+                        sgg_cd=sgg_cd,
+                        ym=ym,  # 거래 발생 월
+                        reason='이름매칭 실패',
+                        normalized_name=normalized_name,
+                        candidates=candidates,
+                        local_apts=local_apts,
+                        sgg_code_matched=sgg_code_matched,
+                        dong_matched=dong_matched,
+                        region_name=region_name,
+                        full_region_code=f"{sgg_cd_item}{umd_cd}" if sgg_cd_item and umd_cd else None,
+                        matching_steps=matching_steps,
+                        api_response_data=api_response_data
+                    )
+                }))
+                continue
+            
+            # 매칭 로그 기록 (apart_YYYYMM.log용) - 거래 발생 월(ym) 사용
+            matching_method = 'name_matching'
+            if matching_steps:
+                # 가장 먼저 성공한 단계 찾기
+                for step in matching_steps:
+                    if step.get('success'):
+                        matching_method = step.get('step', 'name_matching')
+                        break
+            
+            # 새로 매칭된 결정은 페이지 처리 후 일괄 저장
+            if decision is None:
+                result.new_decisions.append({
+                    'umd_nm': umd_nm,
+                    'jibun': jibun,
+                    'api_apt_name': apt_nm,
+                    'apt_id': matched_apt.apt_id,
+                    'method': matching_method
+                })
+            
+            result.events.append(("_record_apt_matching", {
+                'apt_id': matched_apt.apt_id,
+                'apt_name_db': matched_apt.apt_name,
+                'apt_name_api': apt_nm,
+                'ym': ym,  # 거래 발생 월
+                'matching_method': matching_method
+            }))
+            
+            if apt_id_filter is not None and matched_apt.apt_id != apt_id_filter:
+                continue
+            
+            # 거래 데이터 → 저장용 행 (None이면 필수 값 누락)
+            row = build_row(item, matched_apt, apt_nm, api_response_data)
+            if row is None:
+                result.error_count += 1
+                continue
+            
+            # 스테이징 버퍼에 적재 (중복 처리/저장은 페이지 단위 일괄 처리)
+            result.rows.append(row)
+        
+        except Exception:
+            result.error_count += 1
+            continue
+    
+    return result
+
+
+# ============================================================
+# 프로세스 풀 모드
+# ============================================================
+
+def parse_and_match_trades(
+    content: bytes,
+    snapshot: RegionSnapshot,
+    trans_type: str,
+    ym: str,
+    apt_id_filter: Optional[int] = None,
+    max_rows: Optional[int] = None,
+) -> TradeMatchResult:
+    """
+    워커 프로세스 진입점: XML 파싱 + 매칭
+
+    매칭 인덱스는 워커 프로세스의 레지스트리에 시군구별로 캐싱되어
+    같은 워커가 같은 시군구의 다른 연월을 받으면 재사용됩니다.
+    """
+    parsed = DataCollectionServiceBase.parse_molit_xml(content)
+    if parsed.result_code != "000" or not parsed.items or not snapshot.apartments:
+        return TradeMatchResult(
+            result_code=parsed.result_code,
+            result_msg=parsed.result_msg,
+            fetched=len(parsed.items),
+        )
+
+    matcher_index = get_region_matcher_index(snapshot.sgg_cd, snapshot.apartments, snapshot.apt_details)
+    result = match_trade_items(
+        parsed.items,
+        trans_type=trans_type,
+        sgg_cd=snapshot.sgg_cd,
+        ym=ym,
+        local_apts=snapshot.apartments,
+        apt_details=snapshot.apt_details,
+        all_regions=snapshot.regions,
+        decisions=snapshot.decisions,
+        matcher_index=matcher_index,
+        apt_id_filter=apt_id_filter,
+        max_rows=max_rows,
+    )
+    result.result_code = parsed.result_code
+    result.result_msg = parsed.result_msg
+    result.fetched = len(parsed.items)
+    return result
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers: int = 0
+
+
+def get_match_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    파싱/매칭용 프로세스 풀 (워커 수가 바뀌면 재생성)
+
+    fork 시 부모의 이벤트 루프/DB 커넥션이 복제되지 않도록 spawn 방식을 사용합니다.
+    """
+    global _process_pool, _process_pool_workers
+    if _process_pool is None or _process_pool_workers != workers:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _process_pool_workers = workers
+        logger.info(f" 파싱/매칭 프로세스 풀 생성: 워커 {workers}개")
+    return _process_pool
+
+
+async def run_parse_and_match(
+    workers: int,
+    content: bytes,
+    snapshot: RegionSnapshot,
+    trans_type: str,
+    ym: str,
+    apt_id_filter: Optional[int] = None,
+    max_rows: Optional[int] = None,
+) -> TradeMatchResult:
+    """프로세스 풀에서 parse_and_match_trades 실행 (이벤트 루프는 대기만 함)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_match_process_pool(workers),
+        parse_and_match_trades,
+        content,
+        snapshot,
+        trans_type,
+        ym,
+        apt_id_filter,
+        max_rows,
+    )
+
+
+def shutdown_match_process_pool() -> None:
+    """프로세스 풀 종료 (애플리케이션 종료 시)"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_workers = 0
@@ -0,0 +1,504 @@
+"""
+실거래가 수집 작업 큐
+
+매매/전월세 수집을 (종류, 연월, 시군구) 작업 단위로 나누어 collection_work_units 테이블에 기록하고,
+여러 워커가 연월 구분 없이 남은 단위를 하나씩 가져가 처리합니다.
+
+- 느린 시군구 하나가 해당 월 전체를 붙잡지 않음 (다른 워커는 다음 단위로 진행)
+- 프로세스가 중단되어도 완료(done)된 단위는 resume 시 다시 호출하지 않음
+- 실패 단위는 MAX_ATTEMPTS 내에서 같은 실행 안에서 다시 시도 (시도 횟수에 따라 대기 후)
+- reset 등록은 다른 프로세스가 처리 중인(running) 단위를 건드리지 않음
+- FOR UPDATE SKIP LOCKED 로 가져오므로 여러 프로세스가 같은 큐를 나눠 처리할 수 있음
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.models.collection_work_unit import CollectionWorkUnit
+
+logger = logging.getLogger(__name__)
+
+# 수집 종류
+WORK_KIND_SALES = "sales"
+WORK_KIND_RENTS = "rents"
+
+# 단위별 최대 시도 횟수
+MAX_ATTEMPTS = 3
+
+# running 상태로 이 시간 이상 남아 있으면 중단된 작업으로 보고 다시 가져감
+STALE_RUNNING_SECONDS = 15 * 60
+
+# 실패 단위 재시도 대기 기준 시간 (attempts 회 실패 후 RETRY_BACKOFF_SECONDS * 2^(attempts-1)초 대기)
+RETRY_BACKOFF_SECONDS = 30
+
+# 재시도 대기 중인 단위를 기다릴 때 한 번에 잠드는 최대 시간
+_RETRY_POLL_SECONDS = 5
+
+# 한 번에 INSERT 하는 작업 단위 수 (asyncpg 파라미터 수 제한 대비)
+_ENQUEUE_CHUNK_SIZE = 5000
+
+# last_error 최대 길이
+_MAX_ERROR_LENGTH = 1000
+
+
+def retry_backoff_seconds(attempts: int) -> int:
+    """attempts 회 실패한 단위를 다시 가져가기 전 대기 시간(초)"""
+    return RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+
+
+@dataclass
+class WorkUnit:
+    """가져온 작업 단위"""
+    kind: str
+    ym: str
+    sgg_cd: str
+    attempts: int
+
+
+@dataclass
+class WorkUnitOutcome:
+    """작업 단위 처리 결과 (error가 있으면 실패, deferred면 처리하지 않고 큐에 되돌림)"""
+    fetched: int = 0
+    saved: int = 0
+    error: Optional[str] = None
+    deferred: bool = False
+
+
+class CollectionWorkQueue:
+    """
+    수집 작업 큐
+
+    모든 메서드는 상태 변경을 바로 커밋합니다 (다른 워커/프로세스가 즉시 볼 수 있도록).
+    """
+
+    @staticmethod
+    def _range_filter(kind: str, start_ym: str, end_ym: str):
+        return and_(
+            CollectionWorkUnit.kind == kind,
+            CollectionWorkUnit.ym >= start_ym,
+            CollectionWorkUnit.ym <= end_ym,
+        )
+
+    @staticmethod
+    def _claimable_filter(max_attempts: int, now: Optional[datetime] = None):
+        """
+        가져갈 수 있는 단위 조건
+
+        now를 주면 실패 단위는 재시도 대기 시간(retry_backoff_seconds)이 지난 것만 포함합니다.
+        """
+        failed = and_(CollectionWorkUnit.status == "failed", CollectionWorkUnit.attempts < max_attempts)
+        if now is not None:
+            failed = and_(
+                failed,
+                or_(
+                    CollectionWorkUnit.updated_at.is_(None),
+                    *(
+                        and_(
+                            CollectionWorkUnit.attempts == attempts,
+                            CollectionWorkUnit.updated_at <= now - timedelta(seconds=retry_backoff_seconds(attempts)),
+                        )
+                        for attempts in range(max_attempts)
+                    ),
+                ),
+            )
+        return or_(CollectionWorkUnit.status == "pending", failed)
+
+    async def enqueue(
+        self,
+        db: AsyncSession,
+        kind: str,
+        months: List[str],
+        sgg_codes: List[str],
+        reset: bool = False,
+    ) -> int:
+        """
+        작업 단위 등록
+
+        Args:
+            db: 데이터베이스 세션
+            kind: 수집 종류 (sales, rents)
+            months: 연월 목록 (YYYYMM)
+            sgg_codes: 시군구 코드 목록
+            reset: True면 이미 있는 단위도 pending으로 되돌림 (처음부터 다시 수집),
+                   False면 기존 단위 상태 유지 (이어서 수집).
+                   다른 프로세스가 처리 중인 running 단위(STALE_RUNNING_SECONDS 이내 갱신)는 되돌리지 않음
+
+        Returns:
+            등록 대상 단위 수
+        """
+        now = datetime.now()
+        stale_cutoff = now - timedelta(seconds=STALE_RUNNING_SECONDS)
+        rows = [
+            {"kind": kind, "ym": ym, "sgg_cd": sgg_cd, "status": "pending", "attempts": 0,
+             "fetched_count": 0, "saved_count": 0, "created_at": now, "updated_at": now}
+            for ym in months
+            for sgg_cd in sgg_codes
+        ]
+
+        for i in range(0, len(rows), _ENQUEUE_CHUNK_SIZE):
+            stmt = insert(CollectionWorkUnit).values(rows[i:i + _ENQUEUE_CHUNK_SIZE])
+            if reset:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["kind", "ym", "sgg_cd"],
+                    set_={
+                        "status": "pending",
+                        "attempts": 0,
+                        "last_error": None,
+                        "updated_at": now,
+                    },
+                    where=or_(
+                        CollectionWorkUnit.status != "running",
+                        CollectionWorkUnit.updated_at.is_(None),
+                        CollectionWorkUnit.updated_at < stale_cutoff,
+                    ),
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=["kind", "ym", "sgg_cd"])
+            await db.execute(stmt)
+        await db.commit()
+        return len(rows)
+
+    async def requeue_stale(
+        self,
+        db: AsyncSession,
+        kind: str,
+        start_ym: str,
+        end_ym: str,
+        stale_seconds: int = STALE_RUNNING_SECONDS,
+    ) -> int:
+        """
+        중단된 running 단위를 pending으로 되돌림
+
+        Returns:
+            되돌린 단위 수
+        """
+        cutoff = datetime.now() - timedelta(seconds=stale_seconds)
+        result = await db.execute(
+            update(CollectionWorkUnit)
+            .where(
+                self._range_filter(kind, start_ym, end_ym),
+                CollectionWorkUnit.status == "running",
+                or_(CollectionWorkUnit.started_at.is_(None), CollectionWorkUnit.started_at < cutoff),
+            )
+            .values(status="pending", updated_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount or 0
+
+    async def count_claimable_by_month(
+        self,
+        db: AsyncSession,
+        kind: str,
+        start_ym: str,
+        end_ym: str,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> Dict[str, int]:
+        """연월별 처리 대기 단위 수 (재시도 대기 중인 실패 단위 포함)"""
+        result = await db.execute(
+            select(CollectionWorkUnit.ym, func.count())
+            .where(self._range_filter(kind, start_ym, end_ym), self._claimable_filter(max_attempts))
+            .group_by(CollectionWorkUnit.ym)
+        )
+        return {ym: count for ym, count in result.all()}
+
+    async def claim(
+        self,
+        db: AsyncSession,
+        kind: str,
+        start_ym: str,
+        end_ym: str,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> Optional[WorkUnit]:
+        """
+        처리할 단위 하나를 running으로 바꾸고 가져옴
+
+        시도 횟수가 적은 단위, 오래된 연월 순으로 가져오며
+        다른 워커가 잠근 행은 건너뜁니다 (FOR UPDATE SKIP LOCKED).
+        실패 단위는 재시도 대기 시간이 지난 것만 가져갑니다.
+
+        Returns:
+            WorkUnit 또는 None (남은 단위 없음)
+        """
+        now = datetime.now()
+        candidate = (
+            select(CollectionWorkUnit.kind, CollectionWorkUnit.ym, CollectionWorkUnit.sgg_cd)
+            .where(self._range_filter(kind, start_ym, end_ym), self._claimable_filter(max_attempts, now))
+            .order_by(CollectionWorkUnit.attempts, CollectionWorkUnit.ym, CollectionWorkUnit.sgg_cd)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(CollectionWorkUnit)
+            .where(tuple_(CollectionWorkUnit.kind, CollectionWorkUnit.ym, CollectionWorkUnit.sgg_cd).in_(candidate))
+            .values(
+                status="running",
+                attempts=CollectionWorkUnit.attempts + 1,
+                started_at=now,
+                finished_at=None,
+                updated_at=now,
+            )
+            .returning(
+                CollectionWorkUnit.kind,
+                CollectionWorkUnit.ym,
+                CollectionWorkUnit.sgg_cd,
+                CollectionWorkUnit.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        await db.commit()
+        if row is None:
+            return None
+        return WorkUnit(kind=row.kind, ym=row.ym, sgg_cd=row.sgg_cd, attempts=row.attempts)
+
+    async def seconds_until_retry(
+        self,
+        db: AsyncSession,
+        kind: str,
+        start_ym: str,
+        end_ym: str,
+        max_attempts: int = MAX_ATTEMPTS,
+    ) -> Optional[float]:
+        """
+        재시도 대기 중인 실패 단위가 다시 가져갈 수 있게 될 때까지 남은 시간
+
+        Returns:
+            남은 초 (0 이상) 또는 None (재시도할 실패 단위 없음)
+        """
+        result = await db.execute(
+            select(CollectionWorkUnit.attempts, func.min(CollectionWorkUnit.updated_at))
+            .where(
+                self._range_filter(kind, start_ym, end_ym),
+                CollectionWorkUnit.status == "failed",
+                CollectionWorkUnit.attempts < max_attempts,
+            )
+            .group_by(CollectionWorkUnit.attempts)
+        )
+        now = datetime.now()
+        waits = [
+            0.0 if updated_at is None
+            else (updated_at + timedelta(seconds=retry_backoff_seconds(attempts)) - now).total_seconds()
+            for attempts, updated_at in result.all()
+        ]
+        if not waits:
+            return None
+        return max(0.0, min(waits))
+
+    async def finish(
+        self,
+        db: AsyncSession,
+        unit: WorkUnit,
+        outcome: WorkUnitOutcome,
+        duration_ms: int,
+    ) -> None:
+        """처리 결과 기록 (outcome.error가 있으면 failed, 없으면 done)"""
+        now = datetime.now()
+        if outcome.deferred:
+            # 처리하지 않은 단위는 시도 횟수를 되돌리고 pending으로
+            await db.execute(
+                update(CollectionWorkUnit)
+                .where(
+                    CollectionWorkUnit.kind == unit.kind,
+                    CollectionWorkUnit.ym == unit.ym,
+                    CollectionWorkUnit.sgg_cd == unit.sgg_cd,
+                )
+                .values(
+                    status="pending",
+                    attempts=CollectionWorkUnit.attempts - 1,
+                    started_at=None,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            return
+
+        await db.execute(
+            update(CollectionWorkUnit)
+            .where(
+                CollectionWorkUnit.kind == unit.kind,
+                CollectionWorkUnit.ym == unit.ym,
+                CollectionWorkUnit.sgg_cd == unit.sgg_cd,
+            )
+            .values(
+                status="failed" if outcome.error else "done",
+                fetched_count=outcome.fetched,
+                saved_count=outcome.saved,
+                duration_ms=duration_ms,
+                last_error=outcome.error[:_MAX_ERROR_LENGTH] if outcome.error else None,
+                finished_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+    async def get_status(
+        self,
+        db: AsyncSession,
+        kind: str,
+        start_ym: Optional[str] = None,
+        end_ym: Optional[str] = None,
+        failed_limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        큐 진행 상황 조회
+
+        Returns:
+            전체/연월별 상태별 단위 수, 소요 시간 통계, 실패 단위 목록
+        """
+        conditions = [CollectionWorkUnit.kind == kind]
+        if start_ym:
+            conditions.append(CollectionWorkUnit.ym >= start_ym)
+        if end_ym:
+            conditions.append(CollectionWorkUnit.ym <= end_ym)
+
+        result = await db.execute(
+            select(
+                CollectionWorkUnit.ym,
+                CollectionWorkUnit.status,
+                func.count(),
+                func.coalesce(func.sum(CollectionWorkUnit.saved_count), 0),
+                func.coalesce(func.sum(CollectionWorkUnit.duration_ms), 0),
+                func.max(CollectionWorkUnit.duration_ms),
+            )
+            .where(*conditions)
+            .group_by(CollectionWorkUnit.ym, CollectionWorkUnit.status)
+            .order_by(CollectionWorkUnit.ym)
+        )
+
+        totals: Dict[str, int] = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        months: Dict[str, Dict[str, int]] = {}
+        total_saved = 0
+        total_duration_ms = 0
+        max_duration_ms = 0
+        finished_units = 0
+        for ym, unit_status, count, saved, duration_sum, duration_max in result.all():
+            totals[unit_status] = totals.get(unit_status, 0) + count
+            months.setdefault(ym, {})[unit_status] = count
+            total_saved += saved
+            if unit_status in ("done", "failed"):
+                finished_units += count
+                total_duration_ms += duration_sum
+                max_duration_ms = max(max_duration_ms, duration_max or 0)
+
+        failed_result = await db.execute(
+            select(
+                CollectionWorkUnit.ym,
+                CollectionWorkUnit.sgg_cd,
+                CollectionWorkUnit.attempts,
+                CollectionWorkUnit.last_error,
+            )
+            .where(*conditions, CollectionWorkUnit.status == "failed")
+            .order_by(CollectionWorkUnit.ym, CollectionWorkUnit.sgg_cd)
+            .limit(failed_limit)
+        )
+
+        total_units = sum(totals.values())
+        return {
+            "kind": kind,
+            "total_units": total_units,
+            "status_counts": totals,
+            "progress": round(totals["done"] / total_units * 100, 2) if total_units else 0.0,
+            "total_saved": total_saved,
+            "avg_duration_ms": round(total_duration_ms / finished_units) if finished_units else 0,
+            "max_duration_ms": max_duration_ms,
+            "months": months,
+            "failed_units": [
+                {"ym": ym, "sgg_cd": sgg_cd, "attempts": attempts, "last_error": last_error}
+                for ym, sgg_cd, attempts, last_error in failed_result.all()
+            ],
+        }
+
+
+# 전역 큐 인스턴스
+collection_work_queue = CollectionWorkQueue()
+
+
+async def run_work_queue(
+    kind: str,
+    start_ym: str,
+    end_ym: str,
+    process_unit: Callable[[str, str], Awaitable[WorkUnitOutcome]],
+    workers: int,
+    on_month_done: Optional[Callable[[str], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    max_attempts: int = MAX_ATTEMPTS,
+) -> Dict[str, int]:
+    """
+    워커 N개로 큐의 남은 단위를 처리
+
+    Args:
+        kind: 수집 종류
+        start_ym, end_ym: 처리할 연월 범위
+        process_unit: (ym, sgg_cd) → WorkUnitOutcome
+        workers: 동시 워커 수
+        on_month_done: 연월의 모든 단위가 끝났을 때 호출 (월별 로그 저장 등)
+        should_stop: True를 반환하면 새 단위를 가져오지 않음 (max_items 도달 등)
+        max_attempts: 단위별 최대 시도 횟수
+
+    Returns:
+        이번 실행에서 처리한 단위 수 {"done": n, "failed": n}
+    """
+    async with AsyncSessionLocal() as queue_db:
+        outstanding = await collection_work_queue.count_claimable_by_month(
+            queue_db, kind, start_ym, end_ym, max_attempts
+        )
+    touched_months: set = set()
+    processed = {"done": 0, "failed": 0}
+
+    def settle(ym: str) -> None:
+        outstanding[ym] = outstanding.get(ym, 1) - 1
+        if outstanding[ym] == 0 and on_month_done:
+            touched_months.discard(ym)
+            on_month_done(ym)
+
+    async def worker() -> None:
+        async with AsyncSessionLocal() as queue_db:
+            while not (should_stop and should_stop()):
+                unit = await collection_work_queue.claim(queue_db, kind, start_ym, end_ym, max_attempts)
+                if unit is None:
+                    # 재시도 대기 중인 실패 단위가 남아 있으면 대기 시간이 지날 때까지 기다림
+                    wait = await collection_work_queue.seconds_until_retry(
+                        queue_db, kind, start_ym, end_ym, max_attempts
+                    )
+                    if wait is None:
+                        return
+                    await asyncio.sleep(min(max(wait, 0.1), _RETRY_POLL_SECONDS))
+                    continue
+                touched_months.add(unit.ym)
+
+                started = time.monotonic()
+                try:
+                    outcome = await process_unit(unit.ym, unit.sgg_cd)
+                except Exception as e:
+                    outcome = WorkUnitOutcome(error=f"{type(e).__name__}: {str(e)}")
+                duration_ms = int((time.monotonic() - started) * 1000)
+
+                await collection_work_queue.finish(queue_db, unit, outcome, duration_ms)
+                if outcome.deferred:
+                    continue
+                if outcome.error:
+                    processed["failed"] += 1
+                    if unit.attempts >= max_attempts:
+                        settle(unit.ym)
+                else:
+                    processed["done"] += 1
+                    settle(unit.ym)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+
+    # 중단/다른 프로세스 처리 등으로 끝까지 세지 못한 연월도 로그는 남김
+    if on_month_done:
+        for ym in sorted(touched_months):
+            on_month_done(ym)
+    return processed
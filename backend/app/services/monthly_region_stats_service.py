@@ -0,0 +1,238 @@
+"""
+월별 지역 거래 집계 서비스
+
+(지역, 연월, 거래 유형) 단위 롤업 테이블(monthly_region_stats)을 관리합니다.
+실거래가 수집이 끝나면 저장된 거래가 있는 월만 다시 집계하고,
+지도/대시보드/통계 API가 조회할 때 쓰는 헬퍼를 제공합니다.
+"""
+import logging
+import calendar
+from datetime import date
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# 집계 대상 종류 (수집 단위)
+STATS_KIND_SALE = "sale"
+STATS_KIND_RENT = "rent"
+
+# 롤업 거래 유형
+STATS_TYPE_SALE = "sale"
+STATS_TYPE_JEONSE = "jeonse"
+STATS_TYPE_WOLSE = "wolse"
+
+_KIND_TRANSACTION_TYPES = {
+    STATS_KIND_SALE: (STATS_TYPE_SALE,),
+    STATS_KIND_RENT: (STATS_TYPE_JEONSE, STATS_TYPE_WOLSE),
+}
+
+# 매매 월 집계 (취소/삭제 거래, 삭제된 아파트 제외)
+_SALE_AGGREGATE_SQL = """
+    INSERT INTO monthly_region_stats (
+        region_id, ym, transaction_type,
+        transaction_count, price_count, total_price, avg_price,
+        pyeong_count, total_price_per_pyeong, avg_price_per_pyeong,
+        total_area, avg_area, updated_at
+    )
+    SELECT
+        a.region_id,
+        :ym,
+        'sale',
+        COUNT(*),
+        COUNT(s.trans_price),
+        SUM(s.trans_price),
+        AVG(s.trans_price),
+        COUNT(*) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+        SUM(s.trans_price / s.exclusive_area * 3.3) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+        AVG(s.trans_price / s.exclusive_area * 3.3) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+        SUM(s.exclusive_area) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+        AVG(s.exclusive_area) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+        NOW()
+    FROM sales s
+    JOIN apartments a ON s.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+    WHERE s.is_canceled = FALSE
+      AND (s.is_deleted = FALSE OR s.is_deleted IS NULL)
+      AND s.contract_date >= :start_date
+      AND s.contract_date <= :end_date
+      AND a.region_id IS NOT NULL
+    GROUP BY a.region_id
+"""
+
+# 전월세 월 집계 (월세가 0 또는 NULL이면 전세, 가격은 보증금 기준)
+_RENT_AGGREGATE_SQL = """
+    INSERT INTO monthly_region_stats (
+        region_id, ym, transaction_type,
+        transaction_count, price_count, total_price, avg_price,
+        pyeong_count, total_price_per_pyeong, avg_price_per_pyeong,
+        total_area, avg_area, updated_at
+    )
+    SELECT
+        a.region_id,
+        :ym,
+        CASE WHEN r.monthly_rent = 0 OR r.monthly_rent IS NULL THEN 'jeonse' ELSE 'wolse' END,
+        COUNT(*),
+        COUNT(r.deposit_price),
+        SUM(r.deposit_price),
+        AVG(r.deposit_price),
+        COUNT(*) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+        SUM(r.deposit_price / r.exclusive_area * 3.3) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+        AVG(r.deposit_price / r.exclusive_area * 3.3) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+        SUM(r.exclusive_area) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+        AVG(r.exclusive_area) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+        NOW()
+    FROM rents r
+    JOIN apartments a ON r.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+    WHERE (r.is_deleted = FALSE OR r.is_deleted IS NULL)
+      AND r.deal_date >= :start_date
+      AND r.deal_date <= :end_date
+      AND a.region_id IS NOT NULL
+    GROUP BY a.region_id, CASE WHEN r.monthly_rent = 0 OR r.monthly_rent IS NULL THEN 'jeonse' ELSE 'wolse' END
+"""
+
+_AGGREGATE_SQL = {
+    STATS_KIND_SALE: _SALE_AGGREGATE_SQL,
+    STATS_KIND_RENT: _RENT_AGGREGATE_SQL,
+}
+
+# 전체 재집계 시 월 목록 (원본 테이블에 존재하는 월)
+_SOURCE_MONTHS_SQL = {
+    STATS_KIND_SALE: "SELECT DISTINCT TO_CHAR(contract_date, 'YYYYMM') AS ym FROM sales WHERE contract_date IS NOT NULL",
+    STATS_KIND_RENT: "SELECT DISTINCT TO_CHAR(deal_date, 'YYYYMM') AS ym FROM rents WHERE deal_date IS NOT NULL",
+}
+
+_DELETE_STALE_MONTHS_SQL = text(
+    "DELETE FROM monthly_region_stats "
+    "WHERE ym <> ALL(:yms) AND transaction_type = ANY(:transaction_types)"
+)
+
+
+def ym_of(d: date) -> str:
+    """날짜 → YYYYMM"""
+    return f"{d.year:04d}{d.month:02d}"
+
+
+def shift_ym(ym: str, months: int) -> str:
+    """YYYYMM을 months 개월만큼 이동 (음수면 과거)"""
+    index = int(ym[:4]) * 12 + int(ym[4:]) - 1 + months
+    return f"{index // 12:04d}{index % 12 + 1:02d}"
+
+
+def ym_bounds(ym: str) -> Tuple[date, date]:
+    """YYYYMM → (월 첫날, 월 마지막 날)"""
+    y, m = int(ym[:4]), int(ym[4:])
+    return date(y, m, 1), date(y, m, calendar.monthrange(y, m)[1])
+
+
+class MonthlyRegionStatsService:
+    """월별 지역 거래 집계 서비스"""
+
+    async def refresh_months(
+        self,
+        db: AsyncSession,
+        kind: str,
+        yms: Iterable[str]
+    ) -> int:
+        """
+        지정한 월의 집계를 원본 거래 테이블에서 다시 계산 (월 단위 DELETE + INSERT ... SELECT)
+
+        Args:
+            db: 데이터베이스 세션
+            kind: 집계 종류 (sale, rent)
+            yms: 다시 집계할 연월 목록 (YYYYMM)
+
+        Returns:
+            저장된 집계 행 수
+        """
+        if kind not in _AGGREGATE_SQL:
+            raise ValueError(f"유효하지 않은 집계 종류: {kind}")
+
+        months = sorted({ym for ym in yms if ym and len(ym) == 6})
+        if not months:
+            return 0
+
+        transaction_types = list(_KIND_TRANSACTION_TYPES[kind])
+        delete_stmt = text(
+            "DELETE FROM monthly_region_stats "
+            "WHERE ym = :ym AND transaction_type = ANY(:transaction_types)"
+        )
+        aggregate_stmt = text(_AGGREGATE_SQL[kind])
+
+        total_rows = 0
+        for ym in months:
+            start_date, end_date = ym_bounds(ym)
+            await db.execute(delete_stmt, {"ym": ym, "transaction_types": transaction_types})
+            result = await db.execute(
+                aggregate_stmt,
+                {"ym": ym, "start_date": start_date, "end_date": end_date}
+            )
+            total_rows += result.rowcount or 0
+        await db.commit()
+
+        logger.info(
+            f" 월별 지역 집계 갱신: {kind} {months[0]}~{months[-1]} "
+            f"({len(months)}개 월, {total_rows}행)"
+        )
+        return total_rows
+
+    async def rebuild_all(self, db: AsyncSession, kind: Optional[str] = None) -> dict:
+        """
+        원본 거래 테이블에 존재하는 모든 월을 다시 집계
+
+        Args:
+            db: 데이터베이스 세션
+            kind: 집계 종류 (None이면 매매/전월세 모두)
+
+        Returns:
+            종류별 집계 행 수
+        """
+        if kind is not None and kind not in _AGGREGATE_SQL:
+            raise ValueError(f"유효하지 않은 집계 종류: {kind}")
+
+        kinds = [kind] if kind else list(_AGGREGATE_SQL)
+        summary = {}
+        for target_kind in kinds:
+            result = await db.execute(text(_SOURCE_MONTHS_SQL[target_kind]))
+            months = [row.ym for row in result.fetchall()]
+            # 원본 거래가 모두 사라진 월의 집계 정리
+            await db.execute(
+                _DELETE_STALE_MONTHS_SQL,
+                {"yms": months, "transaction_types": list(_KIND_TRANSACTION_TYPES[target_kind])}
+            )
+            summary[target_kind] = await self.refresh_months(db, target_kind, months)
+        await db.commit()
+        return summary
+
+    async def get_ym_range(
+        self,
+        db: AsyncSession,
+        transaction_type: str,
+        require_pyeong: bool = False
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        집계가 존재하는 (최소 연월, 최대 연월)
+
+        Args:
+            transaction_type: 거래 유형 (sale, jeonse, wolse)
+            require_pyeong: True면 평당가 계산 가능 거래가 있는 월만
+        """
+        count_column = "pyeong_count" if require_pyeong else "transaction_count"
+        result = await db.execute(
+            text(f"""
+                SELECT MIN(ym) AS min_ym, MAX(ym) AS max_ym
+                FROM monthly_region_stats
+                WHERE transaction_type = :transaction_type
+                  AND {count_column} > 0
+            """),
+            {"transaction_type": transaction_type}
+        )
+        row = result.first()
+        if not row:
+            return None, None
+        return row.min_ym, row.max_ym
+
+
+# 서비스 인스턴스
+monthly_region_stats_service = MonthlyRegionStatsService()
@@ -0,0 +1,320 @@
+"""
+아파트 평당가 분포 스냅샷 (/apartments/{apt_id}/percentile)
+
+요청마다 전국 아파트의 최근 6개월 평당가를 GROUP BY 로 집계하던 방식 대신,
+아파트별 가격 요약(apartment_price_summary)에서 만든 정렬 배열에서 이진 탐색(bisect)으로 순위를 구합니다.
+
+- 배열: 전국 평당가(오름차순), 동별 평당가(동 ID 순으로 이어 붙이고 동마다 오름차순), 아파트 ID → 평당가/동
+- 저장: float32/int64 로 packing 해 Redis 해시(바이트 클라이언트) + 워커 메모리
+- 재구성: 매매 수집 후와 가격 요약 일일 재계산 후에만 (요청 처리 중에는 스냅샷이 아예 없을 때만)
+- 다른 워커의 재구성은 SNAPSHOT_CHECK_INTERVAL 마다 Redis 버전을 확인해 반영
+- 재구성 후 PERCENTILE_TAG 를 올려 percentile 응답 캐시를 무효화
+"""
+import asyncio
+import logging
+import secrets
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis_binary_client
+from app.utils.cache import CACHE_OPERATION_TIMEOUT, PERCENTILE_TAG, invalidate_cache_tags
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 Redis 키 (해시)
+SNAPSHOT_REDIS_KEY = "realestate:percentile:snapshot"
+
+# 다른 워커가 재구성했는지 Redis 버전을 확인하는 간격 (초)
+SNAPSHOT_CHECK_INTERVAL = 30.0
+
+# 평당가 집계 기간 (개월, 가격 요약의 6m 컬럼)
+PERIOD_MONTHS = 6
+
+# 아파트별 최근 6개월 평균 평당가 (삭제된 아파트 제외)
+_SNAPSHOT_SQL = text("""
+    SELECT ps.apt_id, a.region_id, ps.avg_price_per_pyeong_6m AS price_per_pyeong
+    FROM apartment_price_summary ps
+    JOIN apartments a ON a.apt_id = ps.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+    WHERE ps.transaction_type = 'sale'
+      AND ps.area_bucket = 0
+      AND ps.count_6m > 0
+      AND ps.avg_price_per_pyeong_6m IS NOT NULL
+""")
+
+_ARRAY_FIELDS = {
+    "apt_ids": "q",
+    "apt_prices": "f",
+    "apt_regions": "q",
+    "national": "f",
+    "region_ids": "q",
+    "region_offsets": "q",
+    "region_prices": "f",
+    "region_sums": "d",
+}
+
+# 동이 없는 아파트 (동 내 순위 제외)
+NO_REGION = -1
+
+
+@dataclass
+class PercentileRank:
+    """분포 내 순위 (가격이 높을수록 상위)"""
+    rank: int
+    total_count: int
+    percentile: float
+    average: float
+
+
+@dataclass
+class PercentileSnapshot:
+    """정렬된 평당가 분포"""
+    version: str
+    built_at: str
+    apt_ids: array = field(default_factory=lambda: array("q"))
+    apt_prices: array = field(default_factory=lambda: array("f"))
+    apt_regions: array = field(default_factory=lambda: array("q"))
+    national: array = field(default_factory=lambda: array("f"))
+    national_sum: float = 0.0
+    region_ids: array = field(default_factory=lambda: array("q"))
+    region_offsets: array = field(default_factory=lambda: array("q"))
+    region_prices: array = field(default_factory=lambda: array("f"))
+    region_sums: array = field(default_factory=lambda: array("d"))
+
+    @property
+    def size(self) -> int:
+        return sum(len(getattr(self, name)) * getattr(self, name).itemsize for name in _ARRAY_FIELDS)
+
+    def lookup(self, apt_id: int) -> Optional[Tuple[float, int]]:
+        """아파트 ID → (평당가, 동 ID)"""
+        idx = bisect_left(self.apt_ids, apt_id)
+        if idx == len(self.apt_ids) or self.apt_ids[idx] != apt_id:
+            return None
+        return self.apt_prices[idx], self.apt_regions[idx]
+
+    def national_rank(self, price: float) -> PercentileRank:
+        """전국 순위"""
+        return _rank(self.national, 0, len(self.national), price, self.national_sum)
+
+    def region_rank(self, region_id: int, price: float) -> Optional[PercentileRank]:
+        """동 내 순위 (동 분포가 없으면 None)"""
+        idx = bisect_left(self.region_ids, region_id)
+        if idx == len(self.region_ids) or self.region_ids[idx] != region_id:
+            return None
+        lo, hi = self.region_offsets[idx], self.region_offsets[idx + 1]
+        return _rank(self.region_prices, lo, hi, price, self.region_sums[idx])
+
+    def to_mapping(self) -> Dict[str, bytes]:
+        mapping = {name: getattr(self, name).tobytes() for name in _ARRAY_FIELDS}
+        mapping["version"] = self.version.encode()
+        mapping["built_at"] = self.built_at.encode()
+        mapping["national_sum"] = repr(self.national_sum).encode()
+        return mapping
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[bytes, bytes]) -> Optional["PercentileSnapshot"]:
+        if not mapping or b"version" not in mapping:
+            return None
+        snapshot = cls(
+            version=mapping[b"version"].decode(),
+            built_at=mapping.get(b"built_at", b"").decode(),
+            national_sum=float(mapping.get(b"national_sum", b"0")),
+        )
+        for name, typecode in _ARRAY_FIELDS.items():
+            values = array(typecode)
+            values.frombytes(mapping.get(name.encode(), b""))
+            setattr(snapshot, name, values)
+        return snapshot
+
+
+def _rank(prices: array, lo: int, hi: int, price: float, total: float) -> PercentileRank:
+    # 오름차순 배열에서 price 보다 큰 값의 개수 = 상위 순위 - 1 (같은 가격은 같은 순위)
+    count = hi - lo
+    higher = hi - bisect_right(prices, price, lo, hi)
+    return PercentileRank(
+        rank=higher + 1,
+        total_count=count,
+        percentile=higher / count * 100 if count else 0.0,
+        average=total / count if count else 0.0,
+    )
+
+
+def build_snapshot(rows: Iterable[Tuple[int, Optional[int], float]]) -> PercentileSnapshot:
+    """
+    (apt_id, region_id, 평당가) 목록으로 스냅샷 생성
+
+    평당가는 float32 로 저장하므로 순위 비교도 float32 로 변환한 값끼리 합니다.
+    """
+    items = sorted(
+        (apt_id, region_id if region_id is not None else NO_REGION, float(price))
+        for apt_id, region_id, price in rows
+        if price is not None
+    )
+    snapshot = PercentileSnapshot(
+        version=secrets.token_hex(8),
+        built_at=datetime.utcnow().isoformat(),
+        apt_ids=array("q", (item[0] for item in items)),
+        apt_prices=array("f", (item[2] for item in items)),
+        apt_regions=array("q", (item[1] for item in items)),
+    )
+    snapshot.national = array("f", sorted(snapshot.apt_prices))
+    snapshot.national_sum = sum(item[2] for item in items)
+
+    # 동 ID 순, 동마다 평당가 오름차순 (region_offsets[i]:region_offsets[i + 1] 이 i 번째 동)
+    regional = sorted((region_id, price) for _, region_id, price in items if region_id != NO_REGION)
+    for region_id, price in regional:
+        if not snapshot.region_ids or snapshot.region_ids[-1] != region_id:
+            snapshot.region_ids.append(region_id)
+            snapshot.region_offsets.append(len(snapshot.region_prices))
+            snapshot.region_sums.append(0.0)
+        snapshot.region_prices.append(price)
+        snapshot.region_sums[-1] += price
+    snapshot.region_offsets.append(len(snapshot.region_prices))
+    return snapshot
+
+
+@dataclass
+class PercentileSnapshotMetrics:
+    """분포 스냅샷 지표"""
+    rebuilds: int = 0
+    loads: int = 0
+    version_checks: int = 0
+    failures: int = 0
+    last_rebuild_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rebuilds": self.rebuilds,
+            "loads": self.loads,
+            "version_checks": self.version_checks,
+            "failures": self.failures,
+            "last_rebuild_ms": round(self.last_rebuild_ms, 1),
+        }
+
+
+class PercentileSnapshotStore:
+    """
+    워커별 분포 스냅샷 (Redis 공유)
+
+    Args:
+        check_interval: Redis 버전 확인 간격 (초)
+    """
+
+    def __init__(self, check_interval: float = SNAPSHOT_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._snapshot: Optional[PercentileSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._metrics = PercentileSnapshotMetrics()
+
+    async def rebuild(self, db: AsyncSession) -> Optional[PercentileSnapshot]:
+        """
+        가격 요약에서 스냅샷을 다시 만들고 Redis 에 저장 (수집/요약 재계산 후 호출)
+
+        Returns:
+            새 스냅샷 (실패 시 None)
+        """
+        started = time.perf_counter()
+        try:
+            result = await db.execute(_SNAPSHOT_SQL)
+            rows = [(row.apt_id, row.region_id, row.price_per_pyeong) for row in result.fetchall()]
+            snapshot = await asyncio.to_thread(build_snapshot, rows)
+        except Exception as e:
+            self._metrics.failures += 1
+            logger.warning(f" 평당가 분포 스냅샷 생성 실패: {type(e).__name__}: {e}")
+            return None
+
+        stored = await self._store(snapshot)
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        self._metrics.rebuilds += 1
+        self._metrics.last_rebuild_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f" 평당가 분포 스냅샷 생성: 아파트 {len(snapshot.apt_ids)}개, 동 {len(snapshot.region_ids)}개, "
+            f"{snapshot.size / 1024:.0f}KB, {self._metrics.last_rebuild_ms:.0f}ms"
+        )
+        if stored:
+            # 이전 스냅샷으로 만든 percentile 응답 캐시 무효화
+            await invalidate_cache_tags(PERCENTILE_TAG)
+        return snapshot
+
+    async def _store(self, snapshot: PercentileSnapshot) -> bool:
+        """스냅샷을 Redis 에 저장 (저장하면 True)"""
+        try:
+            redis_client = await get_redis_binary_client()
+            if redis_client is None:
+                return False
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.delete(SNAPSHOT_REDIS_KEY)
+            pipe.hset(SNAPSHOT_REDIS_KEY, mapping=snapshot.to_mapping())
+            await asyncio.wait_for(pipe.execute(), timeout=CACHE_OPERATION_TIMEOUT * 5)
+            return True
+        except Exception as e:
+            # 다른 워커는 각자 스냅샷이 없을 때 직접 생성
+            logger.warning(f" 평당가 분포 스냅샷 Redis 저장 실패: {type(e).__name__}: {e}")
+            return False
+
+    async def _load_if_changed(self) -> None:
+        redis_client = await get_redis_binary_client()
+        if redis_client is None:
+            return
+        self._metrics.version_checks += 1
+        version = await asyncio.wait_for(
+            redis_client.hget(SNAPSHOT_REDIS_KEY, "version"),
+            timeout=CACHE_OPERATION_TIMEOUT
+        )
+        if version is None or (self._snapshot is not None and version.decode() == self._snapshot.version):
+            return
+        mapping = await asyncio.wait_for(
+            redis_client.hgetall(SNAPSHOT_REDIS_KEY),
+            timeout=CACHE_OPERATION_TIMEOUT * 5
+        )
+        snapshot = PercentileSnapshot.from_mapping(mapping)
+        if snapshot is not None:
+            self._snapshot = snapshot
+            self._metrics.loads += 1
+
+    async def get(self, db: Optional[AsyncSession] = None) -> Optional[PercentileSnapshot]:
+        """
+        현재 스냅샷 (check_interval 마다 Redis 버전 확인)
+
+        Args:
+            db: 어디에도 스냅샷이 없을 때 생성에 사용할 세션 (None 이면 생성하지 않음)
+        """
+        if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._snapshot
+
+        async with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._snapshot
+            try:
+                await self._load_if_changed()
+            except Exception as e:
+                logger.debug(f" 평당가 분포 스냅샷 조회 실패: {type(e).__name__} - {e}")
+            self._checked_at = time.monotonic()
+            if self._snapshot is None and db is not None:
+                await self.rebuild(db)
+            return self._snapshot
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """스냅샷 지표"""
+        snapshot = self._snapshot
+        return {
+            "ready": snapshot is not None,
+            "version": snapshot.version if snapshot else None,
+            "built_at": snapshot.built_at if snapshot else None,
+            "apartments": len(snapshot.apt_ids) if snapshot else 0,
+            "regions": len(snapshot.region_ids) if snapshot else 0,
+            "bytes": snapshot.size if snapshot else 0,
+            **self._metrics.to_dict(),
+        }
+
+
+# 워커 공용 스냅샷
+percentile_snapshot_store = PercentileSnapshotStore()
@@ -0,0 +1,360 @@
+"""
+최근 검색어/최근 본 아파트 기록 버퍼 (write-behind)
+
+검색/상세 조회 요청마다 SELECT 후 INSERT/UPDATE + COMMIT 하던 기록을 메모리에 모아 두었다가
+주기적으로 여러 행을 한 번에 upsert 합니다.
+
+- (account_id, search_type, query) / (account_id, apt_id) 단위로 합쳐 마지막 시각만 유지
+- 대기 건수 상한을 넘으면 새 기록은 버림 (기록은 부가 기능이므로 요청 처리를 우선)
+- 플러시: 종류별 한 문장 (INSERT ... ON CONFLICT DO UPDATE + 사용자별 보관 개수 초과분 소프트 삭제)
+- 기록은 최대 FLUSH_DELAY_SECONDS 늦게 조회될 수 있음
+- 저장 결과(id, 시각)가 필요한 최근 검색어 저장 API 는 같은 문장으로 즉시 저장 (save_search)
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 첫 기록이 들어온 뒤 플러시까지 모으는 시간 (초)
+FLUSH_DELAY_SECONDS = 2.0
+
+# 종류별 최대 대기 건수
+MAX_PENDING = 5000
+
+# 사용자별 보관 개수 (조회 API 최대 limit 과 동일)
+RECENT_SEARCH_CAP = 50
+RECENT_VIEW_CAP = 50
+
+SearchKey = Tuple[int, str, str]
+ViewKey = Tuple[int, int]
+
+# 새 기록은 모두 기존 기록보다 최신이므로, 사용자별로 (보관 개수 - 새 기록 수) 를 넘는 기존 기록을 소프트 삭제
+# 결과: upsert 된 행 + 소프트 삭제한 행 수 (trimmed)
+_UPSERT_SEARCHES_SQL = text("""
+    WITH incoming AS (
+        SELECT *
+        FROM unnest(
+            CAST(:account_ids AS INTEGER[]),
+            CAST(:search_types AS VARCHAR[]),
+            CAST(:queries AS VARCHAR[]),
+            CAST(:searched_ats AS TIMESTAMP[])
+        ) AS t(account_id, search_type, query, searched_at)
+    ),
+    upserted AS (
+        INSERT INTO recent_searches (account_id, query, search_type, created_at, updated_at, is_deleted)
+        SELECT account_id, query, search_type, searched_at, searched_at, FALSE
+        FROM incoming
+        ON CONFLICT (account_id, search_type, query) WHERE is_deleted = FALSE
+        DO UPDATE SET created_at = EXCLUDED.created_at, updated_at = EXCLUDED.updated_at
+        RETURNING search_id, query, search_type, created_at
+    ),
+    incoming_counts AS (
+        SELECT account_id, COUNT(*) AS cnt FROM incoming GROUP BY account_id
+    ),
+    overflow AS (
+        SELECT ranked.search_id
+        FROM (
+            SELECT r.search_id, r.account_id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY r.account_id
+                       ORDER BY r.created_at DESC NULLS LAST, r.search_id DESC
+                   ) AS rn
+            FROM recent_searches r
+            JOIN incoming_counts c ON c.account_id = r.account_id
+            WHERE r.is_deleted = FALSE
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.account_id = r.account_id
+                    AND i.search_type = r.search_type
+                    AND i.query = r.query
+              )
+        ) ranked
+        JOIN incoming_counts c ON c.account_id = ranked.account_id
+        WHERE ranked.rn > GREATEST(:cap - c.cnt, 0)
+    ),
+    trimmed AS (
+        UPDATE recent_searches
+        SET is_deleted = TRUE, updated_at = NOW()
+        WHERE search_id IN (SELECT search_id FROM overflow)
+          AND is_deleted = FALSE
+        RETURNING search_id
+    )
+    SELECT u.search_id, u.query, u.search_type, u.created_at,
+           (SELECT COUNT(*) FROM trimmed) AS trimmed
+    FROM upserted u
+""")
+
+_UPSERT_VIEWS_SQL = text("""
+    WITH incoming AS (
+        SELECT *
+        FROM unnest(
+            CAST(:account_ids AS INTEGER[]),
+            CAST(:apt_ids AS INTEGER[]),
+            CAST(:viewed_ats AS TIMESTAMP[])
+        ) AS t(account_id, apt_id, viewed_at)
+    ),
+    upserted AS (
+        INSERT INTO recent_views (account_id, apt_id, viewed_at, created_at, updated_at, is_deleted)
+        SELECT account_id, apt_id, viewed_at, viewed_at, viewed_at, FALSE
+        FROM incoming
+        ON CONFLICT (account_id, apt_id) WHERE is_deleted = FALSE
+        DO UPDATE SET viewed_at = EXCLUDED.viewed_at, updated_at = EXCLUDED.updated_at
+        RETURNING view_id, apt_id, viewed_at
+    ),
+    incoming_counts AS (
+        SELECT account_id, COUNT(*) AS cnt FROM incoming GROUP BY account_id
+    ),
+    overflow AS (
+        SELECT ranked.view_id
+        FROM (
+            SELECT r.view_id, r.account_id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY r.account_id
+                       ORDER BY r.viewed_at DESC NULLS LAST, r.view_id DESC
+                   ) AS rn
+            FROM recent_views r
+            JOIN incoming_counts c ON c.account_id = r.account_id
+            WHERE r.is_deleted = FALSE
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.account_id = r.account_id
+                    AND i.apt_id = r.apt_id
+              )
+        ) ranked
+        JOIN incoming_counts c ON c.account_id = ranked.account_id
+        WHERE ranked.rn > GREATEST(:cap - c.cnt, 0)
+    ),
+    trimmed AS (
+        UPDATE recent_views
+        SET is_deleted = TRUE, updated_at = NOW()
+        WHERE view_id IN (SELECT view_id FROM overflow)
+          AND is_deleted = FALSE
+        RETURNING view_id
+    )
+    SELECT u.view_id, u.apt_id, u.viewed_at,
+           (SELECT COUNT(*) FROM trimmed) AS trimmed
+    FROM upserted u
+""")
+
+
+@dataclass
+class RecentActivityMetrics:
+    """기록 버퍼 지표"""
+    recorded: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    flushes: int = 0
+    flushed_searches: int = 0
+    flushed_views: int = 0
+    trimmed: int = 0
+    failures: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+
+    def observe_flush(self, searches: int, views: int, trimmed: int, elapsed: float) -> None:
+        self.flushes += 1
+        self.flushed_searches += searches
+        self.flushed_views += views
+        self.trimmed += trimmed
+        self.last_flush_ms = elapsed * 1000
+        self.max_flush_ms = max(self.max_flush_ms, self.last_flush_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "recorded": self.recorded,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "flushed_searches": self.flushed_searches,
+            "flushed_views": self.flushed_views,
+            "trimmed": self.trimmed,
+            "failures": self.failures,
+            "last_flush_ms": round(self.last_flush_ms, 1),
+            "max_flush_ms": round(self.max_flush_ms, 1),
+        }
+
+
+def _keep_latest(pending: Dict[Any, datetime], cap: int) -> List[Tuple[Any, datetime]]:
+    """사용자별로 최신 cap 건만 남김 (키의 첫 항목이 account_id)"""
+    per_account: Dict[int, List[Tuple[Any, datetime]]] = {}
+    for key, at in pending.items():
+        per_account.setdefault(key[0], []).append((key, at))
+    rows: List[Tuple[Any, datetime]] = []
+    for items in per_account.values():
+        if len(items) > cap:
+            items.sort(key=lambda item: item[1], reverse=True)
+            items = items[:cap]
+        rows.extend(items)
+    return rows
+
+
+def _trimmed_count(rows: List[Any]) -> int:
+    """upsert 결과 행에 붙은 소프트 삭제 건수"""
+    return int(rows[0].trimmed or 0) if rows else 0
+
+
+class RecentActivityBuffer:
+    """
+    최근 검색어/최근 본 아파트 기록 버퍼
+
+    Args:
+        flush_delay: 첫 기록이 들어온 뒤 플러시까지 기다리는 시간 (초)
+        max_pending: 종류별 최대 대기 건수
+        search_cap: 사용자별 최근 검색어 보관 개수
+        view_cap: 사용자별 최근 본 아파트 보관 개수
+    """
+
+    def __init__(
+        self,
+        flush_delay: float = FLUSH_DELAY_SECONDS,
+        max_pending: int = MAX_PENDING,
+        search_cap: int = RECENT_SEARCH_CAP,
+        view_cap: int = RECENT_VIEW_CAP,
+    ):
+        self.flush_delay = flush_delay
+        self.max_pending = max(1, max_pending)
+        self.search_cap = search_cap
+        self.view_cap = view_cap
+        self._searches: Dict[SearchKey, datetime] = {}
+        self._views: Dict[ViewKey, datetime] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._metrics = RecentActivityMetrics()
+
+    def record_search(self, account_id: int, query: str, search_type: str = "apartment") -> None:
+        """최근 검색어 기록 (DB 저장은 플러시 때)"""
+        self._record(self._searches, (account_id, search_type, query))
+
+    def record_view(self, account_id: int, apt_id: int) -> None:
+        """최근 본 아파트 기록 (DB 저장은 플러시 때)"""
+        self._record(self._views, (account_id, apt_id))
+
+    async def save_search(
+        self,
+        db: AsyncSession,
+        account_id: int,
+        query: str,
+        search_type: str = "apartment"
+    ) -> Any:
+        """
+        최근 검색어 즉시 저장 (플러시와 같은 upsert + 보관 개수 정리)
+
+        Returns:
+            저장된 행 (search_id, query, search_type, created_at)
+        """
+        key = (account_id, search_type, query)
+        self._searches.pop(key, None)
+        result = await db.execute(_UPSERT_SEARCHES_SQL, {
+            "account_ids": [account_id],
+            "search_types": [search_type],
+            "queries": [query],
+            "searched_ats": [datetime.utcnow()],
+            "cap": self.search_cap,
+        })
+        row = result.fetchone()
+        await db.commit()
+        return row
+
+    def _record(self, pending: Dict[Any, datetime], key: Any) -> None:
+        self._metrics.recorded += 1
+        if key in pending:
+            self._metrics.coalesced += 1
+        elif len(pending) >= self.max_pending:
+            self._metrics.dropped += 1
+            return
+        pending[key] = datetime.utcnow()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        # 플러시 중 새로 들어온 기록도 같은 태스크에서 이어서 처리
+        while self._searches or self._views:
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        대기 중인 기록을 종류별 한 문장으로 저장
+
+        Returns:
+            저장한 기록 수 (실패 시 0)
+        """
+        if not self._searches and not self._views:
+            return 0
+
+        searches, self._searches = self._searches, {}
+        views, self._views = self._views, {}
+        search_rows = _keep_latest(searches, self.search_cap)
+        view_rows = _keep_latest(views, self.view_cap)
+
+        started = time.perf_counter()
+        trimmed = 0
+        try:
+            async with AsyncSessionLocal() as db:
+                if search_rows:
+                    result = await db.execute(_UPSERT_SEARCHES_SQL, {
+                        "account_ids": [key[0] for key, _ in search_rows],
+                        "search_types": [key[1] for key, _ in search_rows],
+                        "queries": [key[2] for key, _ in search_rows],
+                        "searched_ats": [at for _, at in search_rows],
+                        "cap": self.search_cap,
+                    })
+                    trimmed += _trimmed_count(result.fetchall())
+                if view_rows:
+                    result = await db.execute(_UPSERT_VIEWS_SQL, {
+                        "account_ids": [key[0] for key, _ in view_rows],
+                        "apt_ids": [key[1] for key, _ in view_rows],
+                        "viewed_ats": [at for _, at in view_rows],
+                        "cap": self.view_cap,
+                    })
+                    trimmed += _trimmed_count(result.fetchall())
+                await db.commit()
+        except Exception as e:
+            # 재시도하지 않음 (기록은 부가 기능, 같은 배치가 계속 실패하는 것을 방지)
+            self._metrics.failures += 1
+            logger.warning(
+                f" 최근 기록 플러시 실패: 검색어 {len(search_rows)}건, 조회 {len(view_rows)}건 - "
+                f"{type(e).__name__}: {e}"
+            )
+            return 0
+
+        elapsed = time.perf_counter() - started
+        self._metrics.observe_flush(len(search_rows), len(view_rows), trimmed, elapsed)
+        logger.debug(
+            f" 최근 기록 플러시: 검색어 {len(search_rows)}건, 조회 {len(view_rows)}건, "
+            f"초과분 소프트 삭제 {trimmed}건, {elapsed * 1000:.1f}ms"
+        )
+        return len(search_rows) + len(view_rows)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """버퍼 지표"""
+        return {
+            "pending_searches": len(self._searches),
+            "pending_views": len(self._views),
+            "max_pending": self.max_pending,
+            "flush_delay": self.flush_delay,
+            **self._metrics.to_dict(),
+        }
+
+    def reset_metrics(self) -> None:
+        self._metrics = RecentActivityMetrics()
+
+
+# 프로세스 공용 기록 버퍼
+recent_activity_buffer = RecentActivityBuffer()
@@ -9,6 +9,8 @@
 - 필요한 컬럼만 SELECT하여 데이터 전송량 감소
 - pg_trgm % 연산자 사용으로 GIN 인덱스 활용 (similarity() 함수 대신)
 - SET pg_trgm.similarity_threshold 제거 (세션 레벨 설정 오버헤드 방지)
+- 메모리 자동완성 색인(services/search_index.py)이 준비되면 DB 대신 색인으로 prefix/초성 검색,
+  색인에서 결과가 없을 때만 pg_trgm 유사도 검색
 """
 from typing import List, Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +20,7 @@ from sqlalchemy.sql import text
 from app.models.apartment import Apartment
 from app.models.apart_detail import ApartDetail
 from app.models.state import State
+from app.services.search_index import apartment_search_index
 from app.utils.search_utils import normalize_apt_name_py
 
 
@@ -42,6 +45,7 @@ class SearchService:
         """
         아파트명 또는 주소로 검색 (최적화된 2단계 검색)
         
+        0단계: 메모리 자동완성 색인 (준비된 경우, 결과가 없을 때만 유사도 검색)
         1단계: 빠른 LIKE 검색 (인덱스 활용)
         2단계: 1단계 결과가 부족하면 pg_trgm 유사도 검색
         
@@ -62,6 +66,15 @@ class SearchService:
         # 검색어 정규화
         normalized_q = normalize_apt_name_py(query)
         
+        # ===== 0단계: 메모리 자동완성 색인 (prefix + 초성 + 자모) =====
+        # 색인이 준비되지 않았으면 None → 기존 DB 검색
+        index_results = apartment_search_index.search(query, limit)
+        if index_results:
+            return index_results
+        if index_results is not None:
+            # 색인에 prefix 매칭이 없으면 LIKE 검색도 결과가 없으므로 유사도 검색만 수행
+            return await self._similarity_search(db, query, normalized_q, threshold, limit, set())
+        
         # ===== 1단계: 빠른 PREFIX 검색 (인덱스 활용) =====
         # lower(text) + text_pattern_ops 인덱스 활용
         fast_results = await self._fast_like_search(db, query, normalized_q, limit)
@@ -0,0 +1,459 @@
+"""
+아파트 검색 자동완성 색인 (워커별 메모리)
+
+/search/apartments 는 키 입력마다 호출되므로 DB ILIKE + 유사도 쿼리 대신
+apartments + apart_details 로 만든 정렬 배열에서 이진 탐색(bisect)으로 prefix 검색합니다.
+
+- 이름: normalize_apt_name_py 로 정규화 후 자모 분해 키 → 조합 중인 입력("롯데캐ㅅ", "롯데캣")도 매칭
+- 초성: "ㄹㄷㅋㅅ" → 롯데캐슬
+- 이름/주소의 어절 시작 위치마다 키 추가 ("팰리스" → 래미안 대치 팰리스, "역삼동" → 서울특별시 강남구 역삼동 ...)
+- 갱신: SEARCH_INDEX_REFRESH_INTERVAL 마다 신규/수정 행(apt_id, apt_detail_id, updated_at 기준)만 읽어 반영하고,
+  변경이 많거나 FULL_REBUILD_INTERVAL 이 지나면 전체 재구성 (updated_at 없이 바뀐 행/삭제 반영)
+- 색인이 준비되지 않았으면 search() 가 None 을 반환하므로 호출 측은 기존 DB 검색을 사용
+"""
+import asyncio
+import logging
+import re
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import select, func, and_, or_, union
+
+from app.core.config import settings
+from app.models.apartment import Apartment
+from app.models.apart_detail import ApartDetail
+from app.utils.search_utils import (
+    normalize_apt_name_py,
+    decompose_jamo,
+    extract_chosung,
+    is_chosung_query,
+)
+
+logger = logging.getLogger(__name__)
+
+# 전체 재구성 주기 (초) - updated_at 이 갱신되지 않는 변경/삭제 반영
+FULL_REBUILD_INTERVAL = 6 * 60 * 60
+
+# 한 번에 증분 반영할 최대 아파트 수 (넘으면 전체 재구성)
+INCREMENTAL_LIMIT = 500
+
+# 초기 구성 실패 시 재시도 대기 (초)
+BUILD_RETRY_DELAY = 30.0
+
+# 주소 하나에서 만드는 최대 키 수 (어절 시작 위치)
+MAX_ADDRESS_KEYS = 6
+
+# 키 종류 (검색 시 이 순서대로 우선)
+NAME = "name"
+NAME_TOKEN = "name_token"
+ADDRESS = "address"
+CHOSUNG = "chosung"
+CHOSUNG_TOKEN = "chosung_token"
+
+_KEY_KINDS = (NAME, NAME_TOKEN, ADDRESS, CHOSUNG, CHOSUNG_TOKEN)
+_TEXT_TIERS = (NAME, NAME_TOKEN, ADDRESS)
+_CHOSUNG_TIERS = (CHOSUNG, CHOSUNG_TOKEN)
+
+_TOKEN_SPLIT = re.compile(r"[\s\-\(\)\[\]·]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _ApartmentDoc(NamedTuple):
+    """색인에 보관하는 검색 결과 필드"""
+    apt_name: str
+    kapt_code: Optional[str]
+    region_id: Optional[int]
+    road_address: Optional[str]
+    jibun_address: Optional[str]
+    lat: Optional[float]
+    lng: Optional[float]
+
+
+def _normalize_address(address: str) -> str:
+    return _WHITESPACE.sub("", address.lower())
+
+
+def _doc_keys(doc: _ApartmentDoc) -> Set[Tuple[str, str]]:
+    """아파트 한 건의 (키 종류, 키) 목록"""
+    keys: Set[Tuple[str, str]] = set()
+
+    name = normalize_apt_name_py(doc.apt_name)
+    if name:
+        keys.add((NAME, decompose_jamo(name)))
+        keys.add((CHOSUNG, extract_chosung(name)))
+        tokens = [token for token in _TOKEN_SPLIT.split(doc.apt_name) if token]
+        for i in range(1, len(tokens)):
+            token_key = normalize_apt_name_py("".join(tokens[i:]))
+            if token_key:
+                keys.add((NAME_TOKEN, decompose_jamo(token_key)))
+                keys.add((CHOSUNG_TOKEN, extract_chosung(token_key)))
+
+    for address in (doc.road_address, doc.jibun_address):
+        if not address:
+            continue
+        tokens = address.lower().split()
+        added = 0
+        for i, token in enumerate(tokens):
+            if added >= MAX_ADDRESS_KEYS:
+                break
+            # 번지/건물번호로 시작하는 위치는 제외
+            if i > 0 and token[0].isdigit():
+                continue
+            keys.add((ADDRESS, "".join(tokens[i:])))
+            added += 1
+    return keys
+
+
+class _SortedKeys:
+    """키 정렬 배열 + 같은 위치의 apt_id 배열"""
+
+    __slots__ = ("keys", "ids")
+
+    def __init__(self, pairs: Iterable[Tuple[str, int]] = ()):
+        ordered = sorted(pairs)
+        self.keys: List[str] = [key for key, _ in ordered]
+        self.ids = array("q", (apt_id for _, apt_id in ordered))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, apt_id: int) -> None:
+        pos = bisect_left(self.keys, key)
+        self.keys.insert(pos, key)
+        self.ids.insert(pos, apt_id)
+
+    def remove(self, key: str, apt_id: int) -> None:
+        pos = bisect_left(self.keys, key)
+        while pos < len(self.keys) and self.keys[pos] == key:
+            if self.ids[pos] == apt_id:
+                del self.keys[pos]
+                del self.ids[pos]
+                return
+            pos += 1
+
+    def scan(self, prefix: str, seen: Set[int], found: List[int], limit: int) -> None:
+        """prefix 로 시작하는 키의 apt_id 를 limit 개까지 순서대로 수집 (중복 제외)"""
+        keys = self.keys
+        pos = bisect_left(keys, prefix)
+        while pos < len(keys) and len(found) < limit:
+            if not keys[pos].startswith(prefix):
+                break
+            apt_id = self.ids[pos]
+            if apt_id not in seen:
+                seen.add(apt_id)
+                found.append(apt_id)
+            pos += 1
+
+
+@dataclass
+class SearchIndexMetrics:
+    """검색 색인 지표"""
+    queries: int = 0
+    answered: int = 0
+    full_builds: int = 0
+    incremental_updates: int = 0
+    updated_apartments: int = 0
+    failures: int = 0
+    last_build_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "answered": self.answered,
+            "full_builds": self.full_builds,
+            "incremental_updates": self.incremental_updates,
+            "updated_apartments": self.updated_apartments,
+            "failures": self.failures,
+            "last_build_ms": round(self.last_build_ms, 1),
+        }
+
+
+class _IndexSnapshot:
+    """전체 재구성 결과 (스레드에서 만든 뒤 한 번에 교체)"""
+
+    def __init__(self, docs: Dict[int, _ApartmentDoc]):
+        self.docs = docs
+        pairs: Dict[str, List[Tuple[str, int]]] = {kind: [] for kind in _KEY_KINDS}
+        for apt_id, doc in docs.items():
+            for kind, key in _doc_keys(doc):
+                pairs[kind].append((key, apt_id))
+        self.tables = {kind: _SortedKeys(pairs[kind]) for kind in _KEY_KINDS}
+
+
+class ApartmentSearchIndex:
+    """
+    아파트 자동완성 색인
+
+    Args:
+        refresh_interval: 증분 갱신 주기 (초)
+        full_rebuild_interval: 전체 재구성 주기 (초)
+        incremental_limit: 증분 반영 최대 아파트 수
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = settings.SEARCH_INDEX_REFRESH_INTERVAL,
+        full_rebuild_interval: float = FULL_REBUILD_INTERVAL,
+        incremental_limit: int = INCREMENTAL_LIMIT,
+    ):
+        self.refresh_interval = refresh_interval
+        self.full_rebuild_interval = full_rebuild_interval
+        self.incremental_limit = incremental_limit
+        self._docs: Dict[int, _ApartmentDoc] = {}
+        self._tables: Dict[str, _SortedKeys] = {kind: _SortedKeys() for kind in _KEY_KINDS}
+        self._ready = False
+        self._max_apt_id = 0
+        self._max_detail_id = 0
+        self._updated_watermark = None
+        self._last_full_build = 0.0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._metrics = SearchIndexMetrics()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    # ===== 조회 =====
+
+    def search(self, query: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        prefix 자동완성 검색
+
+        Returns:
+            검색 결과 목록 (SearchService._format_results 와 같은 형식), 색인이 준비되지 않았으면 None
+        """
+        if not self._ready:
+            return None
+        self._metrics.queries += 1
+
+        name_query = normalize_apt_name_py(query)
+        seen: Set[int] = set()
+        found: List[int] = []
+        if is_chosung_query(name_query):
+            for kind in _CHOSUNG_TIERS:
+                self._tables[kind].scan(name_query, seen, found, limit)
+        else:
+            prefixes = {
+                NAME: decompose_jamo(name_query),
+                NAME_TOKEN: decompose_jamo(name_query),
+                ADDRESS: _normalize_address(query),
+            }
+            for kind in _TEXT_TIERS:
+                if prefixes[kind]:
+                    self._tables[kind].scan(prefixes[kind], seen, found, limit)
+
+        if found:
+            self._metrics.answered += 1
+        return [self._format(apt_id, self._docs[apt_id]) for apt_id in found]
+
+    @staticmethod
+    def _format(apt_id: int, doc: _ApartmentDoc) -> Dict[str, Any]:
+        location = None
+        if doc.lat is not None and doc.lng is not None:
+            location = {"lat": doc.lat, "lng": doc.lng}
+        return {
+            "apt_id": apt_id,
+            "apt_name": doc.apt_name,
+            "kapt_code": doc.kapt_code or None,
+            "region_id": doc.region_id or None,
+            "address": doc.road_address or doc.jibun_address or None,
+            "location": location,
+        }
+
+    # ===== 구성/갱신 =====
+
+    @staticmethod
+    def _doc_query():
+        return (
+            select(
+                Apartment.apt_id,
+                Apartment.apt_name,
+                Apartment.kapt_code,
+                Apartment.region_id,
+                Apartment.is_deleted,
+                ApartDetail.road_address,
+                ApartDetail.jibun_address,
+                func.ST_X(ApartDetail.geometry).label("lng"),
+                func.ST_Y(ApartDetail.geometry).label("lat"),
+            )
+            .outerjoin(
+                ApartDetail,
+                and_(
+                    Apartment.apt_id == ApartDetail.apt_id,
+                    ApartDetail.is_deleted == False
+                )
+            )
+        )
+
+    @staticmethod
+    def _row_to_doc(row) -> _ApartmentDoc:
+        return _ApartmentDoc(
+            apt_name=row.apt_name,
+            kapt_code=row.kapt_code,
+            region_id=row.region_id,
+            road_address=row.road_address,
+            jibun_address=row.jibun_address,
+            lat=float(row.lat) if row.lat is not None else None,
+            lng=float(row.lng) if row.lng is not None else None,
+        )
+
+    async def _load_watermarks(self, db) -> Tuple[int, int, Any]:
+        apt_row = (await db.execute(
+            select(func.max(Apartment.apt_id), func.max(Apartment.updated_at))
+        )).one()
+        detail_row = (await db.execute(
+            select(func.max(ApartDetail.apt_detail_id), func.max(ApartDetail.updated_at))
+        )).one()
+        updated = [value for value in (apt_row[1], detail_row[1]) if value is not None]
+        return apt_row[0] or 0, detail_row[0] or 0, max(updated) if updated else None
+
+    async def rebuild(self) -> int:
+        """전체 재구성 (구성 중에는 이전 색인으로 응답)"""
+        from app.db.session import AsyncSessionLocal
+
+        async with self._lock:
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as db:
+                # 색인 구성 중 들어온 변경은 다음 증분 갱신에서 반영되도록 워터마크를 먼저 읽음
+                max_apt_id, max_detail_id, watermark = await self._load_watermarks(db)
+                result = await db.execute(self._doc_query().where(Apartment.is_deleted == False))
+                rows = result.all()
+
+            docs = {row.apt_id: self._row_to_doc(row) for row in rows}
+            # 키 생성/정렬은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+            snapshot = await asyncio.to_thread(_IndexSnapshot, docs)
+
+            self._docs = snapshot.docs
+            self._tables = snapshot.tables
+            self._max_apt_id = max_apt_id
+            self._max_detail_id = max_detail_id
+            self._updated_watermark = watermark
+            self._last_full_build = time.monotonic()
+            self._ready = True
+
+            elapsed = time.perf_counter() - started
+            self._metrics.full_builds += 1
+            self._metrics.last_build_ms = elapsed * 1000
+            logger.info(
+                f" 아파트 검색 색인 구성 완료: {len(self._docs)}개 아파트, "
+                f"{sum(len(table) for table in self._tables.values())}개 키, {elapsed:.2f}초"
+            )
+            return len(self._docs)
+
+    async def refresh(self) -> int:
+        """
+        신규/수정 아파트만 색인에 반영
+
+        Returns:
+            반영한 아파트 수
+        """
+        if not self._ready or time.monotonic() - self._last_full_build >= self.full_rebuild_interval:
+            await self.rebuild()
+            return len(self._docs)
+
+        from app.db.session import AsyncSessionLocal
+
+        async with self._lock:
+            async with AsyncSessionLocal() as db:
+                max_apt_id, max_detail_id, watermark = await self._load_watermarks(db)
+                apt_changed = Apartment.apt_id > self._max_apt_id
+                detail_changed = ApartDetail.apt_detail_id > self._max_detail_id
+                if self._updated_watermark is not None:
+                    apt_changed = or_(apt_changed, Apartment.updated_at > self._updated_watermark)
+                    detail_changed = or_(detail_changed, ApartDetail.updated_at > self._updated_watermark)
+                changed_query = union(
+                    select(Apartment.apt_id).where(apt_changed),
+                    select(ApartDetail.apt_id).where(detail_changed),
+                )
+                changed_ids = [row[0] for row in (await db.execute(changed_query)).all()]
+
+                if len(changed_ids) > self.incremental_limit:
+                    rows = None
+                elif changed_ids:
+                    result = await db.execute(self._doc_query().where(Apartment.apt_id.in_(changed_ids)))
+                    rows = result.all()
+                else:
+                    rows = []
+
+            if rows is None:
+                logger.info(f" 아파트 검색 색인: 변경 {len(changed_ids)}건 - 전체 재구성")
+            else:
+                self._apply(changed_ids, rows)
+                self._max_apt_id = max_apt_id
+                self._max_detail_id = max_detail_id
+                self._updated_watermark = watermark
+                if changed_ids:
+                    self._metrics.incremental_updates += 1
+                    self._metrics.updated_apartments += len(changed_ids)
+                    logger.debug(f" 아파트 검색 색인 증분 반영: {len(changed_ids)}개 아파트")
+                return len(changed_ids)
+
+        await self.rebuild()
+        return len(self._docs)
+
+    def _apply(self, changed_ids: List[int], rows) -> None:
+        """변경된 아파트의 이전 키를 지우고 새 키를 삽입"""
+        latest = {row.apt_id: row for row in rows}
+        for apt_id in changed_ids:
+            old_doc = self._docs.pop(apt_id, None)
+            if old_doc is not None:
+                for kind, key in _doc_keys(old_doc):
+                    self._tables[kind].remove(key, apt_id)
+            row = latest.get(apt_id)
+            if row is None or row.is_deleted:
+                continue
+            doc = self._row_to_doc(row)
+            self._docs[apt_id] = doc
+            for kind, key in _doc_keys(doc):
+                self._tables[kind].add(key, apt_id)
+
+    # ===== 백그라운드 갱신 =====
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._ready:
+                    await asyncio.sleep(self.refresh_interval)
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._metrics.failures += 1
+                logger.warning(f" 아파트 검색 색인 갱신 실패 (기존 색인/DB 검색 유지): {type(e).__name__} - {e}")
+                if not self._ready:
+                    await asyncio.sleep(BUILD_RETRY_DELAY)
+
+    def start(self) -> None:
+        """색인 구성 + 주기 갱신 시작 (앱 시작 시, 구성 전에는 DB 검색 사용)"""
+        if not settings.SEARCH_INDEX_ENABLED or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기 갱신 종료 (앱 종료 시)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._task = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """검색 색인 지표"""
+        return {
+            "enabled": settings.SEARCH_INDEX_ENABLED,
+            "ready": self._ready,
+            "apartments": len(self._docs),
+            "keys": {kind: len(table) for kind, table in self._tables.items()},
+            **self._metrics.to_dict(),
+        }
+
+
+# 워커 공용 인스턴스
+apartment_search_index = ApartmentSearchIndex()
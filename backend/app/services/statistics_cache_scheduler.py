@@ -10,6 +10,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import async_session
 from app.services.statistics_cache_service import statistics_cache_service
+from app.services.monthly_region_stats_service import monthly_region_stats_service
+from app.services.apartment_price_summary_service import apartment_price_summary_service
+from app.services.percentile_snapshot import percentile_snapshot_store
+from app.services.apartment_neighbor_service import apartment_neighbor_service
+from app.utils.cache import invalidate_cache_tags, STATS_GLOBAL_TAG
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,16 @@ async def precompute_statistics_task():
     """통계 사전 계산 작업"""
     logger.info("통계 사전 계산 작업 시작")
     
+    # 월별 지역 집계 전체 재집계 (수집 후 증분 갱신이 실패했거나 수동으로 고친 데이터 반영)
+    # 사전 계산이 새 집계를 읽도록 먼저 실행
+    try:
+        async with async_session() as db:
+            results = await monthly_region_stats_service.rebuild_all(db)
+            logger.info(f"월별 지역 집계 재집계 완료: {results}")
+        await invalidate_cache_tags(STATS_GLOBAL_TAG)
+    except Exception as e:
+        logger.error(f"월별 지역 집계 재집계 실패: {e}", exc_info=True)
+    
     try:
         async with async_session() as db:
             results = await statistics_cache_service.precompute_all_statistics(
@@ -28,6 +43,24 @@ async def precompute_statistics_task():
             logger.info(f"통계 사전 계산 완료: {results}")
     except Exception as e:
         logger.error(f"통계 사전 계산 실패: {e}", exc_info=True)
+    
+    # 아파트별 가격 요약의 기간 집계(최근 6/12개월) 기준일을 오늘로 맞춤
+    try:
+        async with async_session() as db:
+            results = await apartment_price_summary_service.rebuild_all(db)
+            logger.info(f"아파트 가격 요약 재계산 완료: {results}")
+            # 평당가 분포 스냅샷도 새 요약 기준으로 재구성
+            await percentile_snapshot_store.rebuild(db)
+    except Exception as e:
+        logger.error(f"아파트 가격 요약 재계산 실패: {e}", exc_info=True)
+    
+    # 주변 단지 목록 전체 재계산 (geometry 일괄 업데이트 외 경로로 바뀐 위치/삭제된 단지 반영)
+    try:
+        async with async_session() as db:
+            rows = await apartment_neighbor_service.rebuild_all(db)
+            logger.info(f"주변 단지 목록 재계산 완료: {rows}행")
+    except Exception as e:
+        logger.error(f"주변 단지 목록 재계산 실패: {e}", exc_info=True)
 
 
 async def run_statistics_scheduler():
@@ -13,7 +13,14 @@ from app.models.sale import Sale
 from app.models.rent import Rent
 from app.models.apartment import Apartment
 from app.models.state import State
-from app.utils.cache import get_from_cache, set_to_cache, generate_hash_key, delete_cache_pattern
+from app.utils.cache import (
+    get_from_cache,
+    set_to_cache,
+    generate_hash_key,
+    tag_cache_key,
+    invalidate_cache_tags,
+    STATS_GLOBAL_TAG,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,8 +86,11 @@ class StatisticsCacheService:
         Returns:
             캐시된 통계 데이터 또는 None
         """
-        cache_key = self.generate_cache_key(
-            endpoint, region_type, city_name, transaction_type, max_years, **kwargs
+        cache_key = await tag_cache_key(
+            self.generate_cache_key(
+                endpoint, region_type, city_name, transaction_type, max_years, **kwargs
+            ),
+            STATS_GLOBAL_TAG
         )
         
         cached_data = await get_from_cache(cache_key)
@@ -108,8 +118,11 @@ class StatisticsCacheService:
         Returns:
             저장 성공 여부
         """
-        cache_key = self.generate_cache_key(
-            endpoint, region_type, city_name, transaction_type, max_years, **kwargs
+        cache_key = await tag_cache_key(
+            self.generate_cache_key(
+                endpoint, region_type, city_name, transaction_type, max_years, **kwargs
+            ),
+            STATS_GLOBAL_TAG
         )
         
         success = await set_to_cache(cache_key, data, ttl=ttl)
@@ -419,48 +432,23 @@ class StatisticsCacheService:
         """
         통계 캐시 무효화
         
+        통계 캐시 키는 모두 stats:global 태그 세대 번호만 포함하므로
+        조건과 관계없이 태그 하나를 올려 전체 통계 캐시를 무효화합니다 (SCAN 없음).
+        인자는 호출 측 호환을 위해 유지하며 무효화 범위에는 영향이 없습니다.
+        
         Args:
-            region_id: 지역 ID (해당 지역의 모든 통계 캐시 삭제)
-            apt_id: 아파트 ID (해당 아파트 관련 통계 캐시 삭제)
-            transaction_type: 거래 유형 (해당 거래 유형의 모든 통계 캐시 삭제)
-            city_name: 시도명 (해당 도시의 모든 통계 캐시 삭제)
+            region_id: 지역 ID
+            apt_id: 아파트 ID
+            transaction_type: 거래 유형
+            city_name: 시도명
         
         Returns:
-            삭제된 캐시 개수
+            무효화한 태그 개수
         """
-        patterns = []
-        
-        # 지역별 통계 캐시 무효화
-        if region_id:
-            # 해당 region_id를 가진 모든 통계 캐시 삭제
-            # 주의: region_id로 직접 필터링된 통계는 없을 수 있음
-            # 대신 region_id를 통해 city_name을 찾아서 삭제
-            patterns.append(f"realestate:statistics:*")
-        
-        # 거래 유형별 통계 캐시 무효화
-        if transaction_type:
-            patterns.append(f"realestate:statistics:*")
-        
-        # 도시별 통계 캐시 무효화
-        if city_name:
-            # 지방5대광역시의 특정 도시 통계 캐시 삭제
-            patterns.append(f"realestate:statistics:*")
-        
-        # 아파트별 통계 캐시는 일반적으로 없으므로 스킵
-        
-        # 모든 통계 캐시 삭제 (데이터 대량 업데이트 시)
-        if not any([region_id, apt_id, transaction_type, city_name]):
-            patterns.append(f"realestate:statistics:*")
-        
-        # 패턴 매칭으로 삭제
-        total_deleted = 0
-        for pattern in set(patterns):  # 중복 제거
-            deleted = await delete_cache_pattern(pattern)
-            total_deleted += deleted
-        
-        logger.info(f"통계 캐시 무효화 완료: {total_deleted}개 삭제")
+        invalidated = await invalidate_cache_tags(STATS_GLOBAL_TAG)
+        logger.info(f"통계 캐시 무효화 완료: 태그 {STATS_GLOBAL_TAG}")
         
-        return total_deleted
+        return 1 if invalidated else 0
 
 
 # 서비스 인스턴스
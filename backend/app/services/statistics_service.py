@@ -22,7 +22,14 @@ from app.schemas.statistics import (
     HPIHeatmapResponse,
     HPIHeatmapDataPoint,
 )
-from app.utils.cache import get_from_cache, set_to_cache, build_cache_key, generate_hash_key
+from app.utils.cache import (
+    get_from_cache,
+    set_to_cache,
+    build_cache_key,
+    generate_hash_key,
+    tag_cache_key,
+    STATS_GLOBAL_TAG,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,11 +71,14 @@ async def get_rvol(
     RVOL(상대 거래량) 조회
     """
     # 해시 키 사용
-    cache_key = generate_hash_key(
-        "statistics:rvol",
-        transaction_type=transaction_type,
-        current_period=current_period_months,
-        average_period=average_period_months
+    cache_key = await tag_cache_key(
+        generate_hash_key(
+            "statistics:rvol",
+            transaction_type=transaction_type,
+            current_period=current_period_months,
+            average_period=average_period_months
+        ),
+        STATS_GLOBAL_TAG
     )
     
     cached_data = await get_from_cache(cache_key)
@@ -203,7 +213,7 @@ async def get_quadrant(
     """
     4분면 분류 조회
     """
-    cache_key = generate_hash_key("statistics:quadrant", period_months=period_months)
+    cache_key = await tag_cache_key(generate_hash_key("statistics:quadrant", period_months=period_months), STATS_GLOBAL_TAG)
     
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
@@ -376,11 +386,14 @@ async def get_hpi(
     """
     주택가격지수(HPI) 조회
     """
-    cache_key = generate_hash_key(
-        "statistics:hpi",
-        region_id=region_id,
-        index_type=index_type,
-        months=months
+    cache_key = await tag_cache_key(
+        generate_hash_key(
+            "statistics:hpi",
+            region_id=region_id,
+            index_type=index_type,
+            months=months
+        ),
+        STATS_GLOBAL_TAG
     )
     
     cached_data = await get_from_cache(cache_key)
@@ -499,7 +512,7 @@ async def get_hpi_heatmap(
     """
     주택가격지수 히트맵 조회
     """
-    cache_key = generate_hash_key("statistics:hpi_heatmap", index_type=index_type)
+    cache_key = await tag_cache_key(generate_hash_key("statistics:hpi_heatmap", index_type=index_type), STATS_GLOBAL_TAG)
     
     cached_data = await get_from_cache(cache_key)
     if cached_data is not None:
@@ -610,12 +623,15 @@ async def get_statistics_summary(
     """
     통계 요약 조회
     """
-    cache_key = generate_hash_key(
-        "statistics:summary",
-        transaction_type=transaction_type,
-        current_period=current_period_months,
-        average_period=average_period_months,
-        quadrant_period=quadrant_period_months
+    cache_key = await tag_cache_key(
+        generate_hash_key(
+            "statistics:summary",
+            transaction_type=transaction_type,
+            current_period=current_period_months,
+            average_period=average_period_months,
+            quadrant_period=quadrant_period_months
+        ),
+        STATS_GLOBAL_TAG
     )
     
     cached_data = await get_from_cache(cache_key)
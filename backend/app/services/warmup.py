@@ -73,19 +73,19 @@ async def preload_all_statistics():
     
     async def run_dash_summary(trans_type: str, months: int):
         async with AsyncSessionLocal() as db:
-            return await get_dashboard_summary(trans_type, months, db)
+            return await get_dashboard_summary(trans_type, months, db=db)
     
     async def run_dash_trends(trans_type: str, months: int):
         async with AsyncSessionLocal() as db:
-            return await get_regional_trends(trans_type, months, db)
+            return await get_regional_trends(trans_type, months, db=db)
     
     async def run_dash_heatmap(trans_type: str, months: int):
         async with AsyncSessionLocal() as db:
-            return await get_regional_heatmap(trans_type, months, db)
+            return await get_regional_heatmap(trans_type, months, db=db)
     
     async def run_dash_rankings(trans_type: str, days: int, months: int):
         async with AsyncSessionLocal() as db:
-            return await get_dashboard_rankings(trans_type, days, months, db)
+            return await get_dashboard_rankings(trans_type, days, months, db=db)
     
     async def run_transaction_volume(region_type: str, transaction_type: str, max_years: int):
         """거래량 통계 프리로딩"""
@@ -126,7 +126,7 @@ async def preload_all_statistics():
             for apt_id in popular_apt_ids:
                 try:
                     async with AsyncSessionLocal() as detail_db:
-                        await get_apartment_detail(apt_id, detail_db)
+                        await get_apartment_detail(apt_id, db=detail_db)
                 except Exception as e:
                     logger.debug(f" [Warmup] 아파트 {apt_id} 상세정보 캐싱 실패: {e}")
             
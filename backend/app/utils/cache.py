@@ -13,10 +13,14 @@ import orjson
 import logging
 import asyncio
 import hashlib
-from typing import Optional, Any, List, Dict
+import secrets
+import time
+from contextvars import ContextVar
+from typing import Optional, Any, List, Dict, Callable, Awaitable, Iterable, Set
 from datetime import timedelta
 
 from app.core.redis import get_redis_client
+from app.utils.local_cache import local_cache, MISS, L1_CACHE_PREFIXES, DERIVED_KEY_SUFFIXES
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,9 @@ DEFAULT_TTL = 3600  # 1시간
 # 캐시 작업 타임아웃 (빠른 실패)
 CACHE_OPERATION_TIMEOUT = 1.0  # 1초
 
+# 패턴 삭제 시 DEL 한 번에 보낼 키 수
+PATTERN_DELETE_BATCH_SIZE = 500
+
 # 캐시 실패 카운터 (로깅 최적화용)
 _cache_fail_count = 0
 _cache_fail_log_threshold = 10  # 10회 실패마다 1회 로깅
@@ -83,11 +90,19 @@ def build_cache_key(*parts: str) -> str:
     return ":".join(key_parts)
 
 
+def _derived_keys(key: str) -> List[str]:
+    """원본 키가 바뀌면 함께 지워야 하는 파생 키 (집계 네임스페이스만)"""
+    if not key.startswith(L1_CACHE_PREFIXES):
+        return []
+    return [key + suffix for suffix in DERIVED_KEY_SUFFIXES]
+
+
 async def get_from_cache(key: str) -> Optional[Any]:
     """
     Redis에서 캐시된 값을 조회합니다
     
     성능 최적화:
+    - L1 대상 키(대시보드/통계/지도 집계)는 프로세스 내 캐시를 먼저 조회
     - orjson 사용 (고속 JSON 처리)
     - 타임아웃 1초 (빠른 실패)
     - Redis 연결 실패 시 None 반환 (graceful degradation)
@@ -101,6 +116,10 @@ async def get_from_cache(key: str) -> Optional[Any]:
     """
     global _cache_fail_count
     
+    local_value = local_cache.get(key)
+    if local_value is not MISS:
+        return _unwrap_swr(local_value)
+    
     try:
         redis_client = await get_redis_client()
         if redis_client is None:
@@ -117,7 +136,9 @@ async def get_from_cache(key: str) -> Optional[Any]:
         
         # JSON 디코딩 (orjson 사용)
         _cache_fail_count = 0  # 성공 시 카운터 리셋
-        return orjson.loads(cached_value)
+        value = orjson.loads(cached_value)
+        local_cache.put(key, value, size=len(cached_value))
+        return _unwrap_swr(value)
     except asyncio.TimeoutError:
         _cache_fail_count += 1
         if _cache_fail_count % _cache_fail_log_threshold == 1:
@@ -165,11 +186,26 @@ async def set_to_cache(
         serialized_value = orjson.dumps(value)
         
         # Redis에 저장 (TTL 설정) - 타임아웃 적용
-        await asyncio.wait_for(
-            redis_client.setex(key, ttl, serialized_value),
-            timeout=CACHE_OPERATION_TIMEOUT
-        )
+        derived_keys = _derived_keys(key)
+        if derived_keys:
+            # 파생 키(직렬화된 응답 등)는 이전 값 기준이므로 같은 왕복에서 삭제
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized_value)
+            pipe.delete(*derived_keys)
+            await asyncio.wait_for(pipe.execute(), timeout=CACHE_OPERATION_TIMEOUT)
+        else:
+            await asyncio.wait_for(
+                redis_client.setex(key, ttl, serialized_value),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
         _cache_fail_count = 0  # 성공 시 카운터 리셋
+        
+        # L1 대상 키는 로컬에 저장하고 다른 워커의 이전 값은 무효화
+        if local_cache.handles(key):
+            local_cache.invalidate(key)
+            # Redis 에서 읽은 것과 같은 형태(JSON 타입)로 보관
+            local_cache.put(key, orjson.loads(serialized_value), size=len(serialized_value), ttl=ttl)
+            await local_cache.publish_invalidation(key=key)
         return True
     except asyncio.TimeoutError:
         _cache_fail_count += 1
@@ -183,6 +219,104 @@ async def set_to_cache(
         return False
 
 
+async def get_many_from_cache(keys: List[str]) -> List[Optional[Any]]:
+    """
+    여러 캐시 키를 한 번에 조회합니다 (MGET, 왕복 1회)
+
+    Args:
+        keys: 캐시 키 목록
+
+    Returns:
+        keys와 같은 순서의 값 목록 (없거나 디코딩 실패한 키는 None)
+    """
+    global _cache_fail_count
+
+    if not keys:
+        return []
+
+    try:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return [None] * len(keys)
+
+        cached_values = await asyncio.wait_for(
+            redis_client.mget(keys),
+            timeout=CACHE_OPERATION_TIMEOUT
+        )
+        _cache_fail_count = 0
+
+        results: List[Optional[Any]] = []
+        for cached_value in cached_values:
+            if cached_value is None:
+                results.append(None)
+                continue
+            try:
+                results.append(_unwrap_swr(orjson.loads(cached_value)))
+            except orjson.JSONDecodeError:
+                results.append(None)
+        return results
+    except asyncio.TimeoutError:
+        _cache_fail_count += 1
+        if _cache_fail_count % _cache_fail_log_threshold == 1:
+            logger.debug(f"⏱ 캐시 일괄 조회 타임아웃 ({len(keys)}개 키)")
+        return [None] * len(keys)
+    except Exception as e:
+        _cache_fail_count += 1
+        if _cache_fail_count % _cache_fail_log_threshold == 1:
+            logger.debug(f" 캐시 일괄 조회 실패 ({len(keys)}개 키): {type(e).__name__} - {e}")
+        return [None] * len(keys)
+
+
+async def set_many_to_cache(
+    items: Dict[str, Any],
+    ttl: int = DEFAULT_TTL
+) -> bool:
+    """
+    여러 값을 한 번에 캐시합니다 (SETEX 파이프라인, 왕복 1회)
+
+    Args:
+        items: {캐시 키: 값}
+        ttl: 캐시 유효 시간 (초 단위, 기본 1시간)
+
+    Returns:
+        bool: 성공 여부
+    """
+    global _cache_fail_count
+
+    if not items:
+        return True
+
+    try:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return False
+
+        pipe = redis_client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.setex(key, ttl, orjson.dumps(value))
+            derived_keys = _derived_keys(key)
+            if derived_keys:
+                pipe.delete(*derived_keys)
+        await asyncio.wait_for(pipe.execute(), timeout=CACHE_OPERATION_TIMEOUT)
+        _cache_fail_count = 0
+        
+        for key in items:
+            if local_cache.handles(key):
+                local_cache.invalidate(key)
+                await local_cache.publish_invalidation(key=key)
+        return True
+    except asyncio.TimeoutError:
+        _cache_fail_count += 1
+        if _cache_fail_count % _cache_fail_log_threshold == 1:
+            logger.debug(f"⏱ 캐시 일괄 저장 타임아웃 ({len(items)}개 키)")
+        return False
+    except Exception as e:
+        _cache_fail_count += 1
+        if _cache_fail_count % _cache_fail_log_threshold == 1:
+            logger.debug(f" 캐시 일괄 저장 실패 ({len(items)}개 키): {type(e).__name__} - {e}")
+        return False
+
+
 async def delete_from_cache(key: str) -> bool:
     """
     Redis에서 캐시를 삭제합니다
@@ -198,7 +332,10 @@ async def delete_from_cache(key: str) -> bool:
         if redis_client is None:
             return False
         
-        deleted_count = await redis_client.delete(key)
+        local_cache.invalidate(key)
+        await local_cache.publish_invalidation(key=key)
+        
+        deleted_count = await redis_client.delete(key, *_derived_keys(key))
         logger.debug(f" 캐시 삭제 성공 (키: {key})")
         return deleted_count > 0
     except Exception as e:
@@ -213,6 +350,9 @@ async def delete_cache_pattern(pattern: str) -> int:
     예: "realestate:favorite:locations:account:1:*" 패턴으로
     해당 계정의 모든 관심 지역 캐시를 삭제
     
+    키스페이스 전체를 SCAN 하므로 자주 호출되는 경로(데이터 수집, ORM 이벤트)에서는
+    invalidate_cache_tags()를 사용하세요.
+    
     Args:
         pattern: 삭제할 캐시 키 패턴 (와일드카드 지원)
     
@@ -224,25 +364,340 @@ async def delete_cache_pattern(pattern: str) -> int:
         if redis_client is None:
             return 0
         
-        # 패턴에 맞는 키 찾기 (타임아웃 적용)
+        local_cache.invalidate_pattern(pattern)
+        await local_cache.publish_invalidation(pattern=pattern)
+        
+        # 패턴에 맞는 키를 배치 단위로 삭제 (개수 제한 없음)
+        deleted_count = 0
         keys = []
-        async for key in redis_client.scan_iter(match=pattern, count=100):
+        async for key in redis_client.scan_iter(match=pattern, count=500):
             keys.append(key)
-            if len(keys) >= 1000:  # 최대 1000개까지만 삭제
-                break
-        
-        if not keys:
-            return 0
+            if len(keys) >= PATTERN_DELETE_BATCH_SIZE:
+                deleted_count += await redis_client.delete(*keys)
+                keys = []
+        if keys:
+            deleted_count += await redis_client.delete(*keys)
         
-        # 일괄 삭제
-        deleted_count = await redis_client.delete(*keys)
-        logger.debug(f" 패턴 캐시 삭제 성공 (패턴: {pattern}, 삭제: {deleted_count}개)")
+        if deleted_count:
+            logger.debug(f" 패턴 캐시 삭제 성공 (패턴: {pattern}, 삭제: {deleted_count}개)")
         return deleted_count
     except Exception as e:
         logger.debug(f" 패턴 캐시 삭제 실패 (패턴: {pattern}): {e}")
         return 0
 
 
+# ============ Stale-While-Revalidate (soft/hard TTL) ============
+#
+# 값을 계산 시각, soft TTL 과 함께 봉투(envelope)로 저장하고 hard TTL 로 SETEX 합니다.
+#   - soft TTL 이전: 그대로 반환
+#   - soft TTL ~ hard TTL: 이전 값을 즉시 반환하고 백그라운드에서 다시 계산
+#   - hard TTL 이후: Redis 에서 만료 (일반 캐시 미스)
+# get_from_cache 는 봉투를 벗겨 값만 반환하므로 같은 키를 일반 조회해도 됩니다.
+
+# 봉투 식별 필드 (값: 계산 시각 epoch 초)
+SWR_ENVELOPE_FIELD = "__swr_computed_at__"
+
+# hard TTL 을 지정하지 않으면 soft TTL 의 배수로 설정
+SWR_HARD_TTL_FACTOR = 2
+
+# 프로세스 간 백그라운드 갱신 중복 방지 락 (초)
+SWR_REFRESH_LOCK_SECONDS = 60
+
+# 락 소유자만 해제 (다른 프로세스가 다시 잡은 락을 지우지 않도록 토큰 비교)
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 현재 태스크가 백그라운드 갱신 중인 키 (이 키는 캐시를 건너뛰고 다시 계산)
+_swr_refresh_key: ContextVar[Optional[str]] = ContextVar("swr_refresh_key", default=None)
+
+# 프로세스 내 진행 중인 갱신 키 / 태스크 참조 (GC 방지)
+_swr_refreshing: Set[str] = set()
+_swr_tasks: Set[asyncio.Task] = set()
+
+
+def _is_swr_envelope(value: Any) -> bool:
+    return isinstance(value, dict) and SWR_ENVELOPE_FIELD in value
+
+
+def _unwrap_swr(value: Any) -> Any:
+    """SWR 봉투면 값만 반환"""
+    if _is_swr_envelope(value):
+        return value.get("value")
+    return value
+
+
+def in_swr_refresh(key: str) -> bool:
+    """현재 태스크가 해당 키를 백그라운드 갱신 중인지 여부"""
+    return _swr_refresh_key.get() == key
+
+
+async def set_swr_to_cache(
+    key: str,
+    value: Any,
+    soft_ttl: int = DEFAULT_TTL,
+    hard_ttl: Optional[int] = None
+) -> bool:
+    """
+    SWR 봉투로 캐시합니다
+    
+    Args:
+        key: 캐시 키
+        value: 캐시할 값 (JSON 직렬화 가능한 객체)
+        soft_ttl: 이 시간이 지나면 stale 로 보고 백그라운드 갱신 (초)
+        hard_ttl: Redis 만료 시간 (초, 기본: soft_ttl * SWR_HARD_TTL_FACTOR)
+    
+    Returns:
+        bool: 성공 여부
+    """
+    hard_ttl = max(hard_ttl or soft_ttl * SWR_HARD_TTL_FACTOR, soft_ttl)
+    envelope = {
+        SWR_ENVELOPE_FIELD: time.time(),
+        "soft_ttl": soft_ttl,
+        "value": value,
+    }
+    return await set_to_cache(key, envelope, ttl=hard_ttl)
+
+
+async def get_swr_from_cache(
+    key: str,
+    refresh: Optional[Callable[[], Awaitable[Any]]] = None
+) -> Optional[Any]:
+    """
+    SWR 캐시 조회
+    
+    soft TTL 이 지난 값도 즉시 반환하고, refresh 가 있으면 백그라운드 갱신을 예약합니다.
+    refresh 는 값을 다시 계산해 set_swr_to_cache 로 저장하는 코루틴 함수입니다
+    (보통 swr_endpoint_refresh 로 엔드포인트를 새 DB 세션으로 다시 호출).
+    
+    Args:
+        key: 캐시 키
+        refresh: 백그라운드 갱신 함수 (없으면 stale 값만 반환)
+    
+    Returns:
+        캐시된 값 또는 None (없거나, 현재 태스크가 이 키를 갱신 중인 경우)
+    """
+    if in_swr_refresh(key):
+        return None
+    
+    global _cache_fail_count
+    
+    entry = local_cache.get(key)
+    try:
+        if entry is MISS:
+            redis_client = await get_redis_client()
+            if redis_client is None:
+                return None
+            
+            cached_value = await asyncio.wait_for(
+                redis_client.get(key),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
+            if cached_value is None:
+                return None
+            
+            _cache_fail_count = 0
+            entry = orjson.loads(cached_value)
+            local_cache.put(key, entry, size=len(cached_value))
+    except Exception as e:
+        _cache_fail_count += 1
+        if _cache_fail_count % _cache_fail_log_threshold == 1:
+            logger.debug(f" SWR 캐시 조회 실패 (키: {key}): {type(e).__name__} - {e}")
+        return None
+    
+    if not _is_swr_envelope(entry):
+        # 일반 SETEX 로 저장된 값 (예: 사전 캐싱) - 만료까지 그대로 사용
+        return entry
+    
+    age = time.time() - float(entry[SWR_ENVELOPE_FIELD] or 0)
+    if refresh is not None and age > float(entry.get("soft_ttl") or 0):
+        schedule_swr_refresh(key, refresh)
+    return entry.get("value")
+
+
+def schedule_swr_refresh(key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+    """백그라운드 갱신 예약 (같은 프로세스에서 키당 1개)"""
+    if key in _swr_refreshing:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _swr_refreshing.add(key)
+    task = loop.create_task(_run_swr_refresh(key, refresh))
+    _swr_tasks.add(task)
+    task.add_done_callback(_swr_tasks.discard)
+
+
+async def _run_swr_refresh(key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+    lock_key = f"{key}:refresh"
+    token = secrets.token_hex(8)
+    redis_client = None
+    acquired = False
+    try:
+        # 다른 프로세스가 이미 갱신 중이면 건너뜀 (갱신이 끝나면 해제, 프로세스가 죽으면 리스 만료로 해제)
+        redis_client = await get_redis_client()
+        if redis_client is not None:
+            acquired = bool(await asyncio.wait_for(
+                redis_client.set(lock_key, token, nx=True, ex=SWR_REFRESH_LOCK_SECONDS),
+                timeout=CACHE_OPERATION_TIMEOUT
+            ))
+            if not acquired:
+                return
+        
+        _swr_refresh_key.set(key)
+        started = time.perf_counter()
+        await refresh()
+        logger.debug(f" SWR 백그라운드 갱신 완료 (키: {key}, {(time.perf_counter() - started) * 1000:.0f}ms)")
+    except Exception as e:
+        logger.warning(f" SWR 백그라운드 갱신 실패 (키: {key}): {type(e).__name__} - {e}")
+    finally:
+        _swr_refreshing.discard(key)
+        if acquired:
+            try:
+                await asyncio.wait_for(
+                    redis_client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token),
+                    timeout=CACHE_OPERATION_TIMEOUT
+                )
+            except Exception as e:
+                # 해제 실패 시 리스 만료로 정리됨
+                logger.debug(f" SWR 갱신 락 해제 실패 (키: {key}): {type(e).__name__} - {e}")
+
+
+def swr_endpoint_refresh(endpoint: Callable[..., Awaitable[Any]], **kwargs: Any) -> Callable[[], Awaitable[Any]]:
+    """
+    엔드포인트 함수를 새 DB 세션으로 다시 호출하는 갱신 함수 생성
+    
+    요청의 DB 세션은 응답 후 닫히므로 백그라운드 갱신은 별도 세션을 엽니다.
+    Query 기본값이 적용되지 않으므로 db 를 제외한 모든 파라미터를 kwargs 로 넘겨야 합니다.
+    """
+    async def refresh() -> None:
+        from app.db.session import AsyncSessionLocal
+        async with AsyncSessionLocal() as db:
+            await endpoint(**kwargs, db=db)
+    return refresh
+
+
+# ============ 태그(세대 번호) 기반 캐시 무효화 ============
+#
+# 캐시 키 끝에 태그별 세대 번호를 붙여 저장합니다.
+#   realestate:apartment:detail:123:v:4  (apt:123 태그의 세대 번호 4)
+# 태그를 무효화하면 세대 번호만 INCR 하므로 이전 세대 키는 더 이상 조회되지 않고 TTL로 만료됩니다.
+# SCAN 없이 O(태그 수)로 무효화되며 키 개수 제한도 없습니다.
+
+# 통계 전체 태그 (거래 데이터가 바뀌면 모든 통계 캐시 무효화)
+STATS_GLOBAL_TAG = "stats:global"
+
+# 평당가 분포 스냅샷 태그 (스냅샷을 다시 만들면 percentile 캐시 무효화)
+PERCENTILE_TAG = "stats:percentile"
+
+
+def apt_tag(apt_id: int) -> str:
+    """아파트 단위 캐시 태그 (상세, 주변 비교, 거래 내역 등)"""
+    return f"apt:{apt_id}"
+
+
+def _tag_version_key(tag: str) -> str:
+    """태그 세대 번호 저장 키"""
+    return f"{CACHE_NAMESPACE}:tag:{tag}"
+
+
+async def get_cache_tag_versions(tags: List[str]) -> List[int]:
+    """
+    태그별 현재 세대 번호를 조회합니다 (MGET, 왕복 1회)
+    
+    Redis를 사용할 수 없으면 모두 0을 반환합니다 (캐시 조회/저장도 실패하므로 영향 없음).
+    """
+    if not tags:
+        return []
+    
+    try:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return [0] * len(tags)
+        
+        values = await asyncio.wait_for(
+            redis_client.mget([_tag_version_key(tag) for tag in tags]),
+            timeout=CACHE_OPERATION_TIMEOUT
+        )
+        return [int(value) if value is not None else 0 for value in values]
+    except Exception as e:
+        logger.debug(f" 캐시 태그 조회 실패 ({tags}): {type(e).__name__} - {e}")
+        return [0] * len(tags)
+
+
+async def tag_cache_key(key: str, *tags: str) -> str:
+    """
+    캐시 키에 태그 세대 번호를 붙입니다
+    
+    예: await tag_cache_key(build_cache_key("apartment", "detail", "1"), apt_tag(1))
+        → "realestate:apartment:detail:1:v:3"
+    
+    Args:
+        key: 기본 캐시 키
+        *tags: 이 캐시가 의존하는 태그
+    
+    Returns:
+        str: 세대 번호가 포함된 캐시 키
+    """
+    if not tags:
+        return key
+    versions = await get_cache_tag_versions(list(tags))
+    return f"{key}:v:{'.'.join(str(version) for version in versions)}"
+
+
+async def invalidate_cache_tags(*tags: str) -> bool:
+    """
+    태그의 세대 번호를 올려 해당 태그가 붙은 모든 캐시를 무효화합니다 (INCR 파이프라인, 왕복 1회)
+    
+    Args:
+        *tags: 무효화할 태그 (중복은 한 번만 처리)
+    
+    Returns:
+        bool: 성공 여부
+    """
+    unique_tags = list(dict.fromkeys(tag for tag in tags if tag))
+    if not unique_tags:
+        return True
+    
+    try:
+        redis_client = await get_redis_client()
+        if redis_client is None:
+            return False
+        
+        pipe = redis_client.pipeline(transaction=False)
+        for tag in unique_tags:
+            pipe.incr(_tag_version_key(tag))
+        await asyncio.wait_for(pipe.execute(), timeout=CACHE_OPERATION_TIMEOUT)
+        logger.debug(f" 캐시 태그 무효화 ({len(unique_tags)}개): {unique_tags[:5]}")
+        return True
+    except Exception as e:
+        logger.debug(f" 캐시 태그 무효화 실패 ({unique_tags[:5]}): {type(e).__name__} - {e}")
+        return False
+
+
+# 한 파이프라인에서 세대 번호를 올릴 최대 태그 수
+TAG_INVALIDATION_CHUNK_SIZE = 500
+
+
+async def invalidate_apartment_tags(apt_ids: Iterable[int]) -> bool:
+    """
+    아파트 태그 일괄 무효화 (TAG_INVALIDATION_CHUNK_SIZE 단위 파이프라인)
+    
+    일괄 저장(INSERT ... ON CONFLICT)은 ORM 이벤트를 거치지 않으므로
+    수집 후 거래가 바뀐 아파트의 캐시를 이 함수로 무효화합니다.
+    """
+    tags = [apt_tag(apt_id) for apt_id in sorted({apt_id for apt_id in apt_ids if apt_id})]
+    success = True
+    for start in range(0, len(tags), TAG_INVALIDATION_CHUNK_SIZE):
+        chunk_success = await invalidate_cache_tags(*tags[start:start + TAG_INVALIDATION_CHUNK_SIZE])
+        success = success and chunk_success
+    return success
+
+
 # ============ 즐겨찾기 관련 캐시 키 헬퍼 ============
 
 def get_favorite_locations_cache_key(account_id: int, skip: int = 0, limit: int = 50) -> str:
@@ -0,0 +1,277 @@
+"""
+프로세스 내 L1 캐시 (Redis 앞단)
+
+전국 히트맵, 10년치 거래량처럼 크고 자주 읽히지만 수집 주기 사이에는 거의 바뀌지 않는 집계를
+워커 메모리에 보관해 Redis 왕복과 orjson 디코딩을 생략합니다.
+
+- 지정한 네임스페이스(키 접두사)만 저장
+- 용량(바이트) 상한 + LRU 제거 + 항목별 TTL (L1_CACHE_TTL 이하)
+- 일관성:
+  - 태그 캐시 키는 세대 번호가 키에 포함되므로 무효화되면 이전 키가 조회되지 않음
+  - 그 외 키는 저장/삭제 시 Redis pub/sub 으로 다른 워커에 무효화 메시지 전달
+  - 구독이 끊겼다 다시 연결되면 놓친 메시지가 있을 수 있으므로 L1 전체 비움
+- 저장된 객체는 요청 간에 공유되므로 호출 측에서 수정하지 말 것
+"""
+import asyncio
+import fnmatch
+import logging
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# L1 에 저장할 키 접두사
+L1_CACHE_PREFIXES: Tuple[str, ...] = (
+    "realestate:dashboard:",
+    "realestate:statistics:",
+    "realestate:map:region_prices:",
+    "realestate:map:bounds:sido:",
+)
+
+# 직렬화된 응답 캐시 키 접미사 (app.utils.response_cache)
+RESPONSE_KEY_SUFFIX = ":resp"
+
+# 원본 키에서 파생된 키 접미사 (원본이 무효화되면 함께 제거)
+DERIVED_KEY_SUFFIXES: Tuple[str, ...] = (RESPONSE_KEY_SUFFIX,)
+
+# 무효화 메시지 채널
+L1_INVALIDATION_CHANNEL = "realestate:l1:invalidate"
+
+# 구독 재연결 대기 시간 (초)
+L1_RESUBSCRIBE_DELAY = 5.0
+
+# 조회 실패 표시 (None 도 캐시 값일 수 있으므로 별도 표식 사용)
+MISS = object()
+
+
+@dataclass
+class LocalCacheMetrics:
+    """L1 캐시 지표"""
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    oversized: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "oversized": self.oversized,
+        }
+
+
+class LocalCache:
+    """
+    용량 제한 LRU + TTL 캐시
+
+    Args:
+        max_bytes: 전체 용량 상한 (직렬화 크기 기준, 0 이하면 비활성화)
+        ttl: 항목 최대 유지 시간 (초)
+        prefixes: 저장 대상 키 접두사
+    """
+
+    def __init__(self, max_bytes: int, ttl: float, prefixes: Tuple[str, ...] = L1_CACHE_PREFIXES):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.prefixes = prefixes
+        self.origin = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._metrics = LocalCacheMetrics()
+        self._listener_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def handles(self, key: str) -> bool:
+        """L1 저장 대상 키인지 여부"""
+        return self.enabled and key.startswith(self.prefixes)
+
+    def get(self, key: str) -> Any:
+        """조회 (없거나 만료되면 MISS)"""
+        if not self.handles(key):
+            return MISS
+        entry = self._entries.get(key)
+        if entry is None:
+            self._metrics.misses += 1
+            return MISS
+        value, size, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self._metrics.expirations += 1
+            self._metrics.misses += 1
+            return MISS
+        self._entries.move_to_end(key)
+        self._metrics.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, size: int, ttl: Optional[float] = None) -> None:
+        """
+        저장 (용량을 넘으면 오래 안 쓴 항목부터 제거)
+
+        Args:
+            size: 직렬화된 크기 (바이트)
+            ttl: Redis TTL (L1 TTL 보다 짧으면 이 값 사용)
+        """
+        if not self.handles(key):
+            return
+        if size > self.max_bytes // 4:
+            # 한 항목이 전체의 1/4 를 넘으면 다른 항목을 몰아내므로 저장하지 않음
+            self._metrics.oversized += 1
+            return
+        self._remove(key)
+        lifetime = min(self.ttl, ttl) if ttl else self.ttl
+        self._entries[key] = (value, size, time.monotonic() + lifetime)
+        self._bytes += size
+        self._metrics.sets += 1
+        while self._bytes > self.max_bytes and self._entries:
+            evicted_key = next(iter(self._entries))
+            self._remove(evicted_key)
+            self._metrics.evictions += 1
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def invalidate(self, key: str) -> None:
+        """항목 제거 (파생 키 포함)"""
+        for target in (key, *(key + suffix for suffix in DERIVED_KEY_SUFFIXES)):
+            if self._remove(target):
+                self._metrics.invalidations += 1
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """glob 패턴(Redis SCAN MATCH 와 같은 형식)에 맞는 항목 제거"""
+        matched = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matched:
+            self._remove(key)
+        self._metrics.invalidations += len(matched)
+        return len(matched)
+
+    def clear(self) -> None:
+        self._metrics.invalidations += len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+
+    # ===== 워커 간 무효화 (Redis pub/sub) =====
+
+    async def publish_invalidation(self, key: Optional[str] = None, pattern: Optional[str] = None) -> None:
+        """다른 워커에 무효화 메시지 전송 (실패 시 L1 TTL 로 만료)"""
+        if not self.enabled:
+            return
+        if key is not None and not self.handles(key):
+            return
+        try:
+            redis_client = await get_redis_client()
+            if redis_client is None:
+                return
+            message = orjson.dumps({"o": self.origin, "k": key, "p": pattern}).decode()
+            await asyncio.wait_for(
+                redis_client.publish(L1_INVALIDATION_CHANNEL, message),
+                timeout=1.0
+            )
+        except Exception as e:
+            logger.debug(f" L1 무효화 메시지 전송 실패: {type(e).__name__} - {e}")
+
+    def _handle_message(self, data: str) -> None:
+        try:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return
+        if message.get("o") == self.origin:
+            return
+        if message.get("k"):
+            self.invalidate(message["k"])
+        elif message.get("p"):
+            self.invalidate_pattern(message["p"])
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                redis_client = await get_redis_client()
+                if redis_client is None:
+                    await asyncio.sleep(L1_RESUBSCRIBE_DELAY)
+                    continue
+                pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(L1_INVALIDATION_CHANNEL)
+                # 구독 전 메시지를 놓쳤을 수 있으므로 비우고 시작
+                self.clear()
+                logger.info(" L1 캐시 무효화 채널 구독 시작")
+                while True:
+                    # 공용 클라이언트 소켓 타임아웃(1초) 때문에 블로킹 listen() 대신 짧게 폴링
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._handle_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f" L1 캐시 무효화 구독 끊김 ({L1_RESUBSCRIBE_DELAY}초 후 재연결): {type(e).__name__}")
+                self.clear()
+                await asyncio.sleep(L1_RESUBSCRIBE_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    def start_listener(self) -> None:
+        """무효화 구독 시작 (앱 시작 시)"""
+        if not self.enabled or (self._listener_task is not None and not self._listener_task.done()):
+            return
+        self._listener_task = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop_listener(self) -> None:
+        """무효화 구독 종료 (앱 종료 시)"""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        self._listener_task = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """L1 캐시 지표"""
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "listening": self._listener_task is not None and not self._listener_task.done(),
+            **self._metrics.to_dict(),
+        }
+
+    def reset_metrics(self) -> None:
+        self._metrics = LocalCacheMetrics()
+
+
+# 워커 공용 인스턴스
+local_cache = LocalCache(
+    max_bytes=settings.L1_CACHE_MAX_BYTES,
+    ttl=settings.L1_CACHE_TTL,
+)
@@ -0,0 +1,129 @@
+"""
+지도 타일 유틸리티
+
+지도 영역(bounds) 요청을 고정된 슬리피 타일(z/x/y, Web Mercator)로 나누어
+타일 단위로 집계 결과를 캐싱하기 위한 좌표 계산 함수들을 제공합니다.
+
+뷰포트는 조금만 움직여도 좌표가 바뀌지만 타일 경계는 고정되어 있으므로
+이동 후에도 대부분의 타일은 이전 요청에서 캐싱된 결과를 그대로 사용할 수 있습니다.
+"""
+import math
+from typing import List, NamedTuple, Tuple
+
+# Web Mercator 위도 한계
+MAX_LATITUDE = 85.05112878
+
+# 타일 줌 범위
+MIN_TILE_ZOOM = 4
+MAX_TILE_ZOOM = 16
+
+# 한 요청에서 사용할 최대 타일 수 (초과 시 한 단계 큰 타일 사용)
+MAX_TILES_PER_REQUEST = 16
+
+
+class Tile(NamedTuple):
+    """슬리피 타일 좌표"""
+    z: int
+    x: int
+    y: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.z}-{self.x}-{self.y}"
+
+
+def tile_zoom_for_level(kakao_level: int) -> int:
+    """
+    카카오맵 확대 레벨 → 타일 줌
+
+    카카오맵 레벨 1은 대략 슬리피 줌 19~20에 해당하고 레벨이 1 오를 때마다 축척이 2배가 됩니다.
+    타일 한 변이 일반적인 뷰포트 한 변(약 1000px)과 비슷하도록 (18 - 레벨)을 사용하므로
+    뷰포트 하나는 보통 2×2 ~ 3×3 타일로 덮입니다.
+    """
+    return max(MIN_TILE_ZOOM, min(MAX_TILE_ZOOM, 18 - kakao_level))
+
+
+def _clamp_lat(lat: float) -> float:
+    return max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+
+
+def lnglat_to_tile(lng: float, lat: float, z: int) -> Tuple[int, int]:
+    """경위도 → 타일 x, y"""
+    n = 1 << z
+    lat_rad = math.radians(_clamp_lat(lat))
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(tile: Tile) -> Tuple[float, float, float, float]:
+    """
+    타일 경계
+
+    Returns:
+        (sw_lat, sw_lng, ne_lat, ne_lng)
+    """
+    n = 1 << tile.z
+    west = tile.x / n * 360.0 - 180.0
+    east = (tile.x + 1) / n * 360.0 - 180.0
+    north = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile.y / n))))
+    south = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (tile.y + 1) / n))))
+    return south, west, north, east
+
+
+def tiles_for_bounds(
+    sw_lat: float,
+    sw_lng: float,
+    ne_lat: float,
+    ne_lng: float,
+    z: int,
+    max_tiles: int = MAX_TILES_PER_REQUEST,
+) -> List[Tile]:
+    """
+    영역을 덮는 타일 목록 (타일 수가 max_tiles를 넘으면 줌을 낮춰 더 큰 타일 사용)
+
+    Returns:
+        타일 목록 (y, x 순)
+    """
+    south, north = min(sw_lat, ne_lat), max(sw_lat, ne_lat)
+    west, east = min(sw_lng, ne_lng), max(sw_lng, ne_lng)
+    while True:
+        min_x, min_y = lnglat_to_tile(west, north, z)
+        max_x, max_y = lnglat_to_tile(east, south, z)
+        count = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if count <= max_tiles or z <= 0:
+            return [
+                Tile(z, x, y)
+                for y in range(min_y, max_y + 1)
+                for x in range(min_x, max_x + 1)
+            ]
+        z -= 1
+
+
+def point_in_bounds(
+    lat: float,
+    lng: float,
+    sw_lat: float,
+    sw_lng: float,
+    ne_lat: float,
+    ne_lng: float,
+) -> bool:
+    """좌표가 영역 안에 있는지 (경계 포함)"""
+    return (
+        min(sw_lat, ne_lat) <= lat <= max(sw_lat, ne_lat)
+        and min(sw_lng, ne_lng) <= lng <= max(sw_lng, ne_lng)
+    )
+
+
+def squared_distance_to_center(
+    lat: float,
+    lng: float,
+    sw_lat: float,
+    sw_lng: float,
+    ne_lat: float,
+    ne_lng: float,
+) -> float:
+    """영역 중심까지의 거리 제곱 (경위도 단위, 정렬용)"""
+    center_lat = (sw_lat + ne_lat) / 2.0
+    center_lng = (sw_lng + ne_lng) / 2.0
+    return (lat - center_lat) ** 2 + (lng - center_lng) ** 2
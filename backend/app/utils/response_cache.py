@@ -0,0 +1,307 @@
+"""
+직렬화/압축된 응답 캐시
+
+캐시 히트 때마다 반복되던 orjson.loads → response_model 검증 → ORJSONResponse 직렬화 → GZip 압축을 없애기 위해
+최종 응답 본문(JSON 바이트)과 gzip(가능하면 brotli) 압축본, ETag 를 함께 저장하고 그대로 반환합니다.
+
+- 저장 위치: Redis 해시 "<원본 캐시 키>:resp" (바이트 클라이언트) + L1 캐시
+- 원본 캐시 키가 다시 저장/삭제되면 set_to_cache/delete_from_cache 가 이 키도 함께 지움
+- TTL 은 RESPONSE_CACHE_TTL 이하로 짧게 두어 SWR 갱신 시점을 놓치지 않음
+- Content-Encoding 이 지정된 응답은 GZipMiddleware 가 다시 압축하지 않음 (starlette>=0.35, requirements.txt 에 고정)
+- 원본(identity)/gzip/br 모든 변형과 304 응답에 Vary: Accept-Encoding 을 붙여 공유 캐시가 인코딩별로 구분
+- ETag 는 태그 세대가 포함된 캐시 키(tag_cache_key) + 본문 해시(인코딩별 접미사)이며,
+  If-None-Match 가 일치하면 역직렬화/직렬화 없이 304 반환 (태그 무효화 시 ETag 도 바뀜)
+
+사용 예:
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    cached_data = await get_from_cache(cache_key)
+    if cached_data is not None:
+        return await cache_json_response(http_request, cache_key, cached_data)
+
+엔드포인트를 직접 호출하는 경우(사전 캐싱, SWR 갱신)에는 http_request 가 None 이므로 dict 를 그대로 반환합니다.
+"""
+import asyncio
+import gzip
+import hashlib
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.core.redis import get_redis_binary_client
+from app.utils.cache import CACHE_OPERATION_TIMEOUT
+from app.utils.local_cache import local_cache, MISS, RESPONSE_KEY_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+# 직렬화된 응답 최대 유지 시간 (초)
+RESPONSE_CACHE_TTL = 300
+
+# 이 크기 미만은 압축하지 않음 (GZipMiddleware minimum_size 와 동일)
+COMPRESS_MIN_SIZE = 500
+
+# gzip 압축 레벨 (저장 시 한 번만 압축하므로 최고 압축률)
+GZIP_LEVEL = 9
+
+# brotli 품질 (0~11)
+BROTLI_QUALITY = 5
+
+_BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+if _BROTLI_AVAILABLE:
+    import brotli
+
+# 인코딩별 ETag 접미사
+ETAG_ENCODING_SUFFIXES = ("-gzip", "-br")
+
+# 인코딩에 따라 본문이 달라지므로 모든 변형(identity 포함)에 붙이는 Vary 값
+VARY_ACCEPT_ENCODING = "Accept-Encoding"
+
+# ORJSONResponse 와 같은 직렬화 옵션
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+@dataclass
+class EncodedResponse:
+    """직렬화/압축된 응답"""
+    etag: str
+    body: bytes
+    gzip: Optional[bytes] = None
+    br: Optional[bytes] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzip or b"") + len(self.br or b"")
+
+    def to_mapping(self) -> Dict[str, bytes]:
+        mapping = {"etag": self.etag.encode(), "body": self.body}
+        if self.gzip is not None:
+            mapping["gzip"] = self.gzip
+        if self.br is not None:
+            mapping["br"] = self.br
+        return mapping
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[bytes, bytes]) -> Optional["EncodedResponse"]:
+        if not mapping or b"body" not in mapping or b"etag" not in mapping:
+            return None
+        return cls(
+            etag=mapping[b"etag"].decode(),
+            body=mapping[b"body"],
+            gzip=mapping.get(b"gzip"),
+            br=mapping.get(b"br"),
+        )
+
+
+@dataclass
+class ResponseCacheMetrics:
+    """응답 캐시 지표"""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    compressed_hits: int = 0
+    not_modified: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "compressed_hits": self.compressed_hits,
+            "not_modified": self.not_modified,
+        }
+
+
+_metrics = ResponseCacheMetrics()
+
+
+def encode_response(data: Any, key: Optional[str] = None) -> EncodedResponse:
+    """응답 데이터를 JSON 직렬화하고 압축본과 ETag 생성 (key: 태그 세대가 포함된 캐시 키)"""
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json", by_alias=True)
+    body = orjson.dumps(data, option=_ORJSON_OPTIONS)
+    encoded = EncodedResponse(etag=compute_etag(body, key), body=body)
+    if len(body) >= COMPRESS_MIN_SIZE:
+        encoded.gzip = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        if _BROTLI_AVAILABLE:
+            encoded.br = brotli.compress(body, quality=BROTLI_QUALITY)
+    return encoded
+
+
+def compute_etag(body: bytes, key: Optional[str] = None, weak: bool = False) -> str:
+    """
+    ETag 생성 (같은 키/본문이면 워커/재시작과 관계없이 같은 값)
+
+    Args:
+        body: 응답 본문
+        key: 태그 세대가 포함된 캐시 키 (tag_cache_key 결과, 태그가 무효화되면 ETag 도 바뀜)
+        weak: 약한 ETag (W/) - 이후 GZipMiddleware 가 본문을 압축할 수 있는 응답
+    """
+    digest = hashlib.sha256()
+    if key:
+        digest.update(key.encode())
+        digest.update(b"\0")
+    digest.update(body)
+    etag = f'"{digest.hexdigest()[:32]}"'
+    return f"W/{etag}" if weak else etag
+
+
+def _representation_etag(etag: str, encoding: Optional[str]) -> str:
+    """압축본은 바이트가 다르므로 인코딩별로 다른 강한 ETag 사용 ("hash" → "hash-gzip")"""
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _etag_base(etag: str) -> str:
+    value = etag.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"')
+    for suffix in ETAG_ENCODING_SUFFIXES:
+        if value.endswith(suffix):
+            return value[:-len(suffix)]
+    return value
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 비교 (RFC 9110 약한 비교)
+
+    W/ 접두사와 인코딩 접미사를 무시하므로 gzip 으로 받은 ETag 를 그대로 보내도 일치합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    base = _etag_base(etag)
+    return any(_etag_base(candidate) == base for candidate in if_none_match.split(","))
+
+
+def not_modified_response(etag: str, vary: Optional[str] = VARY_ACCEPT_ENCODING) -> Response:
+    """본문 없는 304 응답"""
+    headers = {"ETag": etag}
+    if vary:
+        headers["Vary"] = vary
+    return Response(status_code=304, headers=headers)
+
+
+def _choose_encoding(request: Request, encoded: EncodedResponse) -> Optional[str]:
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if encoded.br is not None and "br" in accept_encoding:
+        return "br"
+    if encoded.gzip is not None and "gzip" in accept_encoding:
+        return "gzip"
+    return None
+
+
+def build_response(request: Request, encoded: EncodedResponse) -> Response:
+    """클라이언트가 받을 수 있는 인코딩으로 응답 생성 (If-None-Match 가 일치하면 304)"""
+    encoding = _choose_encoding(request, encoded)
+    etag = _representation_etag(encoded.etag, encoding)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        _metrics.not_modified += 1
+        return not_modified_response(etag)
+
+    # 압축본이 없는 작은 본문/identity 응답에도 Vary 를 붙임 (인코딩별 변형을 공유 캐시가 섞지 않도록)
+    headers = {"ETag": etag, "Vary": VARY_ACCEPT_ENCODING}
+    if encoding is None:
+        content = encoded.body
+    else:
+        content = encoded.br if encoding == "br" else encoded.gzip
+        headers["Content-Encoding"] = encoding
+        _metrics.compressed_hits += 1
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+async def get_cached_response(request: Optional[Request], key: str) -> Optional[Response]:
+    """
+    저장된 직렬화 응답 조회
+
+    Args:
+        request: 현재 요청 (None 이면 조회하지 않음)
+        key: 원본 캐시 키
+
+    Returns:
+        Response 또는 None (캐시 미스)
+    """
+    if request is None:
+        return None
+
+    response_key = key + RESPONSE_KEY_SUFFIX
+    encoded = local_cache.get(response_key)
+    if encoded is MISS:
+        encoded = None
+        try:
+            redis_client = await get_redis_binary_client()
+            if redis_client is not None:
+                mapping = await asyncio.wait_for(
+                    redis_client.hgetall(response_key),
+                    timeout=CACHE_OPERATION_TIMEOUT
+                )
+                encoded = EncodedResponse.from_mapping(mapping)
+        except Exception as e:
+            logger.debug(f" 응답 캐시 조회 실패 (키: {response_key}): {type(e).__name__} - {e}")
+        if encoded is not None:
+            local_cache.put(response_key, encoded, size=encoded.size, ttl=RESPONSE_CACHE_TTL)
+
+    if encoded is None:
+        _metrics.misses += 1
+        return None
+    _metrics.hits += 1
+    return build_response(request, encoded)
+
+
+async def cache_json_response(
+    request: Optional[Request],
+    key: str,
+    data: Any,
+    ttl: int = RESPONSE_CACHE_TTL
+) -> Any:
+    """
+    응답 데이터를 한 번 직렬화/압축해 저장하고 Response 로 반환
+
+    Args:
+        request: 현재 요청 (None 이면 data 를 그대로 반환)
+        key: 원본 캐시 키
+        data: 응답 데이터 (dict 또는 Pydantic 모델)
+        ttl: 유지 시간 (초, RESPONSE_CACHE_TTL 이하)
+
+    Returns:
+        Response (request 가 없으면 data)
+    """
+    if request is None:
+        return data
+
+    encoded = encode_response(data, key)
+    response_key = key + RESPONSE_KEY_SUFFIX
+    ttl = min(ttl, RESPONSE_CACHE_TTL)
+    try:
+        redis_client = await get_redis_binary_client()
+        if redis_client is not None:
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.delete(response_key)
+            pipe.hset(response_key, mapping=encoded.to_mapping())
+            pipe.expire(response_key, ttl)
+            await asyncio.wait_for(pipe.execute(), timeout=CACHE_OPERATION_TIMEOUT)
+            _metrics.stores += 1
+    except Exception as e:
+        logger.debug(f" 응답 캐시 저장 실패 (키: {response_key}): {type(e).__name__} - {e}")
+    local_cache.put(response_key, encoded, size=encoded.size, ttl=ttl)
+    return build_response(request, encoded)
+
+
+def get_metrics() -> Dict[str, Any]:
+    """응답 캐시 지표"""
+    return {
+        "brotli": _BROTLI_AVAILABLE,
+        **_metrics.to_dict(),
+    }
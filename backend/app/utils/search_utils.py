@@ -209,3 +209,82 @@ def normalize_apt_name_extended(name: str) -> str:
     result = re.sub(r'아파트$', '', result)
     
     return result
+
+
+# ===== 한글 자모 분해 (자동완성 색인용) =====
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+
+# 초성 19자 (유니코드 음절 순서)
+CHOSUNG_LIST = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# 중성 21자 - 복합 모음은 입력 순서대로 분해 (ㅘ → ㅗㅏ)
+JUNGSUNG_LIST = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]
+
+# 종성 28자 (받침 없음 포함) - 겹받침은 분해 (ㄳ → ㄱㅅ)
+JONGSUNG_LIST = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+
+# 단독으로 입력된 복합 자모 분해
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+_CHOSUNG_SET = frozenset(CHOSUNG_LIST)
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    한글 음절을 자모로 분해 (한글 외 문자는 그대로)
+    
+    입력 중인 마지막 글자("롯데캐ㅅ", "롯데캣")도 완성된 이름의 prefix 가 되도록
+    복합 모음/겹받침까지 기본 자모로 나눕니다.
+    
+    Examples:
+        >>> decompose_jamo("롯데")
+        'ㄹㅗㅅㄷㅔ'
+        >>> decompose_jamo("관")
+        'ㄱㅗㅏㄴ'
+    """
+    parts = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            offset = code - HANGUL_SYLLABLE_START
+            parts.append(CHOSUNG_LIST[offset // 588])
+            parts.append(JUNGSUNG_LIST[(offset % 588) // 28])
+            parts.append(JONGSUNG_LIST[offset % 28])
+        else:
+            parts.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(parts)
+
+
+def extract_chosung(text: str) -> str:
+    """
+    한글 음절을 초성으로 변환 (한글 외 문자는 그대로)
+    
+    Examples:
+        >>> extract_chosung("롯데캐슬")
+        'ㄹㄷㅋㅅ'
+    """
+    parts = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_SYLLABLE_START <= code <= HANGUL_SYLLABLE_END:
+            parts.append(CHOSUNG_LIST[(code - HANGUL_SYLLABLE_START) // 588])
+        else:
+            parts.append(ch)
+    return "".join(parts)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성만으로 이루어진 검색어인지 여부 (예: "ㄹㄷㅋㅅ")"""
+    return bool(text) and all(ch in _CHOSUNG_SET for ch in text)
@@ -0,0 +1,359 @@
+"""
+캐시 미스 요청 병합 (single-flight)
+
+인기 캐시 키가 만료되는 순간 동시에 들어온 요청이 모두 같은 무거운 쿼리를 실행하지 않도록,
+키마다 한 요청(리더)만 계산하고 나머지는 그 결과를 기다립니다.
+
+- 프로세스 내부: 키별 Future 로 대기 (Redis 장애 시에도 동작)
+- 프로세스 간: Redis 락 (SET NX PX, 짧은 리스) 으로 리더 한 명만 계산, 나머지는 캐시를 폴링
+- 대기 시간이 넘으면 직전 결과 사본(stale, TTL 제한)을 반환하고, 사본도 없으면 직접 계산
+- 리더가 실패하면(fail) 같은 프로세스의 대기 요청에도 같은 예외를 전달 (동시에 재계산하지 않음)
+- 대기 요청도 리더와 같은 응답 형태(직렬화 응답 캐시, ETag/Content-Encoding)로 반환 (to_response)
+
+사용 예:
+    cached_response = await get_cached_response(http_request, cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    flight = await single_flight.acquire(cache_key)
+    if flight.value is not None:
+        return await flight.to_response(http_request)
+    try:
+        ...  # DB 조회
+        await flight.set(response_data, ttl=21600)
+        return await cache_json_response(http_request, cache_key, response_data)
+    except Exception as e:
+        flight.fail(e)
+        raise
+    finally:
+        await flight.release()
+"""
+import asyncio
+import logging
+import secrets
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+
+from app.core.redis import get_redis_client
+from app.utils.cache import (
+    CACHE_OPERATION_TIMEOUT,
+    DEFAULT_TTL,
+    RELEASE_LOCK_SCRIPT,
+    get_from_cache,
+    set_to_cache,
+    set_swr_to_cache,
+    in_swr_refresh,
+)
+from app.utils.response_cache import (
+    build_response,
+    cache_json_response,
+    encode_response,
+    get_cached_response,
+)
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 간 락 리스 (초) - 리더가 죽어도 이 시간이 지나면 다른 프로세스가 계산
+LOCK_LEASE_SECONDS = 30
+
+# 리더 결과를 기다리는 최대 시간 (초)
+WAIT_TIMEOUT_SECONDS = 10.0
+
+# 다른 프로세스의 결과를 캐시에서 확인하는 간격 (초)
+POLL_INTERVAL_SECONDS = 0.2
+
+# stale 사본 유지 시간 (원래 TTL 에 더하는 시간, 초)
+STALE_GRACE_SECONDS = 600
+
+
+def _lock_key(key: str) -> str:
+    return f"{key}:lock"
+
+
+def _stale_key(key: str) -> str:
+    return f"{key}:stale"
+
+
+@dataclass
+class SingleFlightMetrics:
+    """요청 병합 지표"""
+    leaders: int = 0
+    local_waits: int = 0
+    remote_waits: int = 0
+    coalesced: int = 0
+    stale_served: int = 0
+    timeouts: int = 0
+    failures: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "leaders": self.leaders,
+            "local_waits": self.local_waits,
+            "remote_waits": self.remote_waits,
+            "coalesced": self.coalesced,
+            "stale_served": self.stale_served,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+        }
+
+
+class Flight:
+    """
+    한 캐시 키에 대한 요청 병합 결과
+
+    value 가 있으면 다른 요청이 계산한 값(또는 stale 사본)이므로 to_response() 로 반환하고,
+    없으면 직접 계산한 뒤 set() 으로 저장하고 release() 로 정리합니다.
+    계산이 실패하면 fail() 로 대기 중인 요청에 예외를 전달합니다.
+    """
+
+    def __init__(
+        self,
+        owner: "SingleFlight",
+        key: str,
+        value: Any = None,
+        future: Optional[asyncio.Future] = None,
+        lock_token: Optional[str] = None,
+        stale: bool = False,
+    ):
+        self._owner = owner
+        self.key = key
+        self.value = value
+        self.stale = stale
+        self._future = future
+        self._lock_token = lock_token
+
+    @property
+    def is_leader(self) -> bool:
+        return self._future is not None
+
+    async def set(self, value: Any, ttl: int = DEFAULT_TTL, swr: bool = False) -> bool:
+        """
+        계산 결과를 캐시(+ stale 사본)에 저장하고 대기 중인 요청에 전달
+
+        Args:
+            value: 캐시할 값 (JSON 직렬화 가능한 객체)
+            ttl: 캐시 유효 시간 (초, swr=True 면 soft TTL)
+            swr: SWR 봉투로 저장 (get_swr_from_cache 로 조회하는 키)
+        """
+        self._resolve(value)
+        if swr:
+            stored = await set_swr_to_cache(self.key, value, soft_ttl=ttl)
+        else:
+            stored = await set_to_cache(self.key, value, ttl=ttl)
+        if not swr and self._owner.stale_grace > 0:
+            # stale 사본은 본 키보다 유예 시간만큼 더 유지 (SWR 키는 봉투 자체가 hard TTL 까지 유지)
+            await set_to_cache(_stale_key(self.key), value, ttl=ttl + self._owner.stale_grace)
+        return stored
+
+    def _resolve(self, value: Any) -> None:
+        if self._future is not None and not self._future.done():
+            self._future.set_result(value)
+
+    def fail(self, error: BaseException) -> None:
+        """
+        계산 실패를 대기 중인 요청에 전달
+
+        같은 프로세스의 대기 요청은 이 예외를 그대로 받으므로 리더 실패 직후 모두가 동시에 재계산하지 않습니다.
+        """
+        if self._future is None or self._future.done():
+            return
+        self._owner._metrics.failures += 1
+        self._future.set_exception(error)
+        # 대기 요청이 없어도 "Future exception was never retrieved" 경고가 남지 않도록 조회 처리
+        self._future.exception()
+
+    async def to_response(self, request: Optional[Request]) -> Any:
+        """
+        value 를 리더와 같은 응답 형태로 반환 (직렬화 응답 캐시 → ETag/Content-Encoding 포함)
+
+        stale 사본은 응답 캐시에 저장하지 않고 이번 응답에만 사용합니다.
+        request 가 None 이면(사전 캐싱, SWR 갱신) value 를 그대로 반환합니다.
+        """
+        if request is None:
+            return self.value
+        if self.stale:
+            return build_response(request, encode_response(self.value, self.key))
+        cached_response = await get_cached_response(request, self.key)
+        if cached_response is not None:
+            return cached_response
+        return await cache_json_response(request, self.key, self.value)
+
+    async def release(self) -> None:
+        """락 해제 (값도 예외도 없이 끝나면 대기 중인 요청은 stale 사본 또는 직접 계산으로 넘어감)"""
+        if self._future is None:
+            return
+        self._resolve(None)
+        if self._owner._inflight.get(self.key) is self._future:
+            del self._owner._inflight[self.key]
+        self._future = None
+
+        if self._lock_token is not None:
+            await self._owner._release_lock(self.key, self._lock_token)
+            self._lock_token = None
+
+
+class SingleFlight:
+    """
+    캐시 키 단위 요청 병합기
+
+    Args:
+        lock_lease: 프로세스 간 락 리스 (초)
+        wait_timeout: 리더 결과를 기다리는 최대 시간 (초)
+        poll_interval: 다른 프로세스 결과 폴링 간격 (초)
+        stale_grace: stale 사본을 본 TTL 보다 더 유지하는 시간 (초, 0 이하면 사본 없음)
+    """
+
+    def __init__(
+        self,
+        lock_lease: int = LOCK_LEASE_SECONDS,
+        wait_timeout: float = WAIT_TIMEOUT_SECONDS,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        stale_grace: int = STALE_GRACE_SECONDS,
+    ):
+        self.lock_lease = lock_lease
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.stale_grace = stale_grace
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._metrics = SingleFlightMetrics()
+
+    async def acquire(self, key: str) -> Flight:
+        """
+        키에 대한 계산 권한 획득 또는 다른 요청의 결과 대기
+
+        Returns:
+            Flight (value 가 None 이 아니면 계산 불필요)
+
+        Raises:
+            같은 프로세스의 리더가 fail() 로 전달한 예외
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            # 같은 프로세스에서 이미 계산 중 (리더가 실패하면 그 예외가 그대로 전파됨)
+            self._metrics.local_waits += 1
+            try:
+                value = await asyncio.wait_for(asyncio.shield(future), timeout=self.wait_timeout)
+            except asyncio.TimeoutError:
+                self._metrics.timeouts += 1
+                value = None
+            if value is not None:
+                self._metrics.coalesced += 1
+                return Flight(self, key, value=value)
+            return await self._fallback(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        flight = Flight(self, key, future=future)
+
+        # 락을 기다리는 사이 다른 요청이 채웠을 수 있으므로 한 번 더 확인 (SWR 갱신 중이면 생략)
+        value = None if in_swr_refresh(key) else await get_from_cache(key)
+        if value is not None:
+            flight._resolve(value)
+            await flight.release()
+            flight.value = value
+            return flight
+
+        acquired, token = await self._acquire_lock(key)
+        if acquired:
+            flight._lock_token = token
+            self._metrics.leaders += 1
+            return flight
+
+        # 다른 프로세스가 계산 중 - 캐시에 결과가 올라올 때까지 폴링
+        self._metrics.remote_waits += 1
+        value = await self._poll_cache(key)
+        if value is not None:
+            self._metrics.coalesced += 1
+            flight._resolve(value)
+            await flight.release()
+            flight.value = value
+            return flight
+
+        self._metrics.timeouts += 1
+        value = await self._get_stale(key)
+        if value is not None:
+            flight._resolve(value)
+            await flight.release()
+            flight.value = value
+            flight.stale = True
+            return flight
+
+        # stale 사본도 없으면 락 없이 직접 계산 (같은 프로세스의 대기 요청은 이 결과를 받음)
+        self._metrics.leaders += 1
+        return flight
+
+    async def _fallback(self, key: str) -> Flight:
+        """리더가 실패/지연된 경우: stale 사본, 없으면 직접 계산"""
+        value = await self._get_stale(key)
+        if value is not None:
+            return Flight(self, key, value=value, stale=True)
+        return Flight(self, key)
+
+    async def _get_stale(self, key: str) -> Optional[Any]:
+        if self.stale_grace <= 0:
+            return None
+        value = await get_from_cache(_stale_key(key))
+        if value is not None:
+            self._metrics.stale_served += 1
+            logger.debug(f" stale 캐시 반환 (키: {key})")
+        return value
+
+    async def _poll_cache(self, key: str) -> Optional[Any]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            value = await get_from_cache(key)
+            if value is not None:
+                return value
+        return None
+
+    async def _acquire_lock(self, key: str):
+        """
+        Redis 락 획득 (SET NX PX)
+
+        Returns:
+            (획득 여부, 토큰) - Redis 를 쓸 수 없으면 (True, None) 으로 프로세스 내 병합만 적용
+        """
+        try:
+            redis_client = await get_redis_client()
+            if redis_client is None:
+                return True, None
+            token = secrets.token_hex(8)
+            acquired = await asyncio.wait_for(
+                redis_client.set(_lock_key(key), token, nx=True, px=int(self.lock_lease * 1000)),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
+            return bool(acquired), token if acquired else None
+        except Exception as e:
+            logger.debug(f" single-flight 락 획득 실패 (키: {key}): {type(e).__name__} - {e}")
+            return True, None
+
+    async def _release_lock(self, key: str, token: str) -> None:
+        try:
+            redis_client = await get_redis_client()
+            if redis_client is None:
+                return
+            await asyncio.wait_for(
+                redis_client.eval(RELEASE_LOCK_SCRIPT, 1, _lock_key(key), token),
+                timeout=CACHE_OPERATION_TIMEOUT
+            )
+        except Exception as e:
+            # 해제 실패 시 리스 만료로 정리됨
+            logger.debug(f" single-flight 락 해제 실패 (키: {key}): {type(e).__name__} - {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """요청 병합 지표"""
+        return {
+            "inflight": len(self._inflight),
+            **self._metrics.to_dict(),
+        }
+
+    def reset_metrics(self) -> None:
+        self._metrics = SingleFlightMetrics()
+
+
+# 프로세스 공용 인스턴스
+single_flight = SingleFlight()
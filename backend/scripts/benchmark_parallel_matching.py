@@ -0,0 +1,155 @@
+"""
+파싱/매칭 프로세스 모드 벤치마크 스크립트
+
+합성 XML 응답과 아파트 스냅샷으로 (연월, 시군구) 단위 파싱+매칭을 실행하여
+이벤트 루프 직접 처리(워커 0)와 프로세스 풀 워커 수별 처리 시간을 비교합니다.
+DB/외부 API 없이 실행되며, 워커 수와 관계없이 결과(저장 행, 로그 이벤트)가 같은지도 확인합니다.
+
+사용법:
+    python scripts/benchmark_parallel_matching.py [--units 40] [--items 2000] [--apartments 300]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+from app.services.data_collection.utils.trade_matching import (
+    TRANS_TYPE_SALE,
+    AptDetailRecord,
+    AptRecord,
+    RegionSnapshot,
+    StateRecord,
+    parse_and_match_trades,
+    run_parse_and_match,
+    shutdown_match_process_pool,
+)
+
+YM = "202401"
+DONG_NAMES = ["역삼동", "대치동", "삼성동", "개포동", "도곡동", "일원동", "수서동", "세곡동"]
+NAME_PREFIXES = ["래미안", "자이", "푸르지오", "힐스테이트", "아이파크", "롯데캐슬", "e편한세상", "더샵"]
+NAME_SUFFIXES = ["", "1차", "2차", "3단지", "센트럴", "파크", "리버뷰", "레이크"]
+
+
+def build_snapshot(sgg_cd: str, apartments: int, rng: random.Random) -> RegionSnapshot:
+    """합성 시군구 스냅샷 생성"""
+    regions: Dict[int, StateRecord] = {}
+    for idx, dong in enumerate(DONG_NAMES):
+        region_id = int(sgg_cd) * 100 + idx
+        regions[region_id] = StateRecord(region_id, f"{sgg_cd}{10100 + idx * 100:05d}", dong)
+
+    region_ids = list(regions)
+    apts: List[AptRecord] = []
+    details: Dict[int, AptDetailRecord] = {}
+    for i in range(apartments):
+        apt_id = int(sgg_cd) * 10000 + i
+        region_id = rng.choice(region_ids)
+        name = f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)}{i}"
+        apts.append(AptRecord(apt_id, name, region_id))
+        details[apt_id] = AptDetailRecord(
+            apt_id, f"서울특별시 {regions[region_id].region_name} {100 + i}", str(100 + i), "0"
+        )
+    return RegionSnapshot(sgg_cd=sgg_cd, apartments=apts, apt_details=details, regions=regions)
+
+
+def build_xml(snapshot: RegionSnapshot, items: int, rng: random.Random) -> bytes:
+    """합성 매매 API 응답 XML 생성 (일부는 이름 변형/미존재 아파트)"""
+    parts = ["<response><header><resultCode>000</resultCode><resultMsg>OK</resultMsg></header>",
+             "<body><items>"]
+    for i in range(items):
+        apt = rng.choice(snapshot.apartments)
+        region = snapshot.regions[apt.region_id]
+        jibun = snapshot.apt_details[apt.apt_id].jibun_bonbun
+        roll = rng.random()
+        if roll < 0.1:
+            apt_name, jibun = f"없는아파트{i}", str(9000 + i)
+        elif roll < 0.3:
+            apt_name = apt.apt_name.replace("차", " 차")
+        else:
+            apt_name = apt.apt_name
+        parts.append(
+            "<item>"
+            f"<aptNm>{apt_name}</aptNm><umdNm>{region.region_name}</umdNm>"
+            f"<sggCd>{snapshot.sgg_cd}</sggCd><umdCd>{region.region_code[5:]}</umdCd>"
+            f"<jibun>{jibun}</jibun><dealAmount>{rng.randint(30000, 300000):,}</dealAmount>"
+            f"<dealYear>{YM[:4]}</dealYear><dealMonth>{int(YM[4:])}</dealMonth><dealDay>{rng.randint(1, 28)}</dealDay>"
+            f"<excluUseAr>{rng.choice([59.9, 84.97, 114.5])}</excluUseAr><floor>{rng.randint(1, 30)}</floor>"
+            f"<buildYear>{rng.randint(1990, 2020)}</buildYear>"
+            "</item>"
+        )
+    parts.append(f"</items><totalCount>{items}</totalCount></body></response>")
+    return "".join(parts).encode("utf-8")
+
+
+def build_units(units: int, items: int, apartments: int) -> List[Tuple[bytes, RegionSnapshot]]:
+    rng = random.Random(42)
+    result = []
+    for i in range(units):
+        snapshot = build_snapshot(f"{11000 + i * 10}", apartments, rng)
+        result.append((build_xml(snapshot, items, rng), snapshot))
+    return result
+
+
+def signature(results) -> List[Tuple]:
+    """결과 비교용 요약 (행 수, 이벤트 수, 매칭된 apt_id 목록)"""
+    return [
+        (len(r.rows), len(r.events), r.error_count, tuple(row["apt_id"] for row in r.rows))
+        for r in results
+    ]
+
+
+async def run_once(units, workers: int):
+    if workers == 0:
+        return [parse_and_match_trades(content, snapshot, TRANS_TYPE_SALE, YM) for content, snapshot in units]
+    return await asyncio.gather(*(
+        run_parse_and_match(workers, content, snapshot, TRANS_TYPE_SALE, YM)
+        for content, snapshot in units
+    ))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="파싱/매칭 프로세스 모드 벤치마크")
+    parser.add_argument("--units", type=int, default=40, help="(연월, 시군구) 단위 수")
+    parser.add_argument("--items", type=int, default=2000, help="단위별 거래 수")
+    parser.add_argument("--apartments", type=int, default=300, help="시군구별 아파트 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [0] + sorted({w for w in (1, 2, 4, cpu_count) if w <= cpu_count})
+
+    print(f"합성 데이터 생성: {args.units}개 단위 × {args.items}건, 시군구별 아파트 {args.apartments}개")
+    units = build_units(args.units, args.items, args.apartments)
+    total_items = args.units * args.items
+
+    baseline_sig = None
+    baseline_ms = None
+    print(f"\n{'워커':>6} | {'평균(ms)':>10} | {'최소(ms)':>10} | {'건/초':>10} | {'배속':>6} | 결과")
+    print("-" * 66)
+    for workers in worker_counts:
+        # 워밍업 (프로세스 생성, 워커별 매칭 인덱스 구성 제외)
+        results = await run_once(units, workers)
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = await run_once(units, workers)
+            times.append((time.perf_counter() - start) * 1000)
+        shutdown_match_process_pool()
+
+        sig = signature(results)
+        if baseline_sig is None:
+            baseline_sig = sig
+            baseline_ms = statistics.mean(times)
+        avg_ms = statistics.mean(times)
+        label = "직접" if workers == 0 else str(workers)
+        print(
+            f"{label:>6} | {avg_ms:>10.1f} | {min(times):>10.1f} | "
+            f"{total_items / (avg_ms / 1000):>10.0f} | {baseline_ms / avg_ms:>5.2f}x | "
+            f"{'일치' if sig == baseline_sig else '불일치'}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -194,6 +194,8 @@ COMMENT ON COLUMN apart_details.is_deleted IS '소프트 삭제';
 
 -- 공간 인덱스 생성 (PostGIS)
 CREATE INDEX IF NOT EXISTS idx_apart_details_geometry ON apart_details USING GIST(geometry);
+-- geography 식 인덱스 (미터 단위 KNN 정렬 <-> 및 ST_DWithin 반경 검색)
+CREATE INDEX IF NOT EXISTS idx_apart_details_geography ON apart_details USING GIST (geography(geometry));
 
 -- 지하철 거리 파싱 함수 인덱스
 CREATE INDEX IF NOT EXISTS idx_apart_details_subway_time_parsed 
@@ -491,6 +493,137 @@ COMMENT ON COLUMN daily_statistics.stat_date IS '통계 날짜';
 COMMENT ON COLUMN daily_statistics.region_id IS '지역 ID (NULL이면 전국)';
 COMMENT ON COLUMN daily_statistics.transaction_type IS '거래 유형 (sale, rent)';
 
+-- ============================================================
+-- APT_MATCH_DECISIONS 테이블 (거래 API 아파트 매칭 결정)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS apt_match_decisions (
+    sgg_cd VARCHAR(5) NOT NULL,
+    umd_nm VARCHAR(50) NOT NULL DEFAULT '',
+    jibun VARCHAR(50) NOT NULL DEFAULT '',
+    api_apt_name VARCHAR(100) NOT NULL,
+    apt_id INTEGER NOT NULL,
+    method VARCHAR(30) NOT NULL,
+    matcher_version VARCHAR(20) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sgg_cd, umd_nm, jibun, api_apt_name),
+    CONSTRAINT fk_apt_match_decisions_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE apt_match_decisions IS '거래 API (시군구, 동, 지번, 아파트명) → apt_id 매칭 결정 (수집 재실행 시 매칭 생략용)';
+COMMENT ON COLUMN apt_match_decisions.method IS '매칭 단계 (address_jibun, name_matching 등)';
+COMMENT ON COLUMN apt_match_decisions.matcher_version IS '매칭 로직 버전 (버전이 다르면 재매칭)';
+
+-- ============================================================
+-- COLLECTION_WORK_UNITS 테이블 (실거래가 수집 작업 큐)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS collection_work_units (
+    kind VARCHAR(10) NOT NULL,
+    ym VARCHAR(6) NOT NULL,
+    sgg_cd VARCHAR(5) NOT NULL,
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    fetched_count INTEGER NOT NULL DEFAULT 0,
+    saved_count INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER,
+    last_error TEXT,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (kind, ym, sgg_cd),
+    CONSTRAINT chk_collection_work_units_status CHECK (status IN ('pending', 'running', 'done', 'failed'))
+);
+
+COMMENT ON TABLE collection_work_units IS '실거래가 수집 작업 큐 (종류, 연월, 시군구 단위, 중단 후 이어서 수집용)';
+COMMENT ON COLUMN collection_work_units.kind IS '수집 종류 (sales, rents)';
+COMMENT ON COLUMN collection_work_units.status IS '상태 (pending, running, done, failed)';
+COMMENT ON COLUMN collection_work_units.attempts IS '시도 횟수';
+COMMENT ON COLUMN collection_work_units.duration_ms IS '마지막 시도 소요 시간 (밀리초)';
+
+-- ============================================================
+-- MONTHLY_REGION_STATS 테이블 (월별 지역 거래 집계)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS monthly_region_stats (
+    region_id INTEGER NOT NULL,
+    ym VARCHAR(6) NOT NULL,
+    transaction_type VARCHAR(10) NOT NULL,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    price_count INTEGER NOT NULL DEFAULT 0,
+    total_price DECIMAL(18, 2),
+    avg_price DECIMAL(12, 2),
+    pyeong_count INTEGER NOT NULL DEFAULT 0,
+    total_price_per_pyeong DECIMAL(18, 2),
+    avg_price_per_pyeong DECIMAL(12, 2),
+    total_area DECIMAL(14, 2),
+    avg_area DECIMAL(7, 2),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (region_id, ym, transaction_type),
+    CONSTRAINT fk_monthly_region_stats_region FOREIGN KEY (region_id) REFERENCES states(region_id),
+    CONSTRAINT chk_monthly_region_stats_type CHECK (transaction_type IN ('sale', 'jeonse', 'wolse'))
+);
+
+COMMENT ON TABLE monthly_region_stats IS '월별 지역 거래 집계 (수집 시 변경된 월만 재집계)';
+COMMENT ON COLUMN monthly_region_stats.ym IS '계약 연월 (YYYYMM)';
+COMMENT ON COLUMN monthly_region_stats.transaction_type IS '거래 유형 (sale, jeonse, wolse)';
+COMMENT ON COLUMN monthly_region_stats.price_count IS '가격이 있는 거래 건수 (평균가 = total_price / price_count)';
+COMMENT ON COLUMN monthly_region_stats.pyeong_count IS '평당가 계산 가능 거래 건수 (전용면적 > 0)';
+
+-- ============================================================
+-- APARTMENT_PRICE_SUMMARY 테이블 (아파트별 가격 요약)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS apartment_price_summary (
+    apt_id INTEGER NOT NULL,
+    transaction_type VARCHAR(10) NOT NULL,
+    area_bucket SMALLINT NOT NULL,
+    latest_price INTEGER,
+    latest_area DECIMAL(7, 2),
+    latest_date DATE,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    count_6m INTEGER NOT NULL DEFAULT 0,
+    avg_price_6m DECIMAL(12, 2),
+    min_price_6m INTEGER,
+    max_price_6m INTEGER,
+    avg_price_per_pyeong_6m DECIMAL(12, 2),
+    avg_area_6m DECIMAL(7, 2),
+    count_12m INTEGER NOT NULL DEFAULT 0,
+    avg_price_12m DECIMAL(12, 2),
+    min_price_12m INTEGER,
+    max_price_12m INTEGER,
+    avg_price_per_pyeong_12m DECIMAL(12, 2),
+    avg_area_12m DECIMAL(7, 2),
+    as_of DATE NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apt_id, transaction_type, area_bucket),
+    CONSTRAINT fk_apartment_price_summary_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id),
+    CONSTRAINT chk_apartment_price_summary_type CHECK (transaction_type IN ('sale', 'jeonse'))
+);
+
+COMMENT ON TABLE apartment_price_summary IS '아파트별 가격 요약 (수집 시 변경된 아파트만 재계산)';
+COMMENT ON COLUMN apartment_price_summary.transaction_type IS '거래 유형 (sale, jeonse)';
+COMMENT ON COLUMN apartment_price_summary.area_bucket IS '평형 (ROUND(전용면적 / 3.3058), 0이면 전체)';
+COMMENT ON COLUMN apartment_price_summary.as_of IS '기간 집계 기준일 (6m = 최근 180일, 12m = 최근 360일)';
+
+-- ============================================================
+-- APARTMENT_NEIGHBORS 테이블 (아파트별 가장 가까운 단지 K개)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS apartment_neighbors (
+    apt_id INTEGER NOT NULL,
+    rank SMALLINT NOT NULL,
+    neighbor_apt_id INTEGER NOT NULL,
+    distance_meters DECIMAL(10, 2) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apt_id, rank),
+    CONSTRAINT fk_apartment_neighbors_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id),
+    CONSTRAINT fk_apartment_neighbors_neighbor FOREIGN KEY (neighbor_apt_id) REFERENCES apartments(apt_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_apartment_neighbors_neighbor_apt_id ON apartment_neighbors(neighbor_apt_id);
+
+COMMENT ON TABLE apartment_neighbors IS '아파트별 가장 가까운 단지 K개 (geometry 변경 시 영향받는 아파트만 재계산)';
+COMMENT ON COLUMN apartment_neighbors.rank IS '거리 순위 (1부터)';
+COMMENT ON COLUMN apartment_neighbors.distance_meters IS 'geography 기준 거리 (미터)';
+
 -- ============================================================
 -- 인덱스 생성 (성능 최적화)
 -- ============================================================
@@ -526,11 +659,17 @@ CREATE INDEX IF NOT EXISTS idx_recent_searches_created_at ON recent_searches(cre
 CREATE INDEX IF NOT EXISTS idx_recent_views_account_id ON recent_views(account_id);
 CREATE INDEX IF NOT EXISTS idx_recent_views_apt_id ON recent_views(apt_id);
 CREATE INDEX IF NOT EXISTS idx_recent_views_viewed_at ON recent_views(viewed_at);
+-- 최근 검색어/최근 본 아파트 UNIQUE 인덱스 (기록 버퍼 일괄 upsert 용, 삭제되지 않은 행 기준)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_recent_searches_account_query ON recent_searches(account_id, search_type, query) WHERE is_deleted = FALSE;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_recent_views_account_apt ON recent_views(account_id, apt_id) WHERE is_deleted = FALSE;
 CREATE INDEX IF NOT EXISTS idx_asset_activity_logs_account_id ON asset_activity_logs(account_id);
 CREATE INDEX IF NOT EXISTS idx_asset_activity_logs_apt_id ON asset_activity_logs(apt_id);
 CREATE INDEX IF NOT EXISTS idx_asset_activity_logs_created_at ON asset_activity_logs(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_daily_stats_date ON daily_statistics(stat_date DESC);
 CREATE INDEX IF NOT EXISTS idx_daily_stats_region_date ON daily_statistics(region_id, stat_date DESC);
+CREATE INDEX IF NOT EXISTS idx_apt_match_decisions_apt_id ON apt_match_decisions(apt_id);
+CREATE INDEX IF NOT EXISTS idx_collection_work_units_claim ON collection_work_units(kind, status, ym);
+CREATE INDEX IF NOT EXISTS idx_monthly_region_stats_type_ym ON monthly_region_stats(transaction_type, ym);
 CREATE INDEX IF NOT EXISTS idx_daily_stats_type_date ON daily_statistics(transaction_type, stat_date DESC);
 
 -- pg_trgm 인덱스 (아파트명 유사도 검색용)
@@ -709,11 +848,19 @@ CREATE INDEX IF NOT EXISTS idx_sales_apt_date_canceled
 ON sales(apt_id, contract_date DESC, is_canceled)
 WHERE (is_deleted = FALSE OR is_deleted IS NULL);
 
+-- 매매 자연키 UNIQUE 인덱스 (수집 일괄 저장 INSERT ... ON CONFLICT 용)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_sales_natural_key
+ON sales (apt_id, contract_date, trans_price, floor, exclusive_area) NULLS NOT DISTINCT;
+
 -- 전세/월세 구분 인덱스
 CREATE INDEX IF NOT EXISTS idx_rents_apt_date_type
 ON rents(apt_id, deal_date DESC, monthly_rent)
 WHERE (is_deleted = FALSE OR is_deleted IS NULL);
 
+-- 전월세 자연키 UNIQUE 인덱스 (수집 일괄 저장 INSERT ... ON CONFLICT 용)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_rents_natural_key
+ON rents (apt_id, deal_date, floor, exclusive_area, deposit_price, monthly_rent, apt_seq) NULLS NOT DISTINCT;
+
 -- 아파트 검색용 복합 인덱스
 CREATE INDEX IF NOT EXISTS idx_apartments_region_deleted_name
 ON apartments(region_id, is_deleted, apt_name)
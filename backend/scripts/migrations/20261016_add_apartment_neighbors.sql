@@ -0,0 +1,55 @@
+-- ============================================================
+-- apartment_neighbors 테이블 + geography KNN 인덱스 추가 (주변 아파트 사전 계산)
+-- 생성일: 2026-10-16
+-- 설명: apart_details에 geography(geometry) 식 GiST 인덱스를 추가해
+--       ORDER BY geography(geometry) <-> :target LIMIT k 형태의 KNN 정렬과
+--       ST_DWithin(geography(geometry), :target, :meters) 반경 검색이 인덱스로 처리되도록 합니다.
+--       apartment_neighbors는 아파트별로 가장 가까운 단지 20개를 거리순으로 저장하며,
+--       geometry 일괄 업데이트 후 영향받는 아파트만 다시 계산합니다(ApartmentNeighborService).
+--       주변 아파트 비교 API는 이 테이블을 먼저 조회하고, 없으면 KNN 쿼리로 조회합니다.
+--       이 마이그레이션은 기존 데이터 전체를 한 번 계산합니다.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS idx_apart_details_geography ON apart_details USING GIST (geography(geometry));
+
+CREATE TABLE IF NOT EXISTS apartment_neighbors (
+    apt_id INTEGER NOT NULL,
+    rank SMALLINT NOT NULL,
+    neighbor_apt_id INTEGER NOT NULL,
+    distance_meters DECIMAL(10, 2) NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apt_id, rank),
+    CONSTRAINT fk_apartment_neighbors_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id),
+    CONSTRAINT fk_apartment_neighbors_neighbor FOREIGN KEY (neighbor_apt_id) REFERENCES apartments(apt_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_apartment_neighbors_neighbor_apt_id ON apartment_neighbors(neighbor_apt_id);
+
+COMMENT ON TABLE apartment_neighbors IS '아파트별 가장 가까운 단지 K개 (geometry 변경 시 영향받는 아파트만 재계산)';
+COMMENT ON COLUMN apartment_neighbors.rank IS '거리 순위 (1부터)';
+COMMENT ON COLUMN apartment_neighbors.distance_meters IS 'geography 기준 거리 (미터)';
+
+ANALYZE apart_details;
+
+-- 기존 데이터 계산 (아파트마다 인덱스 KNN 1회)
+INSERT INTO apartment_neighbors (apt_id, rank, neighbor_apt_id, distance_meters, updated_at)
+SELECT ranked.apt_id, ranked.rank, ranked.neighbor_apt_id, ranked.distance_meters, NOW()
+FROM (
+    SELECT t.apt_id, knn.apt_id AS neighbor_apt_id, knn.distance_meters,
+           ROW_NUMBER() OVER (PARTITION BY t.apt_id ORDER BY knn.distance_meters, knn.apt_id) AS rank
+    FROM apart_details t
+    CROSS JOIN LATERAL (
+        SELECT n.apt_id, ST_Distance(geography(n.geometry), geography(t.geometry)) AS distance_meters
+        FROM apart_details n
+        WHERE n.is_deleted = FALSE
+          AND n.geometry IS NOT NULL
+          AND n.apt_id <> t.apt_id
+        ORDER BY geography(n.geometry) <-> geography(t.geometry)
+        LIMIT 20
+    ) knn
+    WHERE t.is_deleted = FALSE
+      AND t.geometry IS NOT NULL
+) ranked
+ON CONFLICT (apt_id, rank) DO NOTHING;
+
+ANALYZE apartment_neighbors;
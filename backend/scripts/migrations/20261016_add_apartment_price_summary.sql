@@ -0,0 +1,156 @@
+-- ============================================================
+-- apartment_price_summary 테이블 추가 (아파트별 가격 요약)
+-- 생성일: 2026-10-16
+-- 설명: (아파트, 거래 유형, 평형) 단위로 최신 거래와 최근 6/12개월 가격 집계를 저장합니다.
+--       평형은 ROUND(전용면적 / 3.3058)이며 0은 전체 면적입니다.
+--       실거래가 수집 후 거래가 저장된 아파트만 다시 계산하고(ApartmentPriceSummaryService),
+--       매일 새벽 통계 사전 계산 때 전체를 다시 계산해 기간 집계 기준일(as_of)을 맞춥니다.
+--       관심 아파트/내 집/지도/비교/평형별 가격 API는 원본 sales/rents 대신 이 테이블을 조회합니다.
+--       이 마이그레이션은 기존 데이터 전체를 한 번 계산합니다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS apartment_price_summary (
+    apt_id INTEGER NOT NULL,
+    transaction_type VARCHAR(10) NOT NULL,
+    area_bucket SMALLINT NOT NULL,
+    latest_price INTEGER,
+    latest_area DECIMAL(7, 2),
+    latest_date DATE,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    count_6m INTEGER NOT NULL DEFAULT 0,
+    avg_price_6m DECIMAL(12, 2),
+    min_price_6m INTEGER,
+    max_price_6m INTEGER,
+    avg_price_per_pyeong_6m DECIMAL(12, 2),
+    avg_area_6m DECIMAL(7, 2),
+    count_12m INTEGER NOT NULL DEFAULT 0,
+    avg_price_12m DECIMAL(12, 2),
+    min_price_12m INTEGER,
+    max_price_12m INTEGER,
+    avg_price_per_pyeong_12m DECIMAL(12, 2),
+    avg_area_12m DECIMAL(7, 2),
+    as_of DATE NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apt_id, transaction_type, area_bucket),
+    CONSTRAINT fk_apartment_price_summary_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id),
+    CONSTRAINT chk_apartment_price_summary_type CHECK (transaction_type IN ('sale', 'jeonse'))
+);
+
+COMMENT ON TABLE apartment_price_summary IS '아파트별 가격 요약 (수집 시 변경된 아파트만 재계산)';
+COMMENT ON COLUMN apartment_price_summary.transaction_type IS '거래 유형 (sale, jeonse)';
+COMMENT ON COLUMN apartment_price_summary.area_bucket IS '평형 (ROUND(전용면적 / 3.3058), 0이면 전체)';
+COMMENT ON COLUMN apartment_price_summary.as_of IS '기간 집계 기준일 (6m = 최근 180일, 12m = 최근 360일)';
+
+-- 기존 데이터 계산 (매매)
+WITH src AS (
+    SELECT s.apt_id, s.trans_id AS deal_id, s.trans_price AS price,
+           s.exclusive_area AS area, s.contract_date AS deal_date
+    FROM sales s
+    WHERE s.is_canceled = FALSE
+      AND (s.is_deleted = FALSE OR s.is_deleted IS NULL)
+      AND s.trans_price > 0
+      AND s.exclusive_area > 0
+      AND s.contract_date IS NOT NULL
+),
+keyed AS (
+    SELECT apt_id, GREATEST(ROUND(area / 3.3058), 1)::SMALLINT AS area_bucket, deal_id, price, area, deal_date FROM src
+    UNION ALL
+    SELECT apt_id, 0::SMALLINT, deal_id, price, area, deal_date FROM src
+),
+latest AS (
+    SELECT DISTINCT ON (apt_id, area_bucket) apt_id, area_bucket, price, area, deal_date
+    FROM keyed
+    ORDER BY apt_id, area_bucket, deal_date DESC, deal_id DESC
+),
+agg AS (
+    SELECT
+        apt_id, area_bucket,
+        COUNT(*) AS transaction_count,
+        COUNT(*) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS count_6m,
+        AVG(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_price_6m,
+        MIN(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS min_price_6m,
+        MAX(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS max_price_6m,
+        AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_price_per_pyeong_6m,
+        AVG(area) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_area_6m,
+        COUNT(*) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS count_12m,
+        AVG(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_price_12m,
+        MIN(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS min_price_12m,
+        MAX(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS max_price_12m,
+        AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_price_per_pyeong_12m,
+        AVG(area) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_area_12m
+    FROM keyed
+    GROUP BY apt_id, area_bucket
+)
+INSERT INTO apartment_price_summary (
+    apt_id, transaction_type, area_bucket,
+    latest_price, latest_area, latest_date, transaction_count,
+    count_6m, avg_price_6m, min_price_6m, max_price_6m, avg_price_per_pyeong_6m, avg_area_6m,
+    count_12m, avg_price_12m, min_price_12m, max_price_12m, avg_price_per_pyeong_12m, avg_area_12m,
+    as_of, updated_at
+)
+SELECT
+    agg.apt_id, 'sale', agg.area_bucket,
+    latest.price, latest.area, latest.deal_date, agg.transaction_count,
+    agg.count_6m, agg.avg_price_6m, agg.min_price_6m, agg.max_price_6m, agg.avg_price_per_pyeong_6m, agg.avg_area_6m,
+    agg.count_12m, agg.avg_price_12m, agg.min_price_12m, agg.max_price_12m, agg.avg_price_per_pyeong_12m, agg.avg_area_12m,
+    CURRENT_DATE, NOW()
+FROM agg
+JOIN latest ON latest.apt_id = agg.apt_id AND latest.area_bucket = agg.area_bucket
+ON CONFLICT (apt_id, transaction_type, area_bucket) DO NOTHING;
+
+-- 기존 데이터 계산 (전세: 월세 0/NULL, 가격은 보증금)
+WITH src AS (
+    SELECT r.apt_id, r.trans_id AS deal_id, r.deposit_price AS price,
+           r.exclusive_area AS area, r.deal_date AS deal_date
+    FROM rents r
+    WHERE (r.monthly_rent = 0 OR r.monthly_rent IS NULL)
+      AND (r.is_deleted = FALSE OR r.is_deleted IS NULL)
+      AND r.deposit_price > 0
+      AND r.exclusive_area > 0
+      AND r.deal_date IS NOT NULL
+),
+keyed AS (
+    SELECT apt_id, GREATEST(ROUND(area / 3.3058), 1)::SMALLINT AS area_bucket, deal_id, price, area, deal_date FROM src
+    UNION ALL
+    SELECT apt_id, 0::SMALLINT, deal_id, price, area, deal_date FROM src
+),
+latest AS (
+    SELECT DISTINCT ON (apt_id, area_bucket) apt_id, area_bucket, price, area, deal_date
+    FROM keyed
+    ORDER BY apt_id, area_bucket, deal_date DESC, deal_id DESC
+),
+agg AS (
+    SELECT
+        apt_id, area_bucket,
+        COUNT(*) AS transaction_count,
+        COUNT(*) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS count_6m,
+        AVG(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_price_6m,
+        MIN(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS min_price_6m,
+        MAX(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS max_price_6m,
+        AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_price_per_pyeong_6m,
+        AVG(area) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 180 AND CURRENT_DATE) AS avg_area_6m,
+        COUNT(*) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS count_12m,
+        AVG(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_price_12m,
+        MIN(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS min_price_12m,
+        MAX(price) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS max_price_12m,
+        AVG(price / area * 3.3) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_price_per_pyeong_12m,
+        AVG(area) FILTER (WHERE deal_date BETWEEN CURRENT_DATE - 360 AND CURRENT_DATE) AS avg_area_12m
+    FROM keyed
+    GROUP BY apt_id, area_bucket
+)
+INSERT INTO apartment_price_summary (
+    apt_id, transaction_type, area_bucket,
+    latest_price, latest_area, latest_date, transaction_count,
+    count_6m, avg_price_6m, min_price_6m, max_price_6m, avg_price_per_pyeong_6m, avg_area_6m,
+    count_12m, avg_price_12m, min_price_12m, max_price_12m, avg_price_per_pyeong_12m, avg_area_12m,
+    as_of, updated_at
+)
+SELECT
+    agg.apt_id, 'jeonse', agg.area_bucket,
+    latest.price, latest.area, latest.deal_date, agg.transaction_count,
+    agg.count_6m, agg.avg_price_6m, agg.min_price_6m, agg.max_price_6m, agg.avg_price_per_pyeong_6m, agg.avg_area_6m,
+    agg.count_12m, agg.avg_price_12m, agg.min_price_12m, agg.max_price_12m, agg.avg_price_per_pyeong_12m, agg.avg_area_12m,
+    CURRENT_DATE, NOW()
+FROM agg
+JOIN latest ON latest.apt_id = agg.apt_id AND latest.area_bucket = agg.area_bucket
+ON CONFLICT (apt_id, transaction_type, area_bucket) DO NOTHING;
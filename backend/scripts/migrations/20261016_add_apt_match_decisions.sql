@@ -0,0 +1,27 @@
+-- ============================================================
+-- apt_match_decisions 테이블 추가 (거래 API 아파트 매칭 결정 저장)
+-- 생성일: 2026-10-16
+-- 설명: 매매/전월세 수집 시 (시군구, 동, 지번, 아파트명) 조합의 매칭 결과를 저장하여
+--       다음 수집 실행(과거 데이터 재수집 포함)에서 매칭 로직을 생략합니다.
+--       matcher_version이 현재 버전과 다른 결정은 사용하지 않습니다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS apt_match_decisions (
+    sgg_cd VARCHAR(5) NOT NULL,
+    umd_nm VARCHAR(50) NOT NULL DEFAULT '',
+    jibun VARCHAR(50) NOT NULL DEFAULT '',
+    api_apt_name VARCHAR(100) NOT NULL,
+    apt_id INTEGER NOT NULL,
+    method VARCHAR(30) NOT NULL,
+    matcher_version VARCHAR(20) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (sgg_cd, umd_nm, jibun, api_apt_name),
+    CONSTRAINT fk_apt_match_decisions_apt FOREIGN KEY (apt_id) REFERENCES apartments(apt_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_apt_match_decisions_apt_id ON apt_match_decisions(apt_id);
+
+COMMENT ON TABLE apt_match_decisions IS '거래 API (시군구, 동, 지번, 아파트명) → apt_id 매칭 결정 (수집 재실행 시 매칭 생략용)';
+COMMENT ON COLUMN apt_match_decisions.method IS '매칭 단계 (address_jibun, name_matching 등)';
+COMMENT ON COLUMN apt_match_decisions.matcher_version IS '매칭 로직 버전 (버전이 다르면 재매칭)';
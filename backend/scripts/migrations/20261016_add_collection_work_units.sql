@@ -0,0 +1,32 @@
+-- ============================================================
+-- collection_work_units 테이블 추가 (실거래가 수집 작업 큐)
+-- 생성일: 2026-10-16
+-- 설명: 매매/전월세 수집을 (종류, 연월, 시군구) 단위로 나누어 상태/시도 횟수/소요 시간을 기록합니다.
+--       수집이 중단되어도 resume 옵션으로 완료되지 않은 단위부터 이어서 수집합니다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS collection_work_units (
+    kind VARCHAR(10) NOT NULL,
+    ym VARCHAR(6) NOT NULL,
+    sgg_cd VARCHAR(5) NOT NULL,
+    status VARCHAR(10) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    fetched_count INTEGER NOT NULL DEFAULT 0,
+    saved_count INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER,
+    last_error TEXT,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (kind, ym, sgg_cd),
+    CONSTRAINT chk_collection_work_units_status CHECK (status IN ('pending', 'running', 'done', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_collection_work_units_claim ON collection_work_units(kind, status, ym);
+
+COMMENT ON TABLE collection_work_units IS '실거래가 수집 작업 큐 (종류, 연월, 시군구 단위, 중단 후 이어서 수집용)';
+COMMENT ON COLUMN collection_work_units.kind IS '수집 종류 (sales, rents)';
+COMMENT ON COLUMN collection_work_units.status IS '상태 (pending, running, done, failed)';
+COMMENT ON COLUMN collection_work_units.attempts IS '시도 횟수';
+COMMENT ON COLUMN collection_work_units.duration_ms IS '마지막 시도 소요 시간 (밀리초)';
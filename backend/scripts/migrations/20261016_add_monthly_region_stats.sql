@@ -0,0 +1,95 @@
+-- ============================================================
+-- monthly_region_stats 테이블 추가 (월별 지역 거래 집계)
+-- 생성일: 2026-10-16
+-- 설명: (지역, 연월, 거래 유형) 단위로 거래 건수/가격/평당가/면적 합계와 평균을 저장합니다.
+--       실거래가 수집 후 저장된 거래가 있는 월만 다시 집계하며(MonthlyRegionStatsService),
+--       지도/대시보드/통계 API는 원본 sales/rents 대신 이 테이블을 조회합니다.
+--       이 마이그레이션은 기존 데이터 전체를 한 번 집계합니다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS monthly_region_stats (
+    region_id INTEGER NOT NULL,
+    ym VARCHAR(6) NOT NULL,
+    transaction_type VARCHAR(10) NOT NULL,
+    transaction_count INTEGER NOT NULL DEFAULT 0,
+    price_count INTEGER NOT NULL DEFAULT 0,
+    total_price DECIMAL(18, 2),
+    avg_price DECIMAL(12, 2),
+    pyeong_count INTEGER NOT NULL DEFAULT 0,
+    total_price_per_pyeong DECIMAL(18, 2),
+    avg_price_per_pyeong DECIMAL(12, 2),
+    total_area DECIMAL(14, 2),
+    avg_area DECIMAL(7, 2),
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (region_id, ym, transaction_type),
+    CONSTRAINT fk_monthly_region_stats_region FOREIGN KEY (region_id) REFERENCES states(region_id),
+    CONSTRAINT chk_monthly_region_stats_type CHECK (transaction_type IN ('sale', 'jeonse', 'wolse'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_monthly_region_stats_type_ym ON monthly_region_stats(transaction_type, ym);
+
+COMMENT ON TABLE monthly_region_stats IS '월별 지역 거래 집계 (수집 시 변경된 월만 재집계)';
+COMMENT ON COLUMN monthly_region_stats.ym IS '계약 연월 (YYYYMM)';
+COMMENT ON COLUMN monthly_region_stats.transaction_type IS '거래 유형 (sale, jeonse, wolse)';
+COMMENT ON COLUMN monthly_region_stats.price_count IS '가격이 있는 거래 건수 (평균가 = total_price / price_count)';
+COMMENT ON COLUMN monthly_region_stats.pyeong_count IS '평당가 계산 가능 거래 건수 (전용면적 > 0)';
+
+-- 기존 데이터 집계 (매매)
+INSERT INTO monthly_region_stats (
+    region_id, ym, transaction_type,
+    transaction_count, price_count, total_price, avg_price,
+    pyeong_count, total_price_per_pyeong, avg_price_per_pyeong,
+    total_area, avg_area, updated_at
+)
+SELECT
+    a.region_id,
+    TO_CHAR(s.contract_date, 'YYYYMM'),
+    'sale',
+    COUNT(*),
+    COUNT(s.trans_price),
+    SUM(s.trans_price),
+    AVG(s.trans_price),
+    COUNT(*) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+    SUM(s.trans_price / s.exclusive_area * 3.3) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+    AVG(s.trans_price / s.exclusive_area * 3.3) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+    SUM(s.exclusive_area) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+    AVG(s.exclusive_area) FILTER (WHERE s.trans_price IS NOT NULL AND s.exclusive_area > 0),
+    NOW()
+FROM sales s
+JOIN apartments a ON s.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+WHERE s.is_canceled = FALSE
+  AND (s.is_deleted = FALSE OR s.is_deleted IS NULL)
+  AND s.contract_date IS NOT NULL
+  AND a.region_id IS NOT NULL
+GROUP BY a.region_id, TO_CHAR(s.contract_date, 'YYYYMM')
+ON CONFLICT (region_id, ym, transaction_type) DO NOTHING;
+
+-- 기존 데이터 집계 (전월세: 월세 0/NULL이면 전세)
+INSERT INTO monthly_region_stats (
+    region_id, ym, transaction_type,
+    transaction_count, price_count, total_price, avg_price,
+    pyeong_count, total_price_per_pyeong, avg_price_per_pyeong,
+    total_area, avg_area, updated_at
+)
+SELECT
+    a.region_id,
+    TO_CHAR(r.deal_date, 'YYYYMM'),
+    CASE WHEN r.monthly_rent = 0 OR r.monthly_rent IS NULL THEN 'jeonse' ELSE 'wolse' END,
+    COUNT(*),
+    COUNT(r.deposit_price),
+    SUM(r.deposit_price),
+    AVG(r.deposit_price),
+    COUNT(*) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+    SUM(r.deposit_price / r.exclusive_area * 3.3) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+    AVG(r.deposit_price / r.exclusive_area * 3.3) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+    SUM(r.exclusive_area) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+    AVG(r.exclusive_area) FILTER (WHERE r.deposit_price IS NOT NULL AND r.exclusive_area > 0),
+    NOW()
+FROM rents r
+JOIN apartments a ON r.apt_id = a.apt_id AND (a.is_deleted = FALSE OR a.is_deleted IS NULL)
+WHERE (r.is_deleted = FALSE OR r.is_deleted IS NULL)
+  AND r.deal_date IS NOT NULL
+  AND a.region_id IS NOT NULL
+GROUP BY a.region_id, TO_CHAR(r.deal_date, 'YYYYMM'),
+         CASE WHEN r.monthly_rent = 0 OR r.monthly_rent IS NULL THEN 'jeonse' ELSE 'wolse' END
+ON CONFLICT (region_id, ym, transaction_type) DO NOTHING;
@@ -0,0 +1,36 @@
+-- ============================================================
+-- 최근 검색어/최근 본 아파트 UNIQUE 인덱스 추가 (일괄 저장 INSERT ... ON CONFLICT 용)
+-- 생성일: 2026-10-16
+-- 설명: 검색/상세 조회 요청마다 SELECT 후 INSERT/UPDATE 하던 기록을
+--       메모리 버퍼에 모아 여러 행을 한 번에 upsert 할 수 있도록
+--       삭제되지 않은 행 기준 부분 UNIQUE 인덱스를 생성합니다.
+-- ============================================================
+
+-- 1. 기존 중복 행 정리 (가장 최근 기록 유지, 나머지는 소프트 삭제)
+UPDATE recent_searches a
+SET is_deleted = TRUE, updated_at = NOW()
+FROM recent_searches b
+WHERE a.is_deleted = FALSE
+  AND b.is_deleted = FALSE
+  AND a.account_id = b.account_id
+  AND a.search_type = b.search_type
+  AND a.query = b.query
+  AND (COALESCE(a.created_at, '-infinity'), a.search_id) < (COALESCE(b.created_at, '-infinity'), b.search_id);
+
+UPDATE recent_views a
+SET is_deleted = TRUE, updated_at = NOW()
+FROM recent_views b
+WHERE a.is_deleted = FALSE
+  AND b.is_deleted = FALSE
+  AND a.account_id = b.account_id
+  AND a.apt_id = b.apt_id
+  AND (COALESCE(a.viewed_at, '-infinity'), a.view_id) < (COALESCE(b.viewed_at, '-infinity'), b.view_id);
+
+-- 2. 삭제되지 않은 행 기준 UNIQUE 인덱스 생성
+CREATE UNIQUE INDEX IF NOT EXISTS uq_recent_searches_account_query
+ON recent_searches (account_id, search_type, query)
+WHERE is_deleted = FALSE;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_recent_views_account_apt
+ON recent_views (account_id, apt_id)
+WHERE is_deleted = FALSE;
@@ -0,0 +1,24 @@
+-- ============================================================
+-- rents 자연키 UNIQUE 인덱스 추가 (일괄 저장 INSERT ... ON CONFLICT 용)
+-- 생성일: 2026-10-16
+-- 설명: 전월세 수집이 행마다 중복 확인 SELECT를 하지 않고
+--       (apt_id, deal_date, floor, exclusive_area, deposit_price, monthly_rent, apt_seq)
+--       자연키로 INSERT ... ON CONFLICT 처리할 수 있도록 UNIQUE 인덱스를 생성합니다.
+--       전세는 monthly_rent가 NULL이므로 NULLS NOT DISTINCT (PostgreSQL 15+) 사용
+-- ============================================================
+
+-- 1. 기존 중복 행 정리 (가장 먼저 저장된 행 유지)
+DELETE FROM rents a
+USING rents b
+WHERE a.trans_id > b.trans_id
+  AND a.apt_id = b.apt_id
+  AND a.deal_date = b.deal_date
+  AND a.floor = b.floor
+  AND a.exclusive_area = b.exclusive_area
+  AND a.deposit_price IS NOT DISTINCT FROM b.deposit_price
+  AND a.monthly_rent IS NOT DISTINCT FROM b.monthly_rent
+  AND a.apt_seq IS NOT DISTINCT FROM b.apt_seq;
+
+-- 2. 자연키 UNIQUE 인덱스 생성
+CREATE UNIQUE INDEX IF NOT EXISTS uq_rents_natural_key
+ON rents (apt_id, deal_date, floor, exclusive_area, deposit_price, monthly_rent, apt_seq) NULLS NOT DISTINCT;
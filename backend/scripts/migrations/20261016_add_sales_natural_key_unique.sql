@@ -0,0 +1,22 @@
+-- ============================================================
+-- sales 자연키 UNIQUE 인덱스 추가 (일괄 저장 INSERT ... ON CONFLICT 용)
+-- 생성일: 2026-10-16
+-- 설명: 매매 수집이 행마다 중복 확인 SELECT를 하지 않고
+--       (apt_id, contract_date, trans_price, floor, exclusive_area) 자연키로
+--       INSERT ... ON CONFLICT 처리할 수 있도록 UNIQUE 인덱스를 생성합니다.
+--       contract_date/trans_price는 NULL 가능하므로 NULLS NOT DISTINCT (PostgreSQL 15+) 사용
+-- ============================================================
+
+-- 1. 기존 중복 행 정리 (수집 로직과 동일한 기준, 가장 먼저 저장된 행 유지)
+DELETE FROM sales a
+USING sales b
+WHERE a.trans_id > b.trans_id
+  AND a.apt_id = b.apt_id
+  AND a.contract_date IS NOT DISTINCT FROM b.contract_date
+  AND a.trans_price IS NOT DISTINCT FROM b.trans_price
+  AND a.floor = b.floor
+  AND a.exclusive_area = b.exclusive_area;
+
+-- 2. 자연키 UNIQUE 인덱스 생성
+CREATE UNIQUE INDEX IF NOT EXISTS uq_sales_natural_key
+ON sales (apt_id, contract_date, trans_price, floor, exclusive_area) NULLS NOT DISTINCT;
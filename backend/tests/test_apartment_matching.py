@@ -0,0 +1,201 @@
+"""아파트 매칭 결과 보존 테스트 (app.services.data_collection.utils.matching / matcher_index)
+
+지역별 사전 계산 인덱스(RegionMatcherIndex)로 후보를 줄여도 매칭 결과가 바뀌지 않는지 확인합니다.
+기대 apt_id 는 인덱스 도입 전 구현(후보 전체 점수 계산)으로 같은 입력을 매칭해 기록한 값이며,
+인덱스 없이 / 인덱스 사용 두 경로 모두 같은 결과여야 합니다.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.data_collection.utils.matcher_index import RegionMatcherIndex
+from app.services.data_collection.utils.matching import ApartmentMatcher
+
+SGG_CD = "11680"
+
+REGIONS = {
+    1: SimpleNamespace(region_id=1, region_name="대치동", region_code="1168010600"),
+    2: SimpleNamespace(region_id=2, region_name="개포동", region_code="1168010300"),
+    3: SimpleNamespace(region_id=3, region_name="도곡동", region_code="1168011800"),
+    4: SimpleNamespace(region_id=4, region_name="역삼동", region_code="1168010100"),
+    5: SimpleNamespace(region_id=5, region_name="일원동", region_code="1168011400"),
+}
+
+# (apt_id, apt_name, region_id, jibun_address, use_approval_date)
+APARTMENTS = [
+    (101, "은마", 1, "서울특별시 강남구 대치동 316 은마아파트", "1979-08-01"),
+    (102, "래미안대치팰리스1단지", 1, "서울특별시 강남구 대치동 1027", "2015-09-01"),
+    (103, "래미안대치팰리스2단지", 1, "서울특별시 강남구 대치동 1028", "2015-09-01"),
+    (104, "대치아이파크", 1, "서울특별시 강남구 대치동 1026", "2008-07-01"),
+    (105, "한보미도맨션1차", 1, "서울특별시 강남구 대치동 503", "1983-12-01"),
+    (106, "한보미도맨션2차", 1, "서울특별시 강남구 대치동 503-1", "1985-01-01"),
+    (107, "대치삼성1차", 1, "서울특별시 강남구 대치동 63", "2000-11-01"),
+    (108, "개포자이프레지던스", 2, "서울특별시 강남구 개포동 1283", "2023-02-01"),
+    (109, "디에이치아너힐즈", 2, "서울특별시 강남구 개포동 1280", "2019-08-01"),
+    (110, "래미안블레스티지", 2, "서울특별시 강남구 개포동 1281", "2019-02-01"),
+    (111, "개포주공6단지", 2, "서울특별시 강남구 개포동 185", "1983-11-01"),
+    (112, "개포주공7단지", 2, "서울특별시 강남구 개포동 187", "1983-11-01"),
+    (113, "도곡렉슬", 3, "서울특별시 강남구 도곡동 527", "2006-01-01"),
+    (114, "타워팰리스1차", 3, "서울특별시 강남구 도곡동 467", "2002-10-01"),
+    (115, "타워팰리스2차", 3, "서울특별시 강남구 도곡동 467-6", "2003-09-01"),
+    (116, "도곡삼성래미안", 3, "서울특별시 강남구 도곡동 953", "2001-06-01"),
+    (117, "역삼래미안", 4, "서울특별시 강남구 역삼동 754", "2005-05-01"),
+    (118, "역삼아이파크", 4, "서울특별시 강남구 역삼동 780", "2006-06-01"),
+    (119, "e편한세상일원", 5, "서울특별시 강남구 일원동 615", "2005-03-01"),
+    (120, "LG개포자이", 2, "서울특별시 강남구 개포동 12", "2004-05-01"),
+    (121, "일원동 한솔마을(LH임대)", 5, "서울특별시 강남구 일원동 700", "1994-01-01"),
+    (122, "상록수(에스케이)", 5, "서울특별시 강남구 일원동 720", "1993-01-01"),
+]
+
+# (API 아파트명, 법정동, 지번, 건축년도, 기대 apt_id(동 검증), 기대 apt_id(동 검증 없음))
+NAME_CASES = [
+    ('은마', '대치동', '316', '1979', 101, 101),
+    ('은마아파트', '대치동', '316', '1979', 101, 101),
+    ('래미안 대치 팰리스 1단지', '대치동', '1027', '2015', 102, 102),
+    ('래미안대치팰리스2단지', '대치동', '1028', '2015', 103, 103),
+    ('래미안대치팰리스', '대치동', '1027', '2015', 102, 102),
+    ('대치 아이파크', '대치동', '1026', '2008', 104, 104),
+    ('대치I-PARK', '대치동', '1026', '2008', None, None),
+    ('한보미도맨션1', '대치동', '503', '1983', 105, 105),
+    ('미도2차', '대치동', '503-1', '1985', 106, 106),
+    ('삼성1차', '대치동', '63', '2000', 107, 107),
+    ('개포자이 프레지던스', '개포동', '1283', '2023', 108, 108),
+    ('디에이치 아너힐즈', '개포동', '1280', '2019', 109, 109),
+    ('래미안 블레스티지', '개포동', '1281', '2019', 110, 110),
+    ('개포주공 6단지', '개포동', '185', '1983', 111, 111),
+    ('개포주공7', '개포동', '187', '1983', 112, 112),
+    ('도곡 렉슬', '도곡동', '527', '2006', 113, 113),
+    ('타워팰리스', '도곡동', '467', '2002', 114, 114),
+    ('타워팰리스2', '도곡동', '467-6', '2003', 115, 115),
+    ('삼성래미안', '도곡동', '953', '2001', 116, 116),
+    ('역삼 래미안', '역삼동', '754', '2005', 117, 117),
+    ('역삼I PARK', '역삼동', '780', '2006', None, None),
+    ('이편한세상 일원', '일원동', '615', '2005', 119, 119),
+    ('엘지개포자이', '개포동', '12', '2004', 120, 120),
+    ('LG개포 자이', '개포동', None, None, 120, 120),
+    ('한솔마을', '일원동', '700', '1994', None, None),
+    ('상록수에스케이', '일원동', '720', '1993', 122, 122),
+    ('(1027)', '대치동', '1027', None, None, None),
+    ('(467-6)', '도곡동', '467-6', None, None, None),
+    ('없는아파트', '대치동', '9999', '2020', None, None),
+    ('래미안', '역삼동', None, None, 117, 117),
+    ('래미안', '대치동', None, None, None, 117),
+    ('아이파크', '대치동', '1026', None, 104, 104),
+    ('자이', '개포동', '1283', '2023', 108, 108),
+    ('은마', '개포동', '316', None, 101, 101),
+    ('타워팰리스1차', '대치동', '467', '2002', 114, 114),
+    ('개포주공6단지', '개포동', '9', '1983', 111, 111),
+]
+
+# (법정동 코드 10자리, 지번, 기대 apt_id)
+JIBUN_CASES = [
+    ('1168010600', '316', 101),
+    ('1168010600', '1027', 102),
+    ('1168010600', '1028', 103),
+    ('1168010600', '1026', 104),
+    ('1168010600', '503', 105),
+    ('1168010600', '503-1', 106),
+    ('1168010600', '63', 107),
+    ('1168010300', '1283', 108),
+    ('1168010300', '1280', 109),
+    ('1168010300', '1281', 110),
+    ('1168010300', '185', 111),
+    ('1168010300', '187', 112),
+    ('1168011800', '527', 113),
+    ('1168011800', '467', 114),
+    ('1168011800', '467-6', 115),
+    ('1168011800', '953', 116),
+    ('1168010100', '754', 117),
+    ('1168010100', '780', 118),
+    ('1168011400', '615', 119),
+    ('1168010300', '12', 120),
+    ('1168011400', '700', 121),
+    ('1168011400', '720', 122),
+    ('1168010600', '9999', None),
+    ('1168010300', '9', None),
+]
+
+
+@pytest.fixture(scope="module")
+def candidates():
+    return [
+        SimpleNamespace(apt_id=apt_id, apt_name=apt_name, region_id=region_id, apt_seq=None)
+        for apt_id, apt_name, region_id, _, _ in APARTMENTS
+    ]
+
+
+@pytest.fixture(scope="module")
+def apt_details():
+    return {
+        apt_id: SimpleNamespace(
+            apt_id=apt_id,
+            jibun_address=jibun_address,
+            use_approval_date=use_approval_date,
+            jibun_bonbun=None,
+            jibun_bubun=None,
+        )
+        for apt_id, _, _, jibun_address, use_approval_date in APARTMENTS
+    }
+
+
+@pytest.fixture(scope="module")
+def index(candidates, apt_details):
+    return RegionMatcherIndex(candidates, apt_details)
+
+
+def _apt_id(apartment):
+    return apartment.apt_id if apartment is not None else None
+
+
+@pytest.mark.parametrize("use_index", [False, True], ids=["full-scan", "indexed"])
+@pytest.mark.parametrize("require_dong_match", [True, False], ids=["dong-check", "no-dong-check"])
+@pytest.mark.parametrize("apt_name, umd_nm, jibun, build_year, expected_strict, expected_loose", NAME_CASES)
+def test_match_apartment_keeps_outcomes(
+    candidates, apt_details, index, use_index, require_dong_match,
+    apt_name, umd_nm, jibun, build_year, expected_strict, expected_loose,
+):
+    matched = ApartmentMatcher.match_apartment(
+        apt_name,
+        candidates,
+        SGG_CD,
+        umd_nm=umd_nm,
+        jibun=jibun,
+        build_year=build_year,
+        apt_details=apt_details,
+        normalized_cache={},
+        all_regions=REGIONS,
+        require_dong_match=require_dong_match,
+        index=index if use_index else None,
+    )
+    assert _apt_id(matched) == (expected_strict if require_dong_match else expected_loose)
+
+
+@pytest.mark.parametrize("use_index", [False, True], ids=["full-scan", "indexed"])
+@pytest.mark.parametrize("region_code, jibun, expected", JIBUN_CASES)
+def test_match_by_address_and_jibun_keeps_outcomes(candidates, apt_details, index, use_index, region_code, jibun, expected):
+    matched = ApartmentMatcher.match_by_address_and_jibun(
+        region_code,
+        jibun,
+        candidates=candidates,
+        apt_details=apt_details,
+        all_regions=REGIONS,
+        index=index if use_index else None,
+    )
+    assert _apt_id(matched) == expected
+
+
+def test_index_keeps_every_candidate_that_can_match(candidates, apt_details, index):
+    """인덱스가 거른 후보만으로 매칭해도 전체 후보로 매칭한 결과와 같음"""
+    for apt_name, umd_nm, jibun, build_year, _, _ in NAME_CASES:
+        features = ApartmentMatcher.build_name_features(apt_name)
+        if not features["normalized"]:
+            continue
+        api_jibun = ApartmentMatcher.parse_api_jibun(jibun) if jibun else None
+        viable = index.viable_candidate_ids(features, api_jibun)
+        narrowed = [apt for apt in candidates if apt.apt_id in viable]
+        kwargs = dict(
+            umd_nm=umd_nm, jibun=jibun, build_year=build_year, apt_details=apt_details,
+            normalized_cache={}, all_regions=REGIONS, require_dong_match=False,
+        )
+        full = ApartmentMatcher.match_apartment(apt_name, candidates, SGG_CD, **kwargs)
+        assert _apt_id(ApartmentMatcher.match_apartment(apt_name, narrowed, SGG_CD, **kwargs)) == _apt_id(full)
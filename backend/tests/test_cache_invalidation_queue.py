@@ -0,0 +1,117 @@
+"""
+캐시 무효화 큐 테스트
+
+중복 제거, 상한 초과 시 전체 통계 태그 축약, 플러시 지표를 확인합니다.
+"""
+import asyncio
+
+import pytest
+
+from app.services import cache_invalidation
+from app.services.cache_invalidation import CacheInvalidationQueue
+from app.utils.cache import STATS_GLOBAL_TAG, apt_tag
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    """invalidate_cache_tags 호출을 기록 (Redis 없이)"""
+    calls = []
+
+    async def invalidate_cache_tags(*tags):
+        calls.append(set(tags))
+        return True
+
+    monkeypatch.setattr(cache_invalidation, "invalidate_cache_tags", invalidate_cache_tags)
+    return calls
+
+
+def test_enqueue_deduplicates_tags():
+    queue = CacheInvalidationQueue(max_pending=10)
+    queue.enqueue([apt_tag(1), STATS_GLOBAL_TAG])
+    queue.enqueue([apt_tag(1), apt_tag(2), STATS_GLOBAL_TAG])
+
+    metrics = queue.get_metrics()
+    assert queue.pending_count() == 3
+    assert metrics["enqueued"] == 5
+    assert metrics["deduplicated"] == 2
+    assert metrics["dropped"] == 0
+    assert metrics["overflows"] == 0
+
+
+def test_overflow_collapses_to_global_tag_until_flush(invalidated):
+    queue = CacheInvalidationQueue(max_pending=3)
+    queue.enqueue([apt_tag(1), apt_tag(2), apt_tag(3)])
+    # 상한 도달 후 들어온 태그가 축약을 일으킴
+    queue.enqueue([apt_tag(4)])
+    assert queue._pending == {STATS_GLOBAL_TAG}
+
+    # 축약 상태에서는 개별 태그를 다시 쌓지 않음
+    queue.enqueue([apt_tag(5), STATS_GLOBAL_TAG, apt_tag(6)])
+    assert queue._pending == {STATS_GLOBAL_TAG}
+
+    metrics = queue.get_metrics()
+    assert metrics["overflows"] == 1
+    assert metrics["enqueued"] == 7
+    # apt:1~3 (축약 시 버림) + apt:4 (축약을 일으킨 태그) + apt:5, apt:6
+    assert metrics["dropped"] == 6
+    assert metrics["deduplicated"] == 1
+
+    assert asyncio.run(queue.flush()) == 1
+    assert invalidated == [{STATS_GLOBAL_TAG}]
+
+    # 플러시 후에는 다시 개별 태그를 모음
+    queue.enqueue([apt_tag(7)])
+    assert queue._pending == {apt_tag(7)}
+
+
+def test_overflow_keeps_pending_global_tag(invalidated):
+    queue = CacheInvalidationQueue(max_pending=2)
+    queue.enqueue([STATS_GLOBAL_TAG, apt_tag(1), apt_tag(2)])
+
+    metrics = queue.get_metrics()
+    assert queue._pending == {STATS_GLOBAL_TAG}
+    assert metrics["overflows"] == 1
+    assert metrics["dropped"] == 2
+
+
+def test_flush_records_metrics(invalidated):
+    queue = CacheInvalidationQueue()
+    assert asyncio.run(queue.flush()) == 0
+
+    queue.enqueue([apt_tag(1), apt_tag(2), STATS_GLOBAL_TAG])
+    assert asyncio.run(queue.flush()) == 3
+    assert invalidated == [{apt_tag(1), apt_tag(2), STATS_GLOBAL_TAG}]
+
+    metrics = queue.get_metrics()
+    assert metrics["pending"] == 0
+    assert metrics["flushes"] == 1
+    assert metrics["flushed_tags"] == 3
+    assert metrics["failures"] == 0
+
+
+def test_failed_flush_counts_failure(monkeypatch):
+    async def invalidate_cache_tags(*tags):
+        return False
+
+    monkeypatch.setattr(cache_invalidation, "invalidate_cache_tags", invalidate_cache_tags)
+    queue = CacheInvalidationQueue()
+    queue.enqueue([apt_tag(1)])
+
+    assert asyncio.run(queue.flush()) == 0
+    metrics = queue.get_metrics()
+    assert metrics["failures"] == 1
+    assert metrics["flushes"] == 0
+    assert metrics["pending"] == 0
+
+
+def test_enqueue_in_loop_schedules_single_flush(invalidated):
+    async def run():
+        queue = CacheInvalidationQueue(flush_delay=0)
+        queue.enqueue([apt_tag(1)])
+        queue.enqueue([apt_tag(2)])
+        await queue._flush_task
+        return queue
+
+    queue = asyncio.run(run())
+    assert invalidated == [{apt_tag(1), apt_tag(2)}]
+    assert queue.get_metrics()["flushes"] == 1
@@ -0,0 +1,173 @@
+"""수집기 공용 HTTP 전송 계층 테스트 (app.services.data_collection.utils.http_transport)
+
+httpx.MockTransport 로 만든 로컬 스텁 서버에 요청하므로 외부 API 가 필요 없습니다.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.data_collection.utils import http_transport
+from app.services.data_collection.utils.http_transport import CollectorTransport
+
+API_URL = "https://api.stub.test/trade/list"
+
+
+class StubServer:
+    """요청을 기록하고 미리 정한 응답(상태 코드 또는 예외)을 차례로 돌려주는 스텁"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"path": request.url.path})
+
+
+def _transport(server: StubServer, **kwargs) -> CollectorTransport:
+    kwargs.setdefault("rate_per_second", 0)
+    return CollectorTransport(http2=False, transport=httpx.MockTransport(server), **kwargs)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    """지터 범위를 기록하고 백오프 대기는 0초로"""
+    ranges = []
+
+    def uniform(low, high):
+        ranges.append((low, high))
+        return 0.0
+
+    monkeypatch.setattr(http_transport.random, "uniform", uniform)
+    return ranges
+
+
+def test_token_bucket_limits_per_key_and_host():
+    server = StubServer()
+    transport = _transport(server, rate_per_second=20, burst=1)
+
+    async def run():
+        # 같은 (키, 호스트): 첫 요청 이후는 토큰을 기다림
+        for _ in range(3):
+            await transport.get(API_URL, params={"serviceKey": "key-a"})
+        # 다른 키 / 다른 호스트는 각자 버킷 → 첫 요청은 기다리지 않음
+        await transport.get(API_URL, params={"serviceKey": "key-b"})
+        await transport.get("https://other.stub.test/trade/list", params={"serviceKey": "key-a"})
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    assert len(transport._buckets) == 3
+    endpoints = transport.get_metrics()["endpoints"]
+    # 20/s, burst 1 → 두 번째, 세 번째 요청이 각각 약 0.05초 대기
+    assert endpoints["api.stub.test/trade/list"]["throttled_seconds"] >= 0.05
+    assert endpoints["other.stub.test/trade/list"]["throttled_seconds"] == 0
+    assert len(server.requests) == 5
+
+
+def test_token_bucket_spaces_requests_over_time():
+    server = StubServer()
+    transport = _transport(server, rate_per_second=50, burst=1)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.gather(*(transport.get(API_URL, params={"serviceKey": "k"}) for _ in range(6)))
+        await transport.aclose()
+        return loop.time() - started
+
+    # 6건을 50/s 로: 첫 건 이후 5건이 0.02초 간격
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_retries_5xx_with_jittered_backoff(no_backoff):
+    server = StubServer(503, 502, 200)
+    transport = _transport(server)
+
+    response = asyncio.run(transport.get(API_URL, backoff_base=0.5))
+
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+    # 전체 지터: [0, base * 2^attempt]
+    assert no_backoff == [(0, 0.5), (0, 1.0)]
+    metrics = transport.get_metrics()["endpoints"]["api.stub.test/trade/list"]
+    assert metrics["retries"] == 2
+    assert metrics["errors"] == 2
+    assert metrics["status_counts"] == {503: 1, 502: 1, 200: 1}
+
+
+def test_retries_timeouts(no_backoff):
+    server = StubServer(httpx.ReadTimeout("stub timeout"), 200)
+    transport = _transport(server)
+
+    response = asyncio.run(transport.get(API_URL))
+
+    assert response.status_code == 200
+    assert len(server.requests) == 2
+    assert len(no_backoff) == 1
+    metrics = transport.get_metrics()["endpoints"]["api.stub.test/trade/list"]
+    assert metrics["requests"] == 2
+    assert metrics["retries"] == 1
+    assert metrics["errors"] == 1
+
+
+def test_gives_up_after_retries(no_backoff):
+    timeouts = StubServer(*(httpx.ConnectTimeout("stub timeout") for _ in range(3)))
+    with pytest.raises(httpx.ConnectTimeout):
+        asyncio.run(_transport(timeouts).get(API_URL, retries=3))
+    assert len(timeouts.requests) == 3
+
+    # 재시도 대상 상태 코드는 마지막 응답을 그대로 반환
+    unavailable = StubServer(503, 503, 503)
+    response = asyncio.run(_transport(unavailable).get(API_URL, retries=3))
+    assert response.status_code == 503
+    assert len(unavailable.requests) == 3
+
+
+def test_honors_retry_after(monkeypatch):
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(http_transport.asyncio, "sleep", fake_sleep)
+    server = StubServer(429, 200)
+    server_response = server.__call__
+
+    def with_retry_after(request):
+        response = server_response(request)
+        if response.status_code == 429:
+            response.headers["Retry-After"] = "2"
+        return response
+
+    transport = CollectorTransport(rate_per_second=0, http2=False, transport=httpx.MockTransport(with_retry_after))
+    assert asyncio.run(transport.get(API_URL)).status_code == 200
+    assert waits == [2.0]
+
+
+def test_metrics_per_endpoint():
+    server = StubServer(200, 404, 200)
+    transport = _transport(server)
+
+    async def run():
+        await transport.get("https://api.stub.test/trade/list")
+        await transport.get("https://api.stub.test/trade/list")
+        await transport.get("https://api.stub.test/rent/list", params={"page": 2})
+        await transport.aclose()
+
+    asyncio.run(run())
+
+    endpoints = transport.get_metrics()["endpoints"]
+    assert set(endpoints) == {"api.stub.test/trade/list", "api.stub.test/rent/list"}
+    trade = endpoints["api.stub.test/trade/list"]
+    assert trade["requests"] == 2
+    assert trade["errors"] == 1
+    assert trade["status_counts"] == {200: 1, 404: 1}
+    assert endpoints["api.stub.test/rent/list"]["requests"] == 1
+
+    transport.reset_metrics()
+    assert transport.get_metrics()["endpoints"] == {}
@@ -0,0 +1,84 @@
+"""지도 타일 좌표 계산 테스트 (app.utils.map_tiles)"""
+import pytest
+
+from app.utils.map_tiles import (
+    MAX_TILE_ZOOM,
+    MIN_TILE_ZOOM,
+    Tile,
+    lnglat_to_tile,
+    point_in_bounds,
+    squared_distance_to_center,
+    tile_bounds,
+    tile_zoom_for_level,
+    tiles_for_bounds,
+)
+
+# 서울시청 부근
+SEOUL_LAT, SEOUL_LNG = 37.5665, 126.9780
+
+
+def test_tile_zoom_for_level_is_clamped():
+    assert tile_zoom_for_level(3) == 15
+    assert tile_zoom_for_level(1) == MAX_TILE_ZOOM
+    assert tile_zoom_for_level(14) == MIN_TILE_ZOOM
+
+
+def test_lnglat_to_tile_known_values():
+    assert lnglat_to_tile(0.0, 0.0, 1) == (1, 1)
+    assert lnglat_to_tile(SEOUL_LNG, SEOUL_LAT, 10) == (873, 396)
+
+
+def test_lnglat_to_tile_clamps_to_world():
+    assert lnglat_to_tile(180.0, -90.0, 3) == (7, 7)
+    assert lnglat_to_tile(-180.0, 90.0, 3) == (0, 0)
+
+
+def test_tile_bounds_contains_point():
+    x, y = lnglat_to_tile(SEOUL_LNG, SEOUL_LAT, 14)
+    sw_lat, sw_lng, ne_lat, ne_lng = tile_bounds(Tile(14, x, y))
+    assert sw_lat < SEOUL_LAT < ne_lat
+    assert sw_lng < SEOUL_LNG < ne_lng
+
+
+def test_tile_bounds_of_root_tile():
+    sw_lat, sw_lng, ne_lat, ne_lng = tile_bounds(Tile(0, 0, 0))
+    assert sw_lng == -180.0 and ne_lng == 180.0
+    assert ne_lat == pytest.approx(85.0511, abs=1e-3)
+    assert sw_lat == pytest.approx(-85.0511, abs=1e-3)
+
+
+def test_tiles_for_bounds_covers_viewport():
+    bounds = (37.55, 126.96, 37.58, 127.00)
+    tiles = tiles_for_bounds(*bounds, z=14)
+    assert tiles
+    assert all(tile.z == 14 for tile in tiles)
+    # 뷰포트 네 모서리가 모두 타일 안에 있음
+    keys = {(tile.x, tile.y) for tile in tiles}
+    for lat in (bounds[0], bounds[2]):
+        for lng in (bounds[1], bounds[3]):
+            assert lnglat_to_tile(lng, lat, 14) in keys
+
+
+def test_tiles_for_bounds_accepts_swapped_corners():
+    assert tiles_for_bounds(37.58, 127.00, 37.55, 126.96, z=14) == tiles_for_bounds(37.55, 126.96, 37.58, 127.00, z=14)
+
+
+def test_tiles_for_bounds_zooms_out_when_too_many():
+    tiles = tiles_for_bounds(33.0, 124.5, 38.7, 131.0, z=14, max_tiles=16)
+    assert len(tiles) <= 16
+    assert tiles[0].z < 14
+
+
+def test_point_in_bounds_includes_edges():
+    assert point_in_bounds(37.56, 126.98, 37.55, 126.96, 37.58, 127.00)
+    assert point_in_bounds(37.55, 126.96, 37.55, 126.96, 37.58, 127.00)
+    assert point_in_bounds(37.56, 126.98, 37.58, 127.00, 37.55, 126.96)
+    assert not point_in_bounds(37.60, 126.98, 37.55, 126.96, 37.58, 127.00)
+    assert not point_in_bounds(37.56, 127.01, 37.55, 126.96, 37.58, 127.00)
+
+
+def test_squared_distance_to_center_orders_by_distance():
+    bounds = (37.0, 127.0, 38.0, 128.0)
+    assert squared_distance_to_center(37.5, 127.5, *bounds) == 0.0
+    assert squared_distance_to_center(37.6, 127.5, *bounds) == pytest.approx(0.01)
+    assert squared_distance_to_center(37.6, 127.5, *bounds) < squared_distance_to_center(37.9, 127.9, *bounds)
@@ -0,0 +1,79 @@
+"""평당가 분포 스냅샷 순위 계산 테스트 (app.services.percentile_snapshot)"""
+import pytest
+
+from app.services.percentile_snapshot import NO_REGION, PercentileSnapshot, build_snapshot
+
+# (apt_id, region_id, 평당가)
+ROWS = [
+    (30, 2, 3000.0),
+    (10, 1, 1000.0),
+    (20, 1, 2000.0),
+    (40, 2, 2000.0),
+    (50, None, 5000.0),
+    (60, 1, None),
+]
+
+
+@pytest.fixture
+def snapshot():
+    return build_snapshot(ROWS)
+
+
+def test_build_snapshot_sorts_arrays(snapshot):
+    assert list(snapshot.apt_ids) == [10, 20, 30, 40, 50]
+    assert list(snapshot.national) == [1000.0, 2000.0, 2000.0, 3000.0, 5000.0]
+    assert snapshot.national_sum == pytest.approx(13000.0)
+    assert list(snapshot.region_ids) == [1, 2]
+    assert list(snapshot.region_offsets) == [0, 2, 4]
+    assert list(snapshot.region_prices) == [1000.0, 2000.0, 2000.0, 3000.0]
+    assert list(snapshot.region_sums) == [3000.0, 5000.0]
+
+
+def test_lookup(snapshot):
+    assert snapshot.lookup(30) == (3000.0, 2)
+    assert snapshot.lookup(50) == (5000.0, NO_REGION)
+    # 평당가가 없는 아파트와 없는 아파트는 제외
+    assert snapshot.lookup(60) is None
+    assert snapshot.lookup(99) is None
+
+
+def test_national_rank_higher_price_ranks_first(snapshot):
+    top = snapshot.national_rank(5000.0)
+    assert (top.rank, top.total_count, top.percentile) == (1, 5, 0.0)
+    assert top.average == pytest.approx(2600.0)
+
+    bottom = snapshot.national_rank(1000.0)
+    assert bottom.rank == 5
+    assert bottom.percentile == pytest.approx(80.0)
+
+
+def test_national_rank_ties_share_rank(snapshot):
+    assert snapshot.national_rank(2000.0).rank == 3
+
+
+def test_region_rank(snapshot):
+    regional = snapshot.region_rank(2, 2000.0)
+    assert (regional.rank, regional.total_count) == (2, 2)
+    assert regional.percentile == pytest.approx(50.0)
+    assert regional.average == pytest.approx(2500.0)
+    assert snapshot.region_rank(3, 2000.0) is None
+    assert snapshot.region_rank(NO_REGION, 5000.0) is None
+
+
+def test_empty_snapshot():
+    empty = build_snapshot([])
+    assert empty.lookup(1) is None
+    rank = empty.national_rank(1000.0)
+    assert (rank.rank, rank.total_count, rank.percentile, rank.average) == (1, 0, 0.0, 0.0)
+    assert empty.region_rank(1, 1000.0) is None
+
+
+def test_mapping_round_trip(snapshot):
+    mapping = {name.encode(): value for name, value in snapshot.to_mapping().items()}
+    restored = PercentileSnapshot.from_mapping(mapping)
+    assert restored.version == snapshot.version
+    assert list(restored.apt_ids) == list(snapshot.apt_ids)
+    assert list(restored.region_offsets) == list(snapshot.region_offsets)
+    assert restored.national_rank(2000.0) == snapshot.national_rank(2000.0)
+    assert restored.region_rank(1, 1000.0) == snapshot.region_rank(1, 1000.0)
+    assert PercentileSnapshot.from_mapping({}) is None
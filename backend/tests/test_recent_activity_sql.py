@@ -0,0 +1,38 @@
+"""최근 기록 upsert 문장 구문 검사 (app.services.recent_activity_buffer)
+
+PostgreSQL 파서(pglast, libpg_query)로 파싱만 하므로 DB 가 필요 없습니다.
+"""
+import re
+
+import pytest
+
+pglast = pytest.importorskip("pglast")
+
+from app.services.recent_activity_buffer import _UPSERT_SEARCHES_SQL, _UPSERT_VIEWS_SQL
+
+# :name 바인드 파라미터 (:: 캐스트 제외)
+_BIND_PARAM = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+def _to_positional(sql: str) -> str:
+    names = []
+
+    def replace(match):
+        if match.group(1) not in names:
+            names.append(match.group(1))
+        return f"${names.index(match.group(1)) + 1}"
+
+    return _BIND_PARAM.sub(replace, sql)
+
+
+@pytest.mark.parametrize(
+    "statement, params",
+    [
+        (_UPSERT_SEARCHES_SQL, {"account_ids", "search_types", "queries", "searched_ats", "cap"}),
+        (_UPSERT_VIEWS_SQL, {"account_ids", "apt_ids", "viewed_ats", "cap"}),
+    ],
+)
+def test_upsert_statement_parses(statement, params):
+    assert set(statement._bindparams) == params
+    parsed = pglast.parse_sql(_to_positional(statement.text))
+    assert len(parsed) == 1
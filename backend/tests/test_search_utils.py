@@ -0,0 +1,45 @@
+"""자동완성 색인용 한글 자모/초성 분해 테스트 (app.utils.search_utils)"""
+from app.utils.search_utils import decompose_jamo, extract_chosung, is_chosung_query
+
+
+def test_decompose_jamo_splits_syllables():
+    assert decompose_jamo("롯데") == "ㄹㅗㅅㄷㅔ"
+    assert decompose_jamo("캐슬") == "ㅋㅐㅅㅡㄹ"
+
+
+def test_decompose_jamo_splits_compound_vowels_and_final_consonants():
+    assert decompose_jamo("관") == "ㄱㅗㅏㄴ"
+    assert decompose_jamo("의") == "ㅇㅡㅣ"
+    assert decompose_jamo("값") == "ㄱㅏㅂㅅ"
+    assert decompose_jamo("닭") == "ㄷㅏㄹㄱ"
+
+
+def test_decompose_jamo_splits_standalone_compound_jamo():
+    assert decompose_jamo("ㅘ") == "ㅗㅏ"
+    assert decompose_jamo("ㄳ") == "ㄱㅅ"
+
+
+def test_decompose_jamo_keeps_non_hangul():
+    assert decompose_jamo("e편한세상 2단지") == "eㅍㅕㄴㅎㅏㄴㅅㅔㅅㅏㅇ 2ㄷㅏㄴㅈㅣ"
+    assert decompose_jamo("") == ""
+
+
+def test_partial_input_is_prefix_of_full_name():
+    full = decompose_jamo("롯데캐슬")
+    assert full.startswith(decompose_jamo("롯데캣"))
+    assert full.startswith(decompose_jamo("롯데캐ㅅ"))
+    assert decompose_jamo("광").startswith(decompose_jamo("고"))
+
+
+def test_extract_chosung():
+    assert extract_chosung("롯데캐슬") == "ㄹㄷㅋㅅ"
+    assert extract_chosung("쌍용 2차") == "ㅆㅇ 2ㅊ"
+    assert extract_chosung("ㄹㄷ") == "ㄹㄷ"
+
+
+def test_is_chosung_query():
+    assert is_chosung_query("ㄹㄷㅋㅅ")
+    assert not is_chosung_query("롯데")
+    assert not is_chosung_query("ㄹㄷ캐슬")
+    assert not is_chosung_query("ㅘ")
+    assert not is_chosung_query("")
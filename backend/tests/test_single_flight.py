@@ -0,0 +1,138 @@
+"""
+single-flight 요청 병합 테스트 (Redis 없이)
+
+get_redis_client() 가 None 을 반환하면 프로세스 내부 Future 병합만 사용합니다.
+캐시 조회/저장은 메모리 dict 로 대신합니다.
+"""
+import asyncio
+
+import pytest
+
+from app.utils import single_flight as single_flight_module
+from app.utils.single_flight import SingleFlight
+
+WAITERS = 5
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Redis 없는 환경 + 메모리 캐시"""
+    data = {}
+
+    async def get_redis_client():
+        return None
+
+    async def get_from_cache(key):
+        return data.get(key)
+
+    async def set_to_cache(key, value, ttl=None):
+        data[key] = value
+        return True
+
+    monkeypatch.setattr(single_flight_module, "get_redis_client", get_redis_client)
+    monkeypatch.setattr(single_flight_module, "get_from_cache", get_from_cache)
+    monkeypatch.setattr(single_flight_module, "set_to_cache", set_to_cache)
+    monkeypatch.setattr(single_flight_module, "in_swr_refresh", lambda key: False)
+    return data
+
+
+async def _join(flights: SingleFlight, key: str, count: int):
+    """리더가 정해진 뒤 대기 요청 count 개를 시작"""
+    tasks = [asyncio.create_task(flights.acquire(key)) for _ in range(count)]
+    # 대기 요청이 모두 리더의 Future 를 기다릴 때까지 양보
+    await asyncio.sleep(0)
+    return tasks
+
+
+def test_leader_result_reaches_waiters(store):
+    async def run():
+        flights = SingleFlight(wait_timeout=1.0)
+        leader = await flights.acquire("k")
+        assert leader.is_leader and leader.value is None
+
+        tasks = await _join(flights, "k", WAITERS)
+        await leader.set({"n": 1}, ttl=60)
+        await leader.release()
+        waiters = await asyncio.gather(*tasks)
+        return flights, waiters
+
+    flights, waiters = asyncio.run(run())
+    assert [w.value for w in waiters] == [{"n": 1}] * WAITERS
+    assert not any(w.is_leader or w.stale for w in waiters)
+    assert store == {"k": {"n": 1}, "k:stale": {"n": 1}}
+
+    metrics = flights.get_metrics()
+    assert metrics["inflight"] == 0
+    assert metrics["leaders"] == 1
+    assert metrics["local_waits"] == WAITERS
+    assert metrics["coalesced"] == WAITERS
+
+
+def test_leader_failure_reaches_waiters(store):
+    error = RuntimeError("db down")
+
+    async def run():
+        flights = SingleFlight(wait_timeout=1.0)
+        leader = await flights.acquire("k")
+        tasks = await _join(flights, "k", WAITERS)
+        leader.fail(error)
+        await leader.release()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return flights, results
+
+    flights, results = asyncio.run(run())
+    assert all(result is error for result in results)
+    assert store == {}
+
+    metrics = flights.get_metrics()
+    assert metrics["inflight"] == 0
+    assert metrics["failures"] == 1
+    assert metrics["coalesced"] == 0
+
+
+def test_waiters_fall_back_to_stale_on_timeout(store):
+    store["k:stale"] = {"n": 0}
+
+    async def run():
+        flights = SingleFlight(wait_timeout=0.05)
+        leader = await flights.acquire("k")
+        # 리더가 제한 시간 안에 끝내지 못함
+        waiters = await asyncio.gather(*await _join(flights, "k", WAITERS))
+        await leader.release()
+        return flights, waiters
+
+    flights, waiters = asyncio.run(run())
+    assert [w.value for w in waiters] == [{"n": 0}] * WAITERS
+    assert all(w.stale and not w.is_leader for w in waiters)
+    assert asyncio.run(waiters[0].to_response(None)) == {"n": 0}
+
+    metrics = flights.get_metrics()
+    assert metrics["timeouts"] == WAITERS
+    assert metrics["stale_served"] == WAITERS
+    assert metrics["coalesced"] == 0
+
+
+def test_waiters_compute_themselves_without_stale_copy(store):
+    async def run():
+        flights = SingleFlight(wait_timeout=0.05)
+        leader = await flights.acquire("k")
+        waiters = await asyncio.gather(*await _join(flights, "k", WAITERS))
+        await leader.release()
+        return flights, waiters
+
+    flights, waiters = asyncio.run(run())
+    assert all(w.value is None and not w.stale for w in waiters)
+    assert flights.get_metrics()["stale_served"] == 0
+
+
+def test_cached_value_skips_leadership(store):
+    store["k"] = {"n": 2}
+
+    async def run():
+        flights = SingleFlight()
+        return flights, await flights.acquire("k")
+
+    flights, flight = asyncio.run(run())
+    assert flight.value == {"n": 2}
+    assert not flight.is_leader
+    assert flights.get_metrics()["leaders"] == 0
@@ -0,0 +1,85 @@
+"""
+SWR 백그라운드 갱신 락 테스트
+
+갱신이 끝나면 자신이 잡은 {key}:refresh 락만 해제하는지 확인합니다.
+"""
+import asyncio
+
+from app.utils import cache
+
+
+class _FakeRedis:
+    """SET NX 와 락 해제 스크립트만 흉내내는 클라이언트"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        assert script == cache.RELEASE_LOCK_SCRIPT
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+
+def _use_redis(monkeypatch, client):
+    async def get_redis_client():
+        return client
+    monkeypatch.setattr(cache, "get_redis_client", get_redis_client)
+
+
+def test_refresh_releases_its_lock(monkeypatch):
+    redis = _FakeRedis()
+    _use_redis(monkeypatch, redis)
+    seen = []
+
+    async def refresh():
+        seen.append(dict(redis.store))
+
+    asyncio.run(cache._run_swr_refresh("k", refresh))
+    assert list(seen[0]) == ["k:refresh"]
+    assert redis.store == {}
+
+
+def test_refresh_releases_lock_after_failure(monkeypatch):
+    redis = _FakeRedis()
+    _use_redis(monkeypatch, redis)
+
+    async def refresh():
+        raise RuntimeError("boom")
+
+    asyncio.run(cache._run_swr_refresh("k", refresh))
+    assert redis.store == {}
+    assert "k" not in cache._swr_refreshing
+
+
+def test_refresh_skips_and_keeps_foreign_lock(monkeypatch):
+    redis = _FakeRedis()
+    redis.store["k:refresh"] = "other-process"
+    _use_redis(monkeypatch, redis)
+    calls = []
+
+    async def refresh():
+        calls.append(1)
+
+    asyncio.run(cache._run_swr_refresh("k", refresh))
+    assert calls == []
+    assert redis.store == {"k:refresh": "other-process"}
+
+
+def test_refresh_does_not_delete_lock_taken_over_after_lease(monkeypatch):
+    redis = _FakeRedis()
+    _use_redis(monkeypatch, redis)
+
+    async def refresh():
+        # 갱신이 리스보다 오래 걸려 다른 프로세스가 락을 다시 잡은 상황
+        redis.store["k:refresh"] = "other-process"
+
+    asyncio.run(cache._run_swr_refresh("k", refresh))
+    assert redis.store == {"k:refresh": "other-process"}
@@ -0,0 +1,77 @@
+"""
+실거래가 수집 작업 큐 SQL 테스트
+
+DB 없이 생성되는 문장을 PostgreSQL 방언으로 컴파일해 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.data_collection.utils import work_queue
+from app.services.data_collection.utils.work_queue import (
+    CollectionWorkQueue,
+    MAX_ATTEMPTS,
+    WORK_KIND_SALES,
+    retry_backoff_seconds,
+)
+
+
+class _RecordingSession:
+    """execute에 전달된 문장을 모아 두는 세션"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+    async def commit(self):
+        pass
+
+
+def _sql(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def _enqueue(reset: bool) -> str:
+    db = _RecordingSession()
+    asyncio.run(CollectionWorkQueue().enqueue(db, WORK_KIND_SALES, ["202401"], ["11680"], reset=reset))
+    assert len(db.statements) == 1
+    return _sql(db.statements[0])
+
+
+def test_reset_enqueue_skips_fresh_running_units():
+    sql = _enqueue(reset=True)
+    conflict = sql.split("ON CONFLICT", 1)[1]
+    assert "DO UPDATE SET" in conflict
+    where = conflict.split("WHERE", 1)[1]
+    assert "collection_work_units.status !=" in where
+    assert "collection_work_units.updated_at <" in where
+
+
+def test_resume_enqueue_keeps_existing_units():
+    sql = _enqueue(reset=False)
+    assert "ON CONFLICT (kind, ym, sgg_cd) DO NOTHING" in sql
+
+
+def test_retry_backoff_grows_with_attempts():
+    assert retry_backoff_seconds(1) == work_queue.RETRY_BACKOFF_SECONDS
+    assert retry_backoff_seconds(2) == work_queue.RETRY_BACKOFF_SECONDS * 2
+    assert retry_backoff_seconds(3) == work_queue.RETRY_BACKOFF_SECONDS * 4
+
+
+def test_claimable_filter_waits_for_failed_backoff():
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    clause = CollectionWorkQueue._claimable_filter(MAX_ATTEMPTS, now)
+    compiled = clause.compile(dialect=postgresql.dialect())
+    cutoffs = sorted(v for v in compiled.params.values() if isinstance(v, datetime))
+    expected = sorted(
+        now - timedelta(seconds=retry_backoff_seconds(attempts)) for attempts in range(MAX_ATTEMPTS)
+    )
+    assert cutoffs == expected
+    assert "collection_work_units.updated_at <=" in str(compiled)
+
+    # now 없이 호출하면 대기 시간 조건 없이 집계용 조건만 생성
+    plain = CollectionWorkQueue._claimable_filter(MAX_ATTEMPTS).compile(dialect=postgresql.dialect())
+    assert "updated_at" not in str(plain)